@@ -14,6 +14,7 @@ adjacency list structure, as is common in graph algorithms and software.
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from edgegraph.structure import Universe, UnDirectedEdge
 from edgegraph.builder import explicit
 
@@ -21,6 +22,7 @@ from edgegraph.builder import explicit
 def load_adj_dict(
     adjdict: dict,
     linktype: type = UnDirectedEdge,
+    uid_generator: Callable[[], int] | None = None,
 ) -> Universe:
     """
     Load an "adjacency dictionary" to create a
@@ -76,9 +78,12 @@ def load_adj_dict(
     :param linktype: Class of links to use in creation.  May be any subclass of
        :py:class:`~edgegraph.structure.twoendedlink.TwoEndedLink`; default is
        :py:class:`~edgegraph.structure.undirectededge.UnDirectedEdge`.
+    :param uid_generator: UID generator for the new universe, and so for the
+       links created; see
+       :py:attr:`~edgegraph.structure.universe.Universe.uid_generator`.
     :return: a Universe containing the graph described in ``adjdict``.
     """
-    uni = Universe()
+    uni = Universe(uid_generator=uid_generator)
     for v1, v2s in adjdict.items():
         v1.add_to_universe(uni)
         for v2 in v2s:
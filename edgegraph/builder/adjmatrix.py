@@ -14,6 +14,7 @@ adjacency matrix structure, as is common in graph algorithms and software.
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from edgegraph.structure import Universe, Vertex, DirectedEdge
 from edgegraph.builder import explicit
 
@@ -22,6 +23,7 @@ def load_adj_matrix(
     matrix: list[list[bool]],
     vertices: list[Vertex],
     linktype: type = DirectedEdge,
+    uid_generator: Callable[[], int] | None = None,
 ) -> Universe:
     """
     Loads an adjacency matrix to create a graph structure.
@@ -120,6 +122,9 @@ def load_adj_matrix(
     :param linktype: Class of links to use in creation.  May be any subclass of
        :py:class:`~edgegraph.structure.twoendedlink.TwoEndedLink`; default is
        :py:class:`~edgegraph.structure.directededge.DirectedEdge`.
+    :param uid_generator: UID generator for the new universe, and so for the
+       links created; see
+       :py:attr:`~edgegraph.structure.universe.Universe.uid_generator`.
     """
 
     # some sanity checks up front
@@ -138,7 +143,7 @@ def load_adj_matrix(
             )
     # okay, good enough!
 
-    uni = Universe()
+    uni = Universe(uid_generator=uid_generator)
 
     for vert in vertices:
         vert.add_to_universe(uni)
@@ -16,18 +16,35 @@ functions will get the necessary updates to match, and the API stays unchanged.
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
 from edgegraph.structure import (
     Vertex,
     DirectedEdge,
     UnDirectedEdge,
     TwoEndedLink,
+    batching,
+    uidgen,
 )
+from edgegraph.structure.vertex import VertexCore
+from edgegraph.structure.twoendedlink import TwoEndedLinkCore
 from edgegraph.traversal import helpers
 
 if TYPE_CHECKING:
     from edgegraph.structure import Link
 
+#: Constructors known to do nothing beyond that of
+#: :py:class:`~edgegraph.structure.twoendedlink.TwoEndedLinkCore`; link types
+#: using one of these may be created by :py:func:`link_many` without calling
+#: it.
+_PLAIN_INITS = frozenset(
+    (
+        TwoEndedLinkCore.__init__,
+        DirectedEdge.__init__,
+        UnDirectedEdge.__init__,
+    )
+)
+
 
 def link_from_to(
     v1: Vertex, lnktype: type, v2: Vertex, dontdup: bool = False
@@ -57,13 +74,136 @@ def link_from_to(
     """
 
     if dontdup:
-        for lnk in v1.links:
+        # pylint: disable-next=protected-access
+        for lnk in v1._links_to(v2):
             if lnk.other(v1) is v2:
                 return lnk
 
     return lnktype(v1, v2)
 
 
+def link_many(
+    pairs: Iterable[tuple],
+    lnktype: type = DirectedEdge,
+    dontdup: bool = False,
+) -> list[Link]:
+    """
+    Create many links of type ``lnktype`` at once.
+
+    This is equivalent to calling :py:func:`link_from_to` for each pair, but
+    much faster for large numbers of links:
+
+    * for the standard edge types (those whose constructor does nothing more
+      than that of :py:class:`~edgegraph.structure.twoendedlink.TwoEndedLink`,
+      including the :py:mod:`~edgegraph.structure.compact` ones), links are
+      made without calling their constructor, skipping its checks and
+      association round-trips;
+    * the neighbor caches of the vertices involved are invalidated once each,
+      at the end (see :py:mod:`~edgegraph.structure.batching`);
+    * with ``dontdup``, duplicates are found by hashing, rather than by
+      scanning the links of ``v1`` for every pair.
+
+    Other link types are created by calling them as usual.
+
+    .. note::
+
+       Python's cyclic garbage collector is left running.  For very large
+       loads, pausing it around the call (see
+       :ref:`dev/performance/batch`) is the caller's choice to make.
+
+    .. code-block:: python
+
+       edges = explicit.link_many(
+           [(v1, v2), (v2, v3, {"weight": 4})],
+           UnDirectedEdge,
+       )
+
+    :param pairs: Iterable of ``(v1, v2)`` or ``(v1, v2, attributes)``
+       tuples, ``attributes`` being a :py:class:`dict` of attributes to set on
+       the new link (or ``None``).
+    :param lnktype: The class of the links.
+    :param dontdup: If set to True, no link is created between vertices which
+       are already linked (of any type, directed or undirected, in either
+       direction) -- including by an earlier pair in ``pairs``; the
+       already-existing link is given in its place.
+    :raises TypeError: if either end of a pair is not a vertex
+    :return: The links, in the order of ``pairs``.
+    """
+    plain = (
+        lnktype.__init__ in _PLAIN_INITS and lnktype.__new__ is object.__new__
+    )
+
+    # lazily-built map of already-linked vertices, per vertex: {v2: link}
+    linked: dict[VertexCore, dict[VertexCore, Link]] = {}
+
+    def _linked_to(vert):
+        known = linked.get(vert)
+        if known is None:
+            known = linked[vert] = {}
+            # pylint: disable-next=protected-access
+            for lnk in vert._links:
+                other = lnk.other(vert)
+                if other not in known:
+                    known[other] = lnk
+        return known
+
+    # vertices whose neighbor caches need invalidating, once each, at the end
+    touched: dict[VertexCore, None] = {}
+    out = []
+
+    # vertex classes already checked, and the UID generator of each universe
+    # (for vertices in exactly one), so neither is looked up for every pair
+    vtypes: set[type] = set()
+    generators: dict = {}
+
+    with batching.batch():
+        for pair in pairs:
+            v1, v2 = pair[0], pair[1]
+            attributes = pair[2] if len(pair) > 2 else None
+
+            if type(v1) not in vtypes:
+                if not issubclass(type(v1), VertexCore):
+                    raise TypeError(f"v1 is not a Vertex object!  got {v1}")
+                vtypes.add(type(v1))
+            if type(v2) not in vtypes:
+                if not issubclass(type(v2), VertexCore):
+                    raise TypeError(f"v2 is not a Vertex object!  got {v2}")
+                vtypes.add(type(v2))
+
+            if dontdup:
+                existing = _linked_to(v1).get(v2)
+                if existing is not None:
+                    out.append(existing)
+                    continue
+
+            if plain:
+                # pylint: disable-next=protected-access
+                unis = v1._universes
+                if unis and len(unis) == 1:
+                    gen = generators.get(unis[0])
+                    if gen is None:
+                        gen = generators[unis[0]] = uidgen.generator_for(unis)
+                else:
+                    gen = uidgen.generator_for(unis)
+
+                lnk = lnktype._new_between(v1, v2, gen(), attributes)
+                touched[v1] = None
+                touched[v2] = None
+            else:
+                lnk = lnktype(v1, v2, attributes=attributes)
+
+            if dontdup:
+                _linked_to(v1).setdefault(v2, lnk)
+                _linked_to(v2).setdefault(v1, lnk)
+            out.append(lnk)
+
+    for vert in touched:
+        # pylint: disable-next=protected-access
+        vert._qa_neighbors_invalidate()
+
+    return out
+
+
 def unlink(v1: Vertex, v2: Vertex, destroy=True) -> set[TwoEndedLink] | None:
     """
     Remive all links between ``v1`` and ``v2``.
@@ -8,6 +8,7 @@ Procedures for creating random graphs.
 from __future__ import annotations
 
 import random
+from collections.abc import Callable
 from edgegraph.structure import Vertex, DirectedEdge, Universe
 from edgegraph.builder import adjlist
 
@@ -17,6 +18,7 @@ def randgraph(
     edge: type = DirectedEdge,
     connectivity: float | None = None,
     ensurelink: bool | None = True,
+    uid_generator: Callable[[], int] | None = None,
 ) -> Universe:
     """
     Create a random graph.
@@ -32,10 +34,19 @@ def randgraph(
        vertex.  If specified, must be a float ``0 < connectivity <= 1``.  If
        not specified, calculated automatically to author's preference.
     :param ensurelink: Ensure that every vertex gets at least one edge.
+    :param uid_generator: UID generator for the vertices, links, and universe
+       created.  If not given, the global default is used; see
+       :py:mod:`edgegraph.structure.uidgen`.
     :return: a :py:class:`~edgegraph.structure.universe.Universe` object
        containing the graph.
     """
-    verts = [Vertex(attributes={"i": i}) for i in range(count)]
+    verts = [
+        Vertex(
+            uid=uid_generator() if uid_generator else None,
+            attributes={"i": i},
+        )
+        for i in range(count)
+    ]
 
     if connectivity is None:
         # this seems to give a good ratio of vertex-edge, as long as count is
@@ -51,4 +62,6 @@ def randgraph(
 
         adj[verts[i]] = random.sample(verts, k)
 
-    return adjlist.load_adj_dict(adj, linktype=edge)
+    return adjlist.load_adj_dict(
+        adj, linktype=edge, uid_generator=uid_generator
+    )
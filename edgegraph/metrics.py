@@ -0,0 +1,200 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Runtime counters for caching and traversal activity.
+
+Edgegraph can count what its caches and traversals are doing: neighbor cache
+hits and misses, neighbor lookups, traversal calls, and so on.  Counting is
+**disabled** by default, and costs a single flag check at each counting site
+while disabled.  Turn it on with :py:func:`enable`.
+
+Counters are kept by universe -- an event concerning a vertex is counted under
+the first universe that vertex belongs to (or under no universe, if it belongs
+to none), and a traversal under the universe (or snapshot) it was limited to.
+Universes are held weakly; their counters disappear along with them.
+
+.. code-block:: python
+   :linenos:
+
+   #!python3
+   from edgegraph import metrics
+   from edgegraph.builder import randgraph
+   from edgegraph.traversal import breadthfirst
+
+   metrics.enable()
+
+   uni = randgraph.randgraph(count=1000)
+   breadthfirst.bft(uni, uni.vertices[0])
+
+   metrics.REGISTRY.counters(uni)
+   # --> {'traversal.ibft': 1, 'neighbors.calls': 1000, ...}
+
+   metrics.REGISTRY.as_dict()
+   # --> plain dicts, lists, strings, and ints; ready for json.dumps()
+
+Counter names in use are:
+
+============================  ================================================
+Name                          Counts
+============================  ================================================
+``neighbors.calls``           lookups by
+                              :py:func:`~edgegraph.traversal.helpers.neighbors`
+``nbcache.hits``              neighbor lookups answered from a cache
+``nbcache.misses``            cacheable neighbor lookups not in the cache
+``nbcache.insertions``        neighbor lookups added to a cache
+``nbcache.invalidations``     vertices whose cached lookups were dropped
+``nbcache.evictions``         lookups evicted from a bounded cache
+``traversal.<function>``      calls to a traversal or search function
+``pathfinding.<function>``    calls to a pathfinding function
+============================  ================================================
+"""
+
+from __future__ import annotations
+
+import collections
+import weakref
+from typing import Any
+
+#: Whether counting is enabled.  Read by every counting site; change it with
+#: :py:func:`enable` and :py:func:`disable`.
+ENABLED: bool = False
+
+
+class MetricsRegistry(object):
+    """
+    Holds named counters, grouped by universe.
+    """
+
+    def __init__(self):
+        """
+        Create an empty registry.
+        """
+
+        #: Counters of each universe (or snapshot), held weakly
+        self._by_universe: weakref.WeakKeyDictionary[
+            Any, collections.Counter[str]
+        ] = weakref.WeakKeyDictionary()
+
+        #: Counters of events outside of any universe
+        self._unscoped: collections.Counter[str] = collections.Counter()
+
+    def count(self, universe: Any, name: str, n: int = 1) -> None:
+        """
+        Add to a counter.
+
+        :param universe: Universe (or snapshot) the event belongs to, or
+           ``None``.
+        :param name: Name of the counter.
+        :param n: Amount to add.
+        """
+        if universe is None:
+            self._unscoped[name] += n
+            return
+
+        counters = self._by_universe.get(universe)
+        if counters is None:
+            counters = self._by_universe[universe] = collections.Counter()
+        counters[name] += n
+
+    def counters(self, universe: Any = None) -> dict[str, int]:
+        """
+        Get the counters of one universe.
+
+        :param universe: Universe (or snapshot) to get the counters of, or
+           ``None`` for events outside of any universe.
+        :return: Copy of the counters, by name.
+        """
+        if universe is None:
+            return dict(self._unscoped)
+        return dict(self._by_universe.get(universe, ()))
+
+    def by_universe(self) -> dict[Any, dict[str, int]]:
+        """
+        Get the counters of every universe with any.
+
+        :return: Copies of the counters, keyed by universe (or snapshot).
+           Events outside of any universe are under the ``None`` key.
+        """
+        out: dict[Any, dict[str, int]] = {
+            uni: dict(counters) for uni, counters in self._by_universe.items()
+        }
+        if self._unscoped:
+            out[None] = dict(self._unscoped)
+        return out
+
+    def totals(self) -> dict[str, int]:
+        """
+        Get the counters summed over all universes.
+
+        :return: Summed counters, by name.
+        """
+        total: collections.Counter[str] = collections.Counter(self._unscoped)
+        for counters in self._by_universe.values():
+            total.update(counters)
+        return dict(total)
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Get all counters as plain, JSON-serializable data.
+
+        :return: A dictionary with ``"totals"`` (see :py:meth:`totals`),
+           ``"unscoped"`` (events outside of any universe), and
+           ``"universes"``: a list of ``{"uid": ..., "type": ...,
+           "counters": {...}}`` dictionaries.
+        """
+        return {
+            "totals": self.totals(),
+            "unscoped": dict(self._unscoped),
+            "universes": [
+                {
+                    "uid": getattr(uni, "uid", None),
+                    "type": type(uni).__name__,
+                    "counters": dict(counters),
+                }
+                for uni, counters in self._by_universe.items()
+            ],
+        }
+
+    def reset(self) -> None:
+        """
+        Drop all counters.
+        """
+        self._by_universe.clear()
+        self._unscoped.clear()
+
+
+#: The registry all of edgegraph counts into.
+REGISTRY: MetricsRegistry = MetricsRegistry()
+
+
+def enable() -> None:
+    """
+    Start counting.
+    """
+    # pylint: disable-next=global-statement
+    global ENABLED
+    ENABLED = True
+
+
+def disable() -> None:
+    """
+    Stop counting.  Counters collected so far are kept.
+    """
+    # pylint: disable-next=global-statement
+    global ENABLED
+    ENABLED = False
+
+
+def count(universe: Any, name: str, n: int = 1) -> None:
+    """
+    Add to a counter in :py:data:`REGISTRY`.
+
+    **Mostly for internal use.**  Callers should check :py:data:`ENABLED`
+    first, so that nothing is done while counting is disabled.
+
+    :param universe: Universe (or snapshot) the event belongs to, or ``None``.
+    :param name: Name of the counter.
+    :param n: Amount to add.
+    """
+    REGISTRY.count(universe, name, n)
@@ -0,0 +1,457 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Algorithms for finding the shortest paths between every pair of vertices.
+
+Where the distance between every two vertices of a graph is needed, solving
+each pair (or even each source) separately repeats a great deal of work.  The
+function here, :py:func:`all_pairs_shortest_paths`, solves them all at once,
+returning a :py:class:`DistanceMatrix`.  Two methods are available:
+
+* ``"floyd-warshall"``: the Floyd-Warshall algorithm, working on a dense
+  matrix of distances.  It takes :math:`O(V^3)` time regardless of the number
+  of edges, which suits dense graphs.  If `NumPy`_ is installed, the work is
+  vectorized, and runs many times faster; otherwise, a pure-Python fallback is
+  used.
+* ``"johnson"``: Johnson's algorithm, which reweights the edges (with the
+  Bellman-Ford algorithm) so that none are negative, then runs Dijkstra's
+  algorithm from every vertex.  It takes :math:`O(VE \\log V)` time, which
+  suits sparse graphs.
+
+Both allow negative edge weights, and raise
+:py:exc:`~edgegraph.pathfinding.shortestpath.NegativeCycleError` if the graph
+has a negative cycle.
+
+.. seealso::
+
+   :ref:`usage/algos/pathfinding`, :ref:`dev/performance/allpairs`
+
+.. _NumPy: https://numpy.org
+"""
+
+from __future__ import annotations
+
+import array
+import collections
+import heapq
+from typing import TYPE_CHECKING, Any
+from collections.abc import Callable
+
+from edgegraph import metrics
+from edgegraph.traversal import helpers
+from edgegraph.pathfinding import shortestpath
+from edgegraph.pathfinding.shortestpath import NegativeCycleError
+
+# optional; the Floyd-Warshall solver falls back to pure Python without it
+try:
+
+    import numpy
+
+except ImportError:  # pragma: no cover - depends on the environment
+
+    numpy = None
+
+if TYPE_CHECKING:
+    from edgegraph.structure import Vertex, Universe, Link, CSRSnapshot
+
+
+#: Methods accepted by :py:func:`all_pairs_shortest_paths`
+METHODS = [
+    "floyd-warshall",
+    "johnson",
+]
+
+
+class DistanceMatrix(object):
+    """
+    Shortest distances (and paths) between every pair of vertices.
+
+    This is the result of :py:func:`all_pairs_shortest_paths`.  Distances are
+    held in one dense, flat matrix (a NumPy array, or a Python
+    :py:class:`array.array`), alongside a matrix of predecessors from which
+    any path can be rebuilt.
+
+    >>> dm = all_pairs_shortest_paths(uni, weight="cost")
+    >>> dm[v1, v4]
+    3.0
+    >>> dm.path(v1, v4)
+    [v1, v2, v3, v4]
+    >>> dm.distance(v4, v1) is None  # no path back
+    True
+    """
+
+    __slots__ = ("_verts", "_index", "_dist", "_pred")
+
+    def __init__(
+        self,
+        verts: tuple[Vertex, ...],
+        dist: Any,
+        pred: Any,
+    ):
+        """
+        Wrap a solved problem.  **Mostly for internal use**; see
+        :py:func:`all_pairs_shortest_paths`.
+
+        :param verts: The vertices, in matrix order.
+        :param dist: Row-major flat matrix of distances; entry ``i * n + j``
+           is the distance from vertex ``i`` to vertex ``j`` (infinite where
+           there is no path).
+        :param pred: Row-major flat matrix of predecessors; entry ``i * n +
+           j`` is the number of the vertex before ``j`` on the shortest path
+           from ``i`` (-1 where there is none).
+        """
+
+        #: The vertices, in matrix order
+        self._verts = verts
+
+        #: Number of each vertex
+        self._index = {v: i for i, v in enumerate(verts)}
+
+        #: Flat matrix of distances
+        self._dist = dist
+
+        #: Flat matrix of predecessors
+        self._pred = pred
+
+    @property
+    def vertices(self) -> tuple[Vertex, ...]:
+        """
+        Return the vertices, in the order of the matrix's rows and columns.
+        """
+        return self._verts
+
+    def __len__(self) -> int:
+        """
+        Called by :py:`len(matrix)`; the number of vertices (rows).
+        """
+        return len(self._verts)
+
+    def index_of(self, vert: Vertex) -> int:
+        """
+        Get the row / column number of a vertex.
+
+        :raises KeyError: If the vertex is not in the matrix.
+        """
+        return self._index[vert]
+
+    def __getitem__(self, pair: tuple[Vertex, Vertex]) -> float:
+        """
+        Called by :py:`matrix[u, v]`; the shortest distance from ``u`` to
+        ``v``, or infinity if there is no path.
+
+        :raises KeyError: If either vertex is not in the matrix.
+        """
+        u, v = pair
+        i, j = self._index[u], self._index[v]
+        return float(self._dist[i * len(self._verts) + j])
+
+    def distance(self, u: Vertex, v: Vertex) -> float | None:
+        """
+        Get the shortest distance from ``u`` to ``v``.
+
+        :raises KeyError: If either vertex is not in the matrix.
+        :return: The distance, or ``None`` if there is no path.
+        """
+        d = self[u, v]
+        if d == float("inf"):
+            return None
+        return d
+
+    def path(self, u: Vertex, v: Vertex) -> list[Vertex] | None:
+        """
+        Get a shortest path from ``u`` to ``v``.
+
+        :raises KeyError: If either vertex is not in the matrix.
+        :return: The vertices of the path, ``u`` and ``v`` inclusive (just
+           ``[u]`` if the two are the same), or ``None`` if there is no path.
+        """
+        n = len(self._verts)
+        i, j = self._index[u], self._index[v]
+        if i == j:
+            return [u]
+        row = i * n
+        if self._pred[row + j] < 0:
+            return None
+
+        out = []
+        while j != i:
+            out.append(self._verts[j])
+            j = int(self._pred[row + j])
+        out.append(u)
+        out.reverse()
+        return out
+
+    def as_lists(self) -> list[list[float]]:
+        """
+        Get the distances as a list of rows (in the order of
+        :py:attr:`vertices`).
+        """
+        n = len(self._verts)
+        return [
+            [float(d) for d in self._dist[i * n : (i + 1) * n]]
+            for i in range(n)
+        ]
+
+
+def _cycle_error(pred: list[int], start: int, verts) -> NegativeCycleError:
+    """
+    Build the error for a negative cycle found among predecessors, by
+    following them from ``start`` until a vertex comes up twice.
+    """
+    seen: dict[int, int] = {}
+    order: list[int] = []
+    u = start
+    while u not in seen:
+        seen[u] = len(order)
+        order.append(u)
+        u = pred[u]
+
+    cycle = [verts[i] for i in order[seen[u] :]]
+    cycle.reverse()
+    cycle.append(cycle[0])
+    return NegativeCycleError(cycle)
+
+
+def _floyd_warshall_python(
+    n: int, edges: list[dict[int, float]], verts
+) -> tuple[array.array, array.array]:
+    """
+    Floyd-Warshall, on Python lists.
+    """
+    inf = float("inf")
+    dist = [[inf] * n for _ in range(n)]
+    pred = [[-1] * n for _ in range(n)]
+    for i, row in enumerate(edges):
+        for j, w in row.items():
+            dist[i][j] = w
+            pred[i][j] = i
+    for i in range(n):
+        if dist[i][i] > 0:
+            dist[i][i] = 0
+            pred[i][i] = -1
+
+    for k in range(n):
+        dk = dist[k]
+        pk = pred[k]
+        for i in range(n):
+            di = dist[i]
+            dik = di[k]
+            if dik == inf:
+                continue
+            pi = pred[i]
+            for j in range(n):
+                alt = dik + dk[j]
+                if alt < di[j]:
+                    di[j] = alt
+                    pi[j] = pk[j]
+        if dk[k] < 0:
+            raise _cycle_error(pk, k, verts)
+
+    flatdist = array.array("d")
+    flatpred = array.array("q")
+    for i in range(n):
+        flatdist.extend(dist[i])
+        flatpred.extend(pred[i])
+    return flatdist, flatpred
+
+
+def _floyd_warshall_numpy(n: int, edges: list[dict[int, float]], verts):
+    """
+    Floyd-Warshall, vectorized with NumPy: each step relaxes the whole matrix
+    through one intermediate vertex at once.
+    """
+    dist = numpy.full((n, n), numpy.inf)
+    pred = numpy.full((n, n), -1, dtype=numpy.int64)
+    for i, row in enumerate(edges):
+        if row:
+            cols = numpy.fromiter(
+                row.keys(), dtype=numpy.int64, count=len(row)
+            )
+            dist[i, cols] = numpy.fromiter(
+                row.values(), dtype=float, count=len(row)
+            )
+            pred[i, cols] = i
+    diag = numpy.arange(n)
+    positive = dist[diag, diag] > 0
+    dist[diag[positive], diag[positive]] = 0
+    pred[diag[positive], diag[positive]] = -1
+
+    for k in range(n):
+        alt = dist[:, k, None] + dist[None, k, :]
+        better = alt < dist
+        if better.any():
+            numpy.copyto(dist, alt, where=better)
+            numpy.copyto(
+                pred, numpy.broadcast_to(pred[k], (n, n)), where=better
+            )
+        if dist[k, k] < 0:
+            raise _cycle_error([int(p) for p in pred[k]], k, verts)
+
+    return dist.ravel(), pred.ravel()
+
+
+def _johnson(
+    n: int, edges: list[dict[int, float]], verts
+) -> tuple[array.array, array.array]:
+    """
+    Johnson's algorithm: reweight with Bellman-Ford (only if any weight is
+    negative), then run Dijkstra's algorithm from every vertex.
+    """
+    inf = float("inf")
+
+    # potentials making every edge non-negative; all zero if already so
+    h = [0.0] * n
+    if any(w < 0 for row in edges for w in row.values()):
+        # queue-based Bellman-Ford from a virtual vertex with a free edge to
+        # every vertex; starting with all of them queued at distance 0 has the
+        # same effect.  see shortestpath._sssp_base_bellman_ford for how
+        # negative cycles are spotted.
+        pred = [-1] * n
+        hops = [0] * n
+        queue = collections.deque(range(n))
+        queued = [True] * n
+        while queue:
+            u = queue.popleft()
+            queued[u] = False
+            hu = h[u]
+            for v, w in edges[u].items():
+                if hu + w < h[v]:
+                    h[v] = hu + w
+                    pred[v] = u
+                    hops[v] = hops[u] + 1
+                    if hops[v] >= n:
+                        # walk back n steps to be sure of landing on the cycle
+                        x = v
+                        for _ in range(n):
+                            x = pred[x]
+                            if x < 0:
+                                break
+                        if x >= 0:
+                            raise _cycle_error(pred, x, verts)
+                    if not queued[v]:
+                        queued[v] = True
+                        queue.append(v)
+
+    reweighted = [
+        [(j, w + h[i] - h[j]) for j, w in row.items()]
+        for i, row in enumerate(edges)
+    ]
+
+    flatdist = array.array("d", [inf]) * (n * n)
+    flatpred = array.array("q", [-1]) * (n * n)
+    for s in range(n):
+        dist = [inf] * n
+        pred = [-1] * n
+        done = bytearray(n)
+        dist[s] = 0
+        Q = [(0.0, s)]
+        while Q:
+            du, u = heapq.heappop(Q)
+            if done[u]:
+                continue
+            done[u] = 1
+            for v, w in reweighted[u]:
+                alt = du + w
+                if alt < dist[v]:
+                    dist[v] = alt
+                    pred[v] = u
+                    heapq.heappush(Q, (alt, v))
+
+        row = s * n
+        hs = h[s]
+        for j in range(n):
+            if done[j]:
+                flatdist[row + j] = dist[j] - hs + h[j]
+                flatpred[row + j] = pred[j]
+
+    return flatdist, flatpred
+
+
+def all_pairs_shortest_paths(
+    uni: Universe | CSRSnapshot,
+    *,
+    weightfunc: Callable | None = None,
+    weight: str | Callable[[Link], float] | None = None,
+    direction_sensitive: int = helpers.DIR_SENS_FORWARD,
+    unknown_handling: int = helpers.LNK_UNKNOWN_ERROR,
+    ff_via: Callable | None = None,
+    method: str = "johnson",
+    use_numpy: bool | None = None,
+) -> DistanceMatrix:
+    """
+    Find the shortest paths between every pair of vertices in a universe.
+
+    This function solves the all-pairs shortest path (APSP) problem, returning
+    a :py:class:`DistanceMatrix` of the distances between every two vertices,
+    from which the paths may be rebuilt as well.
+
+    Only the vertices of the universe, and the edges between them, are
+    considered.  Weighting and the other options shared with
+    :py:func:`~edgegraph.pathfinding.shortestpath.single_pair_shortest_path`
+    have the same meaning here; see its documentation for details.  Negative
+    weights are allowed.
+
+    .. note::
+
+       The result holds :math:`V^2` distances and predecessors, about 16
+       bytes for each pair; some 150 MB for 3,000 vertices.
+
+    :param uni: Universe (or
+       :py:class:`~edgegraph.structure.csr.CSRSnapshot`) to solve.
+    :param weightfunc: Weight of transiting between two vertices.
+    :param weight: Weight of each edge; an attribute name or edge callback.
+    :param direction_sensitive: Direction to follow edges in.
+    :param unknown_handling: What to do with edges of unknown type.
+    :param ff_via: Filter deciding which edges may be followed.
+    :param method: The algorithm to use:
+
+       * ``"johnson"``: Johnson's algorithm; best for sparse graphs.
+         (**default**)
+       * ``"floyd-warshall"``: the Floyd-Warshall algorithm; best for dense
+         graphs, especially with NumPy installed.
+
+    :param use_numpy: Whether ``method="floyd-warshall"`` should use NumPy.
+       By default, it is used if installed.
+    :raises ValueError: if ``uni`` is ``None``, both ``weightfunc`` and
+       ``weight`` are given, or ``use_numpy=True`` is asked for without NumPy
+       installed.
+    :raises NegativeCycleError: if the graph has a negative-weight cycle.
+    :return: The distance matrix.
+    """
+    if uni is None:
+        raise ValueError("All-pairs shortest paths requires a universe!")
+    # pylint: disable-next=protected-access
+    weightfunc, edgeweight = shortestpath._weights(weightfunc, weight)
+    if use_numpy is None:
+        use_numpy = numpy is not None
+    elif use_numpy and (numpy is None):
+        raise ValueError("use_numpy=True, but NumPy is not installed!")
+
+    if metrics.ENABLED:
+        metrics.count(uni, "pathfinding.all_pairs_shortest_paths")
+
+    verts = tuple(uni.vertices)
+    n = len(verts)
+    # pylint: disable-next=protected-access
+    edges = shortestpath._edge_table(
+        uni,
+        verts,
+        weightfunc,
+        direction_sensitive=direction_sensitive,
+        ff_via=ff_via,
+        unknown_handling=unknown_handling,
+        edgeweight=edgeweight,
+    )
+
+    if method == "floyd-warshall":
+        if use_numpy:
+            dist, pred = _floyd_warshall_numpy(n, edges, verts)
+        else:
+            dist, pred = _floyd_warshall_python(n, edges, verts)
+    elif method == "johnson":
+        dist, pred = _johnson(n, edges, verts)
+    else:
+        raise NotImplementedError(f"method='{method}' is unrecognized")
+
+    return DistanceMatrix(verts, dist, pred)
@@ -0,0 +1,475 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Contraction hierarchies, for answering many shortest path queries on a graph
+that does not change.
+
+A contraction hierarchy is built once, by removing ("contracting") the
+vertices of a graph one at a time, least important first.  Whenever removing a
+vertex would break a shortest path running through it, a *shortcut* edge is
+added between its neighbors, standing in for the two edges it replaces.  Each
+vertex ends up with a rank (its place in the contraction order), and every
+shortest path in the graph then has a counterpart which only climbs in rank
+from the start, and only descends in rank to the destination.
+
+A query therefore runs two small Dijkstra searches, one forward from the start
+and one backward from the destination, each following only edges leading to
+higher-ranked vertices; they meet at the top of the path.  On road-like graphs
+each search settles a few hundred vertices at most, however large the graph.
+
+Build a hierarchy with
+:py:func:`~edgegraph.pathfinding.shortestpath.build_contraction_hierarchy`,
+then query the :py:class:`ContractionHierarchy` it returns.
+
+.. seealso::
+
+   :ref:`usage/algos/pathfinding`, :ref:`dev/performance/contraction`
+"""
+
+from __future__ import annotations
+
+import array
+import heapq
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from edgegraph.structure import Vertex, Universe, CSRSnapshot
+
+
+#: Most vertices a witness search may settle when building a hierarchy.  If
+#: it gives up early, a shortcut is added that may not have been needed; this
+#: costs query time, never correctness.
+WITNESS_SETTLE_LIMIT = 60
+
+
+def _witnesses(
+    out: list[dict[int, float]],
+    source: int,
+    skip: int,
+    limit: float,
+) -> dict[int, float]:
+    """
+    Search from ``source`` for paths avoiding ``skip``, no longer than
+    ``limit``; the "witnesses" that a shortcut through ``skip`` is not needed.
+
+    :return: Distances found (upper bounds, if the search gave up early).
+    """
+    dist = {source: 0.0}
+    Q = [(0.0, source)]
+    settled = 0
+    while Q:
+        du, u = heapq.heappop(Q)
+        if du > dist[u]:
+            continue
+        if du > limit:
+            break
+        settled += 1
+        if settled > WITNESS_SETTLE_LIMIT:
+            break
+        for v, w in out[u].items():
+            if v == skip:
+                continue
+            alt = du + w
+            if alt < dist.get(v, float("inf")):
+                dist[v] = alt
+                heapq.heappush(Q, (alt, v))
+    return dist
+
+
+def _shortcuts(
+    out: list[dict[int, float]],
+    into: list[dict[int, float]],
+    v: int,
+) -> list[tuple[int, int, float]]:
+    """
+    Find the shortcuts needed to contract ``v``.
+
+    :return: ``(u, x, weight)`` three-tuples; a shortcut is needed from ``u``
+       to ``x``, of the given weight.
+    """
+    needed = []
+    for u, wu in into[v].items():
+        targets = [(x, wu + wx) for x, wx in out[v].items() if x != u]
+        if not targets:
+            continue
+        found = _witnesses(out, u, v, max(w for _, w in targets))
+        for x, w in targets:
+            if found.get(x, float("inf")) > w:
+                needed.append((u, x, w))
+    return needed
+
+
+def _contract(
+    edges: list[dict[int, float]],
+) -> tuple[array.array, list[list], list[list]]:
+    """
+    Contract every vertex of a graph, least important first.
+
+    Importance is guessed by the usual "edge difference" (shortcuts added less
+    edges removed), plus the number of neighbors already contracted, which
+    spreads the contraction evenly over the graph.  Guesses go stale as the
+    graph changes; each is checked again when it comes up, and put back if no
+    longer the lowest.
+
+    :param edges: For each vertex, a dictionary of the (non-negative) weight
+       to each neighbor.
+    :return: Three-tuple of the rank of each vertex, and for each vertex its
+       upward arcs out and its upward arcs in, as ``(neighbor, weight, middle
+       vertex or -1)`` three-tuples.
+    """
+    n = len(edges)
+    # loops never shorten a path, and contraction must not see them
+    out = [
+        {x: w for x, w in row.items() if x != u} for u, row in enumerate(edges)
+    ]
+    into: list[dict[int, float]] = [{} for _ in range(n)]
+    for u, row in enumerate(out):
+        for x, w in row.items():
+            into[x][u] = w
+    # middle vertex of each shortcut
+    mid: dict[tuple[int, int], int] = {}
+
+    deleted = [0] * n
+
+    def importance(v):
+        needed = _shortcuts(out, into, v)
+        removed = len(out[v]) + len(into[v])
+        return 2 * (len(needed) - removed) + deleted[v], needed
+
+    Q = [(importance(v)[0], v) for v in range(n)]
+    heapq.heapify(Q)
+
+    rank = array.array("q", [0]) * n
+    up_out: list[list] = [[] for _ in range(n)]
+    up_in: list[list] = [[] for _ in range(n)]
+    order = 0
+    while Q:
+        _, v = heapq.heappop(Q)
+        prio, needed = importance(v)
+        if Q and prio > Q[0][0]:
+            heapq.heappush(Q, (prio, v))
+            continue
+
+        rank[v] = order
+        order += 1
+
+        # all remaining neighbors are contracted later, so rank higher
+        up_out[v] = [(x, w, mid.get((v, x), -1)) for x, w in out[v].items()]
+        up_in[v] = [(u, w, mid.get((u, v), -1)) for u, w in into[v].items()]
+
+        for u, x, w in needed:
+            if w < out[u].get(x, float("inf")):
+                out[u][x] = w
+                into[x][u] = w
+                mid[(u, x)] = v
+
+        for x in out[v]:
+            del into[x][v]
+            deleted[x] += 1
+        for u in into[v]:
+            del out[u][v]
+            deleted[u] += 1
+        out[v] = {}
+        into[v] = {}
+
+    return rank, up_out, up_in
+
+
+def _csr(rows: list[list]) -> tuple[array.array, ...]:
+    """
+    Pack lists of ``(neighbor, weight, middle)`` arcs into flat arrays.
+
+    :return: Four-tuple of the offsets of each row, and the neighbors,
+       weights, and middle vertices of the arcs.
+    """
+    offsets = array.array("q", [0])
+    targets = array.array("q")
+    weights = array.array("d")
+    mids = array.array("q")
+    for row in rows:
+        for x, w, m in row:
+            targets.append(x)
+            weights.append(w)
+            mids.append(m)
+        offsets.append(len(targets))
+    return offsets, targets, weights, mids
+
+
+class ContractionHierarchy(object):
+    """
+    Preprocessed graph answering shortest path queries quickly.
+
+    Build one with
+    :py:func:`~edgegraph.pathfinding.shortestpath.build_contraction_hierarchy`.
+    The graph it was built from may not change afterwards -- or rather, the
+    hierarchy will not notice if it does.
+
+    >>> ch = shortestpath.build_contraction_hierarchy(uni, weight="cost")
+    >>> ch.shortest_path(v1, v4)
+    ([v1, v2, v3, v4], 3.0)
+    >>> ch.distance(v1, v4)
+    3.0
+
+    The hierarchy may be pickled, and is then stored without the graph; only
+    the UIDs of its vertices are kept.  Once unpickled (say, by a worker
+    process), attach it to a copy of the graph with :py:meth:`bind` to have
+    paths given as vertices; until then, they are given as UIDs.
+
+    >>> data = pickle.dumps(ch)
+    >>> # ... elsewhere
+    >>> ch = pickle.loads(data).bind(uni)
+    """
+
+    __slots__ = (
+        "_uids",
+        "_index",
+        "_verts",
+        "_rank",
+        "_up",
+        "_down",
+    )
+
+    def __init__(
+        self,
+        verts: tuple[Vertex, ...],
+        edges: list[dict[int, float]],
+    ):
+        """
+        Contract a graph.  **Mostly for internal use**; use the builder in
+        :py:mod:`~edgegraph.pathfinding.shortestpath` instead.
+
+        :param verts: The vertices, numbered by their position.
+        :param edges: For each vertex, a dictionary of the weight to each
+           neighbor (by number).
+        :raises ValueError: If any weight is negative.
+        """
+        if any(w < 0 for row in edges for w in row.values()):
+            raise ValueError(
+                "Contraction hierarchies cannot have negative edge weights!"
+            )
+
+        rank, up_out, up_in = _contract(edges)
+
+        #: UID of each vertex
+        self._uids = tuple(v.uid for v in verts)
+
+        #: Number of each vertex, by UID
+        self._index = {uid: i for i, uid in enumerate(self._uids)}
+
+        #: The vertices, if bound to a graph
+        self._verts: tuple[Vertex, ...] | None = tuple(verts)
+
+        #: Rank of each vertex
+        self._rank = rank
+
+        #: Upward arcs out of each vertex, packed by :py:func:`_csr`
+        self._up = _csr(up_out)
+
+        #: Upward arcs into each vertex, packed by :py:func:`_csr`
+        self._down = _csr(up_in)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Called when pickling; drop the vertices, leaving their UIDs.
+        """
+        return {
+            "uids": self._uids,
+            "rank": self._rank,
+            "up": self._up,
+            "down": self._down,
+        }
+
+    def __setstate__(self, state: dict[str, Any]):
+        """
+        Called when unpickling; the hierarchy is left unbound.
+        """
+        self._uids = state["uids"]
+        self._index = {uid: i for i, uid in enumerate(self._uids)}
+        self._verts = None
+        self._rank = state["rank"]
+        self._up = state["up"]
+        self._down = state["down"]
+
+    def __len__(self) -> int:
+        """
+        Called by :py:`len(ch)`; the number of vertices.
+        """
+        return len(self._uids)
+
+    @property
+    def shortcuts(self) -> int:
+        """
+        Return the number of arcs in the hierarchy, shortcuts and original
+        edges together.
+        """
+        return len(self._up[1]) + len(self._down[1])
+
+    def bind(self, uni: Universe | CSRSnapshot) -> ContractionHierarchy:
+        """
+        Attach the hierarchy to (a copy of) the graph it was built from, so
+        paths may be given as vertices.
+
+        :param uni: Universe holding a vertex of every UID in the hierarchy.
+        :raises KeyError: If a vertex is missing.
+        :return: The hierarchy itself.
+        """
+        byuid = {v.uid: v for v in uni.vertices}
+        self._verts = tuple(byuid[uid] for uid in self._uids)
+        return self
+
+    def _search(self, s: int, t: int) -> tuple[float, list[int]]:
+        """
+        Run the two upward searches.
+
+        :return: Two-tuple of the distance (infinite if there is no path), and
+           the (still contracted) path as vertex numbers.
+        """
+        inf = float("inf")
+        # each side searches over its own arcs, and checks for stalling over
+        # the other's (see below)
+        sides = (
+            (self._up, self._down, {s: 0.0}, {s: -1}, [(0.0, s)]),
+            (self._down, self._up, {t: 0.0}, {t: -1}, [(0.0, t)]),
+        )
+        fwd, bwd = sides[0][2], sides[1][2]
+        best = inf
+        meet = -1
+
+        while True:
+            # step whichever side has the nearer vertex to settle; once both
+            # are as far as the best path found, it cannot be bettered
+            qf, qb = sides[0][4], sides[1][4]
+            kf = qf[0][0] if qf else inf
+            kb = qb[0][0] if qb else inf
+            if min(kf, kb) >= best:
+                break
+            arcs, stall, dist, prev, Q = sides[0 if kf <= kb else 1]
+            other = bwd if kf <= kb else fwd
+
+            du, u = heapq.heappop(Q)
+            if du > dist[u]:
+                continue
+            if u in other and du + other[u] < best:
+                best = du + other[u]
+                meet = u
+
+            # "stall on demand": if a higher-ranked vertex already reached
+            # has a cheaper way down to u, this search reached u the long way
+            # round, and going on from u is wasted work
+            offsets, targets, weights, _ = stall
+            if any(
+                dist.get(targets[k], inf) + weights[k] < du
+                for k in range(offsets[u], offsets[u + 1])
+            ):
+                continue
+
+            offsets, targets, weights, _ = arcs
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                alt = du + weights[k]
+                if alt < dist.get(v, inf):
+                    dist[v] = alt
+                    prev[v] = u
+                    heapq.heappush(Q, (alt, v))
+
+        if meet < 0:
+            return inf, []
+
+        # climb from the start to the meeting vertex, then descend
+        path = []
+        u = meet
+        while u >= 0:
+            path.append(u)
+            u = sides[0][3][u]
+        path.reverse()
+        u = sides[1][3][meet]
+        while u >= 0:
+            path.append(u)
+            u = sides[1][3][u]
+        return best, path
+
+    def _middle(self, a: int, b: int) -> int:
+        """
+        Get the vertex a shortcut from ``a`` to ``b`` skips, or -1 if the arc
+        is an original edge.
+        """
+        if self._rank[a] < self._rank[b]:
+            offsets, targets, _, mids = self._up
+            u, v = a, b
+        else:
+            offsets, targets, _, mids = self._down
+            u, v = b, a
+        for k in range(offsets[u], offsets[u + 1]):
+            if targets[k] == v:
+                return mids[k]
+        raise AssertionError("arc not in hierarchy")  # pragma: no cover
+
+    def _unpack(self, path: list[int]) -> list[int]:
+        """
+        Replace every shortcut in a path by the edges it stands for.
+        """
+        out = [path[0]]
+        for a, b in zip(path, path[1:]):
+            stack = [(a, b)]
+            while stack:
+                a, b = stack.pop()
+                m = self._middle(a, b)
+                if m < 0:
+                    out.append(b)
+                else:
+                    stack.append((m, b))
+                    stack.append((a, m))
+        return out
+
+    def _number(self, vert: Vertex) -> int:
+        """
+        Get the number of a vertex.
+
+        :raises KeyError: If the vertex is not in the hierarchy.
+        """
+        return self._index[vert.uid]
+
+    def distance(self, start: Vertex, dest: Vertex) -> float | None:
+        """
+        Get the shortest distance between two vertices.
+
+        :raises KeyError: If either vertex is not in the hierarchy.
+        :return: The distance, or ``None`` if there is no path.
+        """
+        s, t = self._number(start), self._number(dest)
+        if s == t:
+            return 0
+        dist, _ = self._search(s, t)
+        if dist == float("inf"):
+            return None
+        return dist
+
+    def shortest_path(
+        self, start: Vertex, dest: Vertex
+    ) -> tuple[list[Any] | None, float | None]:
+        """
+        Find the shortest path between two vertices.
+
+        The result is exactly as from
+        :py:func:`~edgegraph.pathfinding.shortestpath.single_pair_shortest_path`
+        (including ``[start, start], 0`` when the two are the same), so a
+        hierarchy may stand in for it.
+
+        :raises KeyError: If either vertex is not in the hierarchy.
+        :return: Two-tuple of the path (vertices, or their UIDs if the
+           hierarchy is not bound), and its distance; both ``None`` if there
+           is no path.
+        """
+        s, t = self._number(start), self._number(dest)
+        if s == t:
+            path = [s, s]
+            dist = 0
+        else:
+            dist, path = self._search(s, t)
+            if not path:
+                return None, None
+            path = self._unpack(path)
+
+        lookup = self._verts if self._verts is not None else self._uids
+        return [lookup[i] for i in path], dist
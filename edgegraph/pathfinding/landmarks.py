@@ -0,0 +1,329 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Landmark distance oracles, for goal-directed search without coordinates.
+
+An A* search needs a *lower bound* on the distance left to the destination.
+Where vertices have coordinates, the straight-line distance serves; where they
+do not, landmarks can.  A handful of vertices are picked as landmarks, and the
+distances from (and to) each of them to every vertex are worked out once.  By
+the triangle inequality, for any landmark :math:`L`:
+
+.. math::
+
+   d(u, t) \\ge d(L, t) - d(L, u) \\qquad d(u, t) \\ge d(u, L) - d(t, L)
+
+so the greatest of these over all landmarks bounds the distance from below.
+Likewise, :math:`d(u, L) + d(L, t)` bounds it from above.  This is known as
+the ALT (A*, landmarks, triangle inequality) technique.
+
+Build an oracle with :py:func:`build_landmarks`; the
+:py:class:`LandmarkOracle` it returns may be passed straight to
+:py:func:`~edgegraph.pathfinding.shortestpath.single_pair_shortest_path` as
+the ``heuristic`` of ``method="astar"``, or asked for bounds on distances
+directly.
+
+.. seealso::
+
+   :ref:`usage/algos/pathfinding`, :ref:`dev/performance/landmarks`
+"""
+
+from __future__ import annotations
+
+import array
+import heapq
+import random
+from typing import TYPE_CHECKING
+from collections.abc import Callable, Iterable
+
+from edgegraph import metrics
+from edgegraph.traversal import helpers
+from edgegraph.pathfinding import shortestpath
+
+if TYPE_CHECKING:
+    from edgegraph.structure import Vertex, Universe, Link, CSRSnapshot
+
+
+#: Strategies accepted by :py:func:`build_landmarks`
+STRATEGIES = [
+    "farthest",
+    "random",
+]
+
+
+def _distances(edges: list[dict[int, float]], source: int) -> array.array:
+    """
+    Dijkstra's algorithm over an edge table, from one vertex to all.
+
+    :return: Distance to each vertex (infinite where unreachable).
+    """
+    dist = array.array("d", [float("inf")]) * len(edges)
+    dist[source] = 0
+    Q = [(0.0, source)]
+    while Q:
+        du, u = heapq.heappop(Q)
+        if du > dist[u]:
+            continue
+        for v, w in edges[u].items():
+            alt = du + w
+            if alt < dist[v]:
+                dist[v] = alt
+                heapq.heappush(Q, (alt, v))
+    return dist
+
+
+class LandmarkOracle(object):
+    """
+    Distances from and to a few landmark vertices, bounding the distances
+    between all others.
+
+    Build one with :py:func:`build_landmarks`.  The oracle is callable as an
+    A* heuristic, giving the lower bound:
+
+    >>> oracle = build_landmarks(uni, 8, weight="cost")
+    >>> shortestpath.single_pair_shortest_path(
+    ...     uni, start, dest, weight="cost", method="astar", heuristic=oracle
+    ... )
+
+    It also answers approximate distance queries on its own, without any
+    search, with :py:meth:`bounds` and :py:meth:`estimate`.
+    """
+
+    __slots__ = ("_verts", "_index", "_landmarks", "_from", "_to")
+
+    def __init__(
+        self,
+        verts: tuple[Vertex, ...],
+        landmarks: list[int],
+        dist_from: list[array.array],
+        dist_to: list[array.array],
+    ):
+        """
+        Wrap precomputed distances.  **Mostly for internal use**; see
+        :py:func:`build_landmarks`.
+
+        :param verts: The vertices, numbered by their position.
+        :param landmarks: Number of each landmark.
+        :param dist_from: For each landmark, the distance from it to each
+           vertex.
+        :param dist_to: For each landmark, the distance from each vertex to it.
+        """
+
+        #: The vertices, in number order
+        self._verts = verts
+
+        #: Number of each vertex
+        self._index = {v: i for i, v in enumerate(verts)}
+
+        #: Number of each landmark
+        self._landmarks = landmarks
+
+        #: Distances from each landmark
+        self._from = dist_from
+
+        #: Distances to each landmark
+        self._to = dist_to
+
+    @property
+    def landmarks(self) -> list[Vertex]:
+        """
+        Return the landmark vertices.
+        """
+        return [self._verts[i] for i in self._landmarks]
+
+    def __len__(self) -> int:
+        """
+        Called by :py:`len(oracle)`; the number of landmarks.
+        """
+        return len(self._landmarks)
+
+    def _lower(self, u: int, t: int) -> float:
+        """
+        Lower bound on the distance between two vertex numbers.
+        """
+        inf = float("inf")
+        best = 0.0
+        for dfrom, dto in zip(self._from, self._to):
+            # an infinite distance to the nearer end tells nothing; to the
+            # further end, that there is no path at all
+            lu, lt = dfrom[u], dfrom[t]
+            if lu != inf:
+                if lt - lu > best:
+                    best = lt - lu
+            ul, tl = dto[u], dto[t]
+            if tl != inf:
+                if ul - tl > best:
+                    best = ul - tl
+        return best
+
+    def __call__(self, v: Vertex, dest: Vertex) -> float:
+        """
+        Called by :py:`oracle(v, dest)`; a lower bound on the distance from
+        ``v`` to ``dest``, for use as an A* ``heuristic``.
+
+        Vertices unknown to the oracle are given a bound of zero, which is
+        always safe.
+        """
+        u = self._index.get(v)
+        t = self._index.get(dest)
+        if u is None or t is None:
+            return 0
+        return self._lower(u, t)
+
+    def bounds(self, u: Vertex, v: Vertex) -> tuple[float, float]:
+        """
+        Bound the shortest distance from ``u`` to ``v``.
+
+        :raises KeyError: If either vertex is unknown to the oracle.
+        :return: Two-tuple of the lower and upper bounds.  The lower bound is
+           infinite if the landmarks show there is no path; the upper bound is
+           infinite if no landmark lies on a path between the two.
+        """
+        i, j = self._index[u], self._index[v]
+        if i == j:
+            return 0.0, 0.0
+        upper = min(
+            (dto[i] + dfrom[j] for dfrom, dto in zip(self._from, self._to)),
+            default=float("inf"),
+        )
+        return self._lower(i, j), upper
+
+    def estimate(self, u: Vertex, v: Vertex) -> float | None:
+        """
+        Estimate the shortest distance from ``u`` to ``v``, by the shortest
+        route via any landmark.
+
+        This is never less than the true distance, and is exact when a
+        landmark lies on a shortest path.  The more landmarks, and the more
+        central, the better the estimate.
+
+        :raises KeyError: If either vertex is unknown to the oracle.
+        :return: The estimate, or ``None`` if no landmark lies on any path
+           between the two.
+        """
+        upper = self.bounds(u, v)[1]
+        if upper == float("inf"):
+            return None
+        return upper
+
+
+def build_landmarks(
+    uni: Universe | CSRSnapshot,
+    k: int = 8,
+    *,
+    weightfunc: Callable | None = None,
+    weight: str | Callable[[Link], float] | None = None,
+    direction_sensitive: int = helpers.DIR_SENS_FORWARD,
+    unknown_handling: int = helpers.LNK_UNKNOWN_ERROR,
+    ff_via: Callable | None = None,
+    strategy: str = "farthest",
+    landmarks: Iterable[Vertex] | None = None,
+    seed: int | None = None,
+) -> LandmarkOracle:
+    """
+    Pick landmarks in a universe, and work out the distances from and to them.
+
+    Each landmark costs two runs of Dijkstra's algorithm over the whole graph
+    (one if ``direction_sensitive`` is
+    :py:const:`~edgegraph.traversal.helpers.DIR_SENS_ANY`), and two floats per
+    vertex of memory.  A few landmarks (8 to 16) are usually plenty.
+
+    Landmarks at the edges of the graph give the best bounds.  The default
+    ``"farthest"`` strategy finds them greedily: it starts from a random
+    vertex, then repeatedly picks whichever vertex is farthest from all the
+    landmarks so far (preferring any not reachable from them at all).
+
+    All of the arguments shared with
+    :py:func:`~edgegraph.pathfinding.shortestpath.single_pair_shortest_path`
+    have the same meaning here; see its documentation for details.  The
+    oracle's bounds only hold for searches made with the same options.
+
+    :param uni: Universe (or
+       :py:class:`~edgegraph.structure.csr.CSRSnapshot`) to work over.
+    :param k: How many landmarks to pick.
+    :param weightfunc: Weight of transiting between two vertices.
+    :param weight: Weight of each edge; an attribute name or edge callback.
+    :param direction_sensitive: Direction to follow edges in.
+    :param unknown_handling: What to do with edges of unknown type.
+    :param ff_via: Filter deciding which edges may be followed.
+    :param strategy: How to pick the landmarks; ``"farthest"`` (**default**)
+       or ``"random"``.
+    :param landmarks: The landmarks to use, instead of picking them; ``k``
+       and ``strategy`` are then ignored.
+    :param seed: Seed for the random choices of either strategy.
+    :raises ValueError: if ``uni`` is ``None``, both ``weightfunc`` and
+       ``weight`` are given, any edge weight is negative, or ``strategy`` is
+       not known.
+    :raises KeyError: If a given landmark is not in the universe.
+    :return: The oracle.
+    """
+    if uni is None:
+        raise ValueError("Landmarks require a universe!")
+    if strategy not in STRATEGIES:
+        raise ValueError(f"strategy='{strategy}' is unrecognized")
+    # pylint: disable-next=protected-access
+    weightfunc, edgeweight = shortestpath._weights(weightfunc, weight)
+
+    if metrics.ENABLED:
+        metrics.count(uni, "pathfinding.build_landmarks")
+
+    verts = tuple(uni.vertices)
+    n = len(verts)
+    # pylint: disable-next=protected-access
+    edges = shortestpath._edge_table(
+        uni,
+        verts,
+        weightfunc,
+        direction_sensitive=direction_sensitive,
+        ff_via=ff_via,
+        unknown_handling=unknown_handling,
+        edgeweight=edgeweight,
+    )
+    if any(w < 0 for row in edges for w in row.values()):
+        raise ValueError("Landmarks cannot have negative edge weights!")
+
+    if direction_sensitive == helpers.DIR_SENS_ANY:
+        # edges run both ways, so distances to a vertex equal those from it
+        reverse = None
+    else:
+        reverse = [{} for _ in range(n)]
+        for u, row in enumerate(edges):
+            for v, w in row.items():
+                reverse[v][u] = w
+
+    rng = random.Random(seed)
+    chosen: list[int] = []
+    dist_from: list[array.array] = []
+    dist_to: list[array.array] = []
+
+    def add(i):
+        chosen.append(i)
+        dist_from.append(_distances(edges, i))
+        dist_to.append(
+            dist_from[-1] if reverse is None else _distances(reverse, i)
+        )
+
+    if landmarks is not None:
+        index = {v: i for i, v in enumerate(verts)}
+        for vert in landmarks:
+            add(index[vert])
+    elif strategy == "random":
+        for i in rng.sample(range(n), min(k, n)):
+            add(i)
+    elif n:
+        # nearest landmark to each vertex, either way round; unreachable
+        # vertices (infinitely far) are picked first
+        near = [float("inf")] * n
+        i = rng.randrange(n)
+        while len(chosen) < min(k, n):
+            add(i)
+            near[i] = -1.0
+            dfrom, dto = dist_from[-1], dist_to[-1]
+            for j in range(n):
+                d = min(dfrom[j], dto[j])
+                if d < near[j]:
+                    near[j] = d
+            i = max(range(n), key=near.__getitem__)
+
+    return LandmarkOracle(verts, chosen, dist_from, dist_to)
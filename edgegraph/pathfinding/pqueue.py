@@ -0,0 +1,353 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Priority queues for the shortest path solvers.
+
+Dijkstra's algorithm spends much of its time in its priority queue.  Which
+queue is best depends on the graph; this module offers several, all with the
+same small interface, selected with the ``queue`` option of
+:py:func:`~edgegraph.pathfinding.shortestpath.single_pair_shortest_path` and
+:py:func:`~edgegraph.pathfinding.shortestpath.single_source_shortest_paths`:
+
+* :py:class:`BinaryHeap` (``"binary"``): a binary heap (:py:mod:`heapq`) with
+  lazy deletion.  Lowering an item's priority adds a second entry for it, and
+  the stale entry is skipped when it comes up.  Simple and fast, but on dense
+  graphs the heap may hold many stale entries.
+* :py:class:`DaryHeap` (``"dary"``): an indexed d-ary heap, which lowers an
+  item's priority in place (decrease-key).  It never holds more than one entry
+  per item.
+* :py:class:`BucketQueue` (``"bucket"``): an array of buckets, one per integer
+  priority (Dial's algorithm).  Pushing and popping take constant time, but
+  priorities must be non-negative integers, and it suits only graphs whose
+  distances are small.
+
+Any other class (or callable) taking no arguments and returning an object with
+this interface may be given instead:
+
+.. py:method:: push(item, priority)
+   :noindex:
+
+   Add ``item`` with the given priority, or, if it is already queued, lower
+   its priority to that given.  Priorities are never raised.
+
+.. py:method:: pop()
+   :noindex:
+
+   Remove and return the item with the lowest priority, as a
+   ``(priority, item)`` two-tuple.  Of items with equal priority, any may be
+   given.  An item is never given more than once per push.
+
+.. py:method:: __len__()
+   :noindex:
+
+   The number of items queued.  (Not necessarily the number of entries held.)
+
+.. py:attribute:: peak
+   :noindex:
+
+   The most entries held at once, stale ones included; a measure of the
+   queue's memory use.
+
+.. seealso::
+
+   :ref:`dev/performance/pqueue`
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Callable, Hashable
+from typing import Any
+
+
+class BinaryHeap(object):
+    """
+    Binary heap priority queue, with lazy deletion.
+    """
+
+    __slots__ = ("_heap", "_prio", "_entry", "peak")
+
+    def __init__(self):
+        """
+        Create an empty queue.
+        """
+
+        #: Heap of ``(priority, entry number, item)`` entries.  The entry
+        #: number keeps equal priorities in insertion order, and saves
+        #: comparing the items themselves.
+        self._heap: list[tuple[Any, int, Hashable]] = []
+
+        #: Current priority of each queued item
+        self._prio: dict[Hashable, Any] = {}
+
+        #: Next entry number
+        self._entry = 0
+
+        #: Most entries held at once
+        self.peak = 0
+
+    def __len__(self) -> int:
+        """
+        Called by :py:`len(queue)`; the number of items queued.
+        """
+        return len(self._prio)
+
+    def push(self, item: Hashable, priority: Any) -> None:
+        """
+        Queue an item, or lower its priority.
+
+        :param item: Item to queue.
+        :param priority: Its (new) priority.
+        """
+        self._prio[item] = priority
+        heapq.heappush(self._heap, (priority, self._entry, item))
+        self._entry += 1
+        if len(self._heap) > self.peak:
+            self.peak = len(self._heap)
+
+    def pop(self) -> tuple[Any, Hashable]:
+        """
+        Take the item with the lowest priority.
+
+        :raises IndexError: If the queue is empty.
+        :return: Two-tuple of its priority and the item.
+        """
+        heap = self._heap
+        prio = self._prio
+        while True:
+            priority, _, item = heapq.heappop(heap)
+            # skip entries superseded by a later push of a lower priority
+            if (item in prio) and (prio[item] == priority):
+                del prio[item]
+                return priority, item
+
+
+class DaryHeap(object):
+    """
+    Indexed d-ary heap priority queue, with decrease-key.
+
+    Each item has at most one entry, and lowering its priority moves that
+    entry up the heap.  Higher arities make the heap shallower, so pushes and
+    decreases (which are more common than pops in Dijkstra's algorithm) do
+    less work, at the cost of more comparisons per pop.
+    """
+
+    __slots__ = ("_d", "_items", "_keys", "_pos", "peak")
+
+    def __init__(self, d: int = 4):
+        """
+        Create an empty queue.
+
+        :param d: Arity (children per node) of the heap; at least 2.
+        :raises ValueError: If ``d`` is less than 2.
+        """
+        if d < 2:
+            raise ValueError(f"Heap arity must be at least 2, not {d}")
+
+        #: Arity of the heap
+        self._d = d
+
+        #: Items, in heap order
+        self._items: list[Hashable] = []
+
+        #: Priorities, parallel to :py:attr:`_items`
+        self._keys: list[Any] = []
+
+        #: Position of each item in :py:attr:`_items`
+        self._pos: dict[Hashable, int] = {}
+
+        #: Most entries held at once
+        self.peak = 0
+
+    def __len__(self) -> int:
+        """
+        Called by :py:`len(queue)`; the number of items queued.
+        """
+        return len(self._items)
+
+    def push(self, item: Hashable, priority: Any) -> None:
+        """
+        Queue an item, or lower its priority.
+
+        :param item: Item to queue.
+        :param priority: Its (new) priority.
+        """
+        i = self._pos.get(item)
+        if i is None:
+            i = len(self._items)
+            self._items.append(item)
+            self._keys.append(priority)
+            if i >= self.peak:
+                self.peak = i + 1
+        elif priority < self._keys[i]:
+            self._keys[i] = priority
+        else:
+            return
+        self._sift_up(i, item, priority)
+
+    def pop(self) -> tuple[Any, Hashable]:
+        """
+        Take the item with the lowest priority.
+
+        :raises IndexError: If the queue is empty.
+        :return: Two-tuple of its priority and the item.
+        """
+        items = self._items
+        keys = self._keys
+        top = (keys[0], items[0])
+        del self._pos[items[0]]
+
+        item = items.pop()
+        priority = keys.pop()
+        if items:
+            self._sift_down(0, item, priority)
+        return top
+
+    def _sift_up(self, i: int, item: Hashable, priority: Any) -> None:
+        """
+        Move the entry at ``i`` up to its place.
+        """
+        items = self._items
+        keys = self._keys
+        pos = self._pos
+        d = self._d
+        while i > 0:
+            parent = (i - 1) // d
+            if not priority < keys[parent]:
+                break
+            items[i] = items[parent]
+            keys[i] = keys[parent]
+            pos[items[i]] = i
+            i = parent
+        items[i] = item
+        keys[i] = priority
+        pos[item] = i
+
+    def _sift_down(self, i: int, item: Hashable, priority: Any) -> None:
+        """
+        Place an entry at ``i`` (the root's old place), and move it down to its
+        place.
+        """
+        items = self._items
+        keys = self._keys
+        pos = self._pos
+        d = self._d
+        n = len(items)
+        while True:
+            first = i * d + 1
+            if first >= n:
+                break
+            # the lowest of the children
+            best = first
+            for c in range(first + 1, min(first + d, n)):
+                if keys[c] < keys[best]:
+                    best = c
+            if not keys[best] < priority:
+                break
+            items[i] = items[best]
+            keys[i] = keys[best]
+            pos[items[i]] = i
+            i = best
+        items[i] = item
+        keys[i] = priority
+        pos[item] = i
+
+
+class BucketQueue(object):
+    """
+    Bucket priority queue, for small non-negative integer priorities.
+
+    Items are kept in one bucket per priority, and the queue steps through the
+    buckets in order as they empty.  This relies on the popped priorities
+    never going down, as is the case in Dijkstra's algorithm: no item may be
+    pushed with a lower priority than the last one popped.  Lowering an item's
+    priority leaves a stale entry in its old bucket, skipped when reached.
+    """
+
+    __slots__ = ("_buckets", "_prio", "_cursor", "_size", "peak")
+
+    def __init__(self):
+        """
+        Create an empty queue.
+        """
+
+        #: Items of each priority
+        self._buckets: list[list[Hashable]] = []
+
+        #: Current priority of each queued item
+        self._prio: dict[Hashable, int] = {}
+
+        #: Lowest priority any item may have
+        self._cursor = 0
+
+        #: Entries held, stale ones included
+        self._size = 0
+
+        #: Most entries held at once
+        self.peak = 0
+
+    def __len__(self) -> int:
+        """
+        Called by :py:`len(queue)`; the number of items queued.
+        """
+        return len(self._prio)
+
+    def push(self, item: Hashable, priority: int) -> None:
+        """
+        Queue an item, or lower its priority.
+
+        :param item: Item to queue.
+        :param priority: Its (new) priority.
+        :raises ValueError: If the priority is not an integer, or is lower
+           than that of the last item popped.
+        """
+        if priority != int(priority) or priority < self._cursor:
+            raise ValueError(
+                "BucketQueue priorities must be integers, no lower than the "
+                f"last popped ({self._cursor}), not {priority}"
+            )
+        priority = int(priority)
+
+        buckets = self._buckets
+        if priority >= len(buckets):
+            buckets.extend([] for _ in range(priority + 1 - len(buckets)))
+        buckets[priority].append(item)
+        self._prio[item] = priority
+
+        self._size += 1
+        if self._size > self.peak:
+            self.peak = self._size
+
+    def pop(self) -> tuple[int, Hashable]:
+        """
+        Take the item with the lowest priority.
+
+        :raises IndexError: If the queue is empty.
+        :return: Two-tuple of its priority and the item.
+        """
+        if not self._prio:
+            raise IndexError("pop from an empty BucketQueue")
+
+        buckets = self._buckets
+        prio = self._prio
+        cursor = self._cursor
+        while True:
+            bucket = buckets[cursor]
+            while bucket:
+                item = bucket.pop()
+                self._size -= 1
+                # skip entries superseded by a later push of a lower priority
+                if prio.get(item) == cursor:
+                    del prio[item]
+                    self._cursor = cursor
+                    return cursor, item
+            cursor += 1
+
+
+#: Queues selectable by name
+QUEUES: dict[str, Callable[[], Any]] = {
+    "binary": BinaryHeap,
+    "dary": DaryHeap,
+    "bucket": BucketQueue,
+}
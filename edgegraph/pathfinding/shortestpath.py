@@ -8,9 +8,12 @@ This module provides functions to solve the shortest path problem and its
 variants:
 
 * Single pair shortest path; the shortest path between a known start and
-  destination vertex
-
-... and at this time, that's all that's implemented!  More to come soon!
+  destination vertex (:py:func:`single_pair_shortest_path`)
+* Single source shortest paths; the shortest paths from a known start (or
+  several) to every vertex reachable from it
+  (:py:func:`single_source_shortest_paths`)
+* Many single pair queries on a graph that does not change, answered from a
+  preprocessed contraction hierarchy (:py:func:`build_contraction_hierarchy`)
 
 .. seealso::
 
@@ -20,35 +23,87 @@ variants:
 
 from __future__ import annotations
 
+import collections
 import heapq
-from typing import TYPE_CHECKING
-from collections.abc import Callable
-
+import operator
+import types
+from typing import TYPE_CHECKING, Any
+from collections.abc import Callable, Iterable, Iterator, Mapping
+
+from edgegraph import metrics
+from edgegraph.structure import CSRSnapshot
+from edgegraph.structure.vertex import VertexCore
 from edgegraph.traversal import helpers
+from edgegraph.pathfinding import pqueue, contraction
 
 if TYPE_CHECKING:
-    from edgegraph.structure import Vertex, Universe
+    from edgegraph.structure import Vertex, Universe, Link
 
 
 METHODS = [
     "dijkstra",
+    "astar",
+    "bidirectional",
+    "bellman-ford",
 ]
 
 
+class NegativeCycleError(ValueError):
+    """
+    Raised when a cycle of negative total weight makes shortest paths
+    meaningless; around such a cycle, every path can be made shorter still.
+    """
+
+    def __init__(self, cycle: list[Vertex]):
+        """
+        :param cycle: The vertices of the cycle, in the order its edges are
+           followed, with the first repeated at the end.
+        """
+        super().__init__(
+            f"Graph contains a negative-weight cycle of {len(cycle) - 1} "
+            "edge(s)"
+        )
+
+        #: The vertices of the cycle, in order, the first repeated at the end
+        self.cycle = cycle
+
+
+def _sources(
+    start: Vertex | Iterable[Vertex] | Mapping[Vertex, float] | None,
+) -> dict[Vertex, float]:
+    """
+    Normalize the ``start`` option of the solvers into the initial distance of
+    each vertex to start from.
+
+    A single vertex, or each of an iterable of them, starts at distance zero;
+    a mapping gives the distances itself.
+
+    :raises ValueError: If ``start`` is ``None``.
+    """
+    if start is None:
+        raise ValueError("Cannot begin path searching with start=None!")
+    if isinstance(start, VertexCore):
+        return {start: 0}
+    if isinstance(start, Mapping):
+        return dict(start)
+    return dict.fromkeys(start, 0)
+
+
 def _init_single_source(
-    start: Vertex,
+    sources: Mapping[Vertex, float],
 ) -> tuple[dict[Vertex, float], dict[Vertex, Vertex | None]]:
     """
     INITIALIZE-SINGLE-SOURCE() subroutine.
 
     Purely a convienence function (and to keep linters from yelling about
-    duplicate code).
+    duplicate code).  Any number of sources may be given, each with its own
+    initial distance; a search from all of them at once is the same as one
+    from a single extra vertex, with an edge of that weight to each.
 
-    :param start: Starting vertex.
-    :return: Three-tuple of dictionaries, for ``dist[v]``, ``prev[v]``, and
-       ``weight[v]``.
+    :param sources: Initial distance of each starting vertex.
+    :return: Two-tuple of dictionaries, for ``dist[v]`` and ``prev[v]``.
     """
-    return {start: 0}, {start: None}
+    return dict(sources), dict.fromkeys(sources)
 
 
 def _relax(
@@ -80,14 +135,38 @@ def _relax(
         prev[v] = u
 
 
+def _edge_weight(
+    weight: str | Callable[[Link], float],
+) -> Callable[[Link], float]:
+    """
+    Turn the ``weight`` option of the solvers into a function of the link.
+
+    Attribute names become an :py:func:`operator.attrgetter`, which reads the
+    attribute without calling back into any Python-level function.
+
+    :param weight: Attribute name, or callable accepting a link.
+    :raises TypeError: If ``weight`` is neither.
+    :return: Callable accepting a link and returning its weight.
+    """
+    if isinstance(weight, str):
+        return operator.attrgetter(weight)
+    if callable(weight):
+        return weight
+    raise TypeError(
+        f"weight must be an attribute name or a callable, not {type(weight)}"
+    )
+
+
 def _sssp_base_dijkstra(
     uni: Universe,
-    start: Vertex,
+    sources: Mapping[Vertex, float],
     weightfunc: Callable,
     stop_at: Vertex | None = None,
     direction_sensitive: int = helpers.DIR_SENS_FORWARD,
     ff_via: Callable | None = None,
     unknown_handling: int = helpers.LNK_UNKNOWN_ERROR,
+    edgeweight: Callable[[Link], float] | None = None,
+    cutoff: float | None = None,
 ) -> tuple[dict[Vertex, float], dict[Vertex, Vertex | None]]:
     """
     Perform Dijkstra's algorithm to identify single-source shortest paths
@@ -95,9 +174,12 @@ def _sssp_base_dijkstra(
 
     As this is a private, internal function, the entire algorithm and options
     are not detailed here.  See single_pair_shortest_path() for more
-    information.
+    information.  If ``edgeweight`` is given, it is used (with the links
+    themselves) in place of ``weightfunc``.  If ``cutoff`` is given, the
+    search ends once all vertices up to that distance are settled, and only
+    those are returned.
     """
-    dist, prev = _init_single_source(start)
+    dist, prev = _init_single_source(sources)
 
     # Set of vertices we've already visited.
     S = set()
@@ -111,9 +193,9 @@ def _sssp_base_dijkstra(
     # ensures no two heap entries are totally identical, but still maintains
     # sort stability -- that is, of items with equal priority, their insertion
     # order is maintained.
-    Q: list[Vertex] = []
-    heapq.heappush(Q, (0, 0, start))
-    entry = 1
+    Q = [(d, i, s) for i, (s, d) in enumerate(dist.items())]
+    heapq.heapify(Q)
+    entry = len(Q)
 
     infinity = float("inf")
 
@@ -125,15 +207,41 @@ def _sssp_base_dijkstra(
     # 2. There exists an optional early-break condition if we know the user
     #    wants to only look for a specific vertex (stop_at).
     while Q:
-        u = heapq.heappop(Q)[2]
+        du, _, u = heapq.heappop(Q)
 
         if u in S:
             continue
+        if (cutoff is not None) and (du > cutoff):
+            # everything left is further away still
+            return _trim(dist, prev, cutoff)
         S.add(u)
 
         if stop_at and stop_at is u:
             return dist, prev
 
+        if edgeweight is not None:
+            # walk the links themselves, relaxing once per link.  parallel
+            # links between the same two vertices thus compete, and the
+            # cheapest wins.
+            for link, v in helpers.ineighbor_links(
+                u,
+                direction_sensitive=direction_sensitive,
+                unknown_handling=unknown_handling,
+                filterfunc=ff_via,
+            ):
+                if (uni is not None) and (not uni.has_vertex(v)):
+                    continue
+                if v in S:
+                    continue
+
+                alt = du + edgeweight(link)
+                if alt < dist.get(v, infinity):
+                    dist[v] = alt
+                    prev[v] = u
+                    heapq.heappush(Q, (alt, entry, v))
+                    entry += 1
+            continue
+
         nbs = helpers.neighbors(
             u,
             direction_sensitive=direction_sensitive,
@@ -145,7 +253,7 @@ def _sssp_base_dijkstra(
             # filter out vertices not a member of the given universe, if any.
             # by putting the `uni is not None` check first, we can
             # short-circuit the container check if it is not needed
-            if (uni is not None) and (v not in uni.vertices):
+            if (uni is not None) and (not uni.has_vertex(v)):
                 continue
 
             # skip already visited nodes
@@ -156,14 +264,869 @@ def _sssp_base_dijkstra(
             if v not in dist:
                 dist[v] = infinity
 
+            # only queue v again if it is now closer; an entry at the same
+            # distance is already queued, and would be skipped when popped
+            before = dist[v]
             _relax(dist, prev, u, v, weightfunc)
+            if dist[v] < before:
+                heapq.heappush(Q, (dist[v], entry, v))
+                entry += 1
+
+    if cutoff is not None:
+        return _trim(dist, prev, cutoff)
+    return dist, prev
+
+
+def _trim(
+    dist: dict[Vertex, float],
+    prev: dict[Vertex, Vertex | None],
+    cutoff: float,
+) -> tuple[dict[Vertex, float], dict[Vertex, Vertex | None]]:
+    """
+    Drop the vertices further than ``cutoff`` from a solved search.
+
+    **Only for searches without negative edge weights**, where the
+    predecessor of every vertex is no further than the vertex itself; the
+    routes to the vertices kept are then intact.  Where weights may be
+    negative, use :py:func:`_trim_routes` instead.
+    """
+    dist = {v: d for v, d in dist.items() if d <= cutoff}
+    return dist, {v: prev[v] for v in dist}
+
+
+def _trim_routes(
+    dist: dict[Vertex, float],
+    prev: dict[Vertex, Vertex | None],
+    cutoff: float,
+) -> tuple[dict[Vertex, float], dict[Vertex, Vertex | None]]:
+    """
+    Drop the vertices further than ``cutoff`` from a solved search, and those
+    whose route passes through any such vertex.
+
+    With negative edge weights, a vertex within the cutoff may be reached
+    through one beyond it; it is dropped too, so that every vertex kept has
+    its whole route within the cutoff.
+    """
+    keep: dict[Vertex, bool] = {}
+    for v in dist:
+        # walk up the route until a vertex already decided, then decide
+        # every vertex passed on the way
+        chain = []
+        u = v
+        while (u is not None) and (u not in keep):
+            chain.append(u)
+            u = prev[u]
+        ok = True if u is None else keep[u]
+        for u in reversed(chain):
+            ok = ok and dist[u] <= cutoff
+            keep[u] = ok
+
+    dist = {v: d for v, d in dist.items() if keep[v]}
+    return dist, {v: prev[v] for v in dist}
+
+
+def _sssp_base_dijkstra_csr(
+    snap: CSRSnapshot,
+    sources: Mapping[Vertex, float],
+    weightfunc: Callable,
+    stop_at: Vertex | None = None,
+    direction_sensitive: int = helpers.DIR_SENS_FORWARD,
+    ff_via: Callable | None = None,
+    unknown_handling: int = helpers.LNK_UNKNOWN_ERROR,
+    edgeweight: Callable[[Link], float] | None = None,
+    cutoff: float | None = None,
+) -> tuple[dict[Vertex, float], dict[Vertex, Vertex | None]]:
+    """
+    Perform Dijkstra's algorithm over a frozen snapshot.
+
+    This is the same algorithm as :py:func:`_sssp_base_dijkstra`, but the
+    bookkeeping (distances, predecessors, visited set, and the heap) is kept in
+    integer-indexed lists rather than vertex-keyed dictionaries.  The return
+    value is converted back to vertex-keyed dictionaries at the end.
+    """
+    verts = snap.vertices
+    offsets, targets, links, bypass = snap.adjacency(
+        direction_sensitive, unknown_handling
+    )
+    n = len(verts)
+    infinity = float("inf")
+
+    stop = snap.index_of(stop_at) if snap.has_vertex(stop_at) else -1
+
+    dist = [infinity] * n
+    prev = [-1] * n
+    seen = bytearray(n)
+    done = bytearray(n)
+
+    # see _sssp_base_dijkstra for the reasoning behind the entry counter
+    Q: list[tuple[float, int, int]] = []
+    for start, d in sources.items():
+        if snap.has_vertex(start):
+            s = snap.index_of(start)
+            dist[s] = d
+            seen[s] = 1
+            Q.append((d, len(Q), s))
+    heapq.heapify(Q)
+    entry = len(Q)
+
+    while Q:
+        du, _, u = heapq.heappop(Q)
+
+        if done[u]:
+            continue
+        if (cutoff is not None) and (du > cutoff):
+            break
+        done[u] = 1
+
+        if u == stop:
+            break
+
+        vu = verts[u]
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            if done[v]:
+                continue
+            # links of unknown type bypass the filter, as in ineighbors()
+            if (
+                (ff_via is not None)
+                and not (bypass and bypass[k])
+                and (not ff_via(links[k], verts[v]))
+            ):
+                continue
+
+            seen[v] = 1
+            if edgeweight is not None:
+                alt = du + edgeweight(links[k])
+            else:
+                alt = du + weightfunc(vu, verts[v])
+            if dist[v] > alt:
+                dist[v] = alt
+                prev[v] = u
+                heapq.heappush(Q, (alt, entry, v))
+                entry += 1
+
+    outdist = {verts[i]: dist[i] for i in range(n) if seen[i]}
+    outprev: dict[Vertex, Vertex | None] = {
+        verts[i]: (verts[prev[i]] if prev[i] >= 0 else None)
+        for i in range(n)
+        if seen[i]
+    }
+    _outside(snap, sources, outdist, outprev)
+    if cutoff is not None:
+        return _trim(outdist, outprev, cutoff)
+    return outdist, outprev
+
+
+def _sssp_base_bfs(
+    uni: Universe,
+    sources: Mapping[Vertex, float],
+    stop_at: Vertex | None = None,
+    direction_sensitive: int = helpers.DIR_SENS_FORWARD,
+    ff_via: Callable | None = None,
+    unknown_handling: int = helpers.LNK_UNKNOWN_ERROR,
+    cutoff: float | None = None,
+) -> tuple[dict[Vertex, float], dict[Vertex, Vertex | None]]:
+    """
+    Identify single-source shortest paths where every edge has a weight of
+    one, with a breadth-first search.
+
+    With equal weights, vertices are settled in the order they are first
+    found, so a plain FIFO queue does the work of the priority queue.  Ties
+    are broken as :py:func:`_sssp_base_dijkstra` breaks them (the first vertex
+    to reach another is its predecessor), so the results are identical.  All
+    sources must start at the same distance.
+
+    As this is a private, internal function, the entire algorithm and options
+    are not detailed here.  See single_pair_shortest_path() for more
+    information.
+    """
+    dist, prev = _init_single_source(sources)
+    if stop_at in dist:
+        return dist, prev
+
+    queue = collections.deque(dist)
+    while queue:
+        u = queue.popleft()
+        dv = dist[u] + 1
+        if (cutoff is not None) and (dv > cutoff):
+            # everything left is this far away, or further
+            break
+
+        for v in helpers.neighbors(
+            u,
+            direction_sensitive=direction_sensitive,
+            unknown_handling=unknown_handling,
+            filterfunc=ff_via,
+        ):
+            if v in dist:
+                continue
+            if (uni is not None) and (not uni.has_vertex(v)):
+                continue
+
+            dist[v] = dv
+            prev[v] = u
+            if v is stop_at:
+                return dist, prev
+            queue.append(v)
+
+    return dist, prev
+
+
+def _sssp_base_bfs_csr(
+    snap: CSRSnapshot,
+    sources: Mapping[Vertex, float],
+    stop_at: Vertex | None = None,
+    direction_sensitive: int = helpers.DIR_SENS_FORWARD,
+    ff_via: Callable | None = None,
+    unknown_handling: int = helpers.LNK_UNKNOWN_ERROR,
+    cutoff: float | None = None,
+) -> tuple[dict[Vertex, float], dict[Vertex, Vertex | None]]:
+    """
+    Perform :py:func:`_sssp_base_bfs` over a frozen snapshot, on integer
+    vertex numbers.
+    """
+    if stop_at in sources:
+        return _init_single_source(sources)
+
+    verts = snap.vertices
+    offsets, targets, links, bypass = snap.adjacency(
+        direction_sensitive, unknown_handling
+    )
+    n = len(verts)
+
+    stop = snap.index_of(stop_at) if snap.has_vertex(stop_at) else -1
+
+    dist = [-1] * n
+    prev = [-1] * n
+    order = []
+    for start, d in sources.items():
+        if snap.has_vertex(start):
+            s = snap.index_of(start)
+            dist[s] = d
+            order.append(s)
+
+    # the order vertices are found in doubles as the queue
+    head = 0
+    while head < len(order):
+        u = order[head]
+        head += 1
+        dv = dist[u] + 1
+        if (cutoff is not None) and (dv > cutoff):
+            break
+
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            if dist[v] >= 0:
+                continue
+            # links of unknown type bypass the filter, as in ineighbors()
+            if (
+                (ff_via is not None)
+                and not (bypass and bypass[k])
+                and (not ff_via(links[k], verts[v]))
+            ):
+                continue
+
+            dist[v] = dv
+            prev[v] = u
+            order.append(v)
+            if v == stop:
+                head = len(order)
+                break
+
+    outdist = {verts[i]: dist[i] for i in order}
+    outprev: dict[Vertex, Vertex | None] = {
+        verts[i]: (verts[prev[i]] if prev[i] >= 0 else None) for i in order
+    }
+    _outside(snap, sources, outdist, outprev)
+    return outdist, outprev
+
+
+def _outside(
+    snap: CSRSnapshot,
+    sources: Mapping[Vertex, float],
+    dist: dict[Vertex, float],
+    prev: dict[Vertex, Vertex | None],
+) -> None:
+    """
+    Add the sources missing from a snapshot to a search over it, at their own
+    distances; nothing is reachable from them, but they are themselves
+    reached.
+    """
+    for start, d in sources.items():
+        if not snap.has_vertex(start):
+            dist[start] = d
+            prev[start] = None
+
+
+def _sssp_base_01bfs(
+    uni: Universe | CSRSnapshot | None,
+    sources: Mapping[Vertex, float],
+    weightfunc: Callable,
+    stop_at: Vertex | None = None,
+    direction_sensitive: int = helpers.DIR_SENS_FORWARD,
+    ff_via: Callable | None = None,
+    unknown_handling: int = helpers.LNK_UNKNOWN_ERROR,
+    edgeweight: Callable[[Link], float] | None = None,
+    cutoff: float | None = None,
+) -> tuple[dict[Vertex, float], dict[Vertex, Vertex | None]]:
+    """
+    Identify single-source shortest paths where every edge has a weight of
+    zero or one, with a "0-1 BFS".
+
+    A double-ended queue stands in for the priority queue: vertices reached
+    over a zero-weight edge go on the front (they are no further away than
+    the vertex being settled), and those over a one-weight edge on the back.
+    All sources must start at the same distance.
+
+    As this is a private, internal function, the entire algorithm and options
+    are not detailed here.  See single_pair_shortest_path() for more
+    information.
+
+    :raises ValueError: If an edge weighs anything other than zero or one.
+    """
+    dist, prev = _init_single_source(sources)
+    arcs = _weighted_arcs(
+        uni,
+        weightfunc,
+        direction_sensitive=direction_sensitive,
+        ff_via=ff_via,
+        unknown_handling=unknown_handling,
+        edgeweight=edgeweight,
+    )
+    infinity = float("inf")
+
+    done = set()
+    queue = collections.deque(dist)
+    while queue:
+        u = queue.popleft()
+        if u in done:
+            continue
+        du = dist[u]
+        if (cutoff is not None) and (du > cutoff):
+            break
+        done.add(u)
+
+        if u is stop_at:
+            return dist, prev
+
+        for v, w in arcs(u):
+            if (w != 0) and (w != 1):
+                raise ValueError(
+                    f"zero_one=True, but an edge has a weight of {w}"
+                )
+            alt = du + w
+            if alt < dist.get(v, infinity):
+                dist[v] = alt
+                prev[v] = u
+                if w:
+                    queue.append(v)
+                else:
+                    queue.appendleft(v)
+
+    if cutoff is not None:
+        return _trim(dist, prev, cutoff)
+    return dist, prev
+
+
+def _sssp_base_pq(
+    uni: Universe | CSRSnapshot | None,
+    sources: Mapping[Vertex, float],
+    weightfunc: Callable,
+    queue: Callable[[], Any],
+    stop_at: Vertex | None = None,
+    direction_sensitive: int = helpers.DIR_SENS_FORWARD,
+    ff_via: Callable | None = None,
+    unknown_handling: int = helpers.LNK_UNKNOWN_ERROR,
+    edgeweight: Callable[[Link], float] | None = None,
+    cutoff: float | None = None,
+) -> tuple[dict[Vertex, float], dict[Vertex, Vertex | None]]:
+    """
+    Perform Dijkstra's algorithm with a priority queue from
+    :py:mod:`~edgegraph.pathfinding.pqueue` (or any other with the same
+    interface), made by calling ``queue``.
+
+    As this is a private, internal function, the entire algorithm and options
+    are not detailed here.  See single_pair_shortest_path() for more
+    information.
+    """
+    dist, prev = _init_single_source(sources)
+    arcs = _weighted_arcs(
+        uni,
+        weightfunc,
+        direction_sensitive=direction_sensitive,
+        ff_via=ff_via,
+        unknown_handling=unknown_handling,
+        edgeweight=edgeweight,
+    )
+    infinity = float("inf")
+
+    done = set()
+    Q = queue()
+    for s, d in dist.items():
+        Q.push(s, d)
+    while Q:
+        du, u = Q.pop()
+        if (cutoff is not None) and (du > cutoff):
+            break
+        done.add(u)
+
+        if u is stop_at:
+            return dist, prev
+
+        for v, w in arcs(u):
+            if v in done:
+                continue
+            alt = du + w
+            if alt < dist.get(v, infinity):
+                dist[v] = alt
+                prev[v] = u
+                Q.push(v, alt)
+
+    if cutoff is not None:
+        return _trim(dist, prev, cutoff)
+    return dist, prev
+
+
+def _dijkstra(
+    uni: Universe | CSRSnapshot | None,
+    sources: Mapping[Vertex, float],
+    weightfunc: Callable | None,
+    unit: bool = False,
+    zero_one: bool = False,
+    queue: str | Callable[[], Any] | None = None,
+    **kwargs,
+) -> tuple[dict[Vertex, float], dict[Vertex, Vertex | None]]:
+    """
+    Run whichever implementation of Dijkstra's algorithm best suits the graph
+    and its weights.
+
+    :param unit: Whether all edges are known to weigh one; if so, a
+       breadth-first search is used, so long as all sources start at zero.
+    :param zero_one: Whether all edges are known to weigh zero or one; if so,
+       a 0-1 BFS is used, so long as all sources start at zero.
+    :param queue: Priority queue asked for by the user, if any; a name from
+       :py:data:`~edgegraph.pathfinding.pqueue.QUEUES`, or a callable making
+       one.  This takes precedence over the other options.
+    :param kwargs: Passed on to the chosen ``_sssp_base_*`` function.
+    :raises ValueError: If ``queue`` is an unknown name.
+    """
+    if queue is not None:
+        if isinstance(queue, str):
+            if queue not in pqueue.QUEUES:
+                raise ValueError(f"Unknown priority queue '{queue}'")
+            queue = pqueue.QUEUES[queue]
+        return _sssp_base_pq(uni, sources, weightfunc, queue, **kwargs)
+
+    # the queues of the BFS variants only stay in order if every source
+    # starts level; otherwise, the plain algorithm does the same job
+    level = not any(sources.values())
+
+    csr = isinstance(uni, CSRSnapshot)
+    if unit and level:
+        kwargs.pop("edgeweight", None)
+        base = _sssp_base_bfs_csr if csr else _sssp_base_bfs
+        return base(uni, sources, **kwargs)
+    if zero_one and level:
+        return _sssp_base_01bfs(uni, sources, weightfunc, **kwargs)
+
+    base = _sssp_base_dijkstra_csr if csr else _sssp_base_dijkstra
+    return base(uni, sources, weightfunc, **kwargs)
+
+
+def _weighted_arcs(
+    uni: Universe | CSRSnapshot | None,
+    weightfunc: Callable | None,
+    direction_sensitive: int = helpers.DIR_SENS_FORWARD,
+    ff_via: Callable | None = None,
+    unknown_handling: int = helpers.LNK_UNKNOWN_ERROR,
+    edgeweight: Callable[[Link], float] | None = None,
+    reverse: bool = False,
+) -> Callable[[Vertex], Iterator[tuple[Vertex, float]]]:
+    """
+    Make a function giving the weighted arcs out of a vertex.
+
+    This hides the differences between live graphs, snapshots, and the two
+    ways of weighting edges from the solvers that do not need to care.
+
+    With ``reverse``, the arcs *into* the vertex are given instead, as seen
+    by a search working back from the destination: links are followed the
+    other way, ``weightfunc(v, u)`` is asked for the weight of the arc from
+    ``v`` into ``u``, and ``ff_via`` is asked whether ``u`` may be stepped
+    onto over the link.
+
+    :return: Callable accepting a vertex ``u``, and yielding ``(v, weight)``
+       two-tuples for every neighbor ``v`` of ``u`` (within ``uni``, if
+       given).  With ``edgeweight``, a neighbor may be given more than once
+       (once per link).
+    """
+    if reverse:
+        # pylint: disable-next=protected-access
+        direction_sensitive = helpers._reverse_direction(direction_sensitive)
+
+    if isinstance(uni, CSRSnapshot):
+        verts = uni.vertices
+        offsets, targets, links, bypass = uni.adjacency(
+            direction_sensitive, unknown_handling
+        )
+
+        def csr_arcs(u):
+            if not uni.has_vertex(u):
+                return
+            i = uni.index_of(u)
+            for k in range(offsets[i], offsets[i + 1]):
+                v = verts[targets[k]]
+                # links of unknown type bypass the filter, as in ineighbors()
+                if (
+                    (ff_via is not None)
+                    and not (bypass and bypass[k])
+                    and (not ff_via(links[k], u if reverse else v))
+                ):
+                    continue
+                if edgeweight is not None:
+                    yield v, edgeweight(links[k])
+                elif reverse:
+                    yield v, weightfunc(v, u)
+                else:
+                    yield v, weightfunc(u, v)
+
+        return csr_arcs
+
+    def live_arcs(u):
+        filterfunc = ff_via
+        if reverse and (ff_via is not None):
+            filterfunc = lambda e, v: ff_via(e, u)
+
+        if (edgeweight is not None) or reverse:
+            for link, v in helpers.ineighbor_links(
+                u,
+                direction_sensitive=direction_sensitive,
+                unknown_handling=unknown_handling,
+                filterfunc=filterfunc,
+            ):
+                if (uni is not None) and (not uni.has_vertex(v)):
+                    continue
+                if edgeweight is not None:
+                    yield v, edgeweight(link)
+                else:
+                    yield v, weightfunc(v, u)
+            return
+
+        for v in helpers.neighbors(
+            u,
+            direction_sensitive=direction_sensitive,
+            unknown_handling=unknown_handling,
+            filterfunc=filterfunc,
+        ):
+            if (uni is not None) and (not uni.has_vertex(v)):
+                continue
+            yield v, weightfunc(u, v)
+
+    return live_arcs
+
 
-            heapq.heappush(Q, (dist[v], entry, v))
-            entry += 1
+def _edge_table(
+    uni: Universe | CSRSnapshot,
+    verts: tuple[Vertex, ...],
+    weightfunc: Callable | None,
+    **kwargs,
+) -> list[dict[int, float]]:
+    """
+    Collect the weighted edges among the given vertices, by vertex number;
+    of several edges between the same two vertices, the cheapest.  Used by
+    the solvers working on whole graphs at once.
+
+    :param verts: The vertices, numbered by their position.
+    :param kwargs: Passed to :py:func:`_weighted_arcs`.
+    :return: For each vertex, a dictionary of the weight to each neighbor.
+    """
+    arcs = _weighted_arcs(uni, weightfunc, **kwargs)
+    index = {v: i for i, v in enumerate(verts)}
+
+    out: list[dict[int, float]] = []
+    for u in verts:
+        row: dict[int, float] = {}
+        for v, w in arcs(u):
+            j = index[v]
+            if (j not in row) or (w < row[j]):
+                row[j] = w
+        out.append(row)
+    return out
+
+
+def _find_cycle(
+    prev: dict[Vertex, Vertex | None],
+    vert: Vertex,
+) -> list[Vertex] | None:
+    """
+    Look for a cycle among the predecessors of ``vert``.
+
+    :return: The cycle, in the order its edges are followed, with the first
+       vertex repeated at the end; or ``None`` if following the predecessors
+       reaches the start of the search instead.
+    """
+    seen: dict[Vertex, int] = {}
+    order: list[Vertex] = []
+    u: Vertex | None = vert
+    while (u is not None) and (u not in seen):
+        seen[u] = len(order)
+        order.append(u)
+        u = prev[u]
+    if u is None:
+        return None
+
+    # order walks the cycle backwards from u; turn it around and close it
+    cycle = order[seen[u] :]
+    cycle.reverse()
+    cycle.append(cycle[0])
+    return cycle
+
+
+def _sssp_base_bellman_ford(
+    uni: Universe | CSRSnapshot | None,
+    sources: Mapping[Vertex, float],
+    weightfunc: Callable,
+    direction_sensitive: int = helpers.DIR_SENS_FORWARD,
+    ff_via: Callable | None = None,
+    unknown_handling: int = helpers.LNK_UNKNOWN_ERROR,
+    edgeweight: Callable[[Link], float] | None = None,
+    cutoff: float | None = None,
+) -> tuple[dict[Vertex, float], dict[Vertex, Vertex | None]]:
+    """
+    Perform the Bellman-Ford algorithm, in its queue-based form (the "shortest
+    path faster algorithm", or SPFA), which allows negative edge weights.
 
+    Rather than relaxing every edge on every pass, only the edges out of
+    vertices whose distance changed are relaxed again, and the search ends
+    as soon as no distance changes at all.
+
+    Negative cycles are found by the number of edges in the walk behind each
+    distance.  Every distance is set by a walk taken over earlier distances,
+    each strictly lower than the last for its vertex; so a walk that visits
+    some vertex twice has come back to it cheaper, around a negative cycle.
+    A walk visits a vertex twice once it has at least as many edges as there
+    are vertices found so far.  The predecessors then lead around the cycle,
+    or soon will, if the search is continued.
+
+    As this is a private, internal function, the entire algorithm and options
+    are not detailed here.  See single_pair_shortest_path() for more
+    information.
+
+    :raises NegativeCycleError: If a negative cycle is reachable from the
+       sources.
+    """
+    dist, prev = _init_single_source(sources)
+    arcs = _weighted_arcs(
+        uni,
+        weightfunc,
+        direction_sensitive=direction_sensitive,
+        ff_via=ff_via,
+        unknown_handling=unknown_handling,
+        edgeweight=edgeweight,
+    )
+    infinity = float("inf")
+
+    # edges in the walk behind each distance
+    hops = dict.fromkeys(dist, 0)
+    queue = collections.deque(dist)
+    queued = set(dist)
+
+    while queue:
+        u = queue.popleft()
+        queued.discard(u)
+        du = dist[u]
+        hv = hops[u] + 1
+
+        for v, w in arcs(u):
+            alt = du + w
+            if alt < dist.get(v, infinity):
+                dist[v] = alt
+                prev[v] = u
+                hops[v] = hv
+
+                if hv >= len(dist):
+                    cycle = _find_cycle(prev, v)
+                    if cycle is not None:
+                        raise NegativeCycleError(cycle)
+
+                if v not in queued:
+                    queued.add(v)
+                    queue.append(v)
+
+    if cutoff is not None:
+        # routes may dip below the cutoff after passing beyond it
+        return _trim_routes(dist, prev, cutoff)
     return dist, prev
 
 
+def _spsp_base_astar(
+    uni: Universe | CSRSnapshot | None,
+    sources: Mapping[Vertex, float],
+    dest: Vertex,
+    weightfunc: Callable,
+    heuristic: Callable[[Vertex, Vertex], float],
+    direction_sensitive: int = helpers.DIR_SENS_FORWARD,
+    ff_via: Callable | None = None,
+    unknown_handling: int = helpers.LNK_UNKNOWN_ERROR,
+    edgeweight: Callable[[Link], float] | None = None,
+) -> tuple[dict[Vertex, float], dict[Vertex, Vertex | None]]:
+    """
+    Perform an A* search from the sources towards ``dest``.
+
+    This is Dijkstra's algorithm with each vertex ``v`` prioritized by its
+    distance from the start *plus* ``heuristic(v, dest)``, so that vertices
+    towards the destination are settled first.  A vertex may be settled again
+    if a shorter path to it is found later, which only happens for heuristics
+    that are admissible but not consistent; the answer is optimal either way.
+
+    As this is a private, internal function, the entire algorithm and options
+    are not detailed here.  See single_pair_shortest_path() for more
+    information.
+    """
+    dist, prev = _init_single_source(sources)
+    arcs = _weighted_arcs(
+        uni,
+        weightfunc,
+        direction_sensitive=direction_sensitive,
+        ff_via=ff_via,
+        unknown_handling=unknown_handling,
+        edgeweight=edgeweight,
+    )
+    infinity = float("inf")
+
+    # heap entries are (estimate, -distance, entry, vertex).  of equal
+    # estimates, the vertex further from the start (and so, nearer the
+    # destination) is taken first; see _sssp_base_dijkstra for the reasoning
+    # behind the entry counter.
+    Q: list[tuple[float, float, int, Vertex]] = [
+        (d + heuristic(s, dest), -d, i, s)
+        for i, (s, d) in enumerate(dist.items())
+    ]
+    heapq.heapify(Q)
+    entry = len(Q)
+
+    while Q:
+        _, du, _, u = heapq.heappop(Q)
+        du = -du
+
+        # a shorter path to u was found after this entry was pushed
+        if du > dist[u]:
+            continue
+
+        if u is dest:
+            break
+
+        for v, w in arcs(u):
+            alt = du + w
+            if alt < dist.get(v, infinity):
+                dist[v] = alt
+                prev[v] = u
+                heapq.heappush(Q, (alt + heuristic(v, dest), -alt, entry, v))
+                entry += 1
+
+    return dist, prev
+
+
+def _spsp_base_bidirectional(
+    uni: Universe | CSRSnapshot | None,
+    sources: Mapping[Vertex, float],
+    dest: Vertex,
+    weightfunc: Callable,
+    direction_sensitive: int = helpers.DIR_SENS_FORWARD,
+    ff_via: Callable | None = None,
+    unknown_handling: int = helpers.LNK_UNKNOWN_ERROR,
+    edgeweight: Callable[[Link], float] | None = None,
+) -> tuple[list[Vertex] | None, float | None]:
+    """
+    Perform bidirectional Dijkstra's algorithm between the sources and
+    ``dest``.
+
+    Two searches are run in turn: one forward from the start, and one backward
+    (along the links into each vertex) from the destination, each step taken
+    by whichever has the nearer frontier.  Every time a vertex is reached by
+    both, the total length through it is a candidate path.  Once the two
+    frontiers together are as far as the best candidate, no shorter path can
+    remain.
+
+    As this is a private, internal function, the entire algorithm and options
+    are not detailed here.  See single_pair_shortest_path() for more
+    information.
+
+    :return: Two-tuple of the path and its length, or of ``None`` and ``None``
+       if there is none.
+    """
+    if (uni is not None) and (not uni.has_vertex(dest)):
+        return None, None
+
+    kwargs = {
+        "direction_sensitive": direction_sensitive,
+        "ff_via": ff_via,
+        "unknown_handling": unknown_handling,
+        "edgeweight": edgeweight,
+    }
+    arcs = (
+        _weighted_arcs(uni, weightfunc, **kwargs),
+        _weighted_arcs(uni, weightfunc, reverse=True, **kwargs),
+    )
+    fwd_dist, fwd_prev = _init_single_source(sources)
+    dist = (fwd_dist, {dest: 0})
+    prev: tuple[dict[Vertex, Vertex | None], ...] = (fwd_prev, {dest: None})
+    done: tuple[set[Vertex], set[Vertex]] = (set(), set())
+    Q: tuple[list[tuple[float, int, Vertex]], ...] = (
+        [(d, i, s) for i, (s, d) in enumerate(fwd_dist.items())],
+        [(0, len(fwd_dist), dest)],
+    )
+    heapq.heapify(Q[0])
+    # see _sssp_base_dijkstra for the reasoning behind the entry counter
+    entry = len(fwd_dist) + 1
+
+    infinity = float("inf")
+    best = infinity
+    meet = None
+    if dest in fwd_dist:
+        # the destination is itself a source
+        best = fwd_dist[dest]
+        meet = dest
+
+    while Q[0] and Q[1]:
+        if Q[0][0][0] + Q[1][0][0] >= best:
+            break
+
+        # step whichever search has the nearer frontier
+        side = 0 if Q[0][0][0] <= Q[1][0][0] else 1
+        mydist, otherdist = dist[side], dist[1 - side]
+        myprev, mydone = prev[side], done[side]
+
+        du, _, u = heapq.heappop(Q[side])
+        if u in mydone:
+            continue
+        mydone.add(u)
+
+        for v, w in arcs[side](u):
+            if v in mydone:
+                continue
+            alt = du + w
+            if alt < mydist.get(v, infinity):
+                mydist[v] = alt
+                myprev[v] = u
+                heapq.heappush(Q[side], (alt, entry, v))
+                entry += 1
+            if (v in otherdist) and (mydist[v] + otherdist[v] < best):
+                best = mydist[v] + otherdist[v]
+                meet = v
+
+    if meet is None:
+        return None, None
+
+    # the forward half, start to meet, then the backward half onwards to dest
+    path = _route_dijkstra(prev[0], meet)
+    u = prev[1][meet]
+    while u is not None:
+        path.append(u)
+        u = prev[1][u]
+
+    return path, best
+
+
 def _route_dijkstra(
     prev: dict[Vertex, Vertex | None],
     dest: Vertex,
@@ -178,23 +1141,167 @@ def _route_dijkstra(
     if u not in prev:
         return None
 
+    # walk back to the start, then reverse; linear in the path length
     while u is not None:
-        S.insert(0, u)
+        S.append(u)
         u = prev[u]
+    S.reverse()
 
     return S
 
 
+def _weights(
+    weightfunc: Callable | None,
+    weight: str | Callable[[Link], float] | None,
+) -> tuple[Callable | None, Callable[[Link], float] | None]:
+    """
+    Validate the ``weightfunc`` and ``weight`` options of the solvers.
+
+    :return: Two-tuple of the vertex-pair weight function (defaulting to a
+       weight of 1), and the edge weight function; exactly one of the two is
+       ``None``.
+    """
+    if weight is not None:
+        if weightfunc is not None:
+            raise ValueError("Only one of weightfunc and weight may be given!")
+        return None, _edge_weight(weight)
+
+    if weightfunc is None:
+        weightfunc = lambda u, v: 1
+    return weightfunc, None
+
+
+class ShortestPaths(object):
+    """
+    Shortest paths from one vertex (or several) to all others reachable from
+    it.
+
+    This is the result of :py:func:`single_source_shortest_paths`.  The search
+    is done once, when the object is created; any number of destinations may
+    then be queried from it.
+
+    >>> paths = single_source_shortest_paths(uni, v1)
+    >>> paths.distance_to(v4)
+    3
+    >>> paths.path_to(v4)
+    [v1, v2, v3, v4]
+    >>> v9 in paths
+    False
+    """
+
+    __slots__ = ("_sources", "_dist", "_prev")
+
+    def __init__(
+        self,
+        sources: Vertex | Mapping[Vertex, float],
+        dist: dict[Vertex, float],
+        prev: dict[Vertex, Vertex | None],
+    ):
+        """
+        Wrap a solved search.  **Mostly for internal use**; see
+        :py:func:`single_source_shortest_paths`.
+
+        :param sources: The vertex the search started from, or the initial
+           distance of each, if several.
+        :param dist: Distance from the start of each vertex reached.
+        :param prev: Predecessor on the shortest path of each vertex reached
+           (``None`` for the start).
+        """
+
+        #: Initial distance of each vertex the search started from
+        self._sources = _sources(sources)
+
+        #: Distance of each vertex reached
+        self._dist = dist
+
+        #: Predecessor of each vertex reached
+        self._prev = prev
+
+    @property
+    def start(self) -> Vertex | None:
+        """
+        Return the vertex the search started from, or ``None`` if it started
+        from several (see :py:attr:`sources`).
+        """
+        if len(self._sources) != 1:
+            return None
+        return next(iter(self._sources))
+
+    @property
+    def sources(self) -> Mapping[Vertex, float]:
+        """
+        Return a read-only view of the initial distance of each vertex the
+        search started from.
+        """
+        return types.MappingProxyType(self._sources)
+
+    @property
+    def distances(self) -> Mapping[Vertex, float]:
+        """
+        Return a read-only view of the distance to every vertex reached.
+        """
+        return types.MappingProxyType(self._dist)
+
+    @property
+    def predecessors(self) -> Mapping[Vertex, Vertex | None]:
+        """
+        Return a read-only view of the predecessor of every vertex reached,
+        on its shortest path (``None`` for the start vertex).
+        """
+        return types.MappingProxyType(self._prev)
+
+    def __len__(self) -> int:
+        """
+        Called by :py:`len(paths)`; the number of vertices reached, including
+        the start vertex.
+        """
+        return len(self._dist)
+
+    def __contains__(self, vert: Vertex) -> bool:
+        """
+        Called by :py:`vert in paths`; whether a path to ``vert`` was found.
+        """
+        return vert in self._dist
+
+    def distance_to(self, dest: Vertex) -> float | None:
+        """
+        Get the length of the shortest path to the given vertex.
+
+        :param dest: Vertex to find the distance to.
+        :return: The total weight of the shortest path, or ``None`` if no path
+           was found (or the vertex is further away than the cutoff).
+        """
+        return self._dist.get(dest)
+
+    def path_to(self, dest: Vertex) -> list[Vertex] | None:
+        """
+        Get the shortest path to the given vertex.
+
+        The path is built in time linear in its length.
+
+        :param dest: Vertex to find the path to.
+        :return: The vertices of the path, from :py:attr:`start` (or the
+           nearest of the :py:attr:`sources`) to ``dest`` inclusive (just
+           ``[start]`` if ``dest`` is the start), or ``None`` if no path was
+           found.
+        """
+        return _route_dijkstra(self._prev, dest)
+
+
 def single_pair_shortest_path(
     uni: Universe,
-    start: Vertex,
+    start: Vertex | Iterable[Vertex] | Mapping[Vertex, float],
     dest: Vertex,
     *,
     weightfunc: Callable | None = None,
+    weight: str | Callable[[Link], float] | None = None,
     direction_sensitive: int = helpers.DIR_SENS_FORWARD,
     unknown_handling: int = helpers.LNK_UNKNOWN_ERROR,
     ff_via: Callable | None = None,
     method: str = "dijkstra",
+    heuristic: Callable[[Vertex, Vertex], float] | None = None,
+    zero_one: bool = False,
+    queue: str | Callable[[], Any] | None = None,
 ) -> tuple[list[Vertex] | None, float | None]:
     """
     Find the shortest path between two vertices in the given universe.
@@ -207,8 +1314,13 @@ def single_pair_shortest_path(
 
 
     :param uni: Universe to search within.  Set to ``None`` for no universe
-       limiting.
-    :param start: Vertex to start searching from.
+       limiting.  A :py:class:`~edgegraph.structure.csr.CSRSnapshot` may be
+       given instead, for faster searching of a frozen graph.
+    :param start: Vertex to start searching from.  An iterable of vertices may
+       be given instead, to find the shortest path from whichever of them is
+       nearest; or a mapping of vertices to an initial distance for each, to
+       find the path minimizing the initial distance plus the path's own
+       weight.  All are searched from at once, in one search.
     :param dest: Vertex to search for.
     :param weightfunc: Callback function to determine the weight (also
        sometimes called cost) of transiting between two vertices.  If not
@@ -238,11 +1350,37 @@ def single_pair_shortest_path(
           :param v2: The "to" vertex
           :return: Cost of transiting from ``v1`` to ``v2``
 
+    :param weight: Weight of each edge, as an alternative to ``weightfunc``
+       (only one of the two may be given).  This may be either:
+
+       * The name of an attribute of the edges, such as ``weight="cost"``.
+         The attribute is read directly, with no Python-level callback per
+         edge, making this the fastest way to weight a graph.  Every edge
+         followed must have the attribute.
+       * A callable object accepting exactly one positional argument, the
+         edge, and returning its weight.
+
+       Unlike ``weightfunc``, each edge is weighed on its own; where several
+       edges join the same two vertices, the cheapest of them is used.
+
     :param method: The backend algorithm to use.  Options are:
 
        * ``"dijkstra"``: Use Dijkstra's algorithm with a priority queue; worst
          case is :math:`O(V^2)`.  No negative weights are allowed.
          (**default**)
+       * ``"astar"``: Use the A* algorithm, guided towards ``dest`` by the
+         given ``heuristic``.  Settles the same or (usually far) fewer
+         vertices than Dijkstra's algorithm.  No negative weights are
+         allowed.
+       * ``"bidirectional"``: Use Dijkstra's algorithm from both ends at
+         once, forward from ``start`` and backward from ``dest``, until the
+         two searches meet.  This usually settles far fewer vertices than a
+         search from one end alone.  No negative weights are allowed.
+       * ``"bellman-ford"``: Use the Bellman-Ford algorithm (in its
+         queue-based form); worst case is :math:`O(VE)`, but typically much
+         less.  Negative weights **are** allowed, and a
+         :py:exc:`NegativeCycleError` is raised if a negative cycle is
+         reachable from ``start``.
 
 
        .. seealso::
@@ -286,6 +1424,48 @@ def single_pair_shortest_path(
           :return: Whether or not ``v2`` should be considered a neighbor of
              ``v``, when reached via ``e``.
 
+    :param zero_one: Promise that every edge weighs either zero or one, as
+       computed by ``weightfunc`` or ``weight``.  With ``method="dijkstra"``,
+       a much faster "0-1 BFS" is then used, which raises
+       :py:exc:`ValueError` if any other weight is found.
+
+       .. note::
+
+          If neither ``weightfunc`` nor ``weight`` is given, every edge weighs
+          one, and a plain breadth-first search is used automatically.
+
+    :param queue: The priority queue for ``method="dijkstra"`` to use; one
+       of ``"binary"``, ``"dary"``, or ``"bucket"``, or a callable making a
+       queue with the same interface.  See
+       :py:mod:`edgegraph.pathfinding.pqueue` for their strengths; the
+       ``"bucket"`` queue requires integer weights.  If not given, a
+       built-in binary heap is used, or no queue at all where ``zero_one`` or
+       the lack of weights allow.
+
+    :param heuristic: Estimate of the remaining distance to the destination,
+       used by ``method="astar"``.  If not given, the estimate is zero
+       everywhere, and A* settles vertices as Dijkstra's algorithm would.
+
+       .. py:function:: heuristic(v, dest)
+          :noindex:
+
+          Estimates the weight of the shortest path from ``v`` to ``dest``.
+          For example, on a graph whose vertices carry coordinates, the
+          straight-line distance between the two.
+
+          .. warning::
+
+             The estimate must be *admissible*; that is, it must never be more
+             than the true distance.  Otherwise, the path found may not be
+             the shortest.
+
+          :param v: The vertex under consideration.
+          :param dest: The destination vertex.
+          :return: Estimated weight of the path from ``v`` to ``dest``.
+
+    :raises NegativeCycleError: if ``method="bellman-ford"`` finds a
+       negative-weight cycle reachable from ``start``.  The cycle is given in
+       its ``cycle`` attribute.
     :return: A two-tuple of:
 
        #. A :py:class:`list` of :py:class:`~edgegraph.structure.vertex.Vertex`
@@ -305,11 +1485,14 @@ def single_pair_shortest_path(
           the value here will be zero regardless of edge weighting (as there is
           no distance between an object and itself).
     """
-    if weightfunc is None:
-        weightfunc = lambda u, v: 1
+    # with no weights given at all, every edge weighs one
+    unit = (weightfunc is None) and (weight is None)
+    weightfunc, edgeweight = _weights(weightfunc, weight)
 
-    if start is None:
-        raise ValueError("Cannot begin path searching with start=None!")
+    sources = _sources(start)
+
+    if metrics.ENABLED:
+        metrics.count(uni, "pathfinding.single_pair_shortest_path")
 
     if start is dest:
         # if the start *is* the destination, then we don't have to do anything
@@ -321,16 +1504,35 @@ def single_pair_shortest_path(
     # None, which improves performance over an always-true function (it can
     # eliminate a stack frame transition).
 
-    if method == "dijkstra":
-        dist, prev = _sssp_base_dijkstra(
-            uni,
-            start,
-            weightfunc,
-            stop_at=dest,
-            unknown_handling=unknown_handling,
-            direction_sensitive=direction_sensitive,
-            ff_via=ff_via,
-        )
+    if method in ("dijkstra", "astar"):
+        if method == "astar":
+            if heuristic is None:
+                heuristic = lambda v, dest: 0
+            dist, prev = _spsp_base_astar(
+                uni,
+                sources,
+                dest,
+                weightfunc,
+                heuristic,
+                unknown_handling=unknown_handling,
+                direction_sensitive=direction_sensitive,
+                ff_via=ff_via,
+                edgeweight=edgeweight,
+            )
+        else:
+            dist, prev = _dijkstra(
+                uni,
+                sources,
+                weightfunc,
+                unit=unit,
+                zero_one=zero_one,
+                queue=queue,
+                stop_at=dest,
+                unknown_handling=unknown_handling,
+                direction_sensitive=direction_sensitive,
+                ff_via=ff_via,
+                edgeweight=edgeweight,
+            )
         path = _route_dijkstra(prev, dest)
 
         # decide whether to return a distance or not.  use a renamed variable
@@ -342,4 +1544,197 @@ def single_pair_shortest_path(
 
         return (path, retdist)
 
+    if method == "bellman-ford":
+        dist, prev = _sssp_base_bellman_ford(
+            uni,
+            sources,
+            weightfunc,
+            unknown_handling=unknown_handling,
+            direction_sensitive=direction_sensitive,
+            ff_via=ff_via,
+            edgeweight=edgeweight,
+        )
+        path = _route_dijkstra(prev, dest)
+        return (path, dist[dest] if path is not None else None)
+
+    if method == "bidirectional":
+        return _spsp_base_bidirectional(
+            uni,
+            sources,
+            dest,
+            weightfunc,
+            unknown_handling=unknown_handling,
+            direction_sensitive=direction_sensitive,
+            ff_via=ff_via,
+            edgeweight=edgeweight,
+        )
+
     raise NotImplementedError(f"method='{method}' is unrecognized")
+
+
+def single_source_shortest_paths(
+    uni: Universe,
+    start: Vertex | Iterable[Vertex] | Mapping[Vertex, float],
+    *,
+    weightfunc: Callable | None = None,
+    weight: str | Callable[[Link], float] | None = None,
+    direction_sensitive: int = helpers.DIR_SENS_FORWARD,
+    unknown_handling: int = helpers.LNK_UNKNOWN_ERROR,
+    ff_via: Callable | None = None,
+    cutoff: float | None = None,
+    method: str = "dijkstra",
+    zero_one: bool = False,
+    queue: str | Callable[[], Any] | None = None,
+) -> ShortestPaths:
+    """
+    Find the shortest paths from one vertex to every vertex reachable from it.
+
+    This function solves the single-source shortest path (SSSP) problem.
+    Rather than one route, it returns a :py:class:`ShortestPaths` object,
+    which may be asked for the path and distance to any number of
+    destinations without searching again.  For one-to-many queries, this is
+    much cheaper than calling :py:func:`single_pair_shortest_path` once per
+    destination.
+
+    .. code-block:: python
+
+       paths = single_source_shortest_paths(uni, depot, weight="cost")
+       for shop in shops:
+           print(shop, paths.distance_to(shop), paths.path_to(shop))
+
+    All of the arguments shared with :py:func:`single_pair_shortest_path` have
+    the same meaning here; see its documentation for details.
+
+    :param uni: Universe to search within, or ``None``, or a
+       :py:class:`~edgegraph.structure.csr.CSRSnapshot`.
+    :param start: Vertex to start searching from; or an iterable of them, or
+       a mapping of them to initial distances, as for
+       :py:func:`single_pair_shortest_path`.  Each vertex reached is then
+       given its path from the nearest of them.
+    :param weightfunc: Weight of transiting between two vertices.
+    :param weight: Weight of each edge; an attribute name or edge callback.
+    :param direction_sensitive: Direction to follow edges in.
+    :param unknown_handling: What to do with edges of unknown type.
+    :param ff_via: Filter deciding which edges may be followed.
+    :param cutoff: If given, the search stops at this distance; vertices
+       further from ``start`` are treated as unreachable.  This can save a
+       great deal of work for "everything within a given distance" queries.
+       With ``method="bellman-ford"``, a vertex is only kept if every vertex
+       on its shortest path is within the cutoff, too.
+    :param method: The backend algorithm to use; either ``"dijkstra"``
+       (**default**) or ``"bellman-ford"``, as for
+       :py:func:`single_pair_shortest_path`.
+    :param zero_one: As for :py:func:`single_pair_shortest_path`.
+    :param queue: As for :py:func:`single_pair_shortest_path`.
+    :raises ValueError: if ``start`` is ``None``, or both ``weightfunc`` and
+       ``weight`` are given.
+    :raises NegativeCycleError: if ``method="bellman-ford"`` finds a
+       negative-weight cycle reachable from ``start``.
+    :return: The shortest paths from ``start``.
+    """
+    # with no weights given at all, every edge weighs one
+    unit = (weightfunc is None) and (weight is None)
+    weightfunc, edgeweight = _weights(weightfunc, weight)
+
+    sources = _sources(start)
+
+    if metrics.ENABLED:
+        metrics.count(uni, "pathfinding.single_source_shortest_paths")
+
+    if method == "dijkstra":
+        dist, prev = _dijkstra(
+            uni,
+            sources,
+            weightfunc,
+            unit=unit,
+            zero_one=zero_one,
+            queue=queue,
+            unknown_handling=unknown_handling,
+            direction_sensitive=direction_sensitive,
+            ff_via=ff_via,
+            edgeweight=edgeweight,
+            cutoff=cutoff,
+        )
+        return ShortestPaths(sources, dist, prev)
+
+    if method == "bellman-ford":
+        dist, prev = _sssp_base_bellman_ford(
+            uni,
+            sources,
+            weightfunc,
+            unknown_handling=unknown_handling,
+            direction_sensitive=direction_sensitive,
+            ff_via=ff_via,
+            edgeweight=edgeweight,
+            cutoff=cutoff,
+        )
+        return ShortestPaths(sources, dist, prev)
+
+    raise NotImplementedError(f"method='{method}' is unrecognized")
+
+
+def build_contraction_hierarchy(
+    uni: Universe | CSRSnapshot,
+    *,
+    weightfunc: Callable | None = None,
+    weight: str | Callable[[Link], float] | None = None,
+    direction_sensitive: int = helpers.DIR_SENS_FORWARD,
+    unknown_handling: int = helpers.LNK_UNKNOWN_ERROR,
+    ff_via: Callable | None = None,
+) -> contraction.ContractionHierarchy:
+    """
+    Preprocess a graph into a contraction hierarchy, for fast shortest path
+    queries.
+
+    Where one graph is asked for the shortest paths between many pairs of
+    vertices, and does not change, a little preprocessing makes each query
+    much faster than a search from scratch with
+    :py:func:`single_pair_shortest_path`.  The returned
+    :py:class:`~edgegraph.pathfinding.contraction.ContractionHierarchy`
+    answers queries in the same form:
+
+    .. code-block:: python
+
+       ch = build_contraction_hierarchy(uni, weight="cost")
+       for start, dest in requests:
+           path, dist = ch.shortest_path(start, dest)
+
+    Building takes some time (a few seconds for tens of thousands of vertices
+    on road-like graphs), so it pays off only over many queries.  The
+    hierarchy may be pickled and loaded elsewhere instead of rebuilt; see
+    :py:class:`~edgegraph.pathfinding.contraction.ContractionHierarchy`.
+
+    Weights are fixed when the hierarchy is built.  All of the arguments
+    shared with :py:func:`single_pair_shortest_path` have the same meaning
+    here; see its documentation for details.
+
+    :param uni: Universe (or
+       :py:class:`~edgegraph.structure.csr.CSRSnapshot`) to preprocess.
+       Only its vertices, and the edges between them, are considered.
+    :param weightfunc: Weight of transiting between two vertices.
+    :param weight: Weight of each edge; an attribute name or edge callback.
+    :param direction_sensitive: Direction to follow edges in.
+    :param unknown_handling: What to do with edges of unknown type.
+    :param ff_via: Filter deciding which edges may be followed.
+    :raises ValueError: if ``uni`` is ``None``, both ``weightfunc`` and
+       ``weight`` are given, or any edge weight is negative.
+    :return: The contraction hierarchy.
+    """
+    if uni is None:
+        raise ValueError("A contraction hierarchy requires a universe!")
+    weightfunc, edgeweight = _weights(weightfunc, weight)
+
+    if metrics.ENABLED:
+        metrics.count(uni, "pathfinding.build_contraction_hierarchy")
+
+    verts = tuple(uni.vertices)
+    edges = _edge_table(
+        uni,
+        verts,
+        weightfunc,
+        direction_sensitive=direction_sensitive,
+        ff_via=ff_via,
+        unknown_handling=unknown_handling,
+        edgeweight=edgeweight,
+    )
+    return contraction.ContractionHierarchy(verts, edges)
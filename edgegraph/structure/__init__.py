@@ -5,6 +5,7 @@
 Holds the classes that form graphs.
 """
 
+from . import uidgen, batching
 from .base import BaseObject
 from .vertex import Vertex
 from .universe import Universe
@@ -12,3 +13,6 @@ from .link import Link
 from .twoendedlink import TwoEndedLink
 from .undirectededge import UnDirectedEdge
 from .directededge import DirectedEdge
+from .csr import CSRSnapshot
+from .nbcache import NeighborCachePolicy
+from .compact import CompactVertex, CompactDirectedEdge, CompactUnDirectedEdge
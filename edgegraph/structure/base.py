@@ -2,54 +2,34 @@
 # -*- coding: utf-8 -*-
 
 """
-Contains the BaseObject class.
+Contains the BaseObject class, and the BaseObjectCore class it is built on.
 """
 
 from __future__ import annotations
 from typing import TYPE_CHECKING
 from collections.abc import Iterator
-import uuid
+from edgegraph.structure import uidgen
 
 if TYPE_CHECKING:
     from edgegraph.structure.universe import Universe
 
 
-class BaseObject(object):
+class BaseObjectCore(object):
     """
-    Top of the object inheritance tree for everything.
-
-    That's not quite a joke -- this class is the top of the tree when it comes
-    to object types.  All other objects in edgegraph inherit from this one.
-
-    It provides a few standardized attributes and access methods:
-
-    * Universal unique identifier
-    * Dynamic attributes storage
-    * Universe association
-
-    Through the "dynamic attributes storage", this object works as a namespace
-    -- it is intended for adding attributes after initialization /
-    instantiation.  For example:
+    Slotted core of :py:class:`BaseObject`.
 
-       >>> b = BaseObject()
-       >>> dir(b)
-       []
-       >>> b.x = 17
-       >>> b.x
-       17
-       >>> dir(b)
-       ['x']
+    This class holds all of the behavior of :py:class:`BaseObject`, but stores
+    its own state in ``__slots__`` and has no per-instance ``__dict__``.  It
+    does **not** provide dynamic attributes storage by itself; subclasses must
+    provide it.  :py:class:`BaseObject` does so with a plain ``__dict__``,
+    while the classes in :py:mod:`edgegraph.structure.compact` keep a
+    dictionary that is only created when it is first needed.
 
-    The attributes provided to the ``__init__`` method also become a part of
-    this operation:
-
-       >>> b = BaseObject(attributes={"fifteen": 15})
-       >>> dir(b)
-       ['fifteen']
-       >>> b.fifteen
-       15
+    You likely want :py:class:`BaseObject` rather than this class.
     """
 
+    __slots__ = ("_uid", "_universes")
+
     def __init__(
         self,
         *,
@@ -58,15 +38,28 @@ class BaseObject(object):
         universes: Iterator[Universe] | None = None,
     ):
         """
-        Instantiate a BaseObject.
+        Instantiate a BaseObject (or any subclass).
 
         :param uid: universally unique identifier of this object, or None.  If
-            :python:`None`, one will automatically be generated.
+            :python:`None`, one will automatically be generated; see
+            :py:mod:`edgegraph.structure.uidgen`.
         :param attributes: dictionary of attributes to apply to this object.
         :param universes: a set of universes that this object belongs to.
         :raises TypeError: if ``attributes`` argument is of invalid type
         """
 
+        #: Internal reference to the universes this object is a part of
+        #:
+        #: This is ``None`` until the object joins its first universe, to
+        #: avoid holding an empty list for every object.
+        #:
+        #: :meta private:
+        self._universes: list[Universe] | None = None
+        if universes is not None:
+            # deduplicate it while keeping order
+            # https://stackoverflow.com/a/17016257
+            self._universes = [*dict.fromkeys(universes)]
+
         #: Internal UID value
         #:
         #: This is the *real* value -- not exposed to the outside world.  As
@@ -76,26 +69,26 @@ class BaseObject(object):
         #:
         #: :type: int
         #: :meta private:
-        self._uid = uid or uuid.uuid4().int
+        self._uid = uid or uidgen.new_uid(self._universes)
 
         if attributes is not None:
-            if not isinstance(attributes, dict):
-                raise TypeError(
-                    f"`attributes` must be a dictionary; got {type(attributes)}"
-                )
-            for key, val in attributes.items():
-                setattr(self, key, val)
+            self._apply_attributes(attributes)
 
-        #: Internal reference to the universes this object is a part of
-        #:
-        #: :meta private:
-        self._universes: list[Universe] = (
-            list(universes) if universes is not None else []
-        )
+    def _apply_attributes(self, attributes: dict):
+        """
+        Set each of the given attributes on this object.
 
-        # deduplicate it while keeping order
-        # https://stackoverflow.com/a/17016257
-        self._universes = [*dict.fromkeys(self._universes)]
+        **FOR INTERNAL USE ONLY!!**
+
+        :param attributes: dictionary of attributes to apply to this object.
+        :raises TypeError: if ``attributes`` argument is of invalid type
+        """
+        if not isinstance(attributes, dict):
+            raise TypeError(
+                f"`attributes` must be a dictionary; got {type(attributes)}"
+            )
+        for key, val in attributes.items():
+            setattr(self, key, val)
 
     @property
     def uid(self) -> int:
@@ -118,7 +111,7 @@ class BaseObject(object):
            :py:meth:`~edgegraph.structure.base.BaseObject.remove_from_universe`
            to add or remove this object from a given universe
         """
-        return list(self._universes)
+        return list(self._universes or ())
 
     def add_to_universe(self, universe: Universe) -> None:
         """
@@ -127,11 +120,12 @@ class BaseObject(object):
 
         :param universe: the new universe to add this object to
         """
-        # do not accept duplicates
-        if universe in self._universes:
-            return
+        if self._universes is None:
+            self._universes = [universe]
 
-        self._universes.append(universe)
+        # do not accept duplicates
+        elif universe not in self._universes:
+            self._universes.append(universe)
 
     def remove_from_universe(self, universe: Universe) -> None:
         """
@@ -140,7 +134,8 @@ class BaseObject(object):
         :param universe: the universe that this object will be removed from
         :raises ValueError: if this object is not present in the given universe
         """
-        self._universes.remove(universe)
+        # an object in no universes at all still raises the list's ValueError
+        (self._universes or []).remove(universe)
 
     # These three control attrib access via KEYS; bobj['x'], bobj['y'] = y; del
     # bobj['y']
@@ -161,3 +156,48 @@ class BaseObject(object):
         Called by :py:`del bobj['x']` to delete the ``x`` item.
         """
         delattr(self, name)
+
+
+class BaseObject(BaseObjectCore):
+    """
+    Top of the object inheritance tree for everything.
+
+    That's not quite a joke -- this class is the top of the tree when it comes
+    to object types.  All other objects in edgegraph inherit from this one.
+
+    It provides a few standardized attributes and access methods:
+
+    * Universal unique identifier
+    * Dynamic attributes storage
+    * Universe association
+
+    Through the "dynamic attributes storage", this object works as a namespace
+    -- it is intended for adding attributes after initialization /
+    instantiation.  For example:
+
+       >>> b = BaseObject()
+       >>> dir(b)
+       []
+       >>> b.x = 17
+       >>> b.x
+       17
+       >>> dir(b)
+       ['x']
+
+    The attributes provided to the ``__init__`` method also become a part of
+    this operation:
+
+       >>> b = BaseObject(attributes={"fifteen": 15})
+       >>> dir(b)
+       ['fifteen']
+       >>> b.fifteen
+       15
+
+    .. seealso::
+
+       :py:mod:`edgegraph.structure.compact` for a family of classes which do
+       without the per-instance ``__dict__``, trading some speed for memory.
+    """
+
+    # no __slots__ here; instances of this class (and its subclasses) get a
+    # regular per-instance __dict__ to hold dynamic attributes.
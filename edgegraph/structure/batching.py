@@ -0,0 +1,91 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Holds the batch() context manager, for making many graph changes at once.
+
+Every change to the links of a vertex drops the cached neighbor lookups of
+that vertex (see :ref:`dev/performance/vert-nb-cache`).  Building a large
+graph one link at a time therefore drops the caches of busy vertices over and
+over again.  Inside a :py:func:`batch`, this is deferred: each vertex touched
+is only noted, and its caches are dropped once, when the batch ends.
+
+.. code-block:: python
+   :linenos:
+
+   #!python3
+   from edgegraph.structure import Universe, Vertex
+   from edgegraph.builder import explicit
+
+   uni = Universe()
+   verts = [Vertex(universes=[uni]) for _ in range(1000)]
+
+   with uni.batch():
+       for v1, v2 in zip(verts, verts[1:]):
+           explicit.link_directed(v1, v2)
+
+While a batch is open, neighbor lookups of the vertices it has touched bypass
+the caches (and so are never stale); lookups of other vertices use the caches
+as usual.  Batches may be nested; the caches are dropped when the outermost
+one ends.
+
+.. note::
+
+   A batch covers *all* graph changes made while it is open, not only those
+   within the universe it was opened from.  Like the rest of edgegraph, it is
+   not thread-safe.
+
+.. seealso::
+
+   :py:meth:`edgegraph.structure.universe.Universe.batch`, the usual way to
+   open a batch.
+"""
+
+from __future__ import annotations
+
+import contextlib
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from edgegraph.structure.vertex import VertexCore
+
+#: Vertices touched by the open batch, in the order first touched; ``None``
+#: when no batch is open.
+_touched: dict[VertexCore, None] | None = None
+
+
+def in_batch() -> bool:
+    """
+    Determine whether a batch is currently open.
+
+    :return: whether graph changes are currently being batched
+    """
+    return _touched is not None
+
+
+@contextlib.contextmanager
+def batch() -> Iterator[None]:
+    """
+    Batch graph changes until the end of the ``with`` block.
+
+    Neighbor cache invalidation of every vertex touched within the block is
+    deferred until the block ends, then done once per vertex.  This happens
+    even if the block raises an exception.
+    """
+    # pylint: disable-next=global-statement
+    global _touched
+
+    if _touched is not None:
+        # nested; the outermost batch does the work
+        yield
+        return
+
+    _touched = {}
+    try:
+        yield
+    finally:
+        touched, _touched = _touched, None
+        for vert in touched:
+            # pylint: disable-next=protected-access
+            vert._qa_neighbors_invalidate()
@@ -0,0 +1,155 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Holds compact, memory-first variants of the vertex and edge classes.
+
+The default classes (:py:class:`~edgegraph.structure.vertex.Vertex`,
+:py:class:`~edgegraph.structure.directededge.DirectedEdge`, and so on) give
+every instance a ``__dict__``, so that dynamic attributes can be set on them
+at no extra cost.  For very large graphs, that per-instance dictionary is a
+noticeable share of the memory used by each object.
+
+The classes in this module are built on the same slotted cores as the default
+classes (:py:class:`~edgegraph.structure.vertex.VertexCore` and friends), and
+behave the same way, but have no ``__dict__``.  Their structural fields live
+in ``__slots__``, and dynamic attributes (:py:`obj.x = 1` or
+:py:`obj['x'] = 1`) go into a private dictionary that is only created the
+first time one is set.
+
+The price is speed: setting *any* attribute on these objects goes through a
+Python-level :py:meth:`object.__setattr__` override, so creating and linking
+them is slower than with the default classes.  Reading attributes and
+traversing graphs is unaffected.
+
+.. note::
+
+   These classes are **not** subclasses of the default classes (Python does
+   not allow a subclass to drop the ``__dict__`` of its parent).  Code which
+   checks :py:`isinstance(v, Vertex)` will not recognize a
+   :py:class:`CompactVertex`; check against
+   :py:class:`~edgegraph.structure.vertex.VertexCore` instead.  Compact and
+   default objects may be freely mixed in the same graph.
+
+.. note::
+
+   :py:class:`CompactVertex` has its own
+   :py:attr:`~edgegraph.structure.vertex.VertexCore.NEIGHBOR_CACHING` switch,
+   which is disabled by default and is not affected by setting
+   :py:attr:`Vertex.NEIGHBOR_CACHING
+   <edgegraph.structure.vertex.VertexCore.NEIGHBOR_CACHING>`.
+
+.. seealso::
+
+   :ref:`dev/performance/compact` for a comparison of memory usage.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+from edgegraph.structure import vertex, twoendedlink
+
+
+class _CompactAttributes(object):
+    """
+    Mixin providing lazily-allocated dynamic attributes storage.
+
+    Classes using this mixin must have ``_attributes`` in their ``__slots__``,
+    and must not have a ``__dict__``.
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Called by :py:`obj.x` only if ``x`` is not found by the usual means
+        (slots, properties, class attributes).
+        """
+        # the slot itself may be unset (before the first dynamic attribute is
+        # stored); don't recurse looking for it
+        if name == "_attributes":
+            raise AttributeError(name)
+
+        attrs = getattr(self, "_attributes", None)
+        if attrs is not None and name in attrs:
+            return attrs[name]
+
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    def __setattr__(self, name: str, val: Any):
+        """
+        Called by :py:`obj.x = y` to set the ``x`` attribute.
+        """
+        try:
+            object.__setattr__(self, name, val)
+        except AttributeError:
+            # names the class knows about (for example, read-only properties)
+            # keep their error, as they would on a regular object
+            if hasattr(type(self), name):
+                raise
+
+            attrs = getattr(self, "_attributes", None)
+            if attrs is None:
+                attrs = {}
+                object.__setattr__(self, "_attributes", attrs)
+            attrs[name] = val
+
+    def __delattr__(self, name: str):
+        """
+        Called by :py:`del obj.x` to delete the ``x`` attribute.
+        """
+        try:
+            object.__delattr__(self, name)
+        except AttributeError:
+            attrs = getattr(self, "_attributes", None)
+            if not attrs or name not in attrs:
+                raise
+            del attrs[name]
+
+    def __dir__(self) -> list[str]:
+        """
+        Called by :py:`dir(obj)`; includes dynamic attributes.
+        """
+        return [*super().__dir__(), *(getattr(self, "_attributes", None) or ())]
+
+
+class CompactVertex(_CompactAttributes, vertex.VertexCore):
+    """
+    Memory-first variant of :py:class:`~edgegraph.structure.vertex.Vertex`.
+
+    Accepts the same arguments, and behaves the same, as
+    :py:class:`~edgegraph.structure.vertex.Vertex`.
+    """
+
+    __slots__ = ("_attributes",)
+
+
+class CompactDirectedEdge(_CompactAttributes, twoendedlink.TwoEndedLinkCore):
+    """
+    Memory-first variant of
+    :py:class:`~edgegraph.structure.directededge.DirectedEdge` (v1 --> v2).
+
+    Accepts the same arguments, and behaves the same, as
+    :py:class:`~edgegraph.structure.directededge.DirectedEdge`.
+    """
+
+    __slots__ = ("_attributes",)
+
+    _DIRECTED = True
+
+
+class CompactUnDirectedEdge(_CompactAttributes, twoendedlink.TwoEndedLinkCore):
+    """
+    Memory-first variant of
+    :py:class:`~edgegraph.structure.undirectededge.UnDirectedEdge`
+    (v1 -- v2).
+
+    Accepts the same arguments, and behaves the same, as
+    :py:class:`~edgegraph.structure.undirectededge.UnDirectedEdge`.
+    """
+
+    __slots__ = ("_attributes",)
+
+    _DIRECTED = False
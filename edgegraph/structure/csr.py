@@ -0,0 +1,371 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Holds the CSRSnapshot class, an immutable, integer-indexed copy of a universe.
+
+Traversing the object graph directly is flexible, but every hop pays for
+attribute lookups on :py:class:`~edgegraph.structure.vertex.Vertex` and link
+objects, as well as link type checks.  When a graph is built once and then
+traversed many times, it is much cheaper to "freeze" it into a snapshot first.
+
+The snapshot numbers every vertex of the universe with a dense integer (its
+position in :py:attr:`CSRSnapshot.vertices`), and stores adjacency in
+`compressed sparse row`_ form.  Four separate adjacency structures are kept:
+
+* ``out``: directed edges leaving a vertex,
+* ``in``: directed edges arriving at a vertex,
+* ``und``: undirected edges touching a vertex,
+* ``unk``: edges of unknown type (neither directed nor undirected).
+
+Traversals walk combined structures instead, which keep the link order of
+each vertex (so that a snapshot gives neighbors in the same order as
+:py:func:`~edgegraph.traversal.helpers.ineighbors`): ``fwd`` holds the
+``out``, ``und``, and ``unk`` edges of each vertex, ``back`` the ``in``,
+``und``, and ``unk`` edges, and ``any`` every edge (once each).
+
+Each structure is an ``offsets`` array and a ``targets`` array; the neighbors
+of vertex ``i`` are ``targets[offsets[i]:offsets[i + 1]]``.  A parallel tuple
+of link objects is kept as well, so that link-based filters can still be
+applied, along with flags marking the edges of unknown type (which bypass such
+filters, as they do for live traversals).
+
+Only edges between two vertices of the universe are recorded -- the snapshot
+is inherently universe-limited.
+
+.. warning::
+
+   The snapshot is a copy!  Changes made to the universe, its vertices, or its
+   links after freezing are **not** reflected in the snapshot.  Freeze again
+   after editing the graph.
+
+.. seealso::
+
+   :py:meth:`edgegraph.structure.universe.Universe.freeze` is the usual way to
+   create one of these.
+
+.. _compressed sparse row:
+   https://en.wikipedia.org/wiki/Sparse_matrix#Compressed_sparse_row_(CSR,_CRS_or_Yale_format)
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Optional, Tuple
+from collections.abc import Iterable
+
+from edgegraph.traversal.options import (
+    DIR_SENS_FORWARD,
+    DIR_SENS_ANY,
+    DIR_SENS_BACKWARD,
+    LNK_UNKNOWN_NONNEIGHBOR,
+    LNK_UNKNOWN_NEIGHBOR,
+    LNK_UNKNOWN_ERROR,
+)
+
+if TYPE_CHECKING:
+    from edgegraph.structure.vertex import Vertex
+    from edgegraph.structure.link import Link
+
+#: One CSR structure: offsets, targets, links parallel to the targets, and
+#: flags parallel to the targets marking links of unknown type (``None`` if
+#: there are none).  (``typing.Tuple``, as this is evaluated at import time,
+#: on every supported Python.)
+CSRPart = Tuple[memoryview, memoryview, Tuple["Link", ...], Optional[bytes]]
+
+
+def _build_csr(
+    adj: list[list[tuple[int, Link]]],
+    unknown: set[Link] | None = None,
+) -> CSRPart:
+    """
+    Pack a list-of-lists adjacency into CSR arrays.
+
+    :param adj: For each vertex index, a list of ``(target, link)`` tuples.
+    :param unknown: Links of unknown type which may appear in ``adj``.
+    :return: Four-tuple of read-only offsets, read-only targets, the links
+       parallel to the targets, and flags parallel to the targets marking
+       links in ``unknown`` (or ``None``, if no such links are present).
+    """
+    offsets = array("q", [0])
+    targets = array("q")
+    links = []
+    for row in adj:
+        for tgt, lnk in row:
+            targets.append(tgt)
+            links.append(lnk)
+        offsets.append(len(targets))
+
+    bypass = None
+    if unknown:
+        bypass = bytes(lnk in unknown for lnk in links)
+        if not any(bypass):
+            bypass = None
+
+    # views over bytes are read-only on every supported Python (unlike
+    # memoryview.toreadonly(), which needs 3.8)
+    return (
+        memoryview(offsets.tobytes()).cast("q"),
+        memoryview(targets.tobytes()).cast("q"),
+        tuple(links),
+        bypass,
+    )
+
+
+class CSRSnapshot(object):
+    """
+    Immutable, compressed-sparse-row snapshot of a universe.
+
+    Vertices are numbered ``0`` to ``len(snapshot) - 1`` in the insertion order
+    of the universe they were taken from.  Use :py:meth:`index_of` and
+    :py:meth:`vertex_at` to convert between vertex objects and their numbers.
+
+    Traversal and pathfinding functions which accept a universe (for example,
+    :py:func:`~edgegraph.traversal.breadthfirst.ibft`) also accept a snapshot in
+    its place, and run integer-only inner loops on it.  They still accept and
+    return :py:class:`~edgegraph.structure.vertex.Vertex` objects, in the same
+    order as they would on the live universe.
+    """
+
+    def __init__(self, vertices: Iterable[Vertex]):
+        """
+        Freeze the given vertices into a snapshot.
+
+        :param vertices: Vertices to include in the snapshot.  Only links
+           between two of these are recorded.  Duplicates are ignored.
+
+        .. seealso::
+
+           :py:meth:`edgegraph.structure.universe.Universe.freeze`
+        """
+
+        #: Vertex objects, indexed by their snapshot number
+        self._vertices: tuple[Vertex, ...] = tuple(dict.fromkeys(vertices))
+
+        #: Map from vertex object to snapshot number
+        self._index: dict[Vertex, int] = {
+            v: i for i, v in enumerate(self._vertices)
+        }
+
+        n = len(self._vertices)
+        outs: list[list] = [[] for _ in range(n)]
+        ins: list[list] = [[] for _ in range(n)]
+        unds: list[list] = [[] for _ in range(n)]
+        unks: list[list] = [[] for _ in range(n)]
+        anys: list[list] = [[] for _ in range(n)]
+        # combined, link-ordered; with and without the unknown links
+        fwds: list[list] = [[] for _ in range(n)]
+        backs: list[list] = [[] for _ in range(n)]
+        fwds_unk: list[list] = [[] for _ in range(n)]
+        backs_unk: list[list] = [[] for _ in range(n)]
+        unknown: set[Link] = set()
+
+        index = self._index
+        for i, vert in enumerate(self._vertices):
+            for link in vert.links:
+                other = link.other(vert)
+                j = index.get(other)
+                if j is None:
+                    continue
+
+                entry = (j, link)
+                anys[i].append(entry)
+                # pylint: disable-next=protected-access
+                directed = getattr(link, "_DIRECTED", None)
+                if directed is False:
+                    unds[i].append(entry)
+                    fwds[i].append(entry)
+                    backs[i].append(entry)
+                    fwds_unk[i].append(entry)
+                    backs_unk[i].append(entry)
+                elif directed:
+                    # a self-loop is both outbound and inbound
+                    if link.v1 is vert:
+                        outs[i].append(entry)
+                        fwds[i].append(entry)
+                        fwds_unk[i].append(entry)
+                    if link.v2 is vert:
+                        ins[i].append(entry)
+                        backs[i].append(entry)
+                        backs_unk[i].append(entry)
+                else:
+                    unknown.add(link)
+                    unks[i].append(entry)
+                    fwds_unk[i].append(entry)
+                    backs_unk[i].append(entry)
+
+        self._out = _build_csr(outs)
+        self._in = _build_csr(ins)
+        self._und = _build_csr(unds)
+        self._unk = _build_csr(unks)
+        self._any = _build_csr(anys)
+        self._fwd = _build_csr(fwds)
+        self._back = _build_csr(backs)
+        if unknown:
+            self._fwd_unk = _build_csr(fwds_unk, unknown)
+            self._back_unk = _build_csr(backs_unk, unknown)
+        else:
+            self._fwd_unk = self._fwd
+            self._back_unk = self._back
+
+    def __len__(self) -> int:
+        """
+        Called by :py:`len(snapshot)`; the number of vertices.
+        """
+        return len(self._vertices)
+
+    def __contains__(self, vert: Vertex) -> bool:
+        """
+        Called by :py:`vert in snapshot` to check for vertex membership.
+        """
+        return vert in self._index
+
+    def has_vertex(self, vert: Vertex) -> bool:
+        """
+        Determine whether or not the given vertex is part of this snapshot.
+
+        This mirrors
+        :py:meth:`edgegraph.structure.universe.Universe.has_vertex`, so that
+        snapshots can stand in for universes.
+
+        :param vert: the vertex to check for
+        :return: whether or not ``vert`` is in this snapshot
+        """
+        return vert in self._index
+
+    @property
+    def vertices(self) -> tuple[Vertex, ...]:
+        """
+        Return the vertices of this snapshot, indexed by snapshot number.
+        """
+        return self._vertices
+
+    def index_of(self, vert: Vertex) -> int:
+        """
+        Get the snapshot number of the given vertex.
+
+        :param vert: the vertex to look up
+        :raises KeyError: if the vertex is not part of this snapshot
+        :return: the dense integer id of ``vert``
+        """
+        return self._index[vert]
+
+    def vertex_at(self, i: int) -> Vertex:
+        """
+        Get the vertex object with the given snapshot number.
+
+        :param i: snapshot number
+        :return: the original vertex object
+        """
+        return self._vertices[i]
+
+    @property
+    def out_offsets(self) -> memoryview:
+        """
+        Offsets array of the outbound (directed) adjacency.
+        """
+        return self._out[0]
+
+    @property
+    def out_targets(self) -> memoryview:
+        """
+        Targets array of the outbound (directed) adjacency.
+        """
+        return self._out[1]
+
+    @property
+    def in_offsets(self) -> memoryview:
+        """
+        Offsets array of the inbound (directed) adjacency.
+        """
+        return self._in[0]
+
+    @property
+    def in_targets(self) -> memoryview:
+        """
+        Targets array of the inbound (directed) adjacency.
+        """
+        return self._in[1]
+
+    @property
+    def und_offsets(self) -> memoryview:
+        """
+        Offsets array of the undirected adjacency.
+        """
+        return self._und[0]
+
+    @property
+    def und_targets(self) -> memoryview:
+        """
+        Targets array of the undirected adjacency.
+        """
+        return self._und[1]
+
+    def adjacency(
+        self,
+        direction_sensitive: int = DIR_SENS_FORWARD,
+        unknown_handling: int = LNK_UNKNOWN_ERROR,
+    ) -> CSRPart:
+        """
+        Select the CSR structure to walk for a given direction and
+        unknown-link handling.
+
+        **Mostly for internal use** by traversal and pathfinding functions.
+        The arguments take the same values as those of
+        :py:func:`~edgegraph.traversal.helpers.neighbors`.
+
+        :param direction_sensitive: Direction to follow edges in.
+        :param unknown_handling: What to do with links of unknown type.
+        :raises NotImplementedError: if ``unknown_handling`` is set to error,
+           the direction is not "any", and links of unknown type are present
+           in the snapshot.
+        :raises ValueError: if ``direction_sensitive`` is not recognized.
+        :return: An ``(offsets, targets, links, bypass)`` four-tuple.  The
+           neighbors of vertex ``i`` are ``targets[offsets[i]:offsets[i +
+           1]]``, in link order.  ``bypass`` is ``None``, or flags marking the
+           targets reached over links of unknown type, which are exempt from
+           any link filter.
+        """
+        if direction_sensitive == DIR_SENS_FORWARD:
+            known, withunk = self._fwd, self._fwd_unk
+        elif direction_sensitive == DIR_SENS_BACKWARD:
+            known, withunk = self._back, self._back_unk
+        elif direction_sensitive == DIR_SENS_ANY:
+            # every link is followed (and filtered) in "any" mode, unknown or
+            # not
+            return self._any
+        else:
+            raise ValueError(
+                f"Unknown option for direction_sensitive = {direction_sensitive}"
+            )
+
+        if len(self._unk[1]):
+            if unknown_handling == LNK_UNKNOWN_NEIGHBOR:
+                return withunk
+            if unknown_handling != LNK_UNKNOWN_NONNEIGHBOR:
+                raise NotImplementedError(
+                    f"Unknown link class {type(self._unk[2][0])}"
+                )
+
+        return known
+
+    def neighbor_ids(
+        self,
+        i: int,
+        direction_sensitive: int = DIR_SENS_FORWARD,
+        unknown_handling: int = LNK_UNKNOWN_ERROR,
+    ) -> list[int]:
+        """
+        Get the snapshot numbers of the neighbors of vertex number ``i``.
+
+        :param i: snapshot number of the vertex to find neighbors of
+        :param direction_sensitive: see
+           :py:func:`~edgegraph.traversal.helpers.neighbors`
+        :param unknown_handling: see
+           :py:func:`~edgegraph.traversal.helpers.neighbors`
+        :return: list of neighbor snapshot numbers
+        """
+        offsets, targets, _, _ = self.adjacency(
+            direction_sensitive, unknown_handling
+        )
+        return list(targets[offsets[i] : offsets[i + 1]])
@@ -27,6 +27,8 @@ class DirectedEdge(twoendedlink.TwoEndedLink):
          creating these classes directly.
     """
 
+    _DIRECTED = True
+
     def __init__(
         self,
         v1: Vertex | None = None,
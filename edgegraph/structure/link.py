@@ -2,35 +2,39 @@
 # -*- coding: utf-8 -*-
 
 """
-Holds the Link class.
+Holds the Link class, and the LinkCore class it is built on.
 """
 
 from __future__ import annotations
 from typing import TYPE_CHECKING
-from edgegraph.structure import base
+from edgegraph.structure import base, uidgen
 
 if TYPE_CHECKING:
     from edgegraph.structure.vertex import Vertex
 
 
-class Link(base.BaseObject):
+class LinkCore(base.BaseObjectCore):
     """
-    Represents an edge in the edge-vertex graph.
-
-    .. warning::
+    Slotted core of :py:class:`Link`.
 
-       This object is the base class for edge types, and should not be used on
-       its own.  Its meaning and semantics are undefined (it is neither a
-       directed edge nor an undirected edge).
+    All of the behavior of :py:class:`Link` lives here.  Like
+    :py:class:`~edgegraph.structure.base.BaseObjectCore`, this class has no
+    dynamic attributes storage of its own.
 
-    .. seealso::
+    You likely want one of the subclasses of :py:class:`Link` rather than this
+    class.
+    """
 
-       * :py:class:`~edgegraph.structure.undirectededge.UnDirectedEdge`, a
-         subclass representing an undirected edge between two vertices
-       * :py:class:`~edgegraph.structure.directededge.DirectedEdge`, a subclass
-         representing a directed edge between two vertices
+    __slots__ = ("_vertices",)
 
-    """
+    #: Directionality of this link class, used by
+    #: :py:class:`~edgegraph.structure.vertex.Vertex` to record the role it
+    #: plays in each of its links.  ``True`` for directed links (v1 --> v2),
+    #: ``False`` for undirected links, and ``None`` if the semantics are
+    #: unknown.
+    #:
+    #: :meta private:
+    _DIRECTED: bool | None = None
 
     def __init__(
         self,
@@ -58,6 +62,15 @@ class Link(base.BaseObject):
            * :py:meth:`edgegraph.structure.base.BaseObject.__init__`, the
              superclass constructor
         """
+        if not uid and vertices:
+            # links belong to no universe of their own; number them with the
+            # UID generator of the universes their first vertex is in
+            for vert in vertices:
+                if vert is not None:
+                    # pylint: disable-next=protected-access
+                    uid = uidgen.new_uid(vert._universes)
+                    break
+
         super().__init__(uid=uid, attributes=attributes)
 
         # prevent direct usage of this class -- its meaning is undefined
@@ -68,7 +81,7 @@ class Link(base.BaseObject):
         # alternative instance-but-not-subclass function is available, so here
         # we are.
         # pylint: disable-next=unidiomatic-typecheck
-        if (type(self) == Link) and not _force_creation:
+        if (type(self) in (Link, LinkCore)) and not _force_creation:
             raise TypeError(
                 "Base class <Link> may not be instantiated directly!"
             )
@@ -100,8 +113,17 @@ class Link(base.BaseObject):
         :param new: the vertex to add to the link
         """
         self._vertices.append(new)
-        if (new is not None) and (self not in new.links):
-            new.add_to_link(self)
+        if new is not None:
+            # pylint: disable-next=protected-access
+            if self not in new._links:
+                new.add_to_link(self)
+            else:
+                # the vertex is already attached (e.g., both ends of a
+                # self-loop), but its role in this link may have changed
+                # pylint: disable-next=protected-access
+                new._classify_link(self)
+
+        self._reindex_ends(exclude=new)
 
     def unlink_from(self, kill: Vertex):
         """
@@ -118,3 +140,41 @@ class Link(base.BaseObject):
 
             if kill is not None:
                 kill.remove_from_link(self)
+
+            self._reindex_ends(exclude=kill)
+
+    def _reindex_ends(self, exclude: Vertex | None = None):
+        """
+        Refresh this link in the pair indexes of its vertices, after its ends
+        changed.
+
+        **FOR INTERNAL USE ONLY!!**
+
+        :param exclude: a vertex to skip (one that already refreshed itself)
+        """
+        for vert in self._vertices:
+            if vert is None or vert is exclude:
+                continue
+            if getattr(vert, "_pair_index", None) is not None:
+                # pylint: disable-next=protected-access
+                vert._pair_reindex(self)
+
+
+class Link(LinkCore, base.BaseObject):
+    """
+    Represents an edge in the edge-vertex graph.
+
+    .. warning::
+
+       This object is the base class for edge types, and should not be used on
+       its own.  Its meaning and semantics are undefined (it is neither a
+       directed edge nor an undirected edge).
+
+    .. seealso::
+
+       * :py:class:`~edgegraph.structure.undirectededge.UnDirectedEdge`, a
+         subclass representing an undirected edge between two vertices
+       * :py:class:`~edgegraph.structure.directededge.DirectedEdge`, a subclass
+         representing a directed edge between two vertices
+
+    """
@@ -0,0 +1,268 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Holds the NeighborCachePolicy class, a bounded neighbor cache for a universe.
+
+The program-wide
+:py:attr:`~edgegraph.structure.vertex.VertexCore.NEIGHBOR_CACHING` switch
+caches the answers of :py:func:`~edgegraph.traversal.helpers.neighbors`
+in each vertex, without limit.  That suits create-then-traverse scripts, but
+not long-running programs: the cache only ever grows, and calls made with a
+new ``filterfunc`` object each time (for example, a ``lambda``) add entries
+that can never be hit again.
+
+Attaching a :py:class:`NeighborCachePolicy` to a
+:py:class:`~edgegraph.structure.universe.Universe` caches neighbor lookups for
+the vertices of that universe in one shared store, bounded by an entry count
+and / or an (approximate) byte budget.  When full, entries are evicted in
+least-recently-used or clock (second-chance) order.
+
+.. seealso::
+
+   :ref:`dev/performance/vert-nb-cache/policy` for usage.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections import OrderedDict
+from typing import Any, TYPE_CHECKING
+from edgegraph import metrics
+
+if TYPE_CHECKING:
+    from edgegraph.structure.vertex import VertexCore
+
+
+class NeighborCachePolicy(object):
+    """
+    Bounded store of cached neighbor lookups, shared by a universe.
+
+    Entries are keyed on the vertex and the arguments given to
+    :py:func:`~edgegraph.traversal.helpers.neighbors`.  All entries of a
+    vertex are dropped whenever its links change, or it leaves the universe.
+
+    The byte budget counts the size of the cached neighbor lists and their
+    keys (as reported by :py:func:`sys.getsizeof`), not the vertex objects
+    they refer to, which are shared with the graph itself.
+    """
+
+    #: Evict the least-recently-used entry first.
+    LRU: str = "lru"
+
+    #: Evict using the clock (second-chance) algorithm: entries are kept in
+    #: insertion order, and an entry used since the hand last passed it gets
+    #: one more round before being evicted.  Cache hits are cheaper than with
+    #: :py:attr:`LRU`, as they do not reorder the entries.
+    CLOCK: str = "clock"
+
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        max_bytes: int | None = None,
+        eviction: str = LRU,
+        cache_filtered: bool = False,
+    ):
+        """
+        Create a new neighbor cache policy.
+
+        :param max_entries: Maximum number of cached lookups, or ``None`` for
+           no limit.
+        :param max_bytes: Approximate maximum size of the cache in bytes, or
+           ``None`` for no limit.
+        :param eviction: Eviction order when a limit is reached; either
+           :py:attr:`LRU` or :py:attr:`CLOCK`.
+        :param cache_filtered: Whether to cache lookups made with a
+           ``filterfunc``.  Each filter function object is a separate cache
+           key, so this is only useful when the same function object is
+           reused across calls.
+        :raises ValueError: if a limit is negative, or ``eviction`` is not
+           recognized
+        """
+        if eviction not in (self.LRU, self.CLOCK):
+            raise ValueError(f"Unknown eviction policy {eviction!r}")
+        if (max_entries is not None and max_entries < 0) or (
+            max_bytes is not None and max_bytes < 0
+        ):
+            raise ValueError("Cache limits must not be negative!")
+
+        self._max_entries: int | None = max_entries
+        self._max_bytes: int | None = max_bytes
+        self._clock: bool = eviction == self.CLOCK
+        self._cache_filtered: bool = cache_filtered
+
+        #: Cached lookups, in eviction order (front is evicted first).  Keys
+        #: are ``(vertex, *args)``; values are ``[answer, size, referenced]``.
+        self._entries: OrderedDict[tuple, list] = OrderedDict()
+
+        #: Keys of the cached lookups of each vertex, for invalidation
+        self._by_vertex: dict[VertexCore, dict[tuple, None]] = {}
+
+        #: Current size of the cache, in bytes
+        self._nbytes: int = 0
+
+    @property
+    def max_entries(self) -> int | None:
+        """
+        Return the maximum number of cached lookups, if limited.
+        """
+        return self._max_entries
+
+    @property
+    def max_bytes(self) -> int | None:
+        """
+        Return the approximate maximum size of the cache in bytes, if limited.
+        """
+        return self._max_bytes
+
+    @property
+    def eviction(self) -> str:
+        """
+        Return the eviction order used, :py:attr:`LRU` or :py:attr:`CLOCK`.
+        """
+        return self.CLOCK if self._clock else self.LRU
+
+    @property
+    def cache_filtered(self) -> bool:
+        """
+        Return whether lookups made with a ``filterfunc`` are cached.
+        """
+        return self._cache_filtered
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Return the approximate current size of the cache, in bytes.
+        """
+        return self._nbytes
+
+    def __len__(self) -> int:
+        """
+        Called by :py:`len(policy)`; the number of cached lookups.
+        """
+        return len(self._entries)
+
+    def cacheable(self, args: tuple) -> bool:
+        """
+        Determine whether a lookup with the given arguments may be cached.
+
+        :param args: ``(direction_sensitive, unknown_handling, filterfunc)``,
+           as given to :py:func:`~edgegraph.traversal.helpers.neighbors`
+        :return: whether the lookup may be cached
+        """
+        return self._cache_filtered or args[2] is None
+
+    def get(self, vert: VertexCore, args: tuple, missing: Any) -> Any:
+        """
+        Look up a cached neighbor list.
+
+        **Mostly for internal use** by
+        :py:class:`~edgegraph.structure.vertex.VertexCore`.
+
+        :param vert: the vertex whose neighbors were asked for
+        :param args: ``(direction_sensitive, unknown_handling, filterfunc)``
+        :param missing: value to return if nothing is cached
+        :return: the cached neighbor list, or ``missing``
+        """
+        key = (vert, *args)
+        entry = self._entries.get(key)
+        if entry is None:
+            return missing
+
+        if self._clock:
+            entry[2] = True
+        else:
+            self._entries.move_to_end(key)
+        return entry[0]
+
+    def insert(self, vert: VertexCore, args: tuple, answer: list) -> None:
+        """
+        Cache a neighbor list, evicting others if needed.
+
+        **Mostly for internal use** by
+        :py:class:`~edgegraph.structure.vertex.VertexCore`.
+
+        :param vert: the vertex whose neighbors were asked for
+        :param args: ``(direction_sensitive, unknown_handling, filterfunc)``
+        :param answer: the neighbors found
+        """
+        key = (vert, *args)
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._nbytes -= old[1]
+
+        size = sys.getsizeof(answer) + sys.getsizeof(key)
+        if (self._max_bytes is not None and size > self._max_bytes) or (
+            self._max_entries == 0
+        ):
+            # would never fit; don't push everything else out for it
+            if old is not None:
+                self._forget_key(vert, key)
+            return
+
+        self._entries[key] = [answer, size, False]
+        self._by_vertex.setdefault(vert, {})[key] = None
+        self._nbytes += size
+        self._evict()
+
+    def invalidate(self, vert: VertexCore) -> None:
+        """
+        Drop all cached lookups of the given vertex.
+
+        **Mostly for internal use** by
+        :py:class:`~edgegraph.structure.vertex.VertexCore`.
+
+        :param vert: the vertex whose neighbors changed
+        """
+        keys = self._by_vertex.pop(vert, None)
+        if keys is None:
+            return
+        for key in keys:
+            self._nbytes -= self._entries.pop(key)[1]
+
+    def clear(self) -> None:
+        """
+        Drop all cached lookups.
+        """
+        self._entries.clear()
+        self._by_vertex.clear()
+        self._nbytes = 0
+
+    def _forget_key(self, vert: VertexCore, key: tuple) -> None:
+        """
+        Remove a key from the per-vertex index.
+
+        :param vert: the vertex the key belongs to
+        :param key: the key to remove
+        """
+        keys = self._by_vertex[vert]
+        del keys[key]
+        if not keys:
+            del self._by_vertex[vert]
+
+    def _evict(self) -> None:
+        """
+        Evict entries until the cache is within its limits.
+        """
+        entries = self._entries
+        max_entries = self._max_entries
+        max_bytes = self._max_bytes
+        while entries and (
+            (max_entries is not None and len(entries) > max_entries)
+            or (max_bytes is not None and self._nbytes > max_bytes)
+        ):
+            key, entry = entries.popitem(last=False)
+            if self._clock and entry[2]:
+                # second chance: clear the bit and send it round again
+                entry[2] = False
+                entries[key] = entry
+                continue
+
+            self._nbytes -= entry[1]
+            self._forget_key(key[0], key)
+
+            if metrics.ENABLED:
+                metrics.count(
+                    # pylint: disable-next=protected-access
+                    key[0]._qa_metrics_universe(), "nbcache.evictions"
+                )
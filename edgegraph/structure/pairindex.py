@@ -0,0 +1,101 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Holds the PairIndex class, a vertex's index of its links by neighbor.
+
+Finding the links between two vertices
+(:py:func:`~edgegraph.traversal.helpers.find_links`, or the ``dontdup`` option
+of :py:mod:`~edgegraph.builder.explicit`) normally means checking every link of
+one of them.  For vertices with many links, a :py:class:`PairIndex` maps each
+neighbor to the links leading there instead, making the lookup constant-time.
+
+Indexes are built on demand, for vertices with at least
+:py:attr:`~edgegraph.structure.vertex.VertexCore.PAIR_INDEX_THRESHOLD` links,
+the first time the links to one of their neighbors are looked up.  From then
+on, they are kept up to date as links are attached, detached, or have their
+ends reassigned.
+
+.. seealso::
+
+   :ref:`dev/performance/pair-index`
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from edgegraph.structure.link import Link
+    from edgegraph.structure.vertex import VertexCore
+
+
+class PairIndex(object):
+    """
+    Index of the links of one vertex, by the vertex at their other end.
+
+    **Mostly for internal use** by
+    :py:class:`~edgegraph.structure.vertex.VertexCore`.
+    """
+
+    __slots__ = ("_by_neighbor", "_by_link")
+
+    def __init__(self):
+        """
+        Create an empty index.
+        """
+
+        #: Links to each neighbor, as insertion-ordered sets
+        self._by_neighbor: dict[VertexCore, dict[Link, None]] = {}
+
+        #: Neighbors each link is filed under
+        self._by_link: dict[Link, tuple[VertexCore, ...]] = {}
+
+    def __len__(self) -> int:
+        """
+        Called by :py:`len(index)`; the number of links indexed.
+        """
+        return len(self._by_link)
+
+    def links_to(self, neighbor: VertexCore) -> tuple[Link, ...]:
+        """
+        Get the links filed under the given neighbor.
+
+        :param neighbor: the vertex at the other end
+        :return: the links leading there, in the order they were indexed
+        """
+        links = self._by_neighbor.get(neighbor)
+        return tuple(links) if links else ()
+
+    def update(self, link: Link, neighbors: tuple[VertexCore, ...]):
+        """
+        (Re-)file a link under the given neighbors.
+
+        :param link: the link to index
+        :param neighbors: the vertices at its other end(s); may be empty
+        """
+        if self._by_link.get(link) == neighbors:
+            return
+        self.discard(link)
+        if not neighbors:
+            return
+
+        self._by_link[link] = neighbors
+        for nb in neighbors:
+            self._by_neighbor.setdefault(nb, {})[link] = None
+
+    def discard(self, link: Link):
+        """
+        Remove a link from the index, if present.
+
+        :param link: the link to remove
+        """
+        neighbors = self._by_link.pop(link, None)
+        if neighbors is None:
+            return
+
+        for nb in neighbors:
+            links = self._by_neighbor[nb]
+            links.pop(link, None)
+            if not links:
+                del self._by_neighbor[nb]
@@ -2,7 +2,7 @@
 # -*- coding: utf-8 -*-
 
 """
-Holds the TwoEndedLink class.
+Holds the TwoEndedLink class, and the TwoEndedLinkCore class it is built on.
 """
 
 from __future__ import annotations
@@ -13,20 +13,20 @@ if TYPE_CHECKING:
     from edgegraph.structure.vertex import Vertex
 
 
-class TwoEndedLink(link.Link):
+class TwoEndedLinkCore(link.LinkCore):
     """
-    Represents an two-ended edge (v1 and v2) in the vertex-edge graph.  It is
-    neither undirected nor directed, and not intended for explicit use.
+    Slotted core of :py:class:`TwoEndedLink`.
 
-    .. seealso::
+    All of the behavior of :py:class:`TwoEndedLink` lives here.  Like
+    :py:class:`~edgegraph.structure.base.BaseObjectCore`, this class has no
+    dynamic attributes storage of its own.
 
-       You may want one of these subclasses of links, which *are* intended for
-       explicit use:
-
-       * :py:class:`~edgegraph.structure.undirectededge.UnDirectedEdge`
-       * :py:class:`~edgegraph.structure.directededge.DirectedEdge`
+    You likely want one of the subclasses of :py:class:`TwoEndedLink` rather
+    than this class.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         v1: Vertex | None = None,
@@ -46,10 +46,12 @@ class TwoEndedLink(link.Link):
            * :py:meth:`edgegraph.structure.link.Link.__init__`, the
              superclass constructor
         """
-        if (v1 is not None) and (not issubclass(type(v1), vertex.Vertex)):
+        # check against the core class, so that the vertices of
+        # edgegraph.structure.compact are accepted as well
+        if (v1 is not None) and (not issubclass(type(v1), vertex.VertexCore)):
             raise TypeError(f"v1 is not a Vertex object!  got {v1}")
 
-        if (v2 is not None) and (not issubclass(type(v2), vertex.Vertex)):
+        if (v2 is not None) and (not issubclass(type(v2), vertex.VertexCore)):
             raise TypeError(f"v2 is not a Vertex object!  got {v2}")
 
         # mypy complains about the vertices list below, that it may contain
@@ -58,6 +60,61 @@ class TwoEndedLink(link.Link):
         # above; mypy just doesn't seem to recognize it as type narrowing.
         super().__init__(vertices=[v1, v2], uid=uid, attributes=attributes)  # type: ignore
 
+    @classmethod
+    def _new_between(
+        cls, v1: Vertex, v2: Vertex, uid: int, attributes: dict | None
+    ) -> TwoEndedLinkCore:
+        """
+        Create a link of this class between two vertices, without calling
+        its constructor.
+
+        **FOR INTERNAL USE ONLY!!**
+
+        This is the fast path of
+        :py:func:`~edgegraph.builder.explicit.link_many`.  It skips the
+        argument checks and association round-trips of :py:meth:`__init__`,
+        so may only be used for classes whose constructor does nothing more
+        than that of this class.  The neighbor caches of ``v1`` and ``v2`` are
+        **not** invalidated; the caller must see to it.
+
+        :param v1: One end of the edge (a vertex; not checked)
+        :param v2: The other end of the edge (a vertex; not checked)
+        :param uid: UID of the new edge
+        :param attributes: attributes to apply to the new edge, or ``None``
+        :raises TypeError: if ``attributes`` is not a :py:class:`dict`
+        :return: the new edge
+        """
+        lnk = cls.__new__(cls)
+        lnk._uid = uid
+        lnk._universes = None
+        lnk._vertices = [v1, v2]
+        if attributes is not None:
+            lnk._apply_attributes(attributes)
+
+        # the roles of the ends follow from the class alone; this is
+        # Vertex._classify_link(), unrolled
+        directed = cls._DIRECTED
+        if directed is None:
+            role1 = role2 = vertex.ROLE_UNK
+        elif not directed:
+            role1 = role2 = vertex.ROLE_UND
+        else:
+            role1, role2 = vertex.ROLE_OUT, vertex.ROLE_IN
+
+        # pylint: disable=protected-access
+        if v2 is v1:
+            v1._links[lnk] = role1 | role2
+        else:
+            v1._links[lnk] = role1
+            v2._links[lnk] = role2
+            if v2._pair_index is not None:
+                v2._pair_reindex(lnk)
+        if v1._pair_index is not None:
+            v1._pair_reindex(lnk)
+        # pylint: enable=protected-access
+
+        return lnk
+
     @property
     def v1(self) -> Vertex:
         """
@@ -95,6 +152,16 @@ class TwoEndedLink(link.Link):
         self.add_vertex(new)
         self._vertices.append(v2)
 
+        # v2 is re-attached behind the back of add_vertex(); if it also holds
+        # this link, let it re-evaluate its role.  its neighbor has changed,
+        # so its cached neighbor lookups are stale as well.
+        # pylint: disable-next=protected-access
+        if (v2 is not None) and (self in v2._links):
+            # pylint: disable=protected-access
+            v2._classify_link(self)
+            v2._qa_neighbors_invalidate()
+            # pylint: enable=protected-access
+
     @property
     def v2(self) -> Vertex:
         """
@@ -124,6 +191,12 @@ class TwoEndedLink(link.Link):
         self._vertices = [v1]
         self.add_vertex(new)
 
+        # v1 stays attached, but its neighbor has changed
+        # pylint: disable-next=protected-access
+        if (v1 is not None) and (self in v1._links):
+            # pylint: disable-next=protected-access
+            v1._qa_neighbors_invalidate()
+
     def other(self, end: Vertex) -> Vertex | None:
         """
         Identify and return the other end of this edge.
@@ -138,9 +211,27 @@ class TwoEndedLink(link.Link):
         :param end: one end of this edge
         :return: the other end of this edge, or None
         """
-        if end is self.v1:
-            return self.v2
-        if end is self.v2:
-            return self.v1
+        # read the endpoint list directly; this is called for every link of a
+        # vertex when searching for the links between two of them
+        v1, v2 = self._vertices
+        if end is v1:
+            return v2
+        if end is v2:
+            return v1
 
         return None
+
+
+class TwoEndedLink(TwoEndedLinkCore, link.Link):
+    """
+    Represents an two-ended edge (v1 and v2) in the vertex-edge graph.  It is
+    neither undirected nor directed, and not intended for explicit use.
+
+    .. seealso::
+
+       You may want one of these subclasses of links, which *are* intended for
+       explicit use:
+
+       * :py:class:`~edgegraph.structure.undirectededge.UnDirectedEdge`
+       * :py:class:`~edgegraph.structure.directededge.DirectedEdge`
+    """
@@ -0,0 +1,225 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+UID generation strategies for edgegraph objects.
+
+Every :py:class:`~edgegraph.structure.base.BaseObject` not given an explicit
+``uid`` gets one from a *UID generator*: any callable taking no arguments and
+returning a new, non-zero :py:class:`int` on every call.  This module provides
+three:
+
+* :py:func:`random_uid` (the default): a random 128-bit integer from
+  :py:func:`uuid.uuid4`.  Unique across processes and machines, but each call
+  asks the operating system for randomness, and the large integers it makes are
+  slower to hash and bigger to store and pickle.
+* :py:func:`counter`: a process-local, monotonically increasing counter.  By
+  far the fastest, with the smallest integers, but only unique within one
+  process (and one counter).
+* :py:class:`TimeNodeSequence`: 63-bit integers made from a millisecond
+  timestamp, a node number, and a sequence number (similar to "snowflake"
+  IDs).  Roughly time-ordered, and unique across processes as long as each is
+  given a different node number.
+
+The generator is chosen as follows:
+
+#. an explicit ``uid`` argument always wins;
+#. otherwise, the
+   :py:attr:`~edgegraph.structure.universe.Universe.uid_generator` of the
+   first universe given to the object's constructor which has one set (links
+   look at the universes of their vertices);
+#. otherwise, the global default, set by :py:func:`set_default_generator`.
+
+.. code-block:: python
+   :linenos:
+
+   #!python3
+   from edgegraph.structure import Universe, Vertex, uidgen
+
+   # globally ...
+   uidgen.set_default_generator(uidgen.counter())
+
+   # ... or for one universe only
+   uni = Universe(uid_generator=uidgen.TimeNodeSequence(node=3))
+   v = Vertex(universes=[uni])
+
+.. seealso::
+
+   :ref:`dev/performance/uid` for a comparison of construction speed.
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterable
+
+
+def random_uid() -> int:
+    """
+    Generate a random 128-bit UID, using :py:func:`uuid.uuid4`.
+
+    This is the default UID generator.
+
+    :return: a new UID
+    """
+    return uuid.uuid4().int
+
+
+def counter(start: int = 1) -> Callable[[], int]:
+    """
+    Create a process-local, monotonically increasing UID generator.
+
+    Each generator created by this function counts independently; UIDs are
+    only unique among objects numbered by the *same* generator.
+
+    :param start: First UID to hand out.  Must be positive, as a UID of zero
+       is treated as "no UID given".
+    :raises ValueError: if ``start`` is not positive
+    :return: the UID generator
+    """
+    if start < 1:
+        raise ValueError(f"Counter UIDs must start above zero; got {start}")
+
+    # the __next__ of an itertools.count is implemented in C, and atomic under
+    # the GIL -- no need for a python-level wrapper (or lock) around it
+    return itertools.count(start).__next__
+
+
+class TimeNodeSequence(object):
+    """
+    Time + node + sequence UID generator.
+
+    UIDs are 63-bit integers, laid out (most to least significant bits) as:
+
+    * 41 bits of milliseconds since :py:attr:`EPOCH`,
+    * 10 bits of node number,
+    * 12 bits of sequence number, counting objects made within the same
+      millisecond.
+
+    Should more than 4096 UIDs be requested within one millisecond, the
+    timestamp part is advanced early rather than waiting for the clock, so the
+    generator never blocks and never repeats itself, even if the system clock
+    steps backwards.  Calls are thread-safe.
+    """
+
+    #: Start of the timestamp part of the UIDs (2020-01-01T00:00:00Z), in
+    #: milliseconds since the Unix epoch.
+    EPOCH: int = 1_577_836_800_000
+
+    _NODE_BITS = 10
+    _SEQ_BITS = 12
+    _SEQ_MASK = (1 << _SEQ_BITS) - 1
+
+    def __init__(self, node: int | None = None):
+        """
+        Create a new time + node + sequence generator.
+
+        :param node: Node number to embed in the UIDs, ``0 <= node < 1024``.
+           If not given, one is derived from the host's MAC address and the
+           process ID.  Give distinct node numbers to processes that must not
+           generate colliding UIDs.
+        :raises ValueError: if ``node`` is out of range
+        """
+        if node is None:
+            node = (uuid.getnode() ^ os.getpid()) & ((1 << self._NODE_BITS) - 1)
+        if not 0 <= node < (1 << self._NODE_BITS):
+            raise ValueError(f"node must be in [0, 1024); got {node}")
+
+        #: Node number embedded in each UID
+        self._node: int = node
+
+        #: Timestamp of the last UID handed out
+        self._last: int = -1
+
+        #: Sequence number of the last UID handed out
+        self._seq: int = 0
+
+        self._lock = threading.Lock()
+
+    @property
+    def node(self) -> int:
+        """
+        Return the node number embedded in UIDs made by this generator.
+        """
+        return self._node
+
+    def __call__(self) -> int:
+        """
+        Generate a new UID.
+        """
+        with self._lock:
+            now = time.time_ns() // 1_000_000 - self.EPOCH
+            if now > self._last:
+                self._last = now
+                self._seq = 0
+            else:
+                self._seq += 1
+                if self._seq > self._SEQ_MASK:
+                    self._last += 1
+                    self._seq = 0
+
+            return (
+                (self._last << (self._NODE_BITS + self._SEQ_BITS))
+                | (self._node << self._SEQ_BITS)
+                | self._seq
+            )
+
+
+#: The global default generator
+_default_generator: Callable[[], int] = random_uid
+
+
+def set_default_generator(generator: Callable[[], int] | None) -> None:
+    """
+    Set the UID generator used by objects which are not told otherwise.
+
+    :param generator: the new default UID generator, or ``None`` to restore
+       :py:func:`random_uid`.
+    """
+    # pylint: disable-next=global-statement
+    global _default_generator
+    _default_generator = generator if generator is not None else random_uid
+
+
+def get_default_generator() -> Callable[[], int]:
+    """
+    Get the UID generator used by objects which are not told otherwise.
+
+    :return: the current default UID generator
+    """
+    return _default_generator
+
+
+def generator_for(universes: Iterable | None = None) -> Callable[[], int]:
+    """
+    Find the UID generator for a new object.
+
+    **Mostly for internal use** by object constructors.
+
+    :param universes: universes the new object is being created in, if any
+    :return: the generator of the first of the given universes that has one,
+       or the global default.
+    """
+    if universes:
+        for uni in universes:
+            generator = getattr(uni, "uid_generator", None)
+            if generator is not None:
+                return generator
+    return _default_generator
+
+
+def new_uid(universes: Iterable | None = None) -> int:
+    """
+    Generate a UID for a new object.
+
+    **Mostly for internal use** by object constructors.  Uses the generator of
+    the first of the given universes that has one, or the global default.
+
+    :param universes: universes the new object is being created in, if any
+    :return: a new UID
+    """
+    return generator_for(universes)()
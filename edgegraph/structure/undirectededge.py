@@ -27,6 +27,8 @@ class UnDirectedEdge(twoendedlink.TwoEndedLink):
          creating these classes directly.
     """
 
+    _DIRECTED = False
+
     # pylint correctly complains about this superclass call here, citing it is
     # useless and the method should just not be overridden.  in the strictest
     # sense, it is true -- no code changes between this __init__ and the
@@ -7,8 +7,10 @@ Holds the Universe class.
 
 from __future__ import annotations
 from typing import TYPE_CHECKING
+from collections.abc import Callable
+import contextlib
 import types
-from edgegraph.structure import base, vertex
+from edgegraph.structure import base, vertex, csr, nbcache, batching
 
 if TYPE_CHECKING:
     Vertex = vertex.Vertex
@@ -188,12 +190,18 @@ class Universe(vertex.Vertex):
         laws: UniverseLaws | None = None,
         uid: int | None = None,
         attributes: dict | None = None,
+        uid_generator: Callable[[], int] | None = None,
+        neighbor_cache: nbcache.NeighborCachePolicy | None = None,
     ):
         """
         Instantiate a Universe.
 
         :param vertices: a set of vertices to link to this universe
         :param laws: the laws of nature that apply to this universe
+        :param uid_generator: UID generator for objects created in this
+           universe; see :py:attr:`uid_generator`.
+        :param neighbor_cache: neighbor cache policy for the vertices of this
+           universe; see :py:attr:`neighbor_cache`.
 
         .. seealso::
 
@@ -202,6 +210,14 @@ class Universe(vertex.Vertex):
         """
         super().__init__(uid=uid, attributes=attributes)
 
+        #: UID generator for objects created in this universe
+        self._uid_generator: Callable[[], int] | None = uid_generator
+
+        #: Neighbor cache shared by the vertices of this universe
+        self._neighbor_cache: nbcache.NeighborCachePolicy | None = (
+            neighbor_cache
+        )
+
         #: Laws of the universe
         self._laws: UniverseLaws | None = laws
         if self._laws is None:
@@ -209,11 +225,70 @@ class Universe(vertex.Vertex):
         self._laws.applies_to = self
 
         #: Internal set of vertices
-        self._vertices: list[Vertex] = []
+        #:
+        #: A :py:class:`dict` is used (with all values ``None``) as an
+        #: insertion-ordered set, giving constant-time membership tests while
+        #: preserving the order vertices were added in.
+        self._vertices: dict[Vertex, None] = {}
         if vertices is not None:
             for v in vertices:
                 self.add_vertex(v)
 
+    @property
+    def uid_generator(self) -> Callable[[], int] | None:
+        """
+        The UID generator used for objects created in this universe.
+
+        Vertices given this universe in their constructor, and links created
+        between vertices of this universe, are numbered by this generator
+        rather than the global default.  ``None`` (the default) means to use
+        the global default.  Objects which already exist keep their UIDs.
+
+        .. seealso::
+
+           :py:mod:`edgegraph.structure.uidgen` for the available generators
+        """
+        return self._uid_generator
+
+    @uid_generator.setter
+    def uid_generator(self, new: Callable[[], int] | None):
+        """
+        Set the UID generator used for objects created in this universe.
+        """
+        self._uid_generator = new
+
+    @property
+    def neighbor_cache(self) -> nbcache.NeighborCachePolicy | None:
+        """
+        The neighbor cache policy for the vertices of this universe.
+
+        When set, the results of
+        :py:func:`~edgegraph.traversal.helpers.neighbors` for vertices of this
+        universe are cached under this policy, whether or not
+        :py:attr:`~edgegraph.structure.vertex.VertexCore.NEIGHBOR_CACHING` is
+        enabled.  Vertices belonging to several universes use the policy of
+        the first one (in the order of their
+        :py:attr:`~edgegraph.structure.base.BaseObjectCore.universes`) that
+        has one.
+
+        .. seealso::
+
+           :ref:`dev/performance/vert-nb-cache/policy`
+        """
+        return self._neighbor_cache
+
+    @neighbor_cache.setter
+    def neighbor_cache(self, new: nbcache.NeighborCachePolicy | None):
+        """
+        Set the neighbor cache policy for the vertices of this universe.
+        """
+        # neither policy sees link changes in this universe while detached
+        # from it; anything cached in them may go stale
+        for policy in (self._neighbor_cache, new):
+            if policy is not None:
+                policy.clear()
+        self._neighbor_cache = new
+
     @property
     def vertices(self) -> list[vertex.Vertex]:
         """
@@ -232,6 +307,35 @@ class Universe(vertex.Vertex):
         """
         return list(self._vertices)
 
+    def has_vertex(self, vert: vertex.Vertex) -> bool:
+        """
+        Determine whether or not the given vertex is a member of this universe.
+
+        Unlike ``vert in uni.vertices``, this does not build a copy of the
+        vertex list, and runs in constant time regardless of the size of the
+        universe.  Traversal and search functions should prefer this over the
+        :py:attr:`vertices` attribute for membership checks.
+
+        .. seealso::
+
+           The ``in`` operator (:py:meth:`__contains__`) is an alias of this
+           method.
+
+        :param vert: the vertex to check for
+        :return: whether or not ``vert`` is in this universe
+        """
+        return vert in self._vertices
+
+    def __contains__(self, vert: vertex.Vertex) -> bool:
+        """
+        Called by :py:`vert in uni` to check for vertex membership.
+
+        .. seealso::
+
+           :py:meth:`has_vertex`, which this is an alias of
+        """
+        return vert in self._vertices
+
     def add_vertex(self, vert: vertex.Vertex):
         """
         Adds a new vertex to this universe.
@@ -250,7 +354,7 @@ class Universe(vertex.Vertex):
         if vert in self._vertices:
             return
 
-        self._vertices.append(vert)
+        self._vertices[vert] = None
         if self not in vert.universes:
             vert.add_to_universe(self)
 
@@ -263,11 +367,56 @@ class Universe(vertex.Vertex):
         vertices' record of universes as well.
 
         :param vert: the vertex to be removed
+        :raises ValueError: if the vertex is not a member of this universe
         """
-        self._vertices.remove(vert)
+        if vert not in self._vertices:
+            raise ValueError(f"{vert} is not a member of this universe")
+        del self._vertices[vert]
         if self in vert.universes:
             vert.remove_from_universe(self)
 
+    def batch(self) -> contextlib.AbstractContextManager[None]:
+        """
+        Batch graph changes until the end of a ``with`` block.
+
+        Use this when making many link changes at once (such as when loading a
+        large graph): the neighbor caches of the vertices involved are then
+        invalidated once each, when the block ends, rather than at every
+        change.
+
+        .. code-block:: python
+
+           with uni.batch():
+               for v1, v2 in pairs:
+                   explicit.link_directed(v1, v2)
+
+        .. seealso::
+
+           :py:func:`edgegraph.structure.batching.batch`, which this returns,
+           for details (including that the batch is **not** limited to this
+           universe).
+
+        :return: a context manager
+        """
+        return batching.batch()
+
+    def freeze(self) -> csr.CSRSnapshot:
+        """
+        Create an immutable, integer-indexed snapshot of this universe.
+
+        The snapshot can be passed to traversal and pathfinding functions in
+        place of this universe, and is much faster to traverse repeatedly.
+        Changes made to the graph after freezing are not reflected in the
+        snapshot.
+
+        .. seealso::
+
+           :py:class:`~edgegraph.structure.csr.CSRSnapshot` for details
+
+        :return: a snapshot of the current state of this universe
+        """
+        return csr.CSRSnapshot(self._vertices)
+
     @property
     def laws(self) -> UniverseLaws | None:
         """
@@ -2,28 +2,51 @@
 # -*- coding: utf-8 -*-
 
 """
-Holds the Vertex class.
+Holds the Vertex class, and the VertexCore class it is built on.
 """
 
 from __future__ import annotations
 from typing import Any, TYPE_CHECKING
-from collections.abc import Iterator
-from edgegraph.structure import base
+from collections.abc import Iterable, Iterator
+from edgegraph import metrics
+from edgegraph.structure import base, batching
+from edgegraph.structure.pairindex import PairIndex
 
 if TYPE_CHECKING:
     from edgegraph.structure.link import Link
+    from edgegraph.structure.nbcache import NeighborCachePolicy
     from edgegraph.structure.universe import Universe
 
+#: Role bit: a directed link leaving the vertex (followed forwards).
+ROLE_OUT = 1
 
-class Vertex(base.BaseObject):
+#: Role bit: a directed link arriving at the vertex (followed backwards).
+ROLE_IN = 2
+
+#: Role bit: an undirected link (followed either way).
+ROLE_UND = 4
+
+#: Role bit: a link of unknown directionality.
+ROLE_UNK = 8
+
+
+class VertexCore(base.BaseObjectCore):
     """
-    Represents a vertex in an edge-vertex graph.
+    Slotted core of :py:class:`Vertex`.
 
-    This class is a base class for anything that needs to "relate to" something
-    else -- another instance, or completely different types (as long as they
-    both subclass this one, at some level).
+    All of the behavior of :py:class:`Vertex` lives here.  Like
+    :py:class:`~edgegraph.structure.base.BaseObjectCore`, this class has no
+    dynamic attributes storage of its own.
+
+    You likely want :py:class:`Vertex` rather than this class.
     """
 
+    __slots__ = (
+        "_links",
+        "__qa_nb_cache",
+        "_pair_index",
+    )
+
     #: Enable / disable neighbor caching program-wide.
     #:
     #: .. seealso::
@@ -32,7 +55,15 @@ class Vertex(base.BaseObject):
     NEIGHBOR_CACHING: bool = False
 
     _QA_NB_INVALID: object = object()
-    _CACHE_STATS: dict[int, list[int]] = {}
+
+    #: Number of links a vertex must have before an index of its links by
+    #: neighbor is built for it, on the first lookup of the links to one of its
+    #: neighbors.  Set to ``None`` to never build such indexes.
+    #:
+    #: .. seealso::
+    #:
+    #:    :ref:`dev/performance/pair-index` for more information on usage
+    PAIR_INDEX_THRESHOLD: int | None = 32
 
     @classmethod
     def total_cache_stats(cls) -> str:
@@ -44,34 +75,34 @@ class Vertex(base.BaseObject):
         printed, logged, or written to file (it does not do anything other than
         build the string on its own).
 
+        The numbers are the ``nbcache.*`` counters of
+        :py:data:`edgegraph.metrics.REGISTRY`, summed over all universes; they
+        are only collected while :py:mod:`edgegraph.metrics` is enabled.  Use
+        the registry directly for per-universe, structured data.
+
         .. seealso::
 
            * :ref:`dev/performance/vert-nb-cache` for more on caching
            * :py:attr:`NEIGHBOR_CACHING` to enable / disable it
+           * :py:mod:`edgegraph.metrics` for the counters themselves
 
-        :return: Human-readable string indicating size, hits, misses,
-           invalidations, and insertions to the vertex neighbor cache.
+        :return: Human-readable string indicating hits, misses, invalidations,
+           insertions, and evictions of the vertex neighbor caches.
         """
         lines = []
 
-        if cls.NEIGHBOR_CACHING:
+        if not metrics.ENABLED:
+            lines.append("Metrics collection is DISABLED")
 
-            totals = [0, 0, 0, 0]
-            for _, stat in cls._CACHE_STATS.items():
-                totals[0] += stat[0]
-                totals[1] += stat[1]
-                totals[2] += stat[2]
-                totals[3] += stat[3]
-
-            lines.append("=== CACHE STATISTICS OVERALL ===")
-            lines.append(f"Size:          {len(Vertex._CACHE_STATS)}")
-            lines.append(f"Hits:          {totals[0]}")
-            lines.append(f"Misses:        {totals[1]}")
-            lines.append(f"Invalidations: {totals[2]}")
-            lines.append(f"Insertions:    {totals[3]}")
-
-        else:
-            lines.append("Neighbor caching is DISABLED")
+        totals = metrics.REGISTRY.totals()
+        lines.append("=== CACHE STATISTICS OVERALL ===")
+        lines.append(f"Hits:          {totals.get('nbcache.hits', 0)}")
+        lines.append(f"Misses:        {totals.get('nbcache.misses', 0)}")
+        lines.append(
+            f"Invalidations: {totals.get('nbcache.invalidations', 0)}"
+        )
+        lines.append(f"Insertions:    {totals.get('nbcache.insertions', 0)}")
+        lines.append(f"Evictions:     {totals.get('nbcache.evictions', 0)}")
 
         return "\n".join(lines)
 
@@ -98,13 +129,23 @@ class Vertex(base.BaseObject):
         """
         super().__init__(uid=uid, attributes=attributes, universes=universes)
 
-        self._CACHE_STATS.update({self.uid: [0, 0, 0, 0]})
-
         #: Links that this vertex is associated with
         #:
-        #: This is a list of links that include this vertex as one of the
-        #: linked vertices.
-        self._links: list[Link] = []
+        #: This is an insertion-ordered :py:class:`dict` of links that include
+        #: this vertex as one of the linked vertices.  The values are the
+        #: role(s) this vertex plays in each link, as a combination of the
+        #: ``ROLE_*`` bits (a directed self-loop is both :py:data:`ROLE_OUT`
+        #: and :py:data:`ROLE_IN`), kept up to date by
+        #: :py:meth:`_classify_link`.
+        self._links: dict[Link, int] = {}
+
+        #: Quick-access neighbor cache; ``None`` until first used.
+        self.__qa_nb_cache: dict[tuple[Any, ...], list[Vertex]] | None = None
+
+        #: Index of links by neighbor; ``None`` until built by
+        #: :py:meth:`_links_to`.
+        self._pair_index: PairIndex | None = None
+
         if links is not None:
             for link in links:
                 self.add_to_link(link)
@@ -113,8 +154,6 @@ class Vertex(base.BaseObject):
         for uni in self.universes:
             uni.add_vertex(self)
 
-        self.__qa_nb_cache: dict[tuple[Any, ...], list[Vertex]] = {}
-
     def add_to_universe(self, universe: Universe) -> None:
         """
         Adds this object to a new universe.  If it is already there, no action
@@ -128,7 +167,7 @@ class Vertex(base.BaseObject):
         :param universe: the new universe to add this object to
         """
         super().add_to_universe(universe)
-        if self not in universe.vertices:
+        if not universe.has_vertex(self):
             universe.add_vertex(self)
 
     @property
@@ -141,6 +180,21 @@ class Vertex(base.BaseObject):
         """
         return tuple(self._links)
 
+    def _qa_policy(self) -> NeighborCachePolicy | None:
+        """
+        Find the neighbor cache policy that applies to this vertex.
+
+        **FOR INTERNAL USE ONLY!!**
+
+        :return: The policy of the first universe this vertex belongs to which
+           has one, or ``None``.
+        """
+        for uni in self._universes or ():
+            policy = getattr(uni, "neighbor_cache", None)
+            if policy is not None:
+                return policy
+        return None
+
     def _qa_neighbors_get(self, *args):
         """
         Check for and return quick-access neighbors cache data.
@@ -148,23 +202,49 @@ class Vertex(base.BaseObject):
         **FOR INTERNAL USE ONLY!!**
 
         This function is to be used for checking for and returning (if
-        available) cached neighbor data.  If no such data is available (or
-        caching is disabled), :py:attr:`_QA_NB_INVALID` is returned instead as
-        a sentinel.
+        available) cached neighbor data.  The neighbor cache policy of this
+        vertex's universe is used if there is one (see
+        :py:attr:`edgegraph.structure.universe.Universe.neighbor_cache`);
+        otherwise, the per-vertex cache enabled by :py:attr:`NEIGHBOR_CACHING`.
 
         :param args: Arguments passed to neighbors() function.
-        :return: Cached data if available, else :py:attr:`_QA_NB_INVALID`.
+        :return: Cached data if available.  If lookups with these arguments
+           are cached, but no data is available, :py:attr:`_QA_NB_INVALID` is
+           returned instead as a sentinel.  If they are not cached at all,
+           ``None`` is returned, and :py:meth:`_qa_neighbors_insert` need not
+           be called.
         """
-        if not self.NEIGHBOR_CACHING:
-            return self._QA_NB_INVALID
+        # pylint: disable-next=protected-access
+        touched = batching._touched
+        if touched is not None and self in touched:
+            # changed within an open batch; the cache is not yet invalidated
+            return None
 
-        if args in self.__qa_nb_cache:
-            self._CACHE_STATS[self.uid][0] += 1
+        policy = self._qa_policy()
+        if policy is not None:
+            if not policy.cacheable(args):
+                return None
+            answer = policy.get(self, args, self._QA_NB_INVALID)
 
-            return self.__qa_nb_cache[args]
+        elif not self.NEIGHBOR_CACHING:
+            return None
 
-        self._CACHE_STATS[self.uid][1] += 1
-        return self._QA_NB_INVALID
+        elif (self.__qa_nb_cache is not None) and (args in self.__qa_nb_cache):
+            answer = self.__qa_nb_cache[args]
+
+        else:
+            answer = self._QA_NB_INVALID
+
+        if metrics.ENABLED:
+            metrics.count(
+                self._qa_metrics_universe(),
+                (
+                    "nbcache.misses"
+                    if answer is self._QA_NB_INVALID
+                    else "nbcache.hits"
+                ),
+            )
+        return answer
 
     def _qa_neighbors_invalidate(self):
         """
@@ -176,11 +256,27 @@ class Vertex(base.BaseObject):
         This MUST be called when the vertex's neighbors are modified in any way
         -- linked, unlinked, or anything else, to maintain cache integrity and
         prevent stale data.
+
+        Within a :py:func:`~edgegraph.structure.batching.batch`, this only
+        notes the vertex; invalidation is done when the batch ends.
         """
-        if not self.NEIGHBOR_CACHING:
+        # pylint: disable-next=protected-access
+        touched = batching._touched
+        if touched is not None:
+            touched[self] = None
             return
-        self._CACHE_STATS[self.uid][2] += 1
-        self.__qa_nb_cache = {}
+
+        cached = self.NEIGHBOR_CACHING
+        for uni in self._universes or ():
+            policy = getattr(uni, "neighbor_cache", None)
+            if policy is not None:
+                policy.invalidate(self)
+                cached = True
+
+        if metrics.ENABLED and cached:
+            metrics.count(self._qa_metrics_universe(), "nbcache.invalidations")
+
+        self.__qa_nb_cache = None
 
     def _qa_neighbors_insert(self, answer, *args):
         """
@@ -194,10 +290,28 @@ class Vertex(base.BaseObject):
         :param answer: the neighbors of this object
         :param *args: Arguments passed to the neighbors() function
         """
-        if not self.NEIGHBOR_CACHING:
+        policy = self._qa_policy()
+        if policy is not None:
+            policy.insert(self, args, answer)
+        elif not self.NEIGHBOR_CACHING:
             return
-        self._CACHE_STATS[self.uid][3] += 1
-        self.__qa_nb_cache[args] = answer
+        else:
+            if self.__qa_nb_cache is None:
+                self.__qa_nb_cache = {}
+            self.__qa_nb_cache[args] = answer
+
+        if metrics.ENABLED:
+            metrics.count(self._qa_metrics_universe(), "nbcache.insertions")
+
+    def _qa_metrics_universe(self) -> Universe | None:
+        """
+        Get the universe this vertex's cache events are counted under.
+
+        **FOR INTERNAL USE ONLY!!**
+
+        :return: The first universe this vertex belongs to, or ``None``.
+        """
+        return self._universes[0] if self._universes else None
 
     def add_to_link(self, link: Link):
         """
@@ -219,9 +333,12 @@ class Vertex(base.BaseObject):
         :param link: the link to add this vertex to
         """
         if link not in self._links:
-            self._links.append(link)
-            if self not in link.vertices:
+            self._links[link] = 0
+            # pylint: disable-next=protected-access
+            if self not in link._vertices:
                 link.add_vertex(self)
+            else:
+                self._classify_link(link)
 
         self._qa_neighbors_invalidate()
 
@@ -233,11 +350,97 @@ class Vertex(base.BaseObject):
         """
 
         if link in self._links:
-            self._links.remove(link)
+            del self._links[link]
+            if self._pair_index is not None:
+                self._pair_index.discard(link)
             link.unlink_from(self)
 
         self._qa_neighbors_invalidate()
 
+    def _classify_link(self, link: Link):
+        """
+        Record the role this vertex plays in the given link.
+
+        **FOR INTERNAL USE ONLY!!**
+
+        This must be called whenever a link is attached to this vertex, or the
+        role this vertex plays in a link (origin or destination) may have
+        changed.  The link must already be present in :py:attr:`_links`.
+
+        :param link: the link to (re-)classify
+        """
+        # pylint: disable-next=protected-access
+        directed = getattr(link, "_DIRECTED", None)
+        if directed is None:
+            role = ROLE_UNK
+        elif not directed:
+            role = ROLE_UND
+        else:
+            # look at the raw endpoint list, rather than link.v1 / link.v2 --
+            # this may be called part-way through link construction, when v2
+            # does not exist yet.  a self-loop is both outbound and inbound.
+            # pylint: disable-next=protected-access
+            ends = link._vertices
+            role = 0
+            if len(ends) > 0 and ends[0] is self:
+                role |= ROLE_OUT
+            if len(ends) > 1 and ends[1] is self:
+                role |= ROLE_IN
+        self._links[link] = role
+
+        if self._pair_index is not None:
+            self._pair_reindex(link)
+
+    def _pair_reindex(self, link: Link):
+        """
+        File the given link in this vertex's pair index, under the vertex (or
+        vertices) at its other end.
+
+        **FOR INTERNAL USE ONLY!!**
+
+        This must be called whenever the ends of a link of this vertex may have
+        changed, if this vertex has a pair index.
+
+        :param link: the link to (re-)index
+        """
+        # pylint: disable-next=protected-access
+        ends = link._vertices
+        if ends and ends[0] is self:
+            # same as TwoEndedLink.other(): a self-loop leads back here
+            others = ends[1:]
+        else:
+            others = [end for end in ends if end is not self]
+        self._pair_index.update(
+            link,
+            tuple(dict.fromkeys(end for end in others if end is not None)),
+        )
+
+    def _links_to(self, other: VertexCore) -> Iterable[Link]:
+        """
+        Get the links of this vertex which may lead to the given vertex.
+
+        **FOR INTERNAL USE ONLY!!**
+
+        If this vertex has enough links (see :py:attr:`PAIR_INDEX_THRESHOLD`),
+        this is an index lookup; otherwise, all links are returned.  Either
+        way, callers must still check the links they are given.
+
+        :param other: the vertex at the other end
+        :return: candidate links.  Without an index, these are in the order
+           they were attached; with one, links whose ends were reassigned may
+           come later.
+        """
+        if self._pair_index is None:
+            threshold = self.PAIR_INDEX_THRESHOLD
+            if threshold is None or len(self._links) < threshold:
+                return self._links
+
+            self._pair_index = PairIndex()
+            for link in self._links:
+                self._pair_reindex(link)
+
+        return self._pair_index.links_to(other)
+
     def remove_from_universe(self, universe: Universe) -> None:
         """
         Remove this vertex from the specified universe.
@@ -249,6 +452,21 @@ class Vertex(base.BaseObject):
         :param universe: the universe that this vertex will be removed from
         :raises KeyError: if this object is not present in the given universe
         """
+        # cached lookups would go stale, no longer seeing link changes
+        policy = getattr(universe, "neighbor_cache", None)
+        if policy is not None:
+            policy.invalidate(self)
+
         super().remove_from_universe(universe)
-        if self in universe.vertices:
+        if universe.has_vertex(self):
             universe.remove_vertex(self)
+
+
+class Vertex(VertexCore, base.BaseObject):
+    """
+    Represents a vertex in an edge-vertex graph.
+
+    This class is a base class for anything that needs to "relate to" something
+    else -- another instance, or completely different types (as long as they
+    both subclass this one, at some level).
+    """
@@ -6,6 +6,9 @@ Breadth-first search and traversal functions.
 
 The functions here perform searches and traversals of graphs in a breadth-first manner.  The implementations are iterative.
 
+All of these run on the engine in :py:mod:`edgegraph.traversal.visitors`; a
+visitor given to a traversal has its hooks called as the traversal goes.
+
 .. seealso::
 
    * [CLRS09]_, chapter 22.2; [GoTa60]_, chapter 13.3
@@ -48,15 +51,42 @@ visiting v9 before v10) is determined by the structure of the universe.
 
 from __future__ import annotations
 
-import collections
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterable, Iterator
+
+from edgegraph import metrics
+from edgegraph.structure import Universe, Vertex, CSRSnapshot
+from edgegraph.traversal import helpers, visitors
+
+
+def _bf_preflight(
+    uni: Universe | CSRSnapshot | None,
+    start: Vertex | Iterable[Vertex],
+) -> list[Vertex] | None:
+    """
+    Checks common to the breadth-first functions.  For internal use only!
+
+    :raises ValueError: If any start vertex is not in the (non-empty)
+       universe.
+    :return: The start vertices, as a list, or ``None`` if the universe is
+       empty.
 
-from edgegraph.structure import Universe, Vertex
-from edgegraph.traversal import helpers
+    :meta private:
+    """
+    # pylint: disable-next=protected-access
+    starts = helpers._start_vertices(start)
+    if (uni is not None) and not all(uni.has_vertex(s) for s in starts):
+        if len(uni.vertices) == 0:
+            # empty!
+            return None
+        raise ValueError("Start vertex not in specified universe!")
+    return starts
 
 
 def bfs(
-    uni: Universe, start: Vertex, attrib: str, val: object
+    uni: Universe,
+    start: Vertex | Iterable[Vertex],
+    attrib: str,
+    val: object,
 ) -> Vertex | None:
     """
     Perform a breadth-first search.
@@ -69,54 +99,50 @@ def bfs(
     early when the desired value is found.
 
     :param uni: The universe to search in.  Set to ``None`` for no limitations.
-    :param start: The vertex to start searching at.
+       A :py:class:`~edgegraph.structure.csr.CSRSnapshot` may be given
+       instead, for faster searching of a frozen graph.
+    :param start: The vertex to start searching at, or an iterable of
+       several; see :py:func:`ibft`.
     :param attrib: The attribute name to check for each vertex.
     :param val: The value to check for in the aforementioned attribute.
     :return: The vertex which first matched the specified attribute value.
     """
-    if (uni is not None) and (len(uni.vertices) == 0):
-        # empty!
+    starts = _bf_preflight(uni, start)
+    if starts is None:
         return None
-    if (uni is not None) and (start not in uni.vertices):
-        raise ValueError("Start vertex not in specified universe!")
 
-    if hasattr(start, attrib):
-        if start[attrib] == val:
-            return start
+    if metrics.ENABLED:
+        metrics.count(uni, "traversal.bfs")
 
-    visited = set()
-    queue = collections.deque([start])
-    visited.add(start)
-
-    while queue:
-        u = queue.popleft()
-        for v in helpers.ineighbors(u):
-
-            if (uni is not None) and (v not in uni.vertices):
-                continue
-
-            # check for a match first -- then we can exit early
-            if hasattr(v, attrib):
-                if v[attrib] == val:
-                    return v
-
-            # make sure we don't re-visit as a duplicate
-            if v not in visited:
-                visited.add(v)
-                queue.append(v)
-
-    return None
+    # pylint: disable-next=protected-access
+    return helpers._first_match(
+        # pylint: disable-next=protected-access
+        visitors._breadth_first(
+            uni,
+            starts,
+            helpers.DIR_SENS_FORWARD,
+            helpers.LNK_UNKNOWN_ERROR,
+            None,
+            None,
+            None,
+        ),
+        attrib,
+        val,
+    )
 
 
 def ibft(
     uni: Universe,
-    start: Vertex,
+    start: Vertex | Iterable[Vertex],
     *,
     direction_sensitive: int = helpers.DIR_SENS_FORWARD,
     unknown_handling: int = helpers.LNK_UNKNOWN_ERROR,
     ff_via: Callable | None = None,
     ff_result: Callable | None = None,
-) -> Iterator[Vertex]:
+    max_depth: int | None = None,
+    yield_depth: bool = False,
+    visitor: visitors.Visitor | list[visitors.Visitor] | None = None,
+) -> Iterator[Vertex] | Iterator[tuple[Vertex, int]]:
     """
     Perform a breadth-first traversal (generator).
 
@@ -127,7 +153,14 @@ def ibft(
     [GoTa60]_, Algorithm 13.8.
 
     :param uni: The universe to search in.  Set to ``None`` for no limiations.
-    :param start: The vertex to start searching at.
+       A :py:class:`~edgegraph.structure.csr.CSRSnapshot` may be given
+       instead, for faster traversal of a frozen graph.
+    :param start: The vertex to start searching at.  An iterable of vertices
+       may be given instead, to search outwards from all of them at once: the
+       start vertices are yielded first, in the order given, then everything
+       one hop from the nearest of them, and so on.  This is one traversal,
+       as though from a single vertex linked to each of them, rather than
+       one per start vertex.  Repeats are ignored.
     :param direction_sensitive: Directly passed through to
        :py:func:`~edgegraph.traversal.helpers.neighbors`.  This may be one of:
 
@@ -177,52 +210,77 @@ def ibft(
           :param v: Vertex to be considered
           :return: Whether or not ``v`` should be part of the output.
 
+    :param max_depth: If given, vertices more than this many hops from
+       ``start`` are not visited, and the traversal does no work beyond them
+       (``max_depth=0`` gives only ``start``).  Useful for "everything within
+       ``k`` hops" queries; see also :py:func:`ibft_layers`.
+    :param yield_depth: If true, yield ``(vertex, depth)`` two-tuples, where
+       ``depth`` is the number of hops from ``start``, rather than bare
+       vertices.
+    :param visitor: A :py:class:`~edgegraph.traversal.visitors.Visitor`, or
+       a list of them, whose hooks are called as the traversal goes; see
+       :py:mod:`edgegraph.traversal.visitors`.  It sees every vertex
+       visited, whether ``ff_result`` passes it or not.  Not available with
+       ``max_depth`` or ``yield_depth`` (a
+       :py:class:`~edgegraph.traversal.visitors.DepthVisitor` gives the
+       depths instead).
+    :raises ValueError: If ``start`` is not in the (non-empty) universe,
+       ``max_depth`` is negative, or a ``visitor`` is given with
+       ``max_depth`` or ``yield_depth``.
     :return: A generator object that yields vertices in the order of a
        breadth-first traversal in accordance with the set parameters.
     """
-    if (uni is not None) and (len(uni.vertices) == 0):
-        # empty!
+    starts = _bf_preflight(uni, start)
+    if starts is None:
         return
-    if (uni is not None) and (start not in uni.vertices):
-        raise ValueError("Start vertex not in specified universe!")
-
-    visited = set()
-    queue = collections.deque([start])
-    visited.add(start)
 
-    if (ff_result and ff_result(start)) or (not ff_result):
-        yield start
-
-    while queue:
-        u = queue.popleft()
-        for v in helpers.ineighbors(
-            u,
-            direction_sensitive=direction_sensitive,
-            unknown_handling=unknown_handling,
-            filterfunc=ff_via,
+    if metrics.ENABLED:
+        metrics.count(uni, "traversal.ibft")
+
+    if (max_depth is not None) or yield_depth:
+        if visitor is not None:
+            raise ValueError(
+                "visitor cannot be combined with max_depth or yield_depth"
+            )
+        for depth, layer in enumerate(
+            _layers(
+                uni,
+                starts,
+                direction_sensitive,
+                unknown_handling,
+                ff_via,
+                max_depth,
+            )
         ):
-
-            if (uni is not None) and (v not in uni.vertices):
-                continue
-
-            # make sure we don't re-visit as a duplicate
-            if v not in visited:
-                visited.add(v)
-                queue.append(v)
-
+            for v in layer:
                 if (ff_result and ff_result(v)) or (not ff_result):
-                    yield v
+                    yield (v, depth) if yield_depth else v
+        return
+
+    # pylint: disable-next=protected-access
+    yield from visitors._breadth_first(
+        uni,
+        starts,
+        direction_sensitive,
+        unknown_handling,
+        ff_via,
+        ff_result,
+        visitor,
+    )
 
 
 def bft(
     uni: Universe,
-    start: Vertex,
+    start: Vertex | Iterable[Vertex],
     *,
     direction_sensitive: int = helpers.DIR_SENS_FORWARD,
     unknown_handling: int = helpers.LNK_UNKNOWN_ERROR,
     ff_via: Callable | None = None,
     ff_result: Callable | None = None,
-) -> list[Vertex]:
+    max_depth: int | None = None,
+    yield_depth: bool = False,
+    visitor: visitors.Visitor | list[visitors.Visitor] | None = None,
+) -> list[Vertex] | list[tuple[Vertex, int]]:
     """
     Perform a breadth-first traversal (**non**-generator).
 
@@ -246,6 +304,286 @@ def bft(
             unknown_handling=unknown_handling,
             ff_via=ff_via,
             ff_result=ff_result,
+            max_depth=max_depth,
+            yield_depth=yield_depth,
+            visitor=visitor,
         )
     )
     return out
+
+
+def _hop_arcs(
+    uni: Universe | CSRSnapshot | None,
+    direction_sensitive: int,
+    unknown_handling: int,
+    ff_via: Callable | None,
+    reverse: bool,
+) -> Callable[[Vertex], Iterator[Vertex]]:
+    """
+    Make a function giving the neighbors of a vertex, for
+    :py:func:`shortest_hops` and the layered traversals.  For internal use
+    only!
+
+    With ``reverse``, links are followed the other way, and ``ff_via`` is
+    asked whether the vertex being left may be stepped onto, as it would be
+    by a forward search.
+
+    :meta private:
+    """
+    if reverse:
+        # pylint: disable-next=protected-access
+        direction_sensitive = helpers._reverse_direction(direction_sensitive)
+
+    if isinstance(uni, CSRSnapshot):
+        verts = uni.vertices
+        offsets, targets, links, bypass = uni.adjacency(
+            direction_sensitive, unknown_handling
+        )
+
+        def csr_arcs(u):
+            i = uni.index_of(u)
+            for k in range(offsets[i], offsets[i + 1]):
+                v = verts[targets[k]]
+                # links of unknown type bypass the filter, as in ineighbors()
+                if (
+                    (ff_via is not None)
+                    and not (bypass and bypass[k])
+                    and (not ff_via(links[k], u if reverse else v))
+                ):
+                    continue
+                yield v
+
+        return csr_arcs
+
+    def live_arcs(u):
+        filterfunc = ff_via
+        if reverse and (ff_via is not None):
+            filterfunc = lambda e, v: ff_via(e, u)
+
+        for v in helpers.ineighbors(
+            u,
+            direction_sensitive=direction_sensitive,
+            unknown_handling=unknown_handling,
+            filterfunc=filterfunc,
+        ):
+            if (uni is None) or uni.has_vertex(v):
+                yield v
+
+    return live_arcs
+
+
+def _layers(
+    uni: Universe | CSRSnapshot | None,
+    starts: list[Vertex],
+    direction_sensitive: int,
+    unknown_handling: int,
+    ff_via: Callable | None,
+    max_depth: int | None,
+) -> Iterator[list[Vertex]]:
+    """
+    Level-synchronous breadth-first traversal; yields each layer (all
+    vertices at the same depth) in turn, unfiltered.  For internal use only!
+
+    A layer is only expanded into the next once the caller asks for it, and
+    never beyond ``max_depth``.  Within and across layers, vertices come in
+    exactly the order :py:func:`ibft` gives them.
+
+    :meta private:
+    """
+    if (max_depth is not None) and (max_depth < 0):
+        raise ValueError(f"max_depth must not be negative, not {max_depth}")
+
+    arcs = _hop_arcs(uni, direction_sensitive, unknown_handling, ff_via, False)
+    visited = set(starts)
+    layer = starts
+    depth = 0
+
+    while layer:
+        yield layer
+        if depth == max_depth:
+            return
+
+        nxt = []
+        for u in layer:
+            for v in arcs(u):
+                if v not in visited:
+                    visited.add(v)
+                    nxt.append(v)
+        layer = nxt
+        depth += 1
+
+
+def ibft_layers(
+    uni: Universe,
+    start: Vertex | Iterable[Vertex],
+    *,
+    direction_sensitive: int = helpers.DIR_SENS_FORWARD,
+    unknown_handling: int = helpers.LNK_UNKNOWN_ERROR,
+    ff_via: Callable | None = None,
+    ff_result: Callable | None = None,
+    max_depth: int | None = None,
+) -> Iterator[list[Vertex]]:
+    """
+    Perform a breadth-first traversal, one layer at a time (generator).
+
+    Rather than single vertices, this yields lists of them: first ``[start]``,
+    then every vertex one hop from it, then every vertex two hops from it, and
+    so on.  The ``n``\ th list yielded holds exactly the vertices ``n`` hops
+    from ``start``, in the order :py:func:`ibft` would give them.
+
+    >>> for depth, layer in enumerate(ibft_layers(uni, v1, max_depth=2)):
+    ...     print(depth, layer)
+    0 [v1]
+    1 [v2, v3, v4]
+    2 [v5, v6, v7, v8]
+
+    Each layer is worked out only when asked for, so stopping early (or
+    setting ``max_depth``) leaves the rest of the graph untouched; the work
+    for a ``k``-hop query is proportional to the vertices within ``k`` hops,
+    not to all reachable from ``start``.
+
+    :param uni: The universe to search in, as for :py:func:`ibft`.
+    :param start: The vertex to start searching at, or several, as for
+       :py:func:`ibft`; the first layer then holds all of them.
+    :param direction_sensitive: As for :py:func:`ibft`.
+    :param unknown_handling: As for :py:func:`ibft`.
+    :param ff_via: As for :py:func:`ibft`.
+    :param ff_result: As for :py:func:`ibft`; applied within each layer.  A
+       layer may then be empty, but is still yielded, so that depths and
+       list positions keep matching.
+    :param max_depth: If given, stop after the layer this many hops from
+       ``start``.
+    :raises ValueError: If ``start`` is not in the (non-empty) universe, or
+       ``max_depth`` is negative.
+    :return: A generator object yielding lists of vertices, one per depth.
+    """
+    starts = _bf_preflight(uni, start)
+    if starts is None:
+        return
+
+    if metrics.ENABLED:
+        metrics.count(uni, "traversal.ibft_layers")
+
+    for layer in _layers(
+        uni,
+        starts,
+        direction_sensitive,
+        unknown_handling,
+        ff_via,
+        max_depth,
+    ):
+        # copies, so the caller may keep (or change) them freely
+        if ff_result:
+            yield [v for v in layer if ff_result(v)]
+        else:
+            yield list(layer)
+
+
+def shortest_hops(
+    uni: Universe,
+    start: Vertex | Iterable[Vertex],
+    dest: Vertex,
+    *,
+    direction_sensitive: int = helpers.DIR_SENS_FORWARD,
+    unknown_handling: int = helpers.LNK_UNKNOWN_ERROR,
+    ff_via: Callable | None = None,
+) -> list[Vertex] | None:
+    """
+    Find a path with the fewest hops between two vertices.
+
+    This is a bidirectional breadth-first search.  Two searches take turns, a
+    whole level at a time: one forward from ``start``, and one backward (along
+    the links *into* each vertex) from ``dest``, each turn going to whichever
+    has the smaller frontier.  The search ends as soon as the two meet.  Each
+    only has to go about half as deep as a search from one end would, which on
+    graphs where the number of vertices grows quickly with the depth (as in
+    most large, well-connected graphs) is a small fraction of the work.
+
+    >>> path = shortest_hops(uni, v1, v9)
+    >>> len(path) - 1  # number of hops
+    3
+
+    :param uni: The universe to search in.  Set to ``None`` for no
+       limitations.  A :py:class:`~edgegraph.structure.csr.CSRSnapshot` may be
+       given instead, for faster searching of a frozen graph.
+    :param start: The vertex to start searching at, or an iterable of several,
+       in which case the path is from whichever is fewest hops away.
+    :param dest: The vertex to search for.
+    :param direction_sensitive: As for :py:func:`ibft`; the direction to
+       follow links in, going from ``start`` to ``dest``.
+    :param unknown_handling: As for :py:func:`ibft`.
+    :param ff_via: As for :py:func:`ibft`.  The backward search asks it about
+       the same links and vertices as a forward search would; that is, whether
+       the vertex at the ``dest`` end of each link may be stepped onto.
+    :raises ValueError: if ``start`` is not in the (non-empty) universe.
+    :return: The vertices of a path from ``start`` to ``dest`` with the fewest
+       hops, both inclusive (just ``[start]`` if the two are the same), or
+       ``None`` if there is no path.
+    """
+    starts = _bf_preflight(uni, start)
+    if starts is None:
+        return None
+
+    if metrics.ENABLED:
+        metrics.count(uni, "traversal.shortest_hops")
+
+    if dest in starts:
+        return [dest]
+    if (uni is not None) and (not uni.has_vertex(dest)):
+        return None
+
+    arcs = (
+        _hop_arcs(uni, direction_sensitive, unknown_handling, ff_via, False),
+        _hop_arcs(uni, direction_sensitive, unknown_handling, ff_via, True),
+    )
+    # hops from the start (or to the destination) of each vertex reached, and
+    # the vertex it was reached from
+    depth: tuple[dict[Vertex, int], dict[Vertex, int]] = (
+        dict.fromkeys(starts, 0),
+        {dest: 0},
+    )
+    prev: tuple[dict[Vertex, Vertex | None], ...] = (
+        dict.fromkeys(starts),
+        {dest: None},
+    )
+    frontier = [starts, [dest]]
+
+    while frontier[0] and frontier[1]:
+        side = 0 if len(frontier[0]) <= len(frontier[1]) else 1
+        mydepth, otherdepth = depth[side], depth[1 - side]
+        myprev = prev[side]
+
+        # finish the whole level, then take the best meeting point in it
+        meet = None
+        best = 0
+        level = []
+        for u in frontier[side]:
+            du = mydepth[u] + 1
+            for v in arcs[side](u):
+                if v in myprev:
+                    continue
+                myprev[v] = u
+                mydepth[v] = du
+                level.append(v)
+                if (v in otherdepth) and (
+                    (meet is None) or (otherdepth[v] < best)
+                ):
+                    meet = v
+                    best = otherdepth[v]
+
+        if meet is not None:
+            path = []
+            u = meet
+            while u is not None:
+                path.append(u)
+                u = prev[0][u]
+            path.reverse()
+            u = prev[1][meet]
+            while u is not None:
+                path.append(u)
+                u = prev[1][u]
+            return path
+
+        frontier[side] = level
+
+    return None
@@ -10,6 +10,14 @@ provided: one recursive, and one iterative.  The calling API is identical
 between the implementations, but note that *the order of traversal frequently
 differs* between them.  This is the nature of the differing approaches.
 
+The "recursive" functions give the order of a recursive traversal, but do not
+recurse; an explicit stack stands in for the call stack, so they handle paths
+of any length.  :py:func:`dft_timestamps` gives the discovery and finish
+times of the same traversal.
+
+All of these run on the engine in :py:mod:`edgegraph.traversal.visitors`; a
+visitor given to a traversal has its hooks called as the traversal goes.
+
 .. seealso::
 
    * https://en.wikipedia.org/wiki/Depth-first_search
@@ -51,81 +59,45 @@ visiting v3 before v6) is determined by the structure of the universe.
 """
 
 from __future__ import annotations
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterable, Iterator
+from edgegraph import metrics
 from edgegraph.structure import Universe, Vertex
-from edgegraph.traversal import helpers
+from edgegraph.traversal import helpers, visitors
 
 
-def _df_preflight_checks(uni: Universe, start: Vertex):
+def _df_preflight_checks(
+    uni: Universe, start: Vertex | Iterable[Vertex]
+) -> list[Vertex]:
     """
     Perform a few common pre-traversal sanity checks, raising ValueError if
     they fail.  For internal use only!
 
     :param uni: Universe to traverse/search.
-    :param start: Vertex to start trav/search at.
-    :raises ValueError: if the universe is empty, or if the start vertex is not
+    :param start: Vertex (or iterable of vertices) to start trav/search at.
+    :raises ValueError: if the universe is empty, or if a start vertex is not
        in the given universe.
+    :return: The start vertices, as a list.
     """
-    if (uni is not None) and (len(uni.vertices) == 0):
-        raise ValueError("Universe is empty; cannot perform this operation!")
-    if (uni is not None) and (start not in uni.vertices):
-        raise ValueError("Start vertex not in specified universe!")
-
-
-def _dft_recur(
-    uni: Universe,
-    v: Vertex,
-    *,
-    visited: dict[Vertex, None],
-    direction_sensitive: int,
-    unknown_handling: int,
-    ff_via: Callable | None = None,
-    ff_result: Callable | None = None,
-) -> Iterator[Vertex]:
-    """
-    Recursion helper for :py:func:`dft_recursive`.  For internal use only!
-
-    :meta private:
-
-    :param uni: Universe to traverse, or ``None`` for no universe limits.
-    :param v: Top of recursive tree.
-    :param visited: List of vertices already visited.  Must be
-       pass-by-reference!
-    :return: Order of traversal of the given subtree.
-    """
-    visited[v] = None
-
-    if (ff_result and ff_result(v)) or (not ff_result):
-        yield v
-
-    for w in helpers.ineighbors(
-        v,
-        direction_sensitive=direction_sensitive,
-        unknown_handling=unknown_handling,
-        filterfunc=ff_via,
-    ):
-        if (uni is not None) and (w not in uni.vertices):
-            continue
-        if w not in visited:
-            yield from _dft_recur(
-                uni,
-                w,
-                visited=visited,
-                direction_sensitive=direction_sensitive,
-                unknown_handling=unknown_handling,
-                ff_via=ff_via,
-                ff_result=ff_result,
+    # pylint: disable-next=protected-access
+    starts = helpers._start_vertices(start)
+    if (uni is not None) and not all(uni.has_vertex(s) for s in starts):
+        if len(uni.vertices) == 0:
+            raise ValueError(
+                "Universe is empty; cannot perform this operation!"
             )
+        raise ValueError("Start vertex not in specified universe!")
+    return starts
 
 
 def idft_recursive(
     uni: Universe,
-    start: Vertex,
+    start: Vertex | Iterable[Vertex],
     *,
     direction_sensitive: int = helpers.DIR_SENS_FORWARD,
     unknown_handling: int = helpers.LNK_UNKNOWN_ERROR,
     ff_via: Callable | None = None,
     ff_result: Callable | None = None,
+    visitor: visitors.Visitor | list[visitors.Visitor] | None = None,
 ) -> Iterator[Vertex]:
     """
     Perform a recursive depth-first traversal of the given universe, starting
@@ -133,39 +105,55 @@ def idft_recursive(
 
     The algorithm used is detailed in [CLRS09]_, figure 22.4, and [GoTa60]_,
     Algorithm 13.6.  Slight modifications have been made due to the nature of
-    EdgeGraph's data model.  This is a *recursive* implementation that returns
-    a list of :py:class:`~edgegraph.structure.vertex.Vertex` objects, in the
-    order of the traversal performed.
+    EdgeGraph's data model.  This gives the order of a *recursive*
+    implementation, yielding :py:class:`~edgegraph.structure.vertex.Vertex`
+    objects in the order of the traversal performed; the recursion itself is
+    replaced by an explicit stack, so paths may be of any length, and each
+    vertex costs the same to yield however deep it is.
 
     :param uni: The universe to traverse, or ``None`` for no universe limits.
-    :param start: The vertex to begin traversal at.
+       A :py:class:`~edgegraph.structure.csr.CSRSnapshot` may be given
+       instead, for faster traversal of a frozen graph.
+    :param start: The vertex to begin traversal at.  An iterable of vertices
+       may be given instead, for a traversal of the whole *forest* below
+       them: each start vertex in turn (skipping any already visited from an
+       earlier one) is traversed from, sharing one set of visited vertices.
+    :param visitor: A :py:class:`~edgegraph.traversal.visitors.Visitor`, or
+       a list of them, whose hooks are called as the traversal goes; see
+       :py:mod:`edgegraph.traversal.visitors`.  Each link not in the tree
+       goes to its ``back_edge`` or ``forward_or_cross_edge`` hook.
     :return: A generator object that yields vertices in the order of a
        recursive depth-first traversal in accordance with the set parameters.
     :raises ValueError: if the ``start`` vertex is not a member of the
        specified universe, or if the universe is empty.
     """
-    _df_preflight_checks(uni, start)
+    starts = _df_preflight_checks(uni, start)
+
+    if metrics.ENABLED:
+        metrics.count(uni, "traversal.idft_recursive")
 
-    visited: dict[Vertex, None] = {}
-    yield from _dft_recur(
+    # pylint: disable-next=protected-access
+    yield from visitors._depth_first(
         uni,
-        start,
-        visited=visited,
-        direction_sensitive=direction_sensitive,
-        unknown_handling=unknown_handling,
-        ff_via=ff_via,
-        ff_result=ff_result,
+        starts,
+        direction_sensitive,
+        unknown_handling,
+        ff_via,
+        ff_result,
+        visitor,
+        True,
     )
 
 
 def dft_recursive(
     uni: Universe,
-    start: Vertex,
+    start: Vertex | Iterable[Vertex],
     *,
     direction_sensitive: int = helpers.DIR_SENS_FORWARD,
     unknown_handling: int = helpers.LNK_UNKNOWN_ERROR,
     ff_via: Callable | None = None,
     ff_result: Callable | None = None,
+    visitor: visitors.Visitor | list[visitors.Visitor] | None = None,
 ) -> list[Vertex]:
     """
     Perform a recursive depth-first traversal of the given universe, starting
@@ -193,47 +181,78 @@ def dft_recursive(
             unknown_handling=unknown_handling,
             ff_via=ff_via,
             ff_result=ff_result,
+            visitor=visitor,
         )
     )
 
 
-def _dfs_recur(
+def dft_timestamps(
     uni: Universe,
-    v: Vertex,
-    visited: dict[Vertex, None],
-    attrib: str,
-    val: object,
-) -> Vertex | None:
+    start: Vertex | Iterable[Vertex],
+    *,
+    direction_sensitive: int = helpers.DIR_SENS_FORWARD,
+    unknown_handling: int = helpers.LNK_UNKNOWN_ERROR,
+    ff_via: Callable | None = None,
+) -> dict[Vertex, tuple[int, int]]:
+    """
+    Perform a depth-first traversal in the order of :py:func:`idft_recursive`,
+    noting when each vertex is discovered and finished.
+
+    A single clock, starting at one, ticks as each vertex is *discovered*
+    (first visited), and again as it is *finished* (once everything
+    reachable from it has been discovered), as in [CLRS09]_, figure 22.4.
+    These times answer many questions about the graph without another pass:
+
+    * ``u`` is below ``v`` in the depth-first tree exactly when the times of
+      ``u`` fall within those of ``v``;
+    * a link from ``u`` to a vertex ``v`` whose times enclose those of ``u``
+      closes a cycle (it is a *back edge*);
+    * in a graph without cycles, the vertices in decreasing order of finish
+      time are in topological order.
+
+    >>> times = dft_timestamps(uni, v1)
+    >>> times[v1]
+    (1, 24)
+    >>> postorder = sorted(times, key=lambda v: times[v][1])
+
+    :param uni: The universe to traverse, as for :py:func:`idft_recursive`.
+    :param start: The vertex (or vertices) to begin traversal at, as for
+       :py:func:`idft_recursive`; the clock carries on from one tree to the
+       next.
+    :param direction_sensitive: As for :py:func:`idft_recursive`.
+    :param unknown_handling: As for :py:func:`idft_recursive`.
+    :param ff_via: As for :py:func:`idft_recursive`.
+    :return: A dictionary of each vertex visited, in the order of discovery,
+       to a two-tuple of its discovery and finish times.
+    :raises ValueError: if the ``start`` vertex is not a member of the
+       specified universe, or if the universe is empty.
     """
-    Recursion helper for :py:func:`dfs_recursive`.  For internal use only!
+    starts = _df_preflight_checks(uni, start)
 
-    :meta private:
+    if metrics.ENABLED:
+        metrics.count(uni, "traversal.dft_timestamps")
 
-    :param uni: Universe to search in, or ``None`` for no universe limits.
-    :param v: Top of the recursion subtree.
-    :param visited: List of vertices already visited.  Must be
-       pass-by-reference!
-    :param attrib: Name of the attribute to check.
-    :param val: Value of the attribute desired.
-    :return: The target vertex, or None if not found in this subtree.
-    """
-    visited[v] = None
-    for w in helpers.ineighbors(v):
-        if (uni is not None) and (w not in uni.vertices):
-            continue
-        if w not in visited:
-            # check for a match first -- then we can exit early
-            if hasattr(w, attrib):
-                if w[attrib] == val:
-                    return w
-            ret = _dfs_recur(uni, w, visited, attrib, val)
-            if ret:
-                return ret
-    return None
+    stamper = visitors.TimestampVisitor()
+    # pylint: disable-next=protected-access
+    for _ in visitors._depth_first(
+        uni,
+        starts,
+        direction_sensitive,
+        unknown_handling,
+        ff_via,
+        None,
+        stamper,
+        True,
+    ):
+        pass
+    return stamper.times
 
 
 def dfs_recursive(
-    uni: Universe, start: Vertex, attrib: str, val: object
+    uni: Universe,
+    start: Vertex | Iterable[Vertex],
+    attrib: str,
+    val: object,
 ) -> Vertex | None:
     """
     Perform a recursive depth-first search in the given graph for a given
@@ -242,8 +261,9 @@ def dfs_recursive(
     The algorithm used is detailed in [CLRS09]_, figure 22.4, and [GoTa60]_,
     Algorithm 13.6.  Slight modifications have been made due to the nature of
     EdgeGraph's data model, and to add an early-exit condition if the desired
-    vertex is found.  This is a *recursive* implementation that returns either
-    the first vertex discovered matching the specified criteria, or None if no
+    vertex is found.  This searches in the order of a *recursive*
+    implementation (see :py:func:`idft_recursive`), and returns either the
+    first vertex discovered matching the specified criteria, or None if no
     such vertex is found.
 
     Search criteria is specified via the ``attrib`` and ``val`` arguments.
@@ -253,7 +273,10 @@ def dfs_recursive(
     soon as such an attribute is found.
 
     :param uni: The universe to search in, or ``None`` for no universe limits.
-    :param start: The vertex to start searching at.
+       A :py:class:`~edgegraph.structure.csr.CSRSnapshot` may be given
+       instead, for faster searching of a frozen graph.
+    :param start: The vertex to start searching at, or an iterable of
+       several, searched in turn as for :py:func:`idft_recursive`.
     :param attrib: Name of the attribute to check each vertex for.
     :param val: Value to look for in the specified attribute.
     :return: The first vertex with a matching value, or ``None`` if none is
@@ -261,24 +284,38 @@ def dfs_recursive(
     :raises ValueError: if the ``start`` vertex is not a member of the
        specified universe, or if the universe is empty.
     """
-    _df_preflight_checks(uni, start)
+    starts = _df_preflight_checks(uni, start)
 
-    if hasattr(start, attrib):
-        if start[attrib] == val:
-            return start
+    if metrics.ENABLED:
+        metrics.count(uni, "traversal.dfs_recursive")
 
-    visited: dict[Vertex, None] = {}
-    return _dfs_recur(uni, start, visited, attrib, val)
+    # pylint: disable-next=protected-access
+    return helpers._first_match(
+        # pylint: disable-next=protected-access
+        visitors._depth_first(
+            uni,
+            starts,
+            helpers.DIR_SENS_FORWARD,
+            helpers.LNK_UNKNOWN_ERROR,
+            None,
+            None,
+            None,
+            True,
+        ),
+        attrib,
+        val,
+    )
 
 
 def idft_iterative(
     uni: Universe,
-    start: Vertex,
+    start: Vertex | Iterable[Vertex],
     *,
     direction_sensitive: int = helpers.DIR_SENS_FORWARD,
     unknown_handling: int = helpers.LNK_UNKNOWN_ERROR,
     ff_via: Callable | None = None,
     ff_result: Callable | None = None,
+    visitor: visitors.Visitor | list[visitors.Visitor] | None = None,
 ) -> Iterator[Vertex]:
     """
     Perform an iterative depth-first traversal of the given universe, starting
@@ -291,43 +328,47 @@ def idft_iterative(
     traversal performed.
 
     :param uni: The universe to traverse, or ``None`` for no universe limits.
-    :param start: Vertex to start searching at.
+       A :py:class:`~edgegraph.structure.csr.CSRSnapshot` may be given
+       instead, for faster traversal of a frozen graph.
+    :param start: Vertex to start searching at, or an iterable of several,
+       traversed in turn as for :py:func:`idft_recursive`.
+    :param visitor: A :py:class:`~edgegraph.traversal.visitors.Visitor`, or
+       a list of them, whose hooks are called as the traversal goes; see
+       :py:mod:`edgegraph.traversal.visitors`.  Each link not in the tree
+       goes to its ``non_tree_edge`` hook, and ``finish_vertex`` is never
+       called.
     :return: A generator object yielding vertices in the order of an iterative
        depth-first traversal, in accordance with the set parameters.
     :raises ValueError: if the ``start`` vertex is not a member of the
        specified universe, or if the universe is empty.
     """
-    _df_preflight_checks(uni, start)
-
-    stack = [start]
-    discovered = []
-    while len(stack) != 0:
-        v = stack.pop()
-        if v not in discovered:
-            if (uni is not None) and (v not in uni.vertices):
-                continue
+    starts = _df_preflight_checks(uni, start)
 
-            discovered.append(v)
-            if (ff_result and ff_result(v)) or (not ff_result):
-                yield v
+    if metrics.ENABLED:
+        metrics.count(uni, "traversal.idft_iterative")
 
-            for w in helpers.ineighbors(
-                v,
-                direction_sensitive=direction_sensitive,
-                unknown_handling=unknown_handling,
-                filterfunc=ff_via,
-            ):
-                stack.append(w)
+    # pylint: disable-next=protected-access
+    yield from visitors._depth_first(
+        uni,
+        starts,
+        direction_sensitive,
+        unknown_handling,
+        ff_via,
+        ff_result,
+        visitor,
+        False,
+    )
 
 
 def dft_iterative(
     uni: Universe,
-    start: Vertex,
+    start: Vertex | Iterable[Vertex],
     *,
     direction_sensitive: int = helpers.DIR_SENS_FORWARD,
     unknown_handling: int = helpers.LNK_UNKNOWN_ERROR,
     ff_via: Callable | None = None,
     ff_result: Callable | None = None,
+    visitor: visitors.Visitor | list[visitors.Visitor] | None = None,
 ) -> list[Vertex]:
     """
     Perform an iterative depth-first traversal of the given universe, starting at the given vertex (**non**-generator).
@@ -353,12 +394,16 @@ def dft_iterative(
             unknown_handling=unknown_handling,
             ff_via=ff_via,
             ff_result=ff_result,
+            visitor=visitor,
         )
     )
 
 
 def dfs_iterative(
-    uni: Universe, start: Vertex, attrib: str, val: object
+    uni: Universe,
+    start: Vertex | Iterable[Vertex],
+    attrib: str,
+    val: object,
 ) -> Vertex | None:
     """
     Perform a non-recursive depth-first search in the given universe.
@@ -376,7 +421,10 @@ def dfs_iterative(
     soon as such an attribute is found.
 
     :param uni: The universe to search in, or ``None`` for no universe limits.
-    :param start: The vertex to start searching at.
+       A :py:class:`~edgegraph.structure.csr.CSRSnapshot` may be given
+       instead, for faster searching of a frozen graph.
+    :param start: The vertex to start searching at, or an iterable of
+       several, searched in turn as for :py:func:`idft_iterative`.
     :param attrib: Name of the attribute to check each vertex for.
     :param val: Value to look for in the specified attribute.
     :return: The first vertex with a matching value, or ``None`` if none is
@@ -384,19 +432,24 @@ def dfs_iterative(
     :raises ValueError: if the ``start`` vertex is not a member of the
        specified universe, or if the universe is empty.
     """
-    _df_preflight_checks(uni, start)
-
-    stack = [start]
-    discovered = []
-    while len(stack) != 0:
-        v = stack.pop()
-        if (uni is not None) and (v not in uni.vertices):
-            continue
-        if v not in discovered:
-            if hasattr(v, attrib):
-                if v[attrib] == val:
-                    return v
-            discovered.append(v)
-            for w in helpers.ineighbors(v):
-                stack.append(w)
-    return None
+    starts = _df_preflight_checks(uni, start)
+
+    if metrics.ENABLED:
+        metrics.count(uni, "traversal.dfs_iterative")
+
+    # pylint: disable-next=protected-access
+    return helpers._first_match(
+        # pylint: disable-next=protected-access
+        visitors._depth_first(
+            uni,
+            starts,
+            helpers.DIR_SENS_FORWARD,
+            helpers.LNK_UNKNOWN_ERROR,
+            None,
+            None,
+            None,
+            False,
+        ),
+        attrib,
+        val,
+    )
@@ -7,13 +7,20 @@ Helper functions for graph traversals.
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Collection, Iterable
 from typing import Generator
+from edgegraph import metrics
+from edgegraph.traversal import options
 from edgegraph.structure import (
     Vertex,
     Link,
-    DirectedEdge,
-    UnDirectedEdge,
+)
+from edgegraph.structure.vertex import (
+    VertexCore,
+    ROLE_OUT,
+    ROLE_IN,
+    ROLE_UND,
+    ROLE_UNK,
 )
 
 #: Unknown edge classes treated as non-neighbors.
@@ -21,21 +28,21 @@ from edgegraph.structure import (
 #: .. seealso::
 #:
 #:    :py:func:`neighbors`
-LNK_UNKNOWN_NONNEIGHBOR = 0
+LNK_UNKNOWN_NONNEIGHBOR = options.LNK_UNKNOWN_NONNEIGHBOR
 
 #: Unknown edge classes treated as neighbors.
 #:
 #: .. seealso::
 #:
 #:    :py:func:`neighbors`
-LNK_UNKNOWN_NEIGHBOR = 1
+LNK_UNKNOWN_NEIGHBOR = options.LNK_UNKNOWN_NEIGHBOR
 
 #: Unknown edge classes raise an exception.
 #:
 #: .. seealso::
 #:
 #:    :py:func:`neighbors`
-LNK_UNKNOWN_ERROR = 2
+LNK_UNKNOWN_ERROR = options.LNK_UNKNOWN_ERROR
 
 #: Follow links forward
 #:
@@ -45,7 +52,7 @@ LNK_UNKNOWN_ERROR = 2
 #: .. seealso::
 #:
 #:    :py:func:`neighbors`
-DIR_SENS_FORWARD = 0
+DIR_SENS_FORWARD = options.DIR_SENS_FORWARD
 
 #: Follow links regardless of directionality
 #:
@@ -55,7 +62,7 @@ DIR_SENS_FORWARD = 0
 #: .. seealso::
 #:
 #:    :py:func:`neighbors`
-DIR_SENS_ANY = 1
+DIR_SENS_ANY = options.DIR_SENS_ANY
 
 #: Follow links backwards
 #:
@@ -65,7 +72,109 @@ DIR_SENS_ANY = 1
 #: .. seealso::
 #:
 #:    :py:func:`neighbors`
-DIR_SENS_BACKWARD = 2
+DIR_SENS_BACKWARD = options.DIR_SENS_BACKWARD
+
+
+def _reverse_direction(direction_sensitive: int) -> int:
+    """
+    Give the ``direction_sensitive`` option which follows the same links the
+    other way around; for searches working back from a destination.
+
+    :meta private:
+    """
+    if direction_sensitive == DIR_SENS_FORWARD:
+        return DIR_SENS_BACKWARD
+    if direction_sensitive == DIR_SENS_BACKWARD:
+        return DIR_SENS_FORWARD
+    return direction_sensitive
+
+
+def _start_vertices(start: Vertex | Iterable[Vertex] | None) -> list[Vertex]:
+    """
+    Normalize the ``start`` option of the traversals, which may be one vertex
+    or any number of them, into a list.
+
+    Repeated vertices are dropped, keeping the first of each.  A mapping (of
+    vertices to anything) gives its keys.
+
+    :meta private:
+    """
+    if (start is None) or isinstance(start, VertexCore):
+        return [start]
+    return list(dict.fromkeys(start))
+
+
+def _first_match(
+    trav: Iterable[Vertex], attrib: str, val: object
+) -> Vertex | None:
+    """
+    Return the first vertex of the given traversal matching the search
+    criteria of the search functions (``vert[attrib] == val``), or ``None``.
+
+    :meta private:
+    """
+    for v in trav:
+        if hasattr(v, attrib):
+            if v[attrib] == val:
+                return v
+    return None
+
+
+def _link_walk(
+    vert: Vertex,
+    direction_sensitive: int,
+    unknown_handling: int,
+) -> tuple[list[tuple[Link, Vertex]], Collection[Link]]:
+    """
+    Collect the links to follow out of the given vertex, and where they lead.
+
+    Shared by :py:func:`ineighbors` and :py:func:`ineighbor_links`; see the
+    former for the meaning of the options.  No filtering is done here.
+
+    :return: A two-tuple of the ``(link, neighbor)`` pairs to consider, in
+       link order, and the links among them which are of unknown class (and
+       so exempt from any filterfunc).
+    """
+    if direction_sensitive == DIR_SENS_ANY:
+        # no classification required at all -- every link is followed
+        # pylint: disable-next=protected-access
+        return [(link, link.other(vert)) for link in vert._links], ()
+
+    # the vertex records the role it plays in each link (see
+    # Vertex._classify_link) as links are attached, so that no per-link type
+    # checks are needed here.  walking the role map keeps the link order.
+    if direction_sensitive == DIR_SENS_FORWARD:
+        # for outbound links, this vertex is v1; the neighbor is v2
+        want = ROLE_OUT
+        far = 1
+    elif direction_sensitive == DIR_SENS_BACKWARD:
+        # for inbound links, this vertex is v2; the neighbor is v1
+        want = ROLE_IN
+        far = 0
+    else:
+        raise ValueError(
+            f"Unknown option for direction_sensitive = {direction_sensitive}"
+        )
+
+    walk = []
+    unknown: dict[Link, None] = {}
+    # pylint: disable-next=protected-access
+    for link, role in vert._links.items():
+        if role & want:
+            # pylint: disable-next=protected-access
+            walk.append((link, link._vertices[far]))
+        elif role & ROLE_UND:
+            walk.append((link, link.other(vert)))
+        elif role & ROLE_UNK:
+            if unknown_handling == LNK_UNKNOWN_NONNEIGHBOR:
+                continue
+            if unknown_handling == LNK_UNKNOWN_NEIGHBOR:
+                walk.append((link, link.other(vert)))
+                unknown[link] = None
+            else:
+                raise NotImplementedError(f"Unknown link class {type(link)}")
+
+    return walk, unknown
 
 
 def ineighbors(
@@ -174,6 +283,10 @@ def ineighbors(
        neighbors of the specified vertex.
     """
 
+    if metrics.ENABLED:
+        # pylint: disable-next=protected-access
+        metrics.count(vert._qa_metrics_universe(), "neighbors.calls")
+
     # pylint complains about this operation, with fairly good reason -- we're
     # accessing a private member of a client class.  however, since this is
     # still edgegraph-internal code, this is ok; it would be a problem were the
@@ -182,141 +295,55 @@ def ineighbors(
     cached = vert._qa_neighbors_get(
         direction_sensitive, unknown_handling, filterfunc
     )
+    # None means this lookup is not cached at all; the sentinel means it is,
+    # but there's nothing there (yet)
+    caching = cached is not None
     # pylint: disable-next=protected-access
-    if cached is not Vertex._QA_NB_INVALID:
+    if caching and cached is not vert._QA_NB_INVALID:
         yield from cached
         return
 
-    cache = []
-
-    for link in vert.links:
-
-        v2 = link.other(vert)
-
-        if direction_sensitive == DIR_SENS_FORWARD:
-            # undirected edges don't matter
-            if issubclass(type(link), UnDirectedEdge):
-
-                # we'll use boolean short-circuiting to prevent an unnecessary
-                # call into a default filterfunc if one is not provided.  such
-                # a default would always return True, but be an unnecessary
-                # call context switch.
-                # so, we'll first check if filterfunc is None -- if so, good
-                # enough, we can add this to the neighbors.  otherwise, it was
-                # in fact specified, and we should check its decision.
-                # this goes for all three places filterfunc() is used in this
-                # neighbors function
-                if filterfunc is None or filterfunc(link, v2):
-                    if Vertex.NEIGHBOR_CACHING:
-                        cache.append(v2)
-                    yield v2
-                else:
-
-                    # this is not detectable by coverage.py, due to a ~~bug~~
-                    # side effect of the python peephole optimizer.  continue
-                    # statements inside else: blocks are often skipped /
-                    # replaced with a jump opcode.  see
-                    # https://github.com/nedbat/coveragepy/issues/198#issuecomment-399705984
-                    # for more info.  for proof that this IS run, uncomment:
-                    # raise Exception("look, ma!  this happened!")
-                    # and re-run unit tests.  You'll get that exception.
-                    continue  # pragma: no cover
-
-            # for directed edges, only add the neighbor if vert is the origin
-            elif issubclass(type(link), DirectedEdge) and (link.v1 is vert):
-
-                # see above notes on short-circuiting filterfunc() if it's not
-                # provided
-                if filterfunc is None or filterfunc(link, v2):
-                    if Vertex.NEIGHBOR_CACHING:
-                        cache.append(v2)
-                    yield v2
-                else:
-                    # see comment on the above else: continue block for
-                    # explanation of this no-cover statement.
-                    continue  # pragma: no cover
-
-            # we're looking at v2 -- the destination
-            elif issubclass(type(link), DirectedEdge) and (link.v2 is vert):
-                pass
-
-            else:
-                if unknown_handling == LNK_UNKNOWN_NONNEIGHBOR:
-                    continue
-
-                if unknown_handling == LNK_UNKNOWN_NEIGHBOR:
-                    yld = link.other(vert)
-
-                    if Vertex.NEIGHBOR_CACHING:
-                        cache.append(yld)
-                    yield yld
-                else:
-                    raise NotImplementedError(
-                        f"Unknown link class {type(link)}"
-                    )
-
-        elif direction_sensitive == DIR_SENS_BACKWARD:
-
-            if issubclass(type(link), UnDirectedEdge):
-
-                if filterfunc is None or filterfunc(link, v2):
-                    if Vertex.NEIGHBOR_CACHING:
-                        cache.append(v2)
-                    yield v2
-                else:
-                    # see comment on the above else: continue block for
-                    # explanation of this no-cover statement.
-                    continue  # pragma: no cover
-
-            # for directed edges, only add the neighbor if vert is the origin
-            elif issubclass(type(link), DirectedEdge) and (link.v2 is vert):
-
-                # see above notes on short-circuiting filterfunc() if it's not
-                # provided
-                if filterfunc is None or filterfunc(link, v2):
-                    if Vertex.NEIGHBOR_CACHING:
-                        cache.append(v2)
-                    yield v2
-                else:
-                    # see comment on the above else: continue block for
-                    # explanation of this no-cover statement.
-                    continue  # pragma: no cover
-
-            # we're looking at v2 -- the destination
-            elif issubclass(type(link), DirectedEdge) and (link.v1 is vert):
-                pass
-
-            else:
-                if unknown_handling == LNK_UNKNOWN_NONNEIGHBOR:
-                    continue
-
-                if unknown_handling == LNK_UNKNOWN_NEIGHBOR:
-                    yld = link.other(vert)
-
-                    if Vertex.NEIGHBOR_CACHING:
-                        cache.append(yld)
-                    yield yld
-                else:
-                    raise NotImplementedError(
-                        f"Unknown link class {type(link)}"
-                    )
-
-        elif direction_sensitive == DIR_SENS_ANY:
-            # see above notes on short-circuiting filterfunc() if it's not
+    if direction_sensitive == DIR_SENS_ANY:
+        # no classification required at all -- every link is followed
+        cache = []
+        for link in vert.links:
+            v2 = link.other(vert)
+            # see notes below on short-circuiting filterfunc() if it's not
             # provided
             if filterfunc is None or filterfunc(link, v2):
-                if Vertex.NEIGHBOR_CACHING:
+                if caching:
                     cache.append(v2)
                 yield v2
 
-        else:
-            raise ValueError(
-                f"Unknown option for direction_sensitive = {direction_sensitive}"
+        if caching:
+            # pylint: disable-next=protected-access
+            vert._qa_neighbors_insert(
+                cache, direction_sensitive, unknown_handling, filterfunc
             )
+        return
 
-    vert._qa_neighbors_insert(
-        cache, direction_sensitive, unknown_handling, filterfunc
-    )
+    walk, bypass = _link_walk(vert, direction_sensitive, unknown_handling)
+
+    cache = []
+    for link, v2 in walk:
+
+        # we'll use boolean short-circuiting to prevent an unnecessary call
+        # into a default filterfunc if one is not provided.  such a default
+        # would always return True, but be an unnecessary call context switch.
+        # so, we'll first check if filterfunc is None -- if so, good enough, we
+        # can add this to the neighbors.  otherwise, it was in fact specified,
+        # and we should check its decision.
+        # links of unknown class bypass the filterfunc.
+        if filterfunc is None or link in bypass or filterfunc(link, v2):
+            if caching:
+                cache.append(v2)
+            yield v2
+
+    if caching:
+        # pylint: disable-next=protected-access
+        vert._qa_neighbors_insert(
+            cache, direction_sensitive, unknown_handling, filterfunc
+        )
 
 
 def neighbors(
@@ -350,6 +377,47 @@ def neighbors(
     )
 
 
+def ineighbor_links(
+    vert: Vertex,
+    direction_sensitive: int = DIR_SENS_FORWARD,
+    unknown_handling: int = LNK_UNKNOWN_ERROR,
+    filterfunc: Callable | None = None,
+) -> Generator[tuple[Link, Vertex], None, None]:
+    """
+    Identify the neighbors of a given vertex, and the links leading to them
+    (generator).
+
+    This is the same as :py:func:`ineighbors`, except that ``(link,
+    neighbor)`` two-tuples are yielded rather than bare neighbors.  A neighbor
+    reachable over several links (as in a multigraph) is yielded once per
+    link.  This is useful where something must be known about the link taken,
+    such as its weight when path finding, and saves looking the links back up
+    with :py:func:`find_links`.
+
+    .. note::
+
+       Unlike :py:func:`ineighbors`, these lookups are never cached.
+
+    All parameters are exactly the same as for :py:func:`ineighbors`.
+
+    :return: A generator object which yields two-tuples of the
+       :py:class:`~edgegraph.structure.link.Link` followed and the
+       :py:class:`~edgegraph.structure.vertex.Vertex` it leads to.
+    """
+    if metrics.ENABLED:
+        # pylint: disable-next=protected-access
+        metrics.count(vert._qa_metrics_universe(), "neighbors.calls")
+
+    walk, bypass = _link_walk(vert, direction_sensitive, unknown_handling)
+    if filterfunc is None:
+        yield from walk
+        return
+
+    for link, v2 in walk:
+        if link in bypass or filterfunc(link, v2):
+            yield link, v2
+
+
 def find_links(
     v1: Vertex,
     v2: Vertex,
@@ -428,7 +496,9 @@ def find_links(
     """
 
     links = set()
-    for link in v1.links:
+    # constant-time on vertices with many links; see VertexCore._links_to()
+    # pylint: disable-next=protected-access
+    for link in v1._links_to(v2):
 
         # no matter what the other options are, don't care!
         if link.other(v1) is not v2:
@@ -436,7 +506,10 @@ def find_links(
 
         if direction_sensitive:
 
-            if issubclass(type(link), UnDirectedEdge):
+            # links declare their own directionality; see Link._DIRECTED
+            directed = getattr(link, "_DIRECTED", None)
+
+            if directed is False:
 
                 # short-circuit operation, just like in neighbors()
                 if filterfunc is None or filterfunc(link):
@@ -446,7 +519,7 @@ def find_links(
                     # for explanation of this no-cover statement.
                     continue  # pragma: no cover
 
-            elif issubclass(type(link), DirectedEdge):
+            elif directed:
 
                 if link.v1 is not v1:
                     # this is a link from v2 to v1, not the way we want
@@ -0,0 +1,19 @@
+#!/usr/env/python3
+# -*- coding: utf-8 -*-
+
+"""
+Option values for following links, shared by traversals and snapshots.
+
+These are documented (and usually used) as members of
+:py:mod:`edgegraph.traversal.helpers`.  They live here, in a module without
+any imports, so that :py:mod:`edgegraph.structure` may use them as well
+without an import loop.
+"""
+
+LNK_UNKNOWN_NONNEIGHBOR = 0
+LNK_UNKNOWN_NEIGHBOR = 1
+LNK_UNKNOWN_ERROR = 2
+
+DIR_SENS_FORWARD = 0
+DIR_SENS_ANY = 1
+DIR_SENS_BACKWARD = 2
@@ -0,0 +1,981 @@
+#!/usr/env/python3
+# -*- coding: utf-8 -*-
+
+"""
+Visitors, and the traversal engine that calls them.
+
+All of the breadth- and depth-first traversals in
+:py:mod:`~edgegraph.traversal.breadthfirst` and
+:py:mod:`~edgegraph.traversal.depthfirst` run on the engine in this module.
+Given a :py:class:`Visitor`, it calls the visitor's *hooks* as each event of
+the traversal happens, so that parents, depths, discovery and finish times,
+the kinds of edges, and so on are all worked out in the same pass as the
+traversal itself, with no further lookups of links or neighbors:
+
+>>> parents, times = visitors.ParentVisitor(), visitors.TimestampVisitor()
+>>> order = depthfirst.dft_recursive(uni, v1, visitor=[parents, times])
+>>> parents.path_to(v9)
+[v1, v8, v9]
+
+A list of visitors (as above) shares the one pass among several analyses.
+To write one, subclass :py:class:`Visitor`, and override whichever hooks are
+of interest; hooks left alone are never called.
+
+The hooks are, in the order they happen to each vertex:
+
+* :py:meth:`~Visitor.start_vertex` -- a start vertex is about to be
+  discovered (or, for a breadth-first traversal, each of them);
+* :py:meth:`~Visitor.examine_edge` -- a link is about to be followed;
+* :py:meth:`~Visitor.tree_edge` -- the link followed leads to a vertex not
+  yet discovered, so becomes part of the traversal tree;
+* :py:meth:`~Visitor.discover_vertex` -- a vertex is visited for the first
+  time (this is when the traversals yield it);
+* :py:meth:`~Visitor.back_edge`, :py:meth:`~Visitor.forward_or_cross_edge`,
+  :py:meth:`~Visitor.non_tree_edge` -- the link followed leads to a vertex
+  already discovered;
+* :py:meth:`~Visitor.finish_vertex` -- every link out of a vertex has been
+  examined (and, depth-first, everything below it finished).
+
+Which hook a link that is not a tree edge goes to depends on the traversal:
+
+================================  =======================================
+Traversal                         Links not in the tree
+================================  =======================================
+breadth-first                     :py:meth:`~Visitor.non_tree_edge`
+depth-first, recursive order      :py:meth:`~Visitor.back_edge` to a vertex
+                                  not yet finished (an ancestor; so the
+                                  link closes a cycle), otherwise
+                                  :py:meth:`~Visitor.forward_or_cross_edge`
+depth-first, iterative order      :py:meth:`~Visitor.non_tree_edge`
+================================  =======================================
+
+The iterative depth-first order has no meaningful finish times, so never
+calls :py:meth:`~Visitor.finish_vertex`.  A link which may be followed both
+ways (as undirected edges are) is examined from both ends, but only given to
+one of the edge kind hooks, the first time.
+
+With no visitor, the engine runs the traversals exactly as plain loops, with
+no hooks to look up or call at all; they cost nothing unless used.
+
+.. seealso::
+
+   * [CLRS09]_, chapter 22.3, for the classification of edges
+   * The Boost Graph Library's visitor concepts, after which these are
+     modelled
+"""
+
+from __future__ import annotations
+
+import collections
+from collections.abc import Callable, Iterator
+
+from edgegraph.structure import Universe, Vertex, Link, CSRSnapshot
+from edgegraph.traversal import helpers, visitsets
+
+#: Names of every hook a :py:class:`Visitor` may override.
+HOOKS = (
+    "start_vertex",
+    "discover_vertex",
+    "examine_edge",
+    "tree_edge",
+    "back_edge",
+    "forward_or_cross_edge",
+    "non_tree_edge",
+    "finish_vertex",
+)
+
+
+class Visitor(object):
+    """
+    Base class of traversal visitors.
+
+    Every hook does nothing; subclasses override those they need.  The
+    engine only calls hooks which are overridden, so a visitor pays only for
+    the events it is interested in.
+
+    Each edge hook is given the link followed (``e``), the vertex it is
+    followed from (``u``), and the vertex it leads to (``v``).
+    """
+
+    def start_vertex(self, v: Vertex):
+        """
+        Called for each start vertex, just before it is discovered.  Start
+        vertices already discovered from an earlier one are skipped.
+        """
+
+    def discover_vertex(self, v: Vertex):
+        """
+        Called as each vertex is first visited.
+        """
+
+    def examine_edge(self, e: Link, u: Vertex, v: Vertex):
+        """
+        Called for each link followed out of a vertex, before anything else
+        is done with it.
+        """
+
+    def tree_edge(self, e: Link, u: Vertex, v: Vertex):
+        """
+        Called for each link which leads to an undiscovered vertex, just
+        before that vertex is discovered.  These links make up the traversal
+        tree (or forest).
+        """
+
+    def back_edge(self, e: Link, u: Vertex, v: Vertex):
+        """
+        Depth-first (recursive order) only; called for each link leading to
+        a vertex discovered, but not finished.  Such a vertex is an ancestor
+        of ``u`` in the tree (or ``u`` itself), so the link closes a cycle.
+        """
+
+    def forward_or_cross_edge(self, e: Link, u: Vertex, v: Vertex):
+        """
+        Depth-first (recursive order) only; called for each link leading to
+        a finished vertex.
+        """
+
+    def non_tree_edge(self, e: Link, u: Vertex, v: Vertex):
+        """
+        Breadth-first and iterative-order depth-first only; called for each
+        link leading to a vertex already discovered.
+        """
+
+    def finish_vertex(self, v: Vertex):
+        """
+        Called once every link out of a vertex has been examined (and,
+        depth-first, every vertex discovered below it finished).  Never
+        called in the iterative depth-first order.
+        """
+
+
+class ParentVisitor(Visitor):
+    """
+    Record the traversal tree: the vertex (and link) each vertex was
+    discovered from.
+
+    The tree of a breadth-first traversal holds a path with the fewest hops
+    from the start to every vertex.
+    """
+
+    def __init__(self):
+        """
+        Start with an empty tree.
+        """
+
+        #: Vertex each vertex was discovered from (``None`` for starts)
+        self.parents: dict[Vertex, Vertex | None] = {}
+
+        #: Link each vertex was discovered over (``None`` for starts)
+        self.links: dict[Vertex, Link | None] = {}
+
+    def start_vertex(self, v: Vertex):
+        self.parents[v] = None
+        self.links[v] = None
+
+    def tree_edge(self, e: Link, u: Vertex, v: Vertex):
+        self.parents[v] = u
+        self.links[v] = e
+
+    def path_to(self, v: Vertex) -> list[Vertex] | None:
+        """
+        Return the path down the tree to a vertex, from the start it was
+        reached from (both inclusive), or ``None`` if it was not visited.
+        """
+        if v not in self.parents:
+            return None
+        path = []
+        while v is not None:
+            path.append(v)
+            v = self.parents[v]
+        path.reverse()
+        return path
+
+
+class DepthVisitor(Visitor):
+    """
+    Record the depth of each vertex in the traversal tree; that is, how many
+    links it was discovered over from its start.
+
+    In a breadth-first traversal, this is the fewest hops from any start.
+    """
+
+    def __init__(self):
+        """
+        Start with no depths.
+        """
+
+        #: Depth of each vertex discovered
+        self.depths: dict[Vertex, int] = {}
+
+    def start_vertex(self, v: Vertex):
+        self.depths[v] = 0
+
+    def tree_edge(self, e: Link, u: Vertex, v: Vertex):
+        self.depths[v] = self.depths[u] + 1
+
+
+class TimestampVisitor(Visitor):
+    """
+    Record when each vertex is discovered and finished.
+
+    A single clock, starting at one, ticks at each of these events, across
+    all start vertices; see
+    :py:func:`~edgegraph.traversal.depthfirst.dft_timestamps` for what the
+    times of a depth-first traversal tell.  Vertices not finished (as in the
+    iterative depth-first order) keep just their discovery time.
+    """
+
+    def __init__(self):
+        """
+        Start the clock at zero.
+        """
+
+        #: Last time given out
+        self.clock = 0
+
+        #: Each vertex to its discovery time, then a two-tuple of its
+        #: discovery and finish times once finished; in order of discovery
+        self.times: dict[Vertex, int | tuple[int, int]] = {}
+
+    def discover_vertex(self, v: Vertex):
+        self.clock += 1
+        self.times[v] = self.clock
+
+    def finish_vertex(self, v: Vertex):
+        self.clock += 1
+        self.times[v] = (self.times[v], self.clock)
+
+
+class EdgeClassVisitor(Visitor):
+    """
+    Record the kind of each link met: ``"tree"``, ``"back"``,
+    ``"forward_or_cross"``, or ``"non_tree"`` (after the hook each goes to).
+
+    For instance, a directed graph has a cycle reachable from the start
+    exactly when a recursive-order depth-first traversal finds a back edge.
+    """
+
+    def __init__(self):
+        """
+        Start with no links.
+        """
+
+        #: Kind of each link, in the order they were met
+        self.kinds: dict[Link, str] = {}
+
+    def tree_edge(self, e: Link, u: Vertex, v: Vertex):
+        self.kinds[e] = "tree"
+
+    def back_edge(self, e: Link, u: Vertex, v: Vertex):
+        self.kinds[e] = "back"
+
+    def forward_or_cross_edge(self, e: Link, u: Vertex, v: Vertex):
+        self.kinds[e] = "forward_or_cross"
+
+    def non_tree_edge(self, e: Link, u: Vertex, v: Vertex):
+        self.kinds[e] = "non_tree"
+
+    def of_kind(self, kind: str) -> list[Link]:
+        """
+        Return the links of the given kind, in the order they were met.
+        """
+        return [e for e, k in self.kinds.items() if k == kind]
+
+
+def _fan_out(fns: list[Callable]) -> Callable:
+    """
+    Make one hook calling several in turn.
+
+    :meta private:
+    """
+
+    def hook(*args):
+        for fn in fns:
+            fn(*args)
+
+    return hook
+
+
+def _hooks(visitor: Visitor | list[Visitor]) -> dict[str, Callable | None]:
+    """
+    Look up the hooks of a visitor (or list or tuple of them) that the
+    engine must call.  For internal use only!
+
+    :return: Each hook name to the (combined) bound method, or ``None`` if no
+       visitor overrides it.
+
+    :meta private:
+    """
+    visitors = visitor if isinstance(visitor, (list, tuple)) else [visitor]
+    hooks = {}
+    for name in HOOKS:
+        base = getattr(Visitor, name)
+        found = [
+            getattr(vis, name)
+            for vis in visitors
+            if getattr(type(vis), name, base) is not base
+        ]
+        if not found:
+            hooks[name] = None
+        elif len(found) == 1:
+            hooks[name] = found[0]
+        else:
+            hooks[name] = _fan_out(found)
+    return hooks
+
+
+def _link_arcs(
+    uni: Universe | CSRSnapshot | None,
+    direction_sensitive: int,
+    unknown_handling: int,
+    ff_via: Callable | None,
+) -> Callable[[Vertex], list[tuple[Link, Vertex]]]:
+    """
+    Make a function listing the ``(link, neighbor)`` pairs to follow out of a
+    vertex, for the engine with a visitor.  For internal use only!
+
+    :meta private:
+    """
+    if isinstance(uni, CSRSnapshot):
+        verts = uni.vertices
+        offsets, targets, links, bypass = uni.adjacency(
+            direction_sensitive, unknown_handling
+        )
+
+        def csr_arcs(u):
+            i = uni.index_of(u)
+            out = []
+            for k in range(offsets[i], offsets[i + 1]):
+                v = verts[targets[k]]
+                # links of unknown type bypass the filter, as in ineighbors()
+                if (
+                    (ff_via is None)
+                    or (bypass and bypass[k])
+                    or ff_via(links[k], v)
+                ):
+                    out.append((links[k], v))
+            return out
+
+        return csr_arcs
+
+    def live_arcs(u):
+        return [
+            (e, v)
+            for e, v in helpers.ineighbor_links(
+                u,
+                direction_sensitive=direction_sensitive,
+                unknown_handling=unknown_handling,
+                filterfunc=ff_via,
+            )
+            if (uni is None) or uni.has_vertex(v)
+        ]
+
+    return live_arcs
+
+
+###############################################################################
+# breadth-first
+
+
+def _bf_csr(
+    snap: CSRSnapshot,
+    starts: list[Vertex],
+    direction_sensitive: int,
+    unknown_handling: int,
+    ff_via: Callable | None,
+    ff_result: Callable | None,
+) -> Iterator[Vertex]:
+    """
+    Breadth-first traversal over a frozen snapshot, with no visitor.
+
+    Identical in behavior to :py:func:`_bf_live`, except that the inner loop
+    works entirely on the snapshot's integer vertex numbers.
+
+    :meta private:
+    """
+    verts = snap.vertices
+    offsets, targets, links, bypass = snap.adjacency(
+        direction_sensitive, unknown_handling
+    )
+    visited = visitsets.visited_set(snap).flags
+    queue = collections.deque()
+    for start in starts:
+        s = snap.index_of(start)
+        visited[s] = 1
+        queue.append(s)
+
+        if (ff_result and ff_result(start)) or (not ff_result):
+            yield start
+
+    while queue:
+        u = queue.popleft()
+        for k in range(offsets[u], offsets[u + 1]):
+            w = targets[k]
+            if visited[w]:
+                continue
+            # links of unknown type bypass the filter, as in ineighbors()
+            if (
+                (ff_via is not None)
+                and not (bypass and bypass[k])
+                and (not ff_via(links[k], verts[w]))
+            ):
+                continue
+
+            visited[w] = 1
+            queue.append(w)
+
+            if (ff_result and ff_result(verts[w])) or (not ff_result):
+                yield verts[w]
+
+
+def _bf_live(
+    uni: Universe | None,
+    starts: list[Vertex],
+    direction_sensitive: int,
+    unknown_handling: int,
+    ff_via: Callable | None,
+    ff_result: Callable | None,
+) -> Iterator[Vertex]:
+    """
+    Breadth-first traversal, with no visitor.
+
+    :meta private:
+    """
+    visited = set(starts)
+    queue = collections.deque(starts)
+
+    for s in starts:
+        if (ff_result and ff_result(s)) or (not ff_result):
+            yield s
+
+    while queue:
+        u = queue.popleft()
+        for v in helpers.ineighbors(
+            u,
+            direction_sensitive=direction_sensitive,
+            unknown_handling=unknown_handling,
+            filterfunc=ff_via,
+        ):
+
+            if (uni is not None) and (not uni.has_vertex(v)):
+                continue
+
+            # make sure we don't re-visit as a duplicate
+            if v not in visited:
+                visited.add(v)
+                queue.append(v)
+
+                if (ff_result and ff_result(v)) or (not ff_result):
+                    yield v
+
+
+def _bf_visit(
+    uni: Universe | CSRSnapshot | None,
+    starts: list[Vertex],
+    direction_sensitive: int,
+    unknown_handling: int,
+    ff_via: Callable | None,
+    ff_result: Callable | None,
+    hooks: dict[str, Callable | None],
+) -> Iterator[Vertex]:
+    """
+    Breadth-first traversal, calling the given hooks.
+
+    :meta private:
+    """
+    arcs = _link_arcs(uni, direction_sensitive, unknown_handling, ff_via)
+    start_vertex = hooks["start_vertex"]
+    discover_vertex = hooks["discover_vertex"]
+    examine_edge = hooks["examine_edge"]
+    tree_edge = hooks["tree_edge"]
+    non_tree_edge = hooks["non_tree_edge"]
+    finish_vertex = hooks["finish_vertex"]
+
+    visited = set(starts)
+    # links given to an edge kind hook already (from their other end)
+    classified = set()
+    queue = collections.deque(starts)
+
+    for s in starts:
+        if start_vertex:
+            start_vertex(s)
+        if discover_vertex:
+            discover_vertex(s)
+        if (ff_result and ff_result(s)) or (not ff_result):
+            yield s
+
+    while queue:
+        u = queue.popleft()
+        for e, v in arcs(u):
+            if examine_edge:
+                examine_edge(e, u, v)
+
+            if v not in visited:
+                visited.add(v)
+                classified.add(e)
+                if tree_edge:
+                    tree_edge(e, u, v)
+                if discover_vertex:
+                    discover_vertex(v)
+                queue.append(v)
+
+                if (ff_result and ff_result(v)) or (not ff_result):
+                    yield v
+
+            elif e not in classified:
+                classified.add(e)
+                if non_tree_edge:
+                    non_tree_edge(e, u, v)
+
+        if finish_vertex:
+            finish_vertex(u)
+
+
+def _breadth_first(
+    uni: Universe | CSRSnapshot | None,
+    starts: list[Vertex],
+    direction_sensitive: int,
+    unknown_handling: int,
+    ff_via: Callable | None,
+    ff_result: Callable | None,
+    visitor: Visitor | list[Visitor] | None,
+) -> Iterator[Vertex]:
+    """
+    Breadth-first traversal from the given (checked) start vertices, calling
+    the hooks of ``visitor``, if any.  For internal use only!
+
+    :meta private:
+    """
+    if visitor is not None:
+        return _bf_visit(
+            uni,
+            starts,
+            direction_sensitive,
+            unknown_handling,
+            ff_via,
+            ff_result,
+            _hooks(visitor),
+        )
+    base = _bf_csr if isinstance(uni, CSRSnapshot) else _bf_live
+    return base(
+        uni,
+        starts,
+        direction_sensitive,
+        unknown_handling,
+        ff_via,
+        ff_result,
+    )
+
+
+###############################################################################
+# depth-first, recursive order
+
+
+def _df_recursive_csr(
+    snap: CSRSnapshot,
+    starts: list[Vertex],
+    direction_sensitive: int,
+    unknown_handling: int,
+    ff_via: Callable | None,
+    ff_result: Callable | None,
+) -> Iterator[Vertex]:
+    """
+    Recursive-order depth-first traversal over a frozen snapshot, with no
+    visitor.
+
+    Identical in behavior to :py:func:`_df_recursive_live`, except that the
+    inner loop works entirely on the snapshot's integer vertex numbers.
+
+    :meta private:
+    """
+    verts = snap.vertices
+    offsets, targets, links, bypass = snap.adjacency(
+        direction_sensitive, unknown_handling
+    )
+    visited = visitsets.visited_set(snap).flags
+
+    for start in starts:
+        s = snap.index_of(start)
+        if visited[s]:
+            continue
+        visited[s] = 1
+        if (ff_result and ff_result(start)) or (not ff_result):
+            yield start
+
+        # each frame is a vertex number, and the next of its links to look at
+        stack = [[s, offsets[s]]]
+        while stack:
+            frame = stack[-1]
+            v, k = frame
+            end = offsets[v + 1]
+            while k < end:
+                w = targets[k]
+                # links of unknown type bypass the filter, as in ineighbors()
+                if visited[w] or (
+                    (ff_via is not None)
+                    and not (bypass and bypass[k])
+                    and (not ff_via(links[k], verts[w]))
+                ):
+                    k += 1
+                    continue
+                break
+            else:
+                # nothing left to discover below v
+                stack.pop()
+                continue
+
+            frame[1] = k + 1
+            visited[w] = 1
+            if (ff_result and ff_result(verts[w])) or (not ff_result):
+                yield verts[w]
+            stack.append([w, offsets[w]])
+
+
+def _df_recursive_live(
+    uni: Universe | None,
+    starts: list[Vertex],
+    direction_sensitive: int,
+    unknown_handling: int,
+    ff_via: Callable | None,
+    ff_result: Callable | None,
+) -> Iterator[Vertex]:
+    """
+    Recursive-order depth-first traversal, without recursion, and with no
+    visitor.
+
+    Rather than the Python call stack, explicit stacks hold the neighbors of
+    each vertex on the path from the start, and how far through them the
+    traversal has got, exactly as the frames of a recursive traversal would.
+    Each step carries on from the top, so vertices come in the same order, but
+    no step costs more for being deep, and there is no limit on the depth.
+
+    The neighbors of each vertex are listed when it is discovered (so
+    ``ff_via`` is asked about them all then), but each is only checked for
+    having been visited when its turn comes, as in the recursive traversal.
+    Lists rather than generators keep the stack cheap for the garbage
+    collector to walk, which matters on long paths.
+
+    :meta private:
+    """
+    visited = visitsets.visited_set(uni)
+
+    # the frame at the bottom stands in for a vertex linked to every start, so
+    # that they are discovered in turn as any other vertex would be
+    path: list[Vertex | None] = [None]
+    nbs: list[list[Vertex]] = [starts]
+    pos = [0]
+    while path:
+        here = nbs[-1]
+        k = pos[-1]
+        end = len(here)
+        while k < end:
+            w = here[k]
+            k += 1
+            if (uni is not None) and (not uni.has_vertex(w)):
+                continue
+            if w not in visited:
+                break
+        else:
+            # nothing left to discover below the top vertex
+            path.pop()
+            nbs.pop()
+            pos.pop()
+            continue
+
+        pos[-1] = k
+        visited.add(w)
+        if (ff_result and ff_result(w)) or (not ff_result):
+            yield w
+        path.append(w)
+        nbs.append(
+            helpers.neighbors(
+                w,
+                direction_sensitive=direction_sensitive,
+                unknown_handling=unknown_handling,
+                filterfunc=ff_via,
+            )
+        )
+        pos.append(0)
+
+
+def _df_recursive_visit(
+    uni: Universe | CSRSnapshot | None,
+    starts: list[Vertex],
+    direction_sensitive: int,
+    unknown_handling: int,
+    ff_via: Callable | None,
+    ff_result: Callable | None,
+    hooks: dict[str, Callable | None],
+) -> Iterator[Vertex]:
+    """
+    Recursive-order depth-first traversal, calling the given hooks.
+
+    Laid out as :py:func:`_df_recursive_live`, but over ``(link, neighbor)``
+    pairs, and noting which vertices are finished, to tell back edges from
+    the rest.
+
+    :meta private:
+    """
+    arcs = _link_arcs(uni, direction_sensitive, unknown_handling, ff_via)
+    start_vertex = hooks["start_vertex"]
+    discover_vertex = hooks["discover_vertex"]
+    examine_edge = hooks["examine_edge"]
+    tree_edge = hooks["tree_edge"]
+    back_edge = hooks["back_edge"]
+    forward_or_cross_edge = hooks["forward_or_cross_edge"]
+    finish_vertex = hooks["finish_vertex"]
+
+    visited = set()
+    finished = set()
+    # links given to an edge kind hook already (from their other end)
+    classified = set()
+
+    path: list[Vertex | None] = [None]
+    nbs: list[list[tuple[Link | None, Vertex]]] = [
+        [(None, s) for s in starts]
+    ]
+    pos = [0]
+    while path:
+        v = path[-1]
+        here = nbs[-1]
+        k = pos[-1]
+        end = len(here)
+        while k < end:
+            e, w = here[k]
+            k += 1
+            if v is None:
+                # the bottom frame; starts have no links to examine
+                if w not in visited:
+                    break
+                continue
+            if examine_edge:
+                examine_edge(e, v, w)
+            if w not in visited:
+                break
+            if e not in classified:
+                classified.add(e)
+                if w not in finished:
+                    if back_edge:
+                        back_edge(e, v, w)
+                elif forward_or_cross_edge:
+                    forward_or_cross_edge(e, v, w)
+        else:
+            # nothing left to discover below the top vertex
+            path.pop()
+            nbs.pop()
+            pos.pop()
+            if v is not None:
+                finished.add(v)
+                if finish_vertex:
+                    finish_vertex(v)
+            continue
+
+        pos[-1] = k
+        visited.add(w)
+        if v is None:
+            if start_vertex:
+                start_vertex(w)
+        else:
+            classified.add(e)
+            if tree_edge:
+                tree_edge(e, v, w)
+        if discover_vertex:
+            discover_vertex(w)
+        if (ff_result and ff_result(w)) or (not ff_result):
+            yield w
+        path.append(w)
+        nbs.append(arcs(w))
+        pos.append(0)
+
+
+###############################################################################
+# depth-first, iterative order
+
+
+def _df_iterative_csr(
+    snap: CSRSnapshot,
+    starts: list[Vertex],
+    direction_sensitive: int,
+    unknown_handling: int,
+    ff_via: Callable | None,
+    ff_result: Callable | None,
+) -> Iterator[Vertex]:
+    """
+    Iterative depth-first traversal over a frozen snapshot, with no visitor.
+
+    :meta private:
+    """
+    verts = snap.vertices
+    offsets, targets, links, bypass = snap.adjacency(
+        direction_sensitive, unknown_handling
+    )
+    discovered = visitsets.visited_set(snap).flags
+
+    # the first start on top; the rest are only reached once it is exhausted
+    stack = [snap.index_of(start) for start in reversed(starts)]
+    while stack:
+        v = stack.pop()
+        if discovered[v]:
+            continue
+
+        discovered[v] = 1
+        if (ff_result and ff_result(verts[v])) or (not ff_result):
+            yield verts[v]
+
+        for k in range(offsets[v], offsets[v + 1]):
+            w = targets[k]
+            # a vertex already discovered would only be skipped when popped
+            if discovered[w]:
+                continue
+            if (
+                (ff_via is None)
+                or (bypass and bypass[k])
+                or ff_via(links[k], verts[w])
+            ):
+                stack.append(w)
+
+
+def _df_iterative_live(
+    uni: Universe | None,
+    starts: list[Vertex],
+    direction_sensitive: int,
+    unknown_handling: int,
+    ff_via: Callable | None,
+    ff_result: Callable | None,
+) -> Iterator[Vertex]:
+    """
+    Iterative depth-first traversal, with no visitor.
+
+    :meta private:
+    """
+    # the first start on top; the rest are only reached once it is exhausted
+    stack = list(reversed(starts))
+    discovered = visitsets.visited_set(uni)
+    while stack:
+        v = stack.pop()
+        if v in discovered:
+            continue
+
+        discovered.add(v)
+        if (ff_result and ff_result(v)) or (not ff_result):
+            yield v
+
+        for w in helpers.ineighbors(
+            v,
+            direction_sensitive=direction_sensitive,
+            unknown_handling=unknown_handling,
+            filterfunc=ff_via,
+        ):
+            # a vertex already discovered would only be skipped when popped
+            if w in discovered:
+                continue
+            if (uni is None) or uni.has_vertex(w):
+                stack.append(w)
+
+
+def _df_iterative_visit(
+    uni: Universe | CSRSnapshot | None,
+    starts: list[Vertex],
+    direction_sensitive: int,
+    unknown_handling: int,
+    ff_via: Callable | None,
+    ff_result: Callable | None,
+    hooks: dict[str, Callable | None],
+) -> Iterator[Vertex]:
+    """
+    Iterative depth-first traversal, calling the given hooks.
+
+    Each stack entry carries the link it was pushed over, so that the one
+    which finally discovers a vertex is its tree edge; the rest are non-tree
+    edges.
+
+    :meta private:
+    """
+    arcs = _link_arcs(uni, direction_sensitive, unknown_handling, ff_via)
+    start_vertex = hooks["start_vertex"]
+    discover_vertex = hooks["discover_vertex"]
+    examine_edge = hooks["examine_edge"]
+    tree_edge = hooks["tree_edge"]
+    non_tree_edge = hooks["non_tree_edge"]
+
+    discovered = set()
+    # links given to an edge kind hook already (from their other end)
+    classified = set()
+
+    # the first start on top; the rest are only reached once it is exhausted
+    stack: list[tuple[Vertex, Vertex | None, Link | None]] = [
+        (s, None, None) for s in reversed(starts)
+    ]
+    while stack:
+        v, u, e = stack.pop()
+        if v in discovered:
+            if (e is not None) and (e not in classified):
+                classified.add(e)
+                if non_tree_edge:
+                    non_tree_edge(e, u, v)
+            continue
+
+        discovered.add(v)
+        if e is None:
+            if start_vertex:
+                start_vertex(v)
+        else:
+            classified.add(e)
+            if tree_edge:
+                tree_edge(e, u, v)
+        if discover_vertex:
+            discover_vertex(v)
+        if (ff_result and ff_result(v)) or (not ff_result):
+            yield v
+
+        for f, w in arcs(v):
+            if examine_edge:
+                examine_edge(f, v, w)
+            if w not in discovered:
+                stack.append((w, v, f))
+            elif f not in classified:
+                classified.add(f)
+                if non_tree_edge:
+                    non_tree_edge(f, v, w)
+
+
+def _depth_first(
+    uni: Universe | CSRSnapshot | None,
+    starts: list[Vertex],
+    direction_sensitive: int,
+    unknown_handling: int,
+    ff_via: Callable | None,
+    ff_result: Callable | None,
+    visitor: Visitor | list[Visitor] | None,
+    recursive: bool,
+) -> Iterator[Vertex]:
+    """
+    Depth-first traversal from the given (checked) start vertices, in
+    recursive or iterative order, calling the hooks of ``visitor``, if any.
+    For internal use only!
+
+    :meta private:
+    """
+    if visitor is not None:
+        base = _df_recursive_visit if recursive else _df_iterative_visit
+        return base(
+            uni,
+            starts,
+            direction_sensitive,
+            unknown_handling,
+            ff_via,
+            ff_result,
+            _hooks(visitor),
+        )
+    if isinstance(uni, CSRSnapshot):
+        base = _df_recursive_csr if recursive else _df_iterative_csr
+    else:
+        base = _df_recursive_live if recursive else _df_iterative_live
+    return base(
+        uni,
+        starts,
+        direction_sensitive,
+        unknown_handling,
+        ff_via,
+        ff_result,
+    )
@@ -0,0 +1,114 @@
+#!/usr/env/python3
+# -*- coding: utf-8 -*-
+
+"""
+Sets of visited vertices, for traversals.
+
+Every traversal keeps track of the vertices it has already visited, and asks
+whether each vertex it comes across is one of them.  Where vertices are only
+known as objects, a :py:class:`set` of them does this in constant time.
+Where they are numbered densely from zero, as the vertices of a
+:py:class:`~edgegraph.structure.csr.CSRSnapshot` are, a flat array of flags
+indexed by number (a :py:class:`Bitset`) is both smaller and faster.
+
+:py:func:`visited_set` makes whichever suits a universe.  Both kinds support
+``add()``, ``discard()``, ``in``, ``len()``, and iteration.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+from edgegraph.structure import Universe, CSRSnapshot
+
+
+class Bitset(object):
+    """
+    A set of the integers from zero up to (not including) a fixed size.
+
+    Each possible member is given a flag, so membership is tested by indexing
+    alone, with no hashing.  The flags take a byte each, rather than a bit;
+    in pure Python, packing eight to a byte costs more in shifting and masking
+    than it saves.  This is still a small fraction of the memory a
+    :py:class:`set` of the same integers takes.
+
+    >>> seen = Bitset(10)
+    >>> seen.add(3)
+    >>> 3 in seen, 4 in seen
+    (True, False)
+
+    For the innermost loops of traversals, :py:attr:`flags` gives the array
+    itself, to be indexed directly.
+    """
+
+    __slots__ = ("_flags",)
+
+    def __init__(self, size: int):
+        """
+        Make an empty set.
+
+        :param size: One more than the largest integer the set may hold.
+        """
+
+        #: One flag per possible member; non-zero for members
+        self._flags = bytearray(size)
+
+    @property
+    def flags(self) -> bytearray:
+        """
+        Return the flag of each possible member (non-zero for members), for
+        direct use in inner loops.  Changes to it change the set.
+        """
+        return self._flags
+
+    def add(self, i: int):
+        """
+        Add an integer to the set.
+
+        :raises IndexError: If ``i`` is not less than the size of the set.
+        """
+        self._flags[i] = 1
+
+    def discard(self, i: int):
+        """
+        Remove an integer from the set, if it is a member.
+
+        :raises IndexError: If ``i`` is not less than the size of the set.
+        """
+        self._flags[i] = 0
+
+    def __contains__(self, i: int) -> bool:
+        """
+        Called by :py:`i in bitset`; whether ``i`` is a member.  Integers
+        outside the range of the set are not members.
+        """
+        return 0 <= i < len(self._flags) and self._flags[i] != 0
+
+    def __len__(self) -> int:
+        """
+        Called by :py:`len(bitset)`; the number of members.  This counts them,
+        so takes time proportional to the size of the set.
+        """
+        return len(self._flags) - self._flags.count(0)
+
+    def __iter__(self) -> Iterator[int]:
+        """
+        Called by :py:`iter(bitset)`; the members, in increasing order.
+        """
+        return (i for i, flag in enumerate(self._flags) if flag)
+
+
+def visited_set(uni: Universe | CSRSnapshot | None) -> set | Bitset:
+    """
+    Make an empty set of visited vertices, suited to the given universe.
+
+    :param uni: The universe to be traversed, or ``None``.
+    :return: A :py:class:`Bitset` sized for the vertex numbers of a
+       :py:class:`~edgegraph.structure.csr.CSRSnapshot` (members are then
+       vertex *numbers*; see
+       :py:meth:`~edgegraph.structure.csr.CSRSnapshot.index_of`), or a
+       :py:class:`set` (of vertices) for anything else.
+    """
+    if isinstance(uni, CSRSnapshot):
+        return Bitset(len(uni.vertices))
+    return set()
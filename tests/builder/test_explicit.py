@@ -5,11 +5,18 @@
 Unit tests for builder.explicit module.
 """
 
+import gc
+
+import pytest
 from edgegraph.structure import (
+    Universe,
     Vertex,
     TwoEndedLink,
     DirectedEdge,
     UnDirectedEdge,
+    CompactVertex,
+    CompactDirectedEdge,
+    uidgen,
 )
 from edgegraph.builder import explicit
 from edgegraph.traversal import helpers
@@ -250,3 +257,174 @@ def test_dontdup():
     # and finally, check it still makes a new link if there is no duplicate
     l8 = explicit.link_from_to(verts[0], TwoEndedLink, verts[3], dontdup=True)
     assert verts[0].links == (l1, l7, l8), "did not add post-dontdup link!"
+
+
+@pytest.mark.parametrize(
+    "lnktype", [DirectedEdge, UnDirectedEdge, TwoEndedLink, CompactDirectedEdge]
+)
+def test_link_many(lnktype):
+    """
+    Ensure link_many makes the same links as link_from_to would.
+    """
+    uni = Universe()
+    verts = [Vertex(universes=[uni]) for _ in range(4)]
+
+    links = explicit.link_many(
+        [
+            (verts[0], verts[1]),
+            (verts[1], verts[2], {"weight": 5}),
+            (verts[2], verts[2], None),
+        ],
+        lnktype,
+    )
+
+    assert [type(lnk) for lnk in links] == [lnktype] * 3
+    assert links[0].vertices == (verts[0], verts[1])
+    assert links[1].vertices == (verts[1], verts[2])
+    assert links[2].vertices == (verts[2], verts[2])
+    assert links[1].weight == 5
+    assert verts[0].links == (links[0],)
+    assert verts[1].links == (links[0], links[1])
+    assert verts[2].links == (links[1], links[2])
+    assert verts[3].links == ()
+    assert len({lnk.uid for lnk in links}) == 3
+
+    # neighbors (and so, direction buckets) agree with regular construction
+    ref = [Vertex() for _ in range(4)]
+    explicit.link_from_to(ref[0], lnktype, ref[1])
+    explicit.link_from_to(ref[1], lnktype, ref[2])
+    explicit.link_from_to(ref[2], lnktype, ref[2])
+    for vert, rvert in zip(verts, ref):
+        for direction in (
+            helpers.DIR_SENS_FORWARD,
+            helpers.DIR_SENS_ANY,
+            helpers.DIR_SENS_BACKWARD,
+        ):
+            got = helpers.neighbors(
+                vert,
+                direction_sensitive=direction,
+                unknown_handling=helpers.LNK_UNKNOWN_NEIGHBOR,
+            )
+            want = helpers.neighbors(
+                rvert,
+                direction_sensitive=direction,
+                unknown_handling=helpers.LNK_UNKNOWN_NEIGHBOR,
+            )
+            assert [verts.index(v) for v in got] == [
+                ref.index(v) for v in want
+            ]
+
+
+def test_link_many_compact_vertices():
+    """
+    Ensure link_many accepts compact vertices, and sets attributes on compact
+    edges.
+    """
+    v1, v2 = CompactVertex(), CompactVertex()
+    (lnk,) = explicit.link_many([(v1, v2, {"weight": 3})], CompactDirectedEdge)
+    assert lnk.weight == 3
+    assert helpers.neighbors(v1) == [v2]
+
+
+def test_link_many_dontdup():
+    """
+    Ensure link_many's dontdup sees existing links, and its own.
+    """
+    verts = [Vertex() for _ in range(3)]
+    l01 = explicit.link_undirected(verts[0], verts[1])
+
+    links = explicit.link_many(
+        [
+            (verts[0], verts[1]),
+            (verts[1], verts[0]),
+            (verts[1], verts[2]),
+            (verts[2], verts[1]),
+            (verts[1], verts[2]),
+        ],
+        dontdup=True,
+    )
+    assert links[0] is l01
+    assert links[1] is l01
+    assert links[2] is links[3] is links[4]
+    assert links[2].vertices == (verts[1], verts[2])
+    assert verts[1].links == (l01, links[2])
+
+    # without dontdup, duplicates are made
+    more = explicit.link_many([(verts[0], verts[1])] * 2)
+    assert more[0] is not more[1]
+    assert len(verts[0].links) == 3
+
+
+def test_link_many_custom_type():
+    """
+    Ensure link types with their own constructor have it called.
+    """
+    calls = []
+
+    class Counted(DirectedEdge):
+        def __init__(self, v1=None, v2=None, *, uid=None, attributes=None):
+            calls.append((v1, v2))
+            super().__init__(v1, v2, uid=uid, attributes=attributes)
+
+    v1, v2 = Vertex(), Vertex()
+    (lnk,) = explicit.link_many([(v1, v2, {"w": 1})], Counted)
+    assert calls == [(v1, v2)]
+    assert lnk.w == 1
+    assert helpers.neighbors(v1) == [v2]
+
+
+def test_link_many_invalidates_caches():
+    """
+    Ensure neighbor caches see links made by link_many.
+    """
+    v1, v2, v3 = Vertex(), Vertex(), Vertex()
+    explicit.link_directed(v1, v2)
+    assert helpers.neighbors(v1) == [v2]
+    assert helpers.neighbors(v1) == [v2]
+
+    explicit.link_many([(v1, v3), (v3, v1)])
+    assert helpers.neighbors(v1) == [v2, v3]
+    assert helpers.neighbors(v3) == [v1]
+
+
+def test_link_many_uid_generator():
+    """
+    Ensure link_many numbers links with the universe's UID generator.
+    """
+    uni = Universe(uid_generator=uidgen.counter(500))
+    v1, v2 = Vertex(universes=[uni]), Vertex(universes=[uni])
+    (lnk,) = explicit.link_many([(v1, v2)])
+    assert lnk.uid == 502
+
+
+def test_link_many_errors():
+    """
+    Ensure link_many rejects non-vertices and non-dict attributes, and leaves
+    the GC alone.
+    """
+    v1 = Vertex()
+    v2 = Vertex()
+    assert gc.isenabled()
+    with pytest.raises(TypeError):
+        explicit.link_many([(v1, "nope")])
+    with pytest.raises(TypeError):
+        explicit.link_many([(None, v1)])
+    assert v1.links == ()
+
+    class Custom(DirectedEdge):
+        def __init__(self, v1=None, v2=None, *, uid=None, attributes=None):
+            super().__init__(v1, v2, uid=uid, attributes=attributes)
+
+    # the same error as the constructor gives, on either path
+    with pytest.raises(TypeError):
+        DirectedEdge(v1, v2, attributes=["nope"])
+    for lnktype in (DirectedEdge, Custom):
+        with pytest.raises(TypeError):
+            explicit.link_many([(v1, v2, ["nope"])], lnktype)
+
+    gc.disable()
+    try:
+        explicit.link_many([(v1, v2)])
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
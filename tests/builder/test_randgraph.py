@@ -8,7 +8,7 @@ Unit tests for the random graph generator.
 import logging
 import time
 import pytest
-from edgegraph.structure import DirectedEdge, UnDirectedEdge
+from edgegraph.structure import DirectedEdge, UnDirectedEdge, uidgen
 from edgegraph.builder import randgraph
 
 LOG = logging.getLogger(__name__)
@@ -34,6 +34,18 @@ def test_randgraph_edgetype(edgetype):
             assert isinstance(link, edgetype)
 
 
+def test_randgraph_uid_generator():
+    """
+    Ensure the given UID generator numbers the whole graph.
+    """
+    uni = randgraph.randgraph(count=50, uid_generator=uidgen.counter())
+    uids = [v.uid for v in uni.vertices]
+    uids.extend(link.uid for v in uni.vertices for link in v.links)
+    assert min(uids) == 1
+    assert max(uids) < 1000, "some objects used the default generator!"
+    assert uni.uid_generator is not None
+
+
 def test_randgraph_ensurelink_false():
     """
     Ensure that zero connectivity is viable with ensurelink=False.
@@ -13,6 +13,8 @@ from __future__ import annotations
 import logging
 import pytest
 
+from edgegraph import metrics
+
 # guido, forgive me
 from .fixtures import *
 
@@ -28,9 +30,15 @@ def enforce_cache_testing(request):
     enable = request.param == "cache"
     Vertex.NEIGHBOR_CACHING = enable
 
+    # count along with caching, so that the counting paths get exercised too
+    if enable:
+        metrics.enable()
+    else:
+        metrics.disable()
+
     # reset cache stats and sentinel
     Vertex._QA_NB_INVALID = object()
-    Vertex._CACHE_STATS = {}
+    metrics.REGISTRY.reset()
 
     yield
 
@@ -0,0 +1,121 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Integration tests ensuring traversals and searches give the same answers on a
+frozen snapshot as on the live universe.
+"""
+
+import pytest
+from edgegraph.structure import Vertex
+from edgegraph.traversal import breadthfirst, depthfirst, helpers
+from edgegraph.pathfinding import shortestpath
+
+travs = [
+    breadthfirst.bft,
+    depthfirst.dft_recursive,
+    depthfirst.dft_iterative,
+]
+
+searches = [
+    breadthfirst.bfs,
+    depthfirst.dfs_recursive,
+    depthfirst.dfs_iterative,
+]
+
+
+@pytest.mark.parametrize("trav", travs)
+@pytest.mark.parametrize(
+    "direction",
+    [
+        helpers.DIR_SENS_FORWARD,
+        helpers.DIR_SENS_BACKWARD,
+        helpers.DIR_SENS_ANY,
+    ],
+)
+def test_csr_trav_matches(graph_clrs09_22_6, trav, direction):
+    """
+    Ensure traversals on a snapshot match those on the universe.
+    """
+    uni, verts = graph_clrs09_22_6
+    snap = uni.freeze()
+
+    for start in verts:
+        live = trav(uni, start, direction_sensitive=direction)
+        frozen = trav(snap, start, direction_sensitive=direction)
+        assert frozen == live, "snapshot traversal differs from live!"
+
+
+@pytest.mark.parametrize("trav", travs)
+def test_csr_trav_filters(graph_clrs09_22_6, trav):
+    """
+    Ensure ff_via and ff_result are honored on a snapshot.
+    """
+    uni, verts = graph_clrs09_22_6
+    snap = uni.freeze()
+
+    ff_via = lambda e, v2: v2.i != 6
+    ff_result = lambda v: v.i % 2 == 0
+
+    live = trav(uni, verts[0], ff_via=ff_via, ff_result=ff_result)
+    frozen = trav(snap, verts[0], ff_via=ff_via, ff_result=ff_result)
+    assert frozen == live
+
+
+@pytest.mark.parametrize("trav", travs)
+def test_csr_trav_nonmember_start(graph_clrs09_22_6, trav):
+    """
+    Ensure a start vertex outside the snapshot is refused.
+    """
+    uni, _ = graph_clrs09_22_6
+    snap = uni.freeze()
+
+    with pytest.raises(ValueError):
+        trav(snap, Vertex())
+
+
+@pytest.mark.parametrize("search", searches)
+def test_csr_search_matches(graph_clrs09_22_6, search):
+    """
+    Ensure searches on a snapshot match those on the universe.
+    """
+    uni, verts = graph_clrs09_22_6
+    snap = uni.freeze()
+
+    for target in range(-1, 10):
+        live = search(uni, verts[0], "i", target)
+        frozen = search(snap, verts[0], "i", target)
+        assert frozen is live
+
+
+def test_csr_spsp_matches(graph_clrs09_22_6):
+    """
+    Ensure Dijkstra on a snapshot matches Dijkstra on the universe.
+    """
+    uni, verts = graph_clrs09_22_6
+    snap = uni.freeze()
+
+    for start in verts:
+        for dest in verts:
+            live = shortestpath.single_pair_shortest_path(uni, start, dest)
+            frozen = shortestpath.single_pair_shortest_path(snap, start, dest)
+            assert frozen == live
+
+
+def test_csr_spsp_weighted(graph_cheapest_is_longest):
+    """
+    Ensure custom weight functions work on a snapshot.
+    """
+    uni, verts = graph_cheapest_is_longest
+    snap = uni.freeze()
+
+    def weight(u, v):
+        return min(e.weight for e in helpers.find_links(u, v))
+
+    live = shortestpath.single_pair_shortest_path(
+        uni, verts[0], verts[-1], weightfunc=weight
+    )
+    frozen = shortestpath.single_pair_shortest_path(
+        snap, verts[0], verts[-1], weightfunc=weight
+    )
+    assert frozen == live
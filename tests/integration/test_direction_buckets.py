@@ -0,0 +1,130 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests ensuring vertices keep the roles they play in their links up to
+date.
+"""
+
+from edgegraph.structure import (
+    Vertex,
+    DirectedEdge,
+    UnDirectedEdge,
+    TwoEndedLink,
+)
+from edgegraph.structure.vertex import ROLE_OUT, ROLE_IN, ROLE_UND, ROLE_UNK
+from edgegraph.builder import explicit
+
+
+def _buckets(v):
+    """
+    Sort the links of a vertex by the role it plays in them, as a tuple of
+    (outbound, inbound, undirected, unknown) tuples.
+    """
+    return tuple(
+        tuple(lnk for lnk, role in v._links.items() if role & bit)
+        for bit in (ROLE_OUT, ROLE_IN, ROLE_UND, ROLE_UNK)
+    )
+
+
+def test_roles_stored_with_links():
+    """
+    Ensure roles are kept in the link map itself, with no other containers.
+    """
+    v1 = Vertex()
+    v2 = Vertex()
+    u = explicit.link_undirected(v1, v2)
+    d = explicit.link_directed(v1, v2)
+
+    assert v1._links == {u: ROLE_UND, d: ROLE_OUT}
+    assert v2._links == {u: ROLE_UND, d: ROLE_IN}
+    assert not hasattr(v1, "_links_out")
+
+
+def test_buckets_on_init():
+    """
+    Ensure links are bucketed correctly when created.
+    """
+    v1 = Vertex()
+    v2 = Vertex()
+
+    d = DirectedEdge(v1, v2)
+    u = UnDirectedEdge(v1, v2)
+    k = TwoEndedLink(v1, v2)
+
+    assert _buckets(v1) == ((d,), (), (u,), (k,))
+    assert _buckets(v2) == ((), (d,), (u,), (k,))
+
+
+def test_buckets_postinit():
+    """
+    Ensure links are bucketed correctly when their ends are set after
+    creation.
+    """
+    v1 = Vertex()
+    v2 = Vertex()
+
+    e = DirectedEdge()
+    e.v1 = v1
+    assert _buckets(v1) == ((e,), (), (), ())
+
+    e.v2 = v2
+    assert _buckets(v1) == ((e,), (), (), ())
+    assert _buckets(v2) == ((), (e,), (), ())
+
+
+def test_buckets_reassign():
+    """
+    Ensure reassigning link ends moves links between buckets.
+    """
+    v1 = Vertex()
+    v2 = Vertex()
+    v3 = Vertex()
+
+    e = explicit.link_directed(v1, v2)
+
+    e.v1 = v3
+    assert _buckets(v1) == ((), (), (), ())
+    assert _buckets(v3) == ((e,), (), (), ())
+    assert _buckets(v2) == ((), (e,), (), ())
+
+    e.v2 = v1
+    assert _buckets(v2) == ((), (), (), ())
+    assert _buckets(v1) == ((), (e,), (), ())
+    assert _buckets(v3) == ((e,), (), (), ())
+
+
+def test_buckets_self_loop():
+    """
+    Ensure a directed self-loop is both outbound and inbound.
+    """
+    v1 = Vertex()
+    v2 = Vertex()
+
+    loop = explicit.link_directed(v1, v1)
+    assert _buckets(v1) == ((loop,), (loop,), (), ())
+
+    # make a self-loop by reassignment, both ways
+    e = explicit.link_directed(v1, v2)
+    e.v2 = v1
+    assert _buckets(v1) == ((loop, e), (loop, e), (), ())
+
+    f = explicit.link_directed(v2, v1)
+    f.v1 = v1
+    assert _buckets(v1)[0] == (loop, e, f)
+    assert _buckets(v1)[1] == (loop, e, f)
+
+
+def test_buckets_unlink():
+    """
+    Ensure unlinking removes links from the buckets.
+    """
+    v1 = Vertex()
+    v2 = Vertex()
+
+    explicit.link_directed(v1, v2)
+    explicit.link_undirected(v1, v2)
+    explicit.unlink(v1, v2)
+
+    assert _buckets(v1) == ((), (), (), ())
+    assert _buckets(v2) == ((), (), (), ())
@@ -7,10 +7,23 @@ Dedicated performance tests designed to identify slow points.
 
 import itertools
 import logging
+import random
+import sys
 import time
+import tracemalloc
 import pytest
-from edgegraph.builder import randgraph
-from edgegraph.traversal import breadthfirst, depthfirst
+from edgegraph.structure import (
+    Universe,
+    Vertex,
+    DirectedEdge,
+    NeighborCachePolicy,
+    uidgen,
+)
+from edgegraph.structure.compact import CompactVertex, CompactDirectedEdge
+from edgegraph import metrics
+from edgegraph.builder import randgraph, explicit
+from edgegraph.traversal import breadthfirst, depthfirst, helpers, visitors
+from edgegraph.pathfinding import shortestpath, pqueue, allpairs, landmarks
 
 pytestmark = pytest.mark.perf
 
@@ -170,3 +183,831 @@ def test_trav_versus(graph_clrs09_22_6, trav):
     LOG.info(
         f"{fname} performance: total {dur} s, avg {avg} s, {missing} ns miss"
     )
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize(
+    "trav",
+    [
+        breadthfirst.bft,
+    ],
+)
+def test_universe_bounded_trav_100k(trav):
+    """
+    Traverse a 100k-vertex straight line, limited to its universe.
+
+    Universe membership checks happen once per edge; if they are not constant
+    time, this traversal becomes quadratic and will not finish in reasonable
+    time.
+    """
+    nverts = 100_000
+    uni = Universe()
+    verts = [Vertex(universes=[uni]) for _ in range(nverts)]
+    for v1, v2 in zip(verts, verts[1:]):
+        explicit.link_directed(v1, v2)
+
+    LOG.info(f"Begin universe-bounded routine for {trav.__name__}")
+
+    t_start = time.monotonic_ns()
+    out = trav(uni, verts[0])
+    t_end = time.monotonic_ns()
+
+    assert len(out) == nverts
+
+    dur = (t_end - t_start) / 1_000_000_000
+    LOG.info(f"{trav.__name__} on {nverts} bounded verts: {dur} s")
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("frozen", ["live", "frozen"])
+@pytest.mark.parametrize(
+    "trav",
+    [
+        breadthfirst.bft,
+        depthfirst.dft_iterative,
+        depthfirst.dft_recursive,
+    ],
+)
+def test_trav_frozen_versus_live(complete_graph_1k_undirected, trav, frozen):
+    """
+    Compare traversal times of a universe and its frozen snapshot.
+    """
+    howmany = 10
+    uni, verts = complete_graph_1k_undirected
+    if frozen == "frozen":
+        uni = uni.freeze()
+
+    times = [None] * howmany
+    for i in range(howmany):
+        t_substart = time.monotonic_ns()
+        trav(uni, verts[0])
+        times[i] = time.monotonic_ns() - t_substart
+
+    avg = sum(times) / len(times) / 1_000_000_000
+    LOG.info(f"{trav.__name__} ({frozen}) performance: avg {avg} s")
+
+
+def _bytes_per_object(vcls, ecls, nverts):
+    """
+    Measure the memory allocated per vertex, and per edge, building a line of
+    ``nverts`` vertices.
+    """
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        verts = [vcls() for _ in range(nverts)]
+        after_verts = tracemalloc.get_traced_memory()[0]
+        edges = [ecls(v1, v2) for v1, v2 in zip(verts, verts[1:])]
+        after_edges = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    return (
+        (after_verts - base) / len(verts),
+        (after_edges - after_verts) / len(edges),
+    )
+
+
+#: Bytes per vertex and per edge used by the default classes of v0.11.0, as
+#: measured by _bytes_per_object() on CPython 3.11.
+_V0_11_BYTES = (473, 325)
+
+
+@pytest.mark.perf
+def test_memory_per_object():
+    """
+    Compare the memory used per vertex and per edge by the default and compact
+    object families, against that of v0.11.0.
+    """
+    nverts = 50_000
+
+    families = {
+        "default": (Vertex, DirectedEdge),
+        "compact": (CompactVertex, CompactDirectedEdge),
+    }
+    sizes = {}
+    for name, (vcls, ecls) in families.items():
+        per_vert, per_edge = _bytes_per_object(vcls, ecls, nverts)
+        sizes[name] = (per_vert, per_edge)
+        LOG.info(
+            f"{name} objects: {per_vert:.1f} bytes / vertex, "
+            f"{per_edge:.1f} bytes / edge ({per_vert + per_edge:.0f} total; "
+            f"v0.11.0: {sum(_V0_11_BYTES)})"
+        )
+
+    for per_vert, per_edge in sizes.values():
+        assert per_vert + per_edge < sum(_V0_11_BYTES)
+    assert sizes["compact"][0] < sizes["default"][0]
+    assert sizes["compact"][1] < sizes["default"][1]
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("strategy", ["uuid4", "counter", "timenodeseq"])
+def test_uid_construction_throughput(strategy):
+    """
+    Measure vertex and edge construction throughput for each UID generator.
+    """
+    nverts = 100_000
+    generator = {
+        "uuid4": uidgen.random_uid,
+        "counter": uidgen.counter(),
+        "timenodeseq": uidgen.TimeNodeSequence(),
+    }[strategy]
+    uni = Universe(uid_generator=generator)
+
+    t_start = time.monotonic_ns()
+    verts = [Vertex(universes=[uni]) for _ in range(nverts)]
+    t_verts = time.monotonic_ns()
+    for v1, v2 in zip(verts, verts[1:]):
+        explicit.link_directed(v1, v2)
+    t_edges = time.monotonic_ns()
+
+    vrate = nverts / ((t_verts - t_start) / 1_000_000_000)
+    erate = (nverts - 1) / ((t_edges - t_verts) / 1_000_000_000)
+    LOG.info(
+        f"{strategy} UIDs: {vrate:.0f} vertices / s, "
+        f"{erate:.0f} edges / s"
+    )
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("batched", ["unbatched", "batched"])
+@pytest.mark.parametrize("policy", ["vertexcache", "policycache"])
+def test_star_load_batch(monkeypatch, batched, policy):
+    """
+    Measure linking a high-degree hub, with and without a batch.
+    """
+    nleaves = 20_000
+    monkeypatch.setattr(Vertex, "NEIGHBOR_CACHING", True)
+    uni = Universe(
+        neighbor_cache=NeighborCachePolicy() if policy == "policycache" else None
+    )
+    hub = Vertex(universes=[uni])
+    leaves = [Vertex(universes=[uni]) for _ in range(nleaves)]
+
+    t_start = time.monotonic_ns()
+    if batched == "batched":
+        with uni.batch():
+            for leaf in leaves:
+                explicit.link_directed(hub, leaf)
+    else:
+        for leaf in leaves:
+            explicit.link_directed(hub, leaf)
+    dur = (time.monotonic_ns() - t_start) / 1_000_000_000
+
+    assert len(hub.links) == nleaves
+    LOG.info(
+        f"{batched} ({policy}) star load: {dur} s, "
+        f"{nleaves / dur:.0f} edges / s"
+    )
+
+
+def _link_throughput(pairs, bulk, dontdup):
+    """
+    Link the given pairs (directed), in bulk or one at a time.
+
+    :return: edges per second
+    """
+    t_start = time.monotonic_ns()
+    if bulk:
+        explicit.link_many(pairs, dontdup=dontdup)
+    else:
+        for v1, v2 in pairs:
+            explicit.link_directed(v1, v2, dontdup=dontdup)
+    return len(pairs) / ((time.monotonic_ns() - t_start) / 1_000_000_000)
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("shape", ["line", "star"])
+def test_link_many_throughput(shape):
+    """
+    Compare link_many against link_directed in a loop.
+
+    Both the line (100k vertices, no duplicate checks) and the star (3k
+    leaves, with duplicate checks) must be faster in bulk; typically by about
+    1.5x and 2.5x respectively.
+    """
+    nverts = 100_000 if shape == "line" else 3_000
+    dontdup = shape == "star"
+
+    rates = {}
+    for bulk in (False, True):
+        uni = Universe(uid_generator=uidgen.counter())
+        verts = [Vertex(universes=[uni]) for _ in range(nverts)]
+        if shape == "line":
+            pairs = list(zip(verts, verts[1:]))
+        else:
+            pairs = [(verts[0], leaf) for leaf in verts[1:]]
+        rates[bulk] = _link_throughput(pairs, bulk, dontdup)
+
+    LOG.info(
+        f"{shape}: link_directed {rates[False]:.0f} edges / s, "
+        f"link_many {rates[True]:.0f} edges / s "
+        f"({rates[True] / rates[False]:.1f}x)"
+    )
+    assert rates[True] > rates[False]
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("indexed", ["scan", "index"])
+@pytest.mark.parametrize("degree", [10, 100, 1000, 10000])
+def test_find_links_high_degree(degree, indexed):
+    """
+    Measure find_links on a hub vertex, with and without its pair index.
+    """
+    orig = Vertex.PAIR_INDEX_THRESHOLD
+    Vertex.PAIR_INDEX_THRESHOLD = 1 if indexed == "index" else None
+    try:
+        uni = Universe(uid_generator=uidgen.counter())
+        hub = Vertex(universes=[uni])
+        leaves = [Vertex(universes=[uni]) for _ in range(degree)]
+        explicit.link_many([(hub, leaf) for leaf in leaves])
+        probes = leaves[:: max(1, degree // 100)]
+
+        # builds the index, if any
+        helpers.find_links(hub, leaves[0])
+
+        t_start = time.monotonic_ns()
+        for leaf in probes:
+            assert len(helpers.find_links(hub, leaf)) == 1
+        avg = (time.monotonic_ns() - t_start) / len(probes)
+    finally:
+        Vertex.PAIR_INDEX_THRESHOLD = orig
+
+    LOG.info(f"find_links ({indexed}) at degree {degree}: {avg:.0f} ns")
+
+
+def _weighted_grid(side):
+    """
+    Make a ``side`` x ``side`` grid, with directed edges both ways between
+    adjacent vertices, weighted by a ``cost`` attribute.
+    """
+    uni = Universe(uid_generator=uidgen.counter())
+    verts = [Vertex(universes=[uni]) for _ in range(side * side)]
+    pairs = []
+    for i, vert in enumerate(verts):
+        row, col = divmod(i, side)
+        if col + 1 < side:
+            pairs.append((vert, verts[i + 1], {"cost": 1 + (i % 7)}))
+            pairs.append((verts[i + 1], vert, {"cost": 1 + (i % 5)}))
+        if row + 1 < side:
+            pairs.append((vert, verts[i + side], {"cost": 1 + (i % 3)}))
+            pairs.append((verts[i + side], vert, {"cost": 1 + (i % 4)}))
+    explicit.link_many(pairs)
+    return uni, verts
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("how", ["weightfunc", "callback", "attribute"])
+def test_spsp_weight_styles(how):
+    """
+    Compare ways of weighting edges for Dijkstra's algorithm on a grid.
+    """
+    uni, verts = _weighted_grid(100)
+
+    def costof(u, v):
+        return min(e.cost for e in helpers.find_links(u, v))
+
+    if how == "weightfunc":
+        kwargs = {"weightfunc": costof}
+    elif how == "callback":
+        kwargs = {"weight": lambda e: e.cost}
+    else:
+        kwargs = {"weight": "cost"}
+
+    t_start = time.monotonic_ns()
+    path, dist = shortestpath.single_pair_shortest_path(
+        uni, verts[0], verts[-1], **kwargs
+    )
+    dur = (time.monotonic_ns() - t_start) / 1_000_000_000
+
+    assert path[0] is verts[0] and path[-1] is verts[-1]
+    LOG.info(f"Dijkstra on 100x100 grid ({how}): {dur:.3f} s, dist {dist}")
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("how", ["single_pair", "single_source"])
+def test_one_to_many_paths(how):
+    """
+    Compare repeated single-pair searches to one single-source search, for
+    paths from one vertex to many others on a grid.
+    """
+    uni, verts = _weighted_grid(60)
+    dests = verts[59::73]
+
+    t_start = time.monotonic_ns()
+    if how == "single_pair":
+        dists = [
+            shortestpath.single_pair_shortest_path(
+                uni, verts[0], dest, weight="cost"
+            )[1]
+            for dest in dests
+        ]
+    else:
+        paths = shortestpath.single_source_shortest_paths(
+            uni, verts[0], weight="cost"
+        )
+        dists = [paths.distance_to(dest) for dest in dests]
+        for dest in dests:
+            paths.path_to(dest)
+    dur = (time.monotonic_ns() - t_start) / 1_000_000_000
+
+    assert all(d is not None for d in dists)
+    LOG.info(f"{len(dests)} paths on 60x60 grid ({how}): {dur:.3f} s")
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("method", ["dijkstra", "astar"])
+@pytest.mark.parametrize("costs", ["uniform", "varied"])
+def test_spsp_astar_versus_dijkstra(method, costs):
+    """
+    Compare vertices settled and time taken by A* and Dijkstra's algorithm
+    across a grid, guiding A* by the Manhattan distance.
+    """
+    side = 100
+    uni, verts = _weighted_grid(side)
+    where = {v: divmod(i, side) for i, v in enumerate(verts)}
+    weight = (lambda e: 1) if costs == "uniform" else "cost"
+
+    def manhattan(v, dest):
+        # the cheapest edge costs 1, so this never overestimates
+        (r1, c1), (r2, c2) = where[v], where[dest]
+        return abs(r1 - r2) + abs(c1 - c2)
+
+    metrics.REGISTRY.reset()
+    metrics.enable()
+    try:
+        t_start = time.monotonic_ns()
+        path, dist = shortestpath.single_pair_shortest_path(
+            uni,
+            verts[0],
+            verts[-1],
+            weight=weight,
+            method=method,
+            heuristic=manhattan,
+        )
+        dur = (time.monotonic_ns() - t_start) / 1_000_000_000
+        settled = metrics.REGISTRY.totals()["neighbors.calls"]
+    finally:
+        metrics.disable()
+        metrics.REGISTRY.reset()
+
+    _, expect = shortestpath.single_pair_shortest_path(
+        uni, verts[0], verts[-1], weight=weight
+    )
+    assert path[-1] is verts[-1]
+    assert dist == expect
+    if method == "astar" and costs == "uniform":
+        assert settled < len(verts) // 10
+    LOG.info(
+        f"{method} across 100x100 grid ({costs} costs): settled {settled}, "
+        f"{dur:.3f} s"
+    )
+
+
+def _random_sparse(nverts, degree, seed):
+    """
+    Make a random directed graph with a ``cost`` on each edge; a stand-in for
+    large, low-diameter graphs.
+    """
+    rng = random.Random(seed)
+    uni = Universe(uid_generator=uidgen.counter())
+    verts = [Vertex(universes=[uni]) for _ in range(nverts)]
+    explicit.link_many(
+        [
+            (vert, rng.choice(verts), {"cost": rng.randint(1, 9)})
+            for vert in verts
+            for _ in range(degree)
+        ]
+    )
+    return uni, verts
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize(
+    "how", ["dijkstra", "bidirectional", "bft", "shortest_hops"]
+)
+def test_bidirectional_search(how):
+    """
+    Compare one-way and bidirectional searches between random pairs of
+    vertices on a large, random graph.
+    """
+    uni, verts = _random_sparse(20_000, 4, seed=1)
+    rng = random.Random(2)
+    pairs = [(rng.choice(verts), rng.choice(verts)) for _ in range(20)]
+
+    metrics.REGISTRY.reset()
+    metrics.enable()
+    try:
+        t_start = time.monotonic_ns()
+        for start, dest in pairs:
+            if how == "bft":
+                for v in breadthfirst.ibft(uni, start):
+                    if v is dest:
+                        break
+            elif how == "shortest_hops":
+                breadthfirst.shortest_hops(uni, start, dest)
+            else:
+                shortestpath.single_pair_shortest_path(
+                    uni, start, dest, weight="cost", method=how
+                )
+        dur = (time.monotonic_ns() - t_start) / 1_000_000_000 / len(pairs)
+        settled = metrics.REGISTRY.totals()["neighbors.calls"] // len(pairs)
+    finally:
+        metrics.disable()
+        metrics.REGISTRY.reset()
+
+    LOG.info(f"{how} on 20k vertices: settled {settled}, {dur:.4f} s / query")
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("frozen", ["live", "frozen"])
+@pytest.mark.parametrize("how", ["dijkstra", "bfs", "dijkstra_01", "bfs_01"])
+def test_unweighted_fast_paths(how, frozen):
+    """
+    Compare Dijkstra's algorithm to the breadth-first searches used for unit
+    and zero-or-one weights, searching a whole random graph.
+    """
+    uni, verts = _random_sparse(20_000, 4, seed=3)
+    search = uni.freeze() if frozen == "frozen" else uni
+
+    kwargs = {
+        "dijkstra": {"weightfunc": lambda u, v: 1},
+        "bfs": {},
+        "dijkstra_01": {"weight": lambda e: e.cost % 2},
+        "bfs_01": {"weight": lambda e: e.cost % 2, "zero_one": True},
+    }[how]
+
+    t_start = time.monotonic_ns()
+    paths = shortestpath.single_source_shortest_paths(
+        search, verts[0], **kwargs
+    )
+    dur = (time.monotonic_ns() - t_start) / 1_000_000_000
+
+    if how.endswith("01"):
+        expect = shortestpath.single_source_shortest_paths(
+            uni, verts[0], weight=lambda e: e.cost % 2
+        )
+    else:
+        expect = shortestpath.single_source_shortest_paths(
+            uni, verts[0], weightfunc=lambda u, v: 1
+        )
+    assert dict(paths.distances) == dict(expect.distances)
+    LOG.info(f"{how} on 20k vertices ({frozen}): {dur:.3f} s")
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("queue", ["default", "binary", "dary", "bucket"])
+def test_priority_queues(complete_graph_1k_undirected, queue):
+    """
+    Compare the priority queues available to Dijkstra's algorithm, in time and
+    peak size, on a complete graph (where every vertex's distance is lowered
+    many times over).
+    """
+    uni, verts = complete_graph_1k_undirected
+    rng = random.Random(4)
+    costs = {
+        link: rng.randint(1, 100) for vert in verts for link in vert.links
+    }
+
+    made = []
+
+    def factory():
+        made.append(pqueue.QUEUES[queue]())
+        return made[-1]
+
+    t_start = time.monotonic_ns()
+    paths = shortestpath.single_source_shortest_paths(
+        uni,
+        verts[1],
+        weight=costs.__getitem__,
+        queue=None if queue == "default" else factory,
+    )
+    dur = (time.monotonic_ns() - t_start) / 1_000_000_000
+
+    expect = shortestpath.single_source_shortest_paths(
+        uni, verts[1], weight=costs.__getitem__
+    )
+    assert len(expect) > 900
+    assert dict(paths.distances) == dict(expect.distances)
+    peak = made[0].peak if made else "-"
+    LOG.info(f"Dijkstra on K1000 with {queue} queue: {dur:.3f} s, peak {peak}")
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize(
+    "how", ["repeated", "johnson", "floyd-warshall", "floyd-warshall-numpy"]
+)
+@pytest.mark.parametrize("degree", [4, 100])
+def test_all_pairs(how, degree):
+    """
+    Compare the all-pairs shortest path solvers with solving one source at a
+    time, on a sparse and a dense graph of 400 vertices.
+    """
+    if how == "floyd-warshall-numpy" and allpairs.numpy is None:
+        pytest.skip("NumPy is not installed")
+    uni, verts = _random_sparse(400, degree, 6)
+
+    t_start = time.monotonic_ns()
+    if how == "repeated":
+        rows = [
+            shortestpath.single_source_shortest_paths(uni, v, weight="cost")
+            for v in verts
+        ]
+        total = sum(sum(row.distances.values()) for row in rows)
+    else:
+        dm = allpairs.all_pairs_shortest_paths(
+            uni,
+            weight="cost",
+            method=how.removesuffix("-numpy"),
+            use_numpy=how.endswith("-numpy"),
+        )
+        total = sum(
+            d for row in dm.as_lists() for d in row if d != float("inf")
+        )
+    dur = (time.monotonic_ns() - t_start) / 1_000_000_000
+
+    # every solver gives the same total; one row is checked here
+    expect = shortestpath.single_source_shortest_paths(
+        uni, verts[0], weight="cost"
+    )
+    if how != "repeated":
+        assert all(
+            dm.distance(verts[0], v) == expect.distance_to(v) for v in verts
+        )
+    LOG.info(
+        f"All pairs on 400 vertices, degree {degree}, {how}: {dur:.3f} s "
+        f"(total distance {total})"
+    )
+
+
+@pytest.mark.perf
+def test_contraction_hierarchy():
+    """
+    Compare query latency of a contraction hierarchy with searching from
+    scratch, on a 100 x 100 weighted grid (a stand-in for a road network).
+    """
+    uni, verts = _weighted_grid(100)
+    rng = random.Random(8)
+    pairs = [(rng.choice(verts), rng.choice(verts)) for _ in range(200)]
+
+    t_start = time.monotonic_ns()
+    ch = shortestpath.build_contraction_hierarchy(uni, weight="cost")
+    build = (time.monotonic_ns() - t_start) / 1_000_000_000
+    LOG.info(f"Built hierarchy in {build:.3f} s, {ch.shortcuts} arcs")
+
+    results = {}
+    for how in ("dijkstra", "bidirectional", "hierarchy"):
+        t_start = time.monotonic_ns()
+        if how == "hierarchy":
+            dists = [ch.shortest_path(s, t)[1] for s, t in pairs]
+        else:
+            dists = [
+                shortestpath.single_pair_shortest_path(
+                    uni, s, t, weight="cost", method=how
+                )[1]
+                for s, t in pairs
+            ]
+        dur = (time.monotonic_ns() - t_start) / 1_000_000_000
+        results[how] = dists
+        LOG.info(
+            f"Grid 100x100 queries with {how}: "
+            f"{dur / len(pairs) * 1000:.3f} ms per query"
+        )
+
+    assert results["hierarchy"] == results["dijkstra"]
+    assert results["bidirectional"] == results["dijkstra"]
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("graph", ["grid", "sparse"])
+def test_landmark_astar(graph):
+    """
+    Compare vertices settled by Dijkstra's algorithm and by A* guided by 8
+    landmarks, over random queries on a grid and on a random sparse graph
+    (neither with coordinates to guide A* otherwise).
+    """
+    if graph == "grid":
+        uni, verts = _weighted_grid(100)
+    else:
+        uni, verts = _random_sparse(10_000, 3, 9)
+    rng = random.Random(9)
+    pairs = [(rng.choice(verts), rng.choice(verts)) for _ in range(50)]
+
+    t_start = time.monotonic_ns()
+    oracle = landmarks.build_landmarks(uni, 8, weight="cost", seed=9)
+    build = (time.monotonic_ns() - t_start) / 1_000_000_000
+
+    results = {}
+    for method in ("dijkstra", "astar"):
+        metrics.REGISTRY.reset()
+        metrics.enable()
+        try:
+            t_start = time.monotonic_ns()
+            results[method] = [
+                shortestpath.single_pair_shortest_path(
+                    uni,
+                    s,
+                    t,
+                    weight="cost",
+                    method=method,
+                    heuristic=oracle,
+                )[1]
+                for s, t in pairs
+            ]
+            dur = (time.monotonic_ns() - t_start) / 1_000_000_000
+            settled = metrics.REGISTRY.totals()["neighbors.calls"]
+        finally:
+            metrics.disable()
+            metrics.REGISTRY.reset()
+        LOG.info(
+            f"{method} on {graph}: settled {settled // len(pairs)} per query, "
+            f"{dur / len(pairs) * 1000:.2f} ms per query"
+        )
+
+    assert results["astar"] == results["dijkstra"]
+
+    # how good are the estimates alone?
+    errors = [
+        oracle.estimate(s, t) / d - 1
+        for (s, t), d in zip(pairs, results["dijkstra"])
+        if d
+    ]
+    LOG.info(
+        f"Landmarks on {graph} built in {build:.3f} s; estimates "
+        f"{sum(errors) / len(errors):.1%} over on average"
+    )
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("frozen", [False, True])
+@pytest.mark.parametrize("how", ["whole", "max_depth"])
+def test_k_hop_neighborhood(how, frozen):
+    """
+    Compare finding everything within 3 hops by traversing the whole
+    component and keeping the near part, with stopping at the cutoff.
+    """
+    uni, verts = _random_sparse(50_000, 3, 10)
+    search = uni.freeze() if frozen else uni
+
+    t_start = time.monotonic_ns()
+    if how == "whole":
+        # the old way: depths worked out alongside a full traversal
+        depth = {verts[0]: 0}
+        ball = []
+        for v in breadthfirst.ibft(search, verts[0]):
+            if depth[v] <= 3:
+                ball.append(v)
+            for w in helpers.ineighbors(v):
+                depth.setdefault(w, depth[v] + 1)
+    else:
+        ball = breadthfirst.bft(search, verts[0], max_depth=3)
+    dur = (time.monotonic_ns() - t_start) / 1_000_000_000
+
+    assert len(ball) < 100
+    LOG.info(
+        f"3-hop ball ({how}, {'frozen' if frozen else 'live'}): "
+        f"{len(ball)} vertices, {dur * 1000:.3f} ms"
+    )
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("weighted", [False, True])
+@pytest.mark.parametrize("how", ["per_seed", "multi_source"])
+def test_multi_source(how, weighted):
+    """
+    Compare finding the nearest of 50 sites to every vertex with one search
+    per site, merged, with a single search from all of them at once.
+    """
+    uni, verts = _random_sparse(20_000, 3, 11)
+    sites = verts[::400]
+    kwargs = {"weight": "cost"} if weighted else {}
+
+    t_start = time.monotonic_ns()
+    if how == "per_seed":
+        nearest = {}
+        for site in sites:
+            paths = shortestpath.single_source_shortest_paths(
+                uni, site, **kwargs
+            )
+            for v, d in paths.distances.items():
+                if d < nearest.get(v, float("inf")):
+                    nearest[v] = d
+    else:
+        paths = shortestpath.single_source_shortest_paths(uni, sites, **kwargs)
+        nearest = dict(paths.distances)
+    dur = (time.monotonic_ns() - t_start) / 1_000_000_000
+
+    assert len(nearest) > len(verts) // 2
+    LOG.info(
+        f"nearest of {len(sites)} sites ({how}, "
+        f"{'weighted' if weighted else 'unweighted'}): "
+        f"{len(nearest)} vertices, {dur * 1000:.1f} ms"
+    )
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("frozen", [False, True])
+@pytest.mark.parametrize("search", [False, True])
+def test_dft_visited(search, frozen):
+    """
+    Time an iterative depth-first traversal (or fruitless search) of a large
+    graph, where the cost of keeping track of visited vertices dominates.
+    """
+    uni, verts = _random_sparse(20_000, 3, 12)
+    graph = uni.freeze() if frozen else uni
+
+    t_start = time.monotonic_ns()
+    if search:
+        out = depthfirst.dfs_iterative(graph, verts[0], "nonexistent", 1)
+        assert out is None
+        what = "dfs_iterative"
+    else:
+        out = depthfirst.dft_iterative(graph, verts[0])
+        assert len(out) == len(set(out))
+        what = f"dft_iterative, {len(out)} vertices"
+    dur = (time.monotonic_ns() - t_start) / 1_000_000_000
+
+    LOG.info(
+        f"{what} ({'frozen' if frozen else 'live'}): {dur * 1000:.1f} ms"
+    )
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("length", [900, 200_000])
+@pytest.mark.parametrize("how", ["nested_generators", "explicit_stack"])
+def test_dft_deep(how, length):
+    """
+    Compare recursive-order depth-first traversals of a long path, by nested
+    generators (as idft_recursive was written), and by an explicit stack.
+    """
+    if how == "nested_generators" and length > sys.getrecursionlimit() - 50:
+        pytest.skip("nested generators cannot go this deep")
+    verts = [Vertex() for _ in range(length)]
+    explicit.link_many(list(zip(verts, verts[1:])))
+    uni = Universe(vertices=verts)
+
+    def nested(v, visited):
+        visited.add(v)
+        yield v
+        for w in helpers.ineighbors(v):
+            if uni.has_vertex(w) and w not in visited:
+                yield from nested(w, visited)
+
+    t_start = time.monotonic_ns()
+    if how == "nested_generators":
+        out = list(nested(verts[0], set()))
+    else:
+        out = depthfirst.dft_recursive(uni, verts[0])
+    dur = (time.monotonic_ns() - t_start) / 1_000_000_000
+
+    assert out == verts
+    LOG.info(
+        f"path of {length} ({how}): {dur * 1000:.1f} ms, "
+        f"{dur / length * 1_000_000_000:.0f} ns per vertex"
+    )
+
+
+@pytest.mark.perf
+@pytest.mark.parametrize("frozen", [False, True])
+@pytest.mark.parametrize("how", ["plain", "separate_passes", "visitors"])
+def test_visitor_one_pass(how, frozen):
+    """
+    Compare finding the breadth-first tree (parents, links and depths) of a
+    large graph with extra passes over the traversal, with visitors in the
+    same pass; and a plain traversal, for the cost of the traversal alone.
+    """
+    uni, verts = _random_sparse(20_000, 3, 13)
+    graph = uni.freeze() if frozen else uni
+
+    t_start = time.monotonic_ns()
+    if how == "plain":
+        order = breadthfirst.bft(graph, verts[0])
+        links = {}
+    elif how == "separate_passes":
+        order = breadthfirst.bft(graph, verts[0])
+        parents = {verts[0]: None}
+        depths = {verts[0]: 0}
+        for v in order:
+            for w in helpers.ineighbors(v):
+                if w not in parents:
+                    parents[w] = v
+                    depths[w] = depths[v] + 1
+        links = {
+            v: next(iter(helpers.find_links(u, v)))
+            for v, u in parents.items()
+            if u is not None
+        }
+    else:
+        tree, depth = visitors.ParentVisitor(), visitors.DepthVisitor()
+        order = breadthfirst.bft(graph, verts[0], visitor=[tree, depth])
+        links = tree.links
+    dur = (time.monotonic_ns() - t_start) / 1_000_000_000
+
+    assert len(order) > len(verts) // 2
+    tree_links = [e for e in links.values() if e is not None]
+    assert how == "plain" or len(tree_links) == len(order) - 1
+    LOG.info(
+        f"bft tree of {len(order)} vertices ({how}, "
+        f"{'frozen' if frozen else 'live'}): {dur * 1000:.1f} ms"
+    )
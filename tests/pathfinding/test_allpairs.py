@@ -0,0 +1,230 @@
+#!python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for pathfinding.allpairs.
+"""
+
+import random
+import pytest
+from edgegraph.structure import Universe, Vertex
+from edgegraph.builder import explicit
+from edgegraph.traversal import helpers
+from edgegraph.pathfinding import allpairs, shortestpath
+
+#: Every way of solving; NumPy ones are skipped where it is not installed
+SOLVERS = [
+    {"method": "johnson"},
+    {"method": "floyd-warshall", "use_numpy": False},
+    pytest.param(
+        {"method": "floyd-warshall", "use_numpy": True},
+        marks=pytest.mark.skipif(
+            allpairs.numpy is None, reason="NumPy is not installed"
+        ),
+    ),
+]
+
+
+def _random_graph(seed, nverts=40, nedges=150, low=0):
+    """
+    Make a random directed graph with integer weights ``w``.
+    """
+    rng = random.Random(seed)
+    verts = [Vertex(attributes={"i": i}) for i in range(nverts)]
+    explicit.link_many(
+        [
+            (rng.choice(verts), rng.choice(verts), {"w": rng.randint(low, 9)})
+            for _ in range(nedges)
+        ]
+    )
+    return Universe(vertices=verts), verts
+
+
+def _path_cost(path):
+    """
+    Total weight of a path, taking the cheapest link between each pair.
+    """
+    return sum(
+        min(e.w for e in helpers.find_links(u, v))
+        for u, v in zip(path, path[1:])
+    )
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+@pytest.mark.parametrize("solver", SOLVERS)
+@pytest.mark.parametrize("seed", range(3))
+def test_apsp_matches_single_source(seed, solver, frozen):
+    """
+    Ensure every row matches the single-source solver, and every path is a
+    real path of the stated cost.
+    """
+    uni, verts = _random_graph(seed)
+    if frozen:
+        uni = uni.freeze()
+
+    dm = allpairs.all_pairs_shortest_paths(uni, weight="w", **solver)
+
+    assert len(dm) == len(verts)
+    assert list(dm.vertices) == list(uni.vertices)
+    for u in verts:
+        expect = shortestpath.single_source_shortest_paths(uni, u, weight="w")
+        for v in verts:
+            assert dm.distance(u, v) == expect.distance_to(v)
+            path = dm.path(u, v)
+            if expect.distance_to(v) is None:
+                assert path is None
+                assert dm[u, v] == float("inf")
+                continue
+            assert path[0] is u and path[-1] is v
+            assert _path_cost(path) == dm[u, v]
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+@pytest.mark.parametrize("seed", range(3))
+def test_apsp_negative_weights(seed, solver):
+    """
+    Ensure negative weights (without negative cycles) are handled, matching
+    the Bellman-Ford solver.
+    """
+    rng = random.Random(seed)
+    verts = [Vertex(attributes={"i": i}) for i in range(30)]
+    # edges only from lower to higher numbers, so no cycles at all
+    edges = []
+    for _ in range(120):
+        a, b = sorted(rng.sample(range(30), 2))
+        edges.append((verts[a], verts[b], {"w": rng.randint(-5, 9)}))
+    explicit.link_many(edges)
+    uni = Universe(vertices=verts)
+
+    dm = allpairs.all_pairs_shortest_paths(uni, weight="w", **solver)
+
+    for u in verts:
+        expect = shortestpath.single_source_shortest_paths(
+            uni, u, weight="w", method="bellman-ford"
+        )
+        for v in verts:
+            assert dm.distance(u, v) == expect.distance_to(v)
+            if dm.distance(u, v) is not None and u is not v:
+                assert _path_cost(dm.path(u, v)) == dm[u, v]
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_apsp_known(graph_neg_weight_no_loops, solver):
+    """
+    Ensure the answers are right on a small known graph.
+    """
+    uni, verts = graph_neg_weight_no_loops
+
+    dm = allpairs.all_pairs_shortest_paths(uni, weight="weight", **solver)
+
+    assert dm[verts[0], verts[3]] == -3
+    assert dm.path(verts[0], verts[3]) == verts
+    assert dm.path(verts[2], verts[2]) == [verts[2]]
+    assert dm.distance(verts[2], verts[2]) == 0
+    rows = dm.as_lists()
+    assert rows[dm.index_of(verts[0])][dm.index_of(verts[3])] == -3
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_apsp_negative_cycle(solver):
+    """
+    Ensure a negative cycle anywhere in the graph is reported.
+    """
+    verts = [Vertex(attributes={"i": i}) for i in range(5)]
+    a, b, c, d, e = verts
+    explicit.link_many(
+        [
+            (a, b, {"w": 1}),
+            (c, d, {"w": 1}),
+            (d, e, {"w": -3}),
+            (e, c, {"w": 1}),
+        ]
+    )
+    uni = Universe(vertices=verts)
+
+    with pytest.raises(shortestpath.NegativeCycleError) as info:
+        allpairs.all_pairs_shortest_paths(uni, weight="w", **solver)
+
+    cycle = info.value.cycle
+    assert cycle[0] is cycle[-1]
+    assert set(cycle) == {c, d, e}
+    for u, v in zip(cycle, cycle[1:]):
+        assert helpers.find_links(u, v)
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_apsp_negative_self_loop(solver):
+    """
+    Ensure a negative loop from a vertex to itself is a negative cycle.
+    """
+    a, b = Vertex(), Vertex()
+    explicit.link_many([(a, b, {"w": 1}), (b, b, {"w": -1})])
+    uni = Universe(vertices=[a, b])
+
+    with pytest.raises(shortestpath.NegativeCycleError) as info:
+        allpairs.all_pairs_shortest_paths(uni, weight="w", **solver)
+    assert info.value.cycle == [b, b]
+
+
+@pytest.mark.parametrize("solver", SOLVERS)
+def test_apsp_options(solver):
+    """
+    Ensure the shared options (direction, filters, unit weights) are honored.
+    """
+    verts = [Vertex(attributes={"i": i}) for i in range(4)]
+    for u, v in zip(verts, verts[1:]):
+        explicit.link_directed(u, v)
+    uni = Universe(vertices=verts)
+
+    dm = allpairs.all_pairs_shortest_paths(uni, **solver)
+    assert dm[verts[0], verts[3]] == 3
+    assert dm.distance(verts[3], verts[0]) is None
+
+    dm = allpairs.all_pairs_shortest_paths(
+        uni, direction_sensitive=helpers.DIR_SENS_ANY, **solver
+    )
+    assert dm.path(verts[3], verts[0]) == verts[::-1]
+
+    dm = allpairs.all_pairs_shortest_paths(
+        uni, ff_via=lambda e, v: v.i != 2, **solver
+    )
+    assert dm.distance(verts[0], verts[3]) is None
+    assert dm[verts[0], verts[1]] == 1
+
+
+def test_apsp_errors(graph_neg_weight_no_loops):
+    """
+    Ensure bad arguments are rejected.
+    """
+    uni, verts = graph_neg_weight_no_loops
+
+    with pytest.raises(ValueError):
+        allpairs.all_pairs_shortest_paths(None)
+    with pytest.raises(ValueError):
+        allpairs.all_pairs_shortest_paths(
+            uni, weight="weight", weightfunc=lambda u, v: 1
+        )
+    with pytest.raises(NotImplementedError):
+        allpairs.all_pairs_shortest_paths(uni, method="dantzig")
+
+    dm = allpairs.all_pairs_shortest_paths(uni, weight="weight")
+    with pytest.raises(KeyError):
+        dm.distance(verts[0], Vertex())
+
+
+def test_apsp_numpy_missing(monkeypatch, graph_neg_weight_no_loops):
+    """
+    Ensure asking for NumPy without it installed is an error, and that the
+    fallback is used by default.
+    """
+    uni, verts = graph_neg_weight_no_loops
+    monkeypatch.setattr(allpairs, "numpy", None)
+
+    with pytest.raises(ValueError):
+        allpairs.all_pairs_shortest_paths(
+            uni, weight="weight", method="floyd-warshall", use_numpy=True
+        )
+    dm = allpairs.all_pairs_shortest_paths(
+        uni, weight="weight", method="floyd-warshall"
+    )
+    assert dm[verts[0], verts[3]] == -3
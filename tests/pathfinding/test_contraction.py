@@ -0,0 +1,158 @@
+#!python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for pathfinding.contraction, and
+shortestpath.build_contraction_hierarchy.
+"""
+
+import pickle
+import random
+import pytest
+from edgegraph.structure import Universe, Vertex
+from edgegraph.builder import explicit
+from edgegraph.traversal import helpers
+from edgegraph.pathfinding import shortestpath, contraction
+
+
+def _random_graph(seed, nverts=80, nedges=300):
+    """
+    Make a random directed graph with integer weights ``w``.
+    """
+    rng = random.Random(seed)
+    verts = [Vertex(attributes={"i": i}) for i in range(nverts)]
+    explicit.link_many(
+        [
+            (rng.choice(verts), rng.choice(verts), {"w": rng.randint(0, 9)})
+            for _ in range(nedges)
+        ]
+    )
+    return Universe(vertices=verts), verts
+
+
+def _path_cost(path):
+    """
+    Total weight of a path, taking the cheapest link between each pair.
+    """
+    return sum(
+        min(e.w for e in helpers.find_links(u, v))
+        for u, v in zip(path, path[1:])
+    )
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+@pytest.mark.parametrize("seed", range(4))
+def test_ch_matches_dijkstra(seed, frozen):
+    """
+    Ensure every query gives Dijkstra's distance, along a real path.
+    """
+    uni, verts = _random_graph(seed)
+    if frozen:
+        uni = uni.freeze()
+    rng = random.Random(seed)
+
+    ch = shortestpath.build_contraction_hierarchy(uni, weight="w")
+
+    assert len(ch) == len(verts)
+    for _ in range(200):
+        start, dest = rng.choice(verts), rng.choice(verts)
+        path, dist = ch.shortest_path(start, dest)
+        expect = shortestpath.single_pair_shortest_path(
+            uni, start, dest, weight="w"
+        )
+        assert dist == expect[1]
+        assert ch.distance(start, dest) == expect[1]
+        if path is None:
+            assert expect[0] is None
+        elif start is dest:
+            assert path == [start, start]
+        else:
+            assert path[0] is start and path[-1] is dest
+            assert _path_cost(path) == dist
+
+
+def test_ch_limited_witnesses(monkeypatch):
+    """
+    Ensure answers stay right when witness searches give up early (adding
+    shortcuts that were not needed).
+    """
+    monkeypatch.setattr(contraction, "WITNESS_SETTLE_LIMIT", 1)
+    uni, verts = _random_graph(7)
+    rng = random.Random(7)
+
+    ch = shortestpath.build_contraction_hierarchy(uni, weight="w")
+
+    for _ in range(100):
+        start, dest = rng.choice(verts), rng.choice(verts)
+        assert (
+            ch.distance(start, dest)
+            == shortestpath.single_pair_shortest_path(
+                uni, start, dest, weight="w"
+            )[1]
+        )
+
+
+def test_ch_options():
+    """
+    Ensure the shared options are honored when building.
+    """
+    verts = [Vertex(attributes={"i": i}) for i in range(5)]
+    for u, v in zip(verts, verts[1:]):
+        explicit.link_directed(u, v)
+    uni = Universe(vertices=verts)
+
+    ch = shortestpath.build_contraction_hierarchy(uni)
+    assert ch.shortest_path(verts[0], verts[4]) == (verts, 4)
+    assert ch.shortest_path(verts[4], verts[0]) == (None, None)
+
+    ch = shortestpath.build_contraction_hierarchy(
+        uni, direction_sensitive=helpers.DIR_SENS_ANY
+    )
+    assert ch.shortest_path(verts[4], verts[0]) == (verts[::-1], 4)
+
+    ch = shortestpath.build_contraction_hierarchy(
+        uni, ff_via=lambda e, v: v.i != 2
+    )
+    assert ch.distance(verts[0], verts[4]) is None
+    assert ch.distance(verts[3], verts[4]) == 1
+
+
+def test_ch_pickle():
+    """
+    Ensure a hierarchy survives pickling without its graph, and may be bound
+    to a copy of it.
+    """
+    uni, verts = _random_graph(3)
+    ch = shortestpath.build_contraction_hierarchy(uni, weight="w")
+    path, dist = ch.shortest_path(verts[0], verts[1])
+    assert path is not None
+
+    loaded = pickle.loads(pickle.dumps(ch))
+
+    assert loaded.shortest_path(verts[0], verts[1]) == (
+        [v.uid for v in path],
+        dist,
+    )
+    assert loaded.bind(uni) is loaded
+    assert loaded.shortest_path(verts[0], verts[1]) == (path, dist)
+    assert loaded.shortcuts == ch.shortcuts
+
+
+def test_ch_errors():
+    """
+    Ensure bad graphs and arguments are rejected.
+    """
+    a, b = Vertex(), Vertex()
+    explicit.link_many([(a, b, {"w": -1})])
+    uni = Universe(vertices=[a, b])
+
+    with pytest.raises(ValueError):
+        shortestpath.build_contraction_hierarchy(uni, weight="w")
+    with pytest.raises(ValueError):
+        shortestpath.build_contraction_hierarchy(None)
+
+    ch = shortestpath.build_contraction_hierarchy(uni)
+    with pytest.raises(KeyError):
+        ch.distance(a, Vertex())
+    with pytest.raises(KeyError):
+        ch.bind(Universe(vertices=[a]))
@@ -0,0 +1,147 @@
+#!python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for pathfinding.landmarks.
+"""
+
+import random
+import pytest
+from edgegraph.structure import Universe, Vertex
+from edgegraph.builder import explicit
+from edgegraph.traversal import helpers
+from edgegraph.pathfinding import landmarks, shortestpath
+
+
+def _random_graph(seed, nverts=80, nedges=250):
+    """
+    Make a random directed graph with integer weights ``w``.
+    """
+    rng = random.Random(seed)
+    verts = [Vertex(attributes={"i": i}) for i in range(nverts)]
+    explicit.link_many(
+        [
+            (rng.choice(verts), rng.choice(verts), {"w": rng.randint(0, 9)})
+            for _ in range(nedges)
+        ]
+    )
+    return Universe(vertices=verts), verts
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+@pytest.mark.parametrize(
+    "direction", [helpers.DIR_SENS_FORWARD, helpers.DIR_SENS_ANY]
+)
+@pytest.mark.parametrize("strategy", landmarks.STRATEGIES)
+@pytest.mark.parametrize("seed", range(3))
+def test_landmark_bounds(seed, strategy, direction, frozen):
+    """
+    Ensure the bounds always hold, and A* with the oracle finds the true
+    shortest distances.
+    """
+    uni, verts = _random_graph(seed)
+    if frozen:
+        uni = uni.freeze()
+    rng = random.Random(seed)
+    kwargs = {"weight": "w", "direction_sensitive": direction}
+
+    oracle = landmarks.build_landmarks(
+        uni, 4, strategy=strategy, seed=seed, **kwargs
+    )
+
+    assert len(oracle) == 4
+    assert len(set(oracle.landmarks)) == 4
+    for _ in range(100):
+        start, dest = rng.choice(verts), rng.choice(verts)
+        _, dist = shortestpath.single_pair_shortest_path(
+            uni, start, dest, **kwargs
+        )
+        lower, upper = oracle.bounds(start, dest)
+        if dist is None:
+            assert upper == float("inf")
+            assert oracle.estimate(start, dest) is None
+        else:
+            assert lower <= dist <= upper
+            assert oracle(start, dest) == lower
+        _, astar = shortestpath.single_pair_shortest_path(
+            uni, start, dest, method="astar", heuristic=oracle, **kwargs
+        )
+        assert astar == dist
+
+
+def test_landmark_exact_on_path():
+    """
+    Ensure bounds are exact along a path, with landmarks at its start (for
+    the lower bound) and on the way (for the upper).
+    """
+    verts = [Vertex(attributes={"i": i}) for i in range(6)]
+    explicit.link_many(
+        [(u, v, {"w": 2}) for u, v in zip(verts, verts[1:])]
+    )
+    uni = Universe(vertices=verts)
+
+    oracle = landmarks.build_landmarks(
+        uni, weight="w", landmarks=[verts[0], verts[2]]
+    )
+
+    assert oracle.landmarks == [verts[0], verts[2]]
+    assert oracle.bounds(verts[1], verts[4]) == (6, 6)
+    assert oracle.estimate(verts[1], verts[4]) == 6
+    assert oracle.bounds(verts[2], verts[2]) == (0, 0)
+    # no landmark between these two
+    assert oracle.bounds(verts[3], verts[5]) == (4, float("inf"))
+    # no path back, which the landmarks can tell
+    assert oracle(verts[4], verts[1]) == float("inf")
+
+
+def test_landmark_farthest_spreads():
+    """
+    Ensure the farthest strategy picks the ends of a long path, and reaches
+    into every component.
+    """
+    verts = [Vertex() for _ in range(30)]
+    for u, v in zip(verts[:20], verts[1:20]):
+        explicit.link_undirected(u, v)
+    for u, v in zip(verts[20:], verts[21:]):
+        explicit.link_undirected(u, v)
+    uni = Universe(vertices=verts)
+
+    oracle = landmarks.build_landmarks(
+        uni, 3, direction_sensitive=helpers.DIR_SENS_ANY, seed=1
+    )
+
+    picked = set(oracle.landmarks)
+    assert picked & set(verts[20:])
+    assert picked & {verts[0], verts[19]}
+
+
+def test_landmark_oracle_alone(graph_cheapest_is_shortest):
+    """
+    Ensure the heuristic tolerates vertices it does not know.
+    """
+    uni, verts = graph_cheapest_is_shortest
+    oracle = landmarks.build_landmarks(uni, 2, seed=0)
+
+    assert oracle(Vertex(), verts[0]) == 0
+    with pytest.raises(KeyError):
+        oracle.bounds(Vertex(), verts[0])
+
+
+def test_landmark_errors():
+    """
+    Ensure bad arguments are rejected.
+    """
+    a, b = Vertex(), Vertex()
+    explicit.link_many([(a, b, {"w": -1})])
+    uni = Universe(vertices=[a, b])
+
+    with pytest.raises(ValueError):
+        landmarks.build_landmarks(uni, weight="w")
+    with pytest.raises(ValueError):
+        landmarks.build_landmarks(None)
+    with pytest.raises(ValueError):
+        landmarks.build_landmarks(uni, strategy="central")
+    with pytest.raises(KeyError):
+        landmarks.build_landmarks(uni, landmarks=[Vertex()])
+
+    assert len(landmarks.build_landmarks(Universe())) == 0
@@ -0,0 +1,174 @@
+#!python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for pathfinding.pqueue, and its use by the shortest path solvers.
+"""
+
+import functools
+import random
+import pytest
+from edgegraph.structure import Universe, Vertex
+from edgegraph.builder import explicit
+from edgegraph.pathfinding import pqueue, shortestpath
+
+
+@pytest.mark.parametrize("name", sorted(pqueue.QUEUES))
+@pytest.mark.parametrize("seed", range(5))
+def test_queue_order(name, seed):
+    """
+    Ensure items come out in priority order, each once, at their lowest
+    priority, with decreases mixed in between pops as Dijkstra's algorithm
+    does them.
+    """
+    rng = random.Random(seed)
+    q = pqueue.QUEUES[name]()
+    best = {}
+    floor = 0
+    out = []
+
+    for _ in range(300):
+        if best and rng.random() < 0.3:
+            prio, item = q.pop()
+            assert prio == best.pop(item)
+            assert prio >= floor
+            floor = prio
+            out.append(item)
+            continue
+
+        item = rng.randrange(100)
+        if item in out:
+            continue
+        prio = floor + rng.randrange(20)
+        if prio < best.get(item, float("inf")):
+            best[item] = prio
+            q.push(item, prio)
+        assert len(q) == len(best)
+
+    while best:
+        prio, item = q.pop()
+        assert prio == best.pop(item)
+        assert prio >= floor
+        floor = prio
+    assert len(q) == 0
+
+
+@pytest.mark.parametrize("name", sorted(pqueue.QUEUES))
+def test_queue_empty_pop(name):
+    """
+    Ensure popping an empty queue raises IndexError.
+    """
+    q = pqueue.QUEUES[name]()
+    with pytest.raises(IndexError):
+        q.pop()
+    q.push("a", 1)
+    q.pop()
+    with pytest.raises(IndexError):
+        q.pop()
+
+
+def test_dary_decrease_key_peak():
+    """
+    Ensure the indexed heap holds one entry per item, where the lazy heap
+    holds one per push.
+    """
+    dary = pqueue.DaryHeap()
+    binary = pqueue.BinaryHeap()
+    for q in (dary, binary):
+        for prio in range(10, 0, -1):
+            q.push("x", prio)
+        q.push("y", 5)
+
+    assert dary.peak == 2
+    assert binary.peak == 11
+    assert dary.pop() == binary.pop() == (1, "x")
+    assert len(dary) == len(binary) == 1
+
+
+def test_dary_arity():
+    """
+    Ensure the arity is validated, and any valid arity works.
+    """
+    with pytest.raises(ValueError):
+        pqueue.DaryHeap(1)
+
+    q = pqueue.DaryHeap(d=2)
+    for i in (5, 3, 8, 1, 9, 2):
+        q.push(i, i)
+    assert [q.pop()[0] for _ in range(6)] == [1, 2, 3, 5, 8, 9]
+
+
+def test_bucket_rejects():
+    """
+    Ensure the bucket queue refuses priorities it cannot handle.
+    """
+    q = pqueue.BucketQueue()
+    with pytest.raises(ValueError):
+        q.push("a", 1.5)
+    q.push("a", 3)
+    q.push("b", 4)
+    q.pop()
+    with pytest.raises(ValueError):
+        q.push("c", 2)
+
+
+def _random_graph(seed, nverts=60, nedges=300):
+    """
+    Make a random directed graph with integer weights ``w``.
+    """
+    rng = random.Random(seed)
+    verts = [Vertex(attributes={"i": i}) for i in range(nverts)]
+    explicit.link_many(
+        [
+            (rng.choice(verts), rng.choice(verts), {"w": rng.randint(1, 9)})
+            for _ in range(nedges)
+        ]
+    )
+    return Universe(vertices=verts), verts
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+@pytest.mark.parametrize(
+    "queue",
+    ["binary", "dary", "bucket", functools.partial(pqueue.DaryHeap, d=2)],
+)
+@pytest.mark.parametrize("seed", range(3))
+def test_solvers_with_queues(seed, queue, frozen):
+    """
+    Ensure every queue gives the same distances as the default.
+    """
+    uni, verts = _random_graph(seed)
+    if frozen:
+        uni = uni.freeze()
+    rng = random.Random(seed)
+
+    for _ in range(10):
+        start, dest = rng.choice(verts), rng.choice(verts)
+        path, dist = shortestpath.single_pair_shortest_path(
+            uni, start, dest, weight="w", queue=queue
+        )
+        _, expect = shortestpath.single_pair_shortest_path(
+            uni, start, dest, weight="w"
+        )
+        assert dist == expect
+        if (path is not None) and (start is not dest):
+            assert path[0] is start and path[-1] is dest
+
+    paths = shortestpath.single_source_shortest_paths(
+        uni, verts[0], weight="w", queue=queue, cutoff=12
+    )
+    expect = shortestpath.single_source_shortest_paths(
+        uni, verts[0], weight="w", cutoff=12
+    )
+    assert dict(paths.distances) == dict(expect.distances)
+
+
+def test_solver_unknown_queue(graph_cheapest_is_shortest):
+    """
+    Ensure unknown queue names are rejected.
+    """
+    uni, verts = graph_cheapest_is_shortest
+    with pytest.raises(ValueError):
+        shortestpath.single_pair_shortest_path(
+            uni, verts[0], verts[5], queue="fibonacci"
+        )
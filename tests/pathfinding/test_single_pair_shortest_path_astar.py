@@ -0,0 +1,177 @@
+#!python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the A* method of single_pair_shortest_path().
+"""
+
+import pytest
+from edgegraph import metrics
+from edgegraph.structure import Universe, Vertex
+from edgegraph.builder import explicit
+from edgegraph.traversal import helpers
+from edgegraph.pathfinding import shortestpath
+
+
+def _grid(side, holes=()):
+    """
+    Make a ``side`` x ``side`` grid of vertices with ``x`` and ``y``
+    attributes, linked both ways to their neighbors with a ``cost`` of 1.
+    Grid cells listed in ``holes`` are left out.
+    """
+    uni = Universe()
+    verts = {}
+    for x in range(side):
+        for y in range(side):
+            if (x, y) not in holes:
+                verts[x, y] = Vertex(
+                    attributes={"x": x, "y": y}, universes=[uni]
+                )
+    pairs = []
+    for (x, y), vert in verts.items():
+        for nb in ((x + 1, y), (x, y + 1)):
+            if nb in verts:
+                pairs.append((vert, verts[nb], {"cost": 1}))
+                pairs.append((verts[nb], vert, {"cost": 1}))
+    explicit.link_many(pairs)
+    return uni, verts
+
+
+def _manhattan(v, dest):
+    """
+    Admissible (and consistent) heuristic for the unit-cost grid.
+    """
+    return abs(v.x - dest.x) + abs(v.y - dest.y)
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+@pytest.mark.parametrize("kwargs", [{"weight": "cost"}, {}])
+def test_spsp_astar_matches_dijkstra(frozen, kwargs):
+    """
+    Ensure A* finds paths as short as Dijkstra's algorithm does.
+    """
+    holes = {(3, y) for y in range(1, 10)} | {(6, y) for y in range(0, 9)}
+    uni, verts = _grid(10, holes)
+    if frozen:
+        uni = uni.freeze()
+
+    start, dest = verts[0, 0], verts[9, 9]
+    apath, adist = shortestpath.single_pair_shortest_path(
+        uni, start, dest, method="astar", heuristic=_manhattan, **kwargs
+    )
+    dpath, ddist = shortestpath.single_pair_shortest_path(
+        uni, start, dest, **kwargs
+    )
+
+    assert adist == ddist
+    assert len(apath) == len(dpath)
+    assert apath[0] is start and apath[-1] is dest
+    for u, v in zip(apath, apath[1:]):
+        assert helpers.find_links(u, v)
+
+
+def test_spsp_astar_settles_fewer():
+    """
+    Ensure the heuristic actually steers the search.
+    """
+    uni, verts = _grid(30)
+    start, dest = verts[0, 0], verts[29, 0]
+
+    settled = {}
+    metrics.REGISTRY.reset()
+    metrics.enable()
+    try:
+        for method in ("dijkstra", "astar"):
+            shortestpath.single_pair_shortest_path(
+                uni,
+                start,
+                dest,
+                weight="cost",
+                method=method,
+                heuristic=_manhattan,
+            )
+            settled[method] = metrics.REGISTRY.totals()["neighbors.calls"]
+            metrics.REGISTRY.reset()
+    finally:
+        metrics.disable()
+
+    assert settled["astar"] == 29
+    assert settled["astar"] * 10 < settled["dijkstra"]
+
+
+def test_spsp_astar_inconsistent_heuristic():
+    """
+    Ensure an admissible, but inconsistent, heuristic still gives the shortest
+    path, by settling vertices again when a shorter path to them is found.
+    """
+    s, a, b, c, t = (Vertex(attributes={"i": i}) for i in range(5))
+    explicit.link_many(
+        [
+            (s, a, {"w": 1}),
+            (s, b, {"w": 1}),
+            (a, c, {"w": 1}),
+            (b, c, {"w": 3}),
+            (c, t, {"w": 3}),
+        ]
+    )
+    uni = Universe(vertices=[s, a, b, c, t])
+
+    # true distances to t: s 5, a 4, b 6, c 3.  the estimate at a is
+    # admissible, but pushes the search down the wrong branch to c first.
+    estimates = {s: 0, a: 4, b: 0, c: 0, t: 0}
+
+    path, dist = shortestpath.single_pair_shortest_path(
+        uni,
+        s,
+        t,
+        weight="w",
+        method="astar",
+        heuristic=lambda v, dest: estimates[v],
+    )
+
+    assert path == [s, a, c, t]
+    assert dist == 5
+
+
+def test_spsp_astar_options():
+    """
+    Ensure the shared direction and filter options are honored.
+    """
+    uni, verts = _grid(5)
+    start, dest = verts[0, 0], verts[4, 0]
+
+    # forbid the bottom row; the path must go around it
+    path, dist = shortestpath.single_pair_shortest_path(
+        uni,
+        start,
+        dest,
+        method="astar",
+        heuristic=_manhattan,
+        ff_via=lambda e, v: (v.y > 0) or (v is dest),
+    )
+    assert dist == 6
+    assert all(v.y > 0 for v in path[1:-1])
+
+    # only backwards; the edges all go both ways, so nothing changes
+    _, dist = shortestpath.single_pair_shortest_path(
+        uni,
+        start,
+        dest,
+        method="astar",
+        heuristic=_manhattan,
+        direction_sensitive=helpers.DIR_SENS_BACKWARD,
+    )
+    assert dist == 4
+
+
+def test_spsp_astar_no_path():
+    """
+    Ensure unreachable destinations give no path.
+    """
+    a = Vertex(attributes={"x": 0, "y": 0})
+    b = Vertex(attributes={"x": 1, "y": 0})
+    uni = Universe(vertices=[a, b])
+
+    assert shortestpath.single_pair_shortest_path(
+        uni, a, b, method="astar", heuristic=_manhattan
+    ) == (None, None)
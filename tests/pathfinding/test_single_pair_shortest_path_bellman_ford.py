@@ -0,0 +1,156 @@
+#!python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the Bellman-Ford method of the shortest path solvers.
+"""
+
+import random
+import pytest
+from edgegraph.structure import Universe, Vertex
+from edgegraph.builder import explicit
+from edgegraph.traversal import helpers
+from edgegraph.pathfinding import shortestpath
+
+
+def _getweight(u, v):
+    """
+    Testing purposes only - access edge weights from the weighted-graph
+    fixtures.
+    """
+    return min(e.weight for e in helpers.find_links(u, v))
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+@pytest.mark.parametrize("style", ["weight", "weightfunc"])
+def test_spsp_bf_negative_weight(graph_neg_weight_no_loops, style, frozen):
+    """
+    Ensure negative weights are handled, where Dijkstra's algorithm would not.
+    """
+    uni, verts = graph_neg_weight_no_loops
+    if frozen:
+        uni = uni.freeze()
+    if style == "weight":
+        kwargs = {"weight": "weight"}
+    else:
+        kwargs = {"weightfunc": _getweight}
+
+    path, dist = shortestpath.single_pair_shortest_path(
+        uni, verts[0], verts[3], method="bellman-ford", **kwargs
+    )
+
+    assert path == verts
+    assert dist == -3
+
+    paths = shortestpath.single_source_shortest_paths(
+        uni, verts[0], method="bellman-ford", **kwargs
+    )
+    assert [paths.distance_to(v) for v in verts] == [0, 1, -4, -3]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_spsp_bf_matches_dijkstra(seed):
+    """
+    Ensure non-negative weights give the same distances as Dijkstra's
+    algorithm.
+    """
+    rng = random.Random(seed)
+    verts = [Vertex() for _ in range(50)]
+    explicit.link_many(
+        [
+            (rng.choice(verts), rng.choice(verts), {"w": rng.randint(0, 9)})
+            for _ in range(200)
+        ]
+    )
+    uni = Universe(vertices=verts)
+
+    bf = shortestpath.single_source_shortest_paths(
+        uni, verts[0], weight="w", method="bellman-ford"
+    )
+    dj = shortestpath.single_source_shortest_paths(uni, verts[0], weight="w")
+
+    assert dict(bf.distances) == dict(dj.distances)
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+def test_spsp_bf_negative_cycle(frozen):
+    """
+    Ensure a reachable negative cycle is reported, edges in order.
+    """
+    verts = [Vertex(attributes={"i": i}) for i in range(6)]
+    a, b, c, d, e, f = verts
+    explicit.link_many(
+        [
+            (a, b, {"w": 1}),
+            (b, c, {"w": 1}),
+            (c, d, {"w": -2}),
+            (d, b, {"w": 0}),
+            (d, e, {"w": 4}),
+            (a, f, {"w": 3}),
+        ]
+    )
+    uni = Universe(vertices=verts)
+    if frozen:
+        uni = uni.freeze()
+
+    with pytest.raises(shortestpath.NegativeCycleError) as info:
+        shortestpath.single_pair_shortest_path(
+            uni, a, e, weight="w", method="bellman-ford"
+        )
+
+    cycle = info.value.cycle
+    assert cycle[0] is cycle[-1]
+    assert set(cycle) == {b, c, d}
+    assert len(cycle) == 4
+    for u, v in zip(cycle, cycle[1:]):
+        assert helpers.find_links(u, v)
+    assert isinstance(info.value, ValueError)
+
+
+def test_spsp_bf_unreachable_negative_cycle():
+    """
+    Ensure negative cycles not reachable from the start do not matter.
+    """
+    a, b, c, d = (Vertex() for _ in range(4))
+    explicit.link_many(
+        [(a, b, {"w": 2}), (c, d, {"w": -1}), (d, c, {"w": -1})]
+    )
+    uni = Universe(vertices=[a, b, c, d])
+
+    assert shortestpath.single_pair_shortest_path(
+        uni, a, b, weight="w", method="bellman-ford"
+    ) == ([a, b], 2)
+
+
+def test_spsp_bf_negative_self_loop():
+    """
+    Ensure a negative loop from a vertex to itself is a negative cycle.
+    """
+    a, b = Vertex(), Vertex()
+    explicit.link_many([(a, b, {"w": 1}), (b, b, {"w": -1})])
+    uni = Universe(vertices=[a, b])
+
+    with pytest.raises(shortestpath.NegativeCycleError) as info:
+        shortestpath.single_source_shortest_paths(
+            uni, a, weight="w", method="bellman-ford"
+        )
+    assert info.value.cycle == [b, b]
+
+
+def test_spsp_bf_undirected_negative_edge():
+    """
+    Ensure an undirected negative edge is (rightly) seen as a negative cycle;
+    it may be crossed back and forth.
+    """
+    a, b = Vertex(), Vertex()
+    explicit.link_undirected(a, b)
+    uni = Universe(vertices=[a, b])
+
+    with pytest.raises(shortestpath.NegativeCycleError):
+        shortestpath.single_source_shortest_paths(
+            uni,
+            a,
+            weightfunc=lambda u, v: -1,
+            method="bellman-ford",
+            direction_sensitive=helpers.DIR_SENS_ANY,
+        )
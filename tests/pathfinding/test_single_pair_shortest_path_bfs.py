@@ -0,0 +1,141 @@
+#!python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the breadth-first fast paths of the shortest path solvers,
+used for unit weights and (on request) zero-or-one weights.
+"""
+
+import random
+import pytest
+from edgegraph.structure import Universe, Vertex
+from edgegraph.builder import explicit
+from edgegraph.traversal import helpers
+from edgegraph.pathfinding import shortestpath
+
+
+def _random_graph(seed, nverts=80, nedges=200):
+    """
+    Make a random directed graph, with a random ``w`` of zero or one on each
+    edge.
+    """
+    rng = random.Random(seed)
+    verts = [Vertex(attributes={"i": i}) for i in range(nverts)]
+    explicit.link_many(
+        [
+            (rng.choice(verts), rng.choice(verts), {"w": rng.randint(0, 1)})
+            for _ in range(nedges)
+        ]
+    )
+    return Universe(vertices=verts), verts
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+@pytest.mark.parametrize(
+    "direction", [helpers.DIR_SENS_FORWARD, helpers.DIR_SENS_ANY]
+)
+@pytest.mark.parametrize("seed", range(4))
+def test_unit_weights_identical(seed, direction, frozen):
+    """
+    Ensure the breadth-first search gives exactly what Dijkstra's algorithm
+    gives, ties and all.
+    """
+    uni, verts = _random_graph(seed)
+    if frozen:
+        uni = uni.freeze()
+    rng = random.Random(seed)
+    kwargs = {
+        "direction_sensitive": direction,
+        "ff_via": lambda e, v: v.i % 7 != 3,
+    }
+
+    for _ in range(20):
+        start, dest = rng.choice(verts), rng.choice(verts)
+        fast = shortestpath.single_pair_shortest_path(
+            uni, start, dest, **kwargs
+        )
+        slow = shortestpath.single_pair_shortest_path(
+            uni, start, dest, weightfunc=lambda u, v: 1, **kwargs
+        )
+        assert fast == slow
+
+    start = verts[0]
+    fast = shortestpath.single_source_shortest_paths(uni, start, **kwargs)
+    slow = shortestpath.single_source_shortest_paths(
+        uni, start, weightfunc=lambda u, v: 1, **kwargs
+    )
+    assert dict(fast.distances) == dict(slow.distances)
+    assert dict(fast.predecessors) == dict(slow.predecessors)
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+def test_unit_weights_cutoff(frozen):
+    """
+    Ensure the cutoff is honored by the breadth-first search.
+    """
+    verts = [Vertex() for _ in range(10)]
+    for u, v in zip(verts, verts[1:]):
+        explicit.link_directed(u, v)
+    uni = Universe(vertices=verts)
+    if frozen:
+        uni = uni.freeze()
+
+    paths = shortestpath.single_source_shortest_paths(uni, verts[0], cutoff=3)
+
+    assert set(paths.distances) == set(verts[:4])
+    assert paths.path_to(verts[3]) == verts[:4]
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+@pytest.mark.parametrize("style", ["weight", "weightfunc"])
+@pytest.mark.parametrize("seed", range(4))
+def test_zero_one_matches_dijkstra(seed, style, frozen):
+    """
+    Ensure the 0-1 BFS finds the same distances as Dijkstra's algorithm.
+    """
+    uni, verts = _random_graph(seed)
+    live = uni
+    if frozen:
+        uni = uni.freeze()
+    rng = random.Random(seed)
+
+    if style == "weight":
+        kwargs = {"weight": "w"}
+    else:
+        kwargs = {
+            "weightfunc": lambda u, v: min(
+                e.w for e in helpers.find_links(u, v)
+            )
+        }
+
+    for _ in range(20):
+        start, dest = rng.choice(verts), rng.choice(verts)
+        path, dist = shortestpath.single_pair_shortest_path(
+            uni, start, dest, zero_one=True, **kwargs
+        )
+        _, expect = shortestpath.single_pair_shortest_path(
+            live, start, dest, **kwargs
+        )
+        assert dist == expect
+        if (path is not None) and (start is not dest):
+            assert path[0] is start and path[-1] is dest
+
+    paths = shortestpath.single_source_shortest_paths(
+        uni, verts[0], zero_one=True, cutoff=2, **kwargs
+    )
+    expect = shortestpath.single_source_shortest_paths(
+        live, verts[0], cutoff=2, **kwargs
+    )
+    assert dict(paths.distances) == dict(expect.distances)
+
+
+def test_zero_one_rejects_other_weights(graph_cheapest_is_longest):
+    """
+    Ensure weights other than zero or one are not silently mishandled.
+    """
+    uni, verts = graph_cheapest_is_longest
+
+    with pytest.raises(ValueError):
+        shortestpath.single_pair_shortest_path(
+            uni, verts[0], verts[5], weight="weight", zero_one=True
+        )
@@ -0,0 +1,142 @@
+#!python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the bidirectional method of single_pair_shortest_path().
+"""
+
+import random
+import pytest
+from edgegraph.structure import Universe, Vertex
+from edgegraph.builder import explicit
+from edgegraph.traversal import helpers
+from edgegraph.pathfinding import shortestpath
+
+
+def _random_weighted(seed, nverts=60, nedges=240):
+    """
+    Make a random directed graph with a random ``w`` on each edge.
+    """
+    rng = random.Random(seed)
+    verts = [Vertex(attributes={"i": i}) for i in range(nverts)]
+    explicit.link_many(
+        [
+            (rng.choice(verts), rng.choice(verts), {"w": rng.randint(1, 9)})
+            for _ in range(nedges)
+        ]
+    )
+    return Universe(vertices=verts), verts
+
+
+def _path_weight(path, weight):
+    """
+    Total weight of the cheapest edges along the given path.
+    """
+    return sum(
+        min(weight(e) for e in helpers.find_links(u, v))
+        for u, v in zip(path, path[1:])
+    )
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+@pytest.mark.parametrize(
+    "direction", [helpers.DIR_SENS_FORWARD, helpers.DIR_SENS_BACKWARD]
+)
+@pytest.mark.parametrize("seed", range(5))
+def test_spsp_bidir_matches_dijkstra(seed, direction, frozen):
+    """
+    Ensure bidirectional search gives the same distances as one-way search.
+    """
+    uni, verts = _random_weighted(seed)
+    if frozen:
+        uni = uni.freeze()
+    rng = random.Random(seed)
+
+    for _ in range(20):
+        start, dest = rng.choice(verts), rng.choice(verts)
+        kwargs = {"weight": "w", "direction_sensitive": direction}
+
+        bpath, bdist = shortestpath.single_pair_shortest_path(
+            uni, start, dest, method="bidirectional", **kwargs
+        )
+        _, ddist = shortestpath.single_pair_shortest_path(
+            uni, start, dest, **kwargs
+        )
+
+        assert bdist == ddist
+        if bpath is not None and start is not dest:
+            assert bpath[0] is start and bpath[-1] is dest
+            if direction == helpers.DIR_SENS_FORWARD:
+                assert _path_weight(bpath, lambda e: e.w) == bdist
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+def test_spsp_bidir_weightfunc_direction(frozen):
+    """
+    Ensure the backward search asks the weight of each hop in the direction it
+    is travelled, as the forward search does.
+    """
+    a, b, c = Vertex(), Vertex(), Vertex()
+    explicit.link_undirected(a, b)
+    explicit.link_undirected(b, c)
+    explicit.link_undirected(a, c)
+    uni = Universe(vertices=[a, b, c])
+    if frozen:
+        uni = uni.freeze()
+
+    # going a -> b -> c is cheap, c -> b -> a (and a <-> c) expensive
+    costs = {(a, b): 1, (b, c): 1, (b, a): 10, (c, b): 10}
+
+    path, dist = shortestpath.single_pair_shortest_path(
+        uni,
+        a,
+        c,
+        method="bidirectional",
+        weightfunc=lambda u, v: costs.get((u, v), 5),
+    )
+
+    assert path == [a, b, c]
+    assert dist == 2
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+def test_spsp_bidir_ff_via(frozen):
+    """
+    Ensure the filter is asked about the vertex being stepped *onto*, by both
+    searches, including the destination itself.
+    """
+    uni, verts = _random_weighted(7)
+    if frozen:
+        uni = uni.freeze()
+    banned = set(verts[10:20])
+
+    def ff(e, v):
+        return v not in banned
+
+    for start in verts[:5]:
+        for dest in verts[5:30]:
+            kwargs = {"weight": "w", "ff_via": ff}
+            bpath, bdist = shortestpath.single_pair_shortest_path(
+                uni, start, dest, method="bidirectional", **kwargs
+            )
+            _, ddist = shortestpath.single_pair_shortest_path(
+                uni, start, dest, **kwargs
+            )
+            assert bdist == ddist
+            if dest in banned:
+                assert bpath is None
+            elif bpath is not None:
+                assert not banned.intersection(bpath)
+
+
+def test_spsp_bidir_outside_universe():
+    """
+    Ensure a destination outside of the universe cannot be found.
+    """
+    a, b = Vertex(), Vertex()
+    explicit.link_directed(a, b)
+    uni = Universe(vertices=[a])
+
+    assert shortestpath.single_pair_shortest_path(
+        uni, a, b, method="bidirectional"
+    ) == (None, None)
@@ -5,6 +5,9 @@
 Unit tests for the single_pair_shortest_path() function.
 """
 
+import pytest
+from edgegraph.structure import Universe, Vertex
+from edgegraph.builder import explicit
 from edgegraph.traversal import helpers
 from edgegraph.pathfinding import shortestpath
 
@@ -57,3 +60,86 @@ def test_spsp_dijkstra_weighted_diff(graph_cheapest_is_longest):
 
     assert dist == 15
     assert path == verts
+
+
+@pytest.mark.parametrize("weight", ["weight", lambda e: e.weight])
+@pytest.mark.parametrize("snapshot", [False, True])
+def test_spsp_dijkstra_edge_weight(graph_cheapest_is_longest, weight, snapshot):
+    """
+    Ensure edge weights may be given as an attribute name or edge callback.
+    """
+    uni, verts = graph_cheapest_is_longest
+    if snapshot:
+        uni = uni.freeze()
+
+    path, dist = shortestpath.single_pair_shortest_path(
+        uni, verts[0], verts[5], weight=weight
+    )
+
+    assert dist == 15
+    assert path == verts
+
+
+@pytest.mark.parametrize("snapshot", [False, True])
+def test_spsp_dijkstra_edge_weight_multigraph(snapshot):
+    """
+    Ensure the cheapest of several parallel edges is the one taken.
+    """
+    uni = Universe()
+    v = [Vertex(universes=[uni]) for _ in range(3)]
+    explicit.link_many(
+        [
+            (v[0], v[1], {"cost": 5}),
+            (v[0], v[1], {"cost": 1}),
+            (v[0], v[1], {"cost": 3}),
+            (v[1], v[2], {"cost": 4}),
+            (v[0], v[2], {"cost": 6}),
+        ]
+    )
+    if snapshot:
+        uni = uni.freeze()
+
+    path, dist = shortestpath.single_pair_shortest_path(
+        uni, v[0], v[2], weight="cost"
+    )
+    assert path == [v[0], v[1], v[2]]
+    assert dist == 5
+
+
+def test_spsp_dijkstra_edge_weight_filter(graph_cheapest_is_longest):
+    """
+    Ensure ff_via is still applied to each edge when weighing edges.
+    """
+    uni, verts = graph_cheapest_is_longest
+
+    path, dist = shortestpath.single_pair_shortest_path(
+        uni,
+        verts[0],
+        verts[5],
+        weight="weight",
+        ff_via=lambda e, v2: e.weight != 1,
+    )
+    assert path == [verts[0], verts[5]]
+    assert dist == 20
+
+
+def test_spsp_dijkstra_edge_weight_args(graph_cheapest_is_longest):
+    """
+    Ensure bad combinations of the weight arguments are rejected.
+    """
+    uni, verts = graph_cheapest_is_longest
+
+    with pytest.raises(ValueError):
+        shortestpath.single_pair_shortest_path(
+            uni, verts[0], verts[5], weight="weight", weightfunc=_getweight
+        )
+
+    with pytest.raises(TypeError):
+        shortestpath.single_pair_shortest_path(
+            uni, verts[0], verts[5], weight=4
+        )
+
+    with pytest.raises(AttributeError):
+        shortestpath.single_pair_shortest_path(
+            uni, verts[0], verts[5], weight="nonexistent"
+        )
@@ -0,0 +1,272 @@
+#!python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the single_source_shortest_paths() function.
+"""
+
+import random
+import pytest
+from edgegraph.structure import Universe, Vertex
+from edgegraph.builder import explicit
+from edgegraph.pathfinding import shortestpath
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+def test_sssp_distances_and_paths(graph_cheapest_is_longest, frozen):
+    """
+    Ensure every destination can be queried from one search.
+    """
+    uni, verts = graph_cheapest_is_longest
+    if frozen:
+        uni = uni.freeze()
+
+    paths = shortestpath.single_source_shortest_paths(
+        uni, verts[0], weight="weight"
+    )
+
+    assert paths.start is verts[0]
+    assert len(paths) == 6
+    assert [paths.distance_to(v) for v in verts] == [0, 1, 3, 6, 10, 15]
+    assert paths.path_to(verts[5]) == verts
+    assert paths.path_to(verts[2]) == verts[:3]
+    assert paths.path_to(verts[0]) == [verts[0]]
+
+
+def test_sssp_matches_single_pair(graph_clrs09_22_6):
+    """
+    Ensure the one-to-many answers agree with repeated single-pair searches.
+    """
+    uni, verts = graph_clrs09_22_6
+
+    paths = shortestpath.single_source_shortest_paths(uni, verts[0])
+
+    for dest in verts[1:]:
+        sol = shortestpath.single_pair_shortest_path(uni, verts[0], dest)
+        if sol is None:
+            assert dest not in paths
+            assert paths.path_to(dest) is None
+            assert paths.distance_to(dest) is None
+        else:
+            assert paths.distance_to(dest) == sol[1]
+            assert paths.path_to(dest) == sol[0]
+
+
+def test_sssp_unreachable():
+    """
+    Ensure vertices with no path are reported as such.
+    """
+    a, b, c = Vertex(), Vertex(), Vertex()
+    explicit.link_directed(a, b)
+    uni = Universe(vertices=[a, b, c])
+
+    paths = shortestpath.single_source_shortest_paths(uni, a)
+
+    assert c not in paths
+    assert paths.distance_to(c) is None
+    assert paths.path_to(c) is None
+    assert b in paths
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+@pytest.mark.parametrize("style", ["weight", "weightfunc"])
+def test_sssp_cutoff(graph_cheapest_is_longest, frozen, style):
+    """
+    Ensure the cutoff stops the search at the given distance, inclusive.
+    """
+    uni, verts = graph_cheapest_is_longest
+    if frozen:
+        uni = uni.freeze()
+
+    if style == "weight":
+        kwargs = {"weight": "weight"}
+    else:
+        kwargs = {"weightfunc": lambda u, v: 2}
+
+    paths = shortestpath.single_source_shortest_paths(
+        uni, verts[0], cutoff=6, **kwargs
+    )
+
+    if style == "weight":
+        assert set(paths.distances) == set(verts[:4])
+        assert paths.distance_to(verts[3]) == 6
+        assert paths.path_to(verts[3]) == verts[:4]
+    else:
+        # verts[5] is one hop away at a cost of 2; verts[1..3] within 6
+        assert set(paths.distances) == set(verts[:4]) | {verts[5]}
+        assert paths.path_to(verts[5]) == [verts[0], verts[5]]
+    assert paths.path_to(verts[4]) is None
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+def test_sssp_cutoff_negative(frozen):
+    """
+    Ensure a Bellman-Ford cutoff drops vertices reached only through one
+    beyond it, even where their own distance is within it.
+    """
+    a, b, c, d = [Vertex() for _ in range(4)]
+    explicit.link_directed(a, b).weight = 7
+    explicit.link_directed(b, c).weight = -2
+    explicit.link_directed(a, d).weight = 5
+    uni = Universe(vertices=[a, b, c, d])
+    if frozen:
+        uni = uni.freeze()
+
+    paths = shortestpath.single_source_shortest_paths(
+        uni, a, weight="weight", method="bellman-ford", cutoff=5
+    )
+
+    assert set(paths.distances) == {a, d}
+    assert paths.distance_to(c) is None
+    assert paths.path_to(c) is None
+    assert paths.path_to(d) == [a, d]
+
+
+def test_sssp_read_only_views(graph_cheapest_is_shortest):
+    """
+    Ensure the mappings given out cannot be used to corrupt the result.
+    """
+    uni, verts = graph_cheapest_is_shortest
+
+    paths = shortestpath.single_source_shortest_paths(uni, verts[0])
+
+    with pytest.raises(TypeError):
+        paths.distances[verts[0]] = 5
+    with pytest.raises(TypeError):
+        paths.predecessors[verts[0]] = verts[1]
+    assert paths.predecessors[verts[0]] is None
+    assert paths.predecessors[verts[5]] is verts[0]
+
+
+def test_sssp_errors(graph_cheapest_is_shortest):
+    """
+    Ensure bad arguments are rejected.
+    """
+    uni, verts = graph_cheapest_is_shortest
+
+    with pytest.raises(ValueError):
+        shortestpath.single_source_shortest_paths(uni, None)
+    with pytest.raises(ValueError):
+        shortestpath.single_source_shortest_paths(
+            uni, verts[0], weight="weight", weightfunc=lambda u, v: 1
+        )
+    with pytest.raises(NotImplementedError):
+        shortestpath.single_source_shortest_paths(
+            uni, verts[0], method="nonsense"
+        )
+
+
+def test_route_is_linear():
+    """
+    Ensure a long path is rebuilt correctly (and without quadratic work).
+    """
+    verts = [Vertex() for _ in range(20000)]
+    for u, v in zip(verts, verts[1:]):
+        explicit.link_directed(u, v)
+    uni = Universe(vertices=verts)
+
+    paths = shortestpath.single_source_shortest_paths(uni, verts[0])
+
+    assert paths.path_to(verts[-1]) == verts
+    assert paths.distance_to(verts[-1]) == len(verts) - 1
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"weight": "w"},
+        {"weight": "z", "zero_one": True},
+        {"weight": "w", "queue": "dary"},
+        {"weight": "w", "method": "bellman-ford"},
+    ],
+)
+@pytest.mark.parametrize("initial", [False, True])
+@pytest.mark.parametrize("seed", range(3))
+def test_sssp_multi_source(seed, initial, kwargs, frozen):
+    """
+    Ensure a search from several vertices gives each vertex its distance from
+    the nearest, counting the initial distances.
+    """
+    rng = random.Random(seed)
+    verts = [Vertex() for _ in range(60)]
+    explicit.link_many(
+        [
+            (
+                rng.choice(verts),
+                rng.choice(verts),
+                {"w": rng.randint(1, 9), "z": rng.randint(0, 1)},
+            )
+            for _ in range(150)
+        ]
+    )
+    uni = Universe(vertices=verts)
+    if frozen:
+        uni = uni.freeze()
+    sources = {v: (rng.randint(0, 5) if initial else 0) for v in verts[:4]}
+    start = sources if initial else list(sources)
+
+    singles = {
+        s: shortestpath.single_source_shortest_paths(uni, s, **kwargs)
+        for s in sources
+    }
+    expect = {}
+    for s, d in sources.items():
+        for v, dv in singles[s].distances.items():
+            expect[v] = min(expect.get(v, float("inf")), d + dv)
+
+    paths = shortestpath.single_source_shortest_paths(uni, start, **kwargs)
+
+    assert dict(paths.distances) == expect
+    assert dict(paths.sources) == sources
+    assert paths.start is None
+    for v in expect:
+        path = paths.path_to(v)
+        assert path[0] in sources
+        assert paths.predecessors[path[0]] is None
+        assert sources[path[0]] + singles[path[0]].distance_to(v) == expect[v]
+
+    spsp_kwargs = dict(kwargs)
+    spsp_kwargs.pop("method", None)
+    for method in ("dijkstra", "astar", "bidirectional", "bellman-ford"):
+        for v in verts[::7]:
+            path, dist = shortestpath.single_pair_shortest_path(
+                uni, start, v, method=method, **spsp_kwargs
+            )
+            assert dist == expect.get(v)
+            if path is not None:
+                assert path[0] in sources
+                assert path[-1] is v
+
+
+def test_sssp_multi_source_edges(graph_cheapest_is_longest):
+    """
+    Ensure the odd cases of several start vertices are handled.
+    """
+    uni, verts = graph_cheapest_is_longest
+
+    paths = shortestpath.single_source_shortest_paths(
+        uni, [verts[0], verts[3], verts[0]], weight="weight"
+    )
+    assert list(paths.sources) == [verts[0], verts[3]]
+    assert paths.path_to(verts[3]) == [verts[3]]
+    assert paths.path_to(verts[5]) == verts[3:]
+    assert paths.distance_to(verts[5]) == 9
+
+    # a source further away than another's path to it is reached through that
+    paths = shortestpath.single_source_shortest_paths(
+        uni, {verts[0]: 0, verts[3]: 10}, weight="weight"
+    )
+    assert paths.path_to(verts[3]) == verts[:4]
+    assert paths.distance_to(verts[3]) == 6
+
+    empty = shortestpath.single_source_shortest_paths(uni, [])
+    assert len(empty) == 0
+    assert shortestpath.single_pair_shortest_path(uni, [], verts[1]) == (
+        None,
+        None,
+    )
+    assert shortestpath.single_pair_shortest_path(
+        uni, [verts[2], verts[1]], verts[1], method="bidirectional"
+    ) == ([verts[1]], 0)
@@ -299,3 +299,16 @@ def test_base_obj_init_universes_deduplicate():
     bo = base.BaseObject(universes=unis)
 
     assert len(bo.universes) == 1, "duplicate universes got through __init__"
+
+
+def test_base_obj_universes_lazy():
+    """
+    Ensure the universes list is only created when it is needed.
+    """
+    bo = base.BaseObject()
+    assert bo._universes is None, "universes list created eagerly!"
+    assert bo.universes == [], "empty universes not reported as a list!"
+
+    # removing from a universe the object was never in is still an error
+    with pytest.raises(ValueError):
+        bo.remove_from_universe(universe.Universe())
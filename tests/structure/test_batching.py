@@ -0,0 +1,169 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for structure.batching module.
+"""
+
+import pytest
+from edgegraph.structure import (
+    Universe,
+    Vertex,
+    DirectedEdge,
+    NeighborCachePolicy,
+    batching,
+)
+from edgegraph.builder import explicit
+from edgegraph.traversal import helpers, breadthfirst
+
+# W0212 is protected-access, or, access to a protected member (starting with a
+# _) of a client class.  In this case, the test objectives require we inspect
+# internal state of the objects, so we need to read these attributes.
+# pylint: disable=W0212
+
+_FWD = (helpers.DIR_SENS_FORWARD, helpers.LNK_UNKNOWN_ERROR, None)
+
+
+def _count_invalidations(monkeypatch):
+    """
+    Count calls to the real invalidation of each vertex's cache.
+    """
+    calls = {}
+    orig = Vertex._qa_neighbors_invalidate
+
+    def counting(self):
+        if batching._touched is None:
+            calls[self] = calls.get(self, 0) + 1
+        orig(self)
+
+    monkeypatch.setattr(Vertex, "_qa_neighbors_invalidate", counting)
+    return calls
+
+
+def test_batch_basic():
+    """
+    Ensure links made within a batch are all present afterwards.
+    """
+    uni = Universe()
+    verts = [Vertex(universes=[uni]) for _ in range(10)]
+
+    assert not batching.in_batch()
+    with uni.batch():
+        assert batching.in_batch()
+        for v1, v2 in zip(verts, verts[1:]):
+            explicit.link_directed(v1, v2)
+    assert not batching.in_batch()
+
+    assert breadthfirst.bft(uni, verts[0]) == verts
+
+
+def test_batch_invalidates_once(monkeypatch):
+    """
+    Ensure each touched vertex is invalidated exactly once, at batch end.
+    """
+    uni = Universe()
+    hub = Vertex(universes=[uni])
+    leaves = [Vertex(universes=[uni]) for _ in range(20)]
+    calls = _count_invalidations(monkeypatch)
+
+    with uni.batch():
+        for leaf in leaves:
+            explicit.link_directed(hub, leaf)
+        assert calls == {}
+
+    assert calls[hub] == 1
+    assert all(calls[leaf] == 1 for leaf in leaves)
+
+
+def test_batch_unbatched_invalidates_every_change(monkeypatch):
+    """
+    Sanity check for the above -- without a batch, every change invalidates.
+    """
+    uni = Universe()
+    hub = Vertex(universes=[uni])
+    leaves = [Vertex(universes=[uni]) for _ in range(20)]
+    calls = _count_invalidations(monkeypatch)
+
+    for leaf in leaves:
+        explicit.link_directed(hub, leaf)
+
+    assert calls[hub] >= len(leaves)
+
+
+@pytest.mark.parametrize("policy", [False, True])
+def test_batch_no_stale_reads(policy):
+    """
+    Ensure neighbor lookups within a batch see changes made in it.
+    """
+    uni = Universe(neighbor_cache=NeighborCachePolicy() if policy else None)
+    v1, v2, v3 = (Vertex(universes=[uni]) for _ in range(3))
+    explicit.link_directed(v1, v2)
+
+    # warm up the cache
+    assert helpers.neighbors(v1) == [v2]
+    assert helpers.neighbors(v1) == [v2]
+
+    with uni.batch():
+        explicit.link_directed(v1, v3)
+        assert helpers.neighbors(v1) == [v2, v3]
+        # untouched vertices still use the cache
+        assert helpers.neighbors(v3) == []
+
+    if policy:
+        # invalidated at the end of the batch, and re-cacheable afterwards
+        assert uni.neighbor_cache.get(v1, _FWD, None) is None
+        assert helpers.neighbors(v1) == [v2, v3]
+        assert uni.neighbor_cache.get(v1, _FWD, None) == [v2, v3]
+    assert helpers.neighbors(v1) == [v2, v3]
+
+
+def test_batch_nested(monkeypatch):
+    """
+    Ensure nested batches defer to the outermost one.
+    """
+    uni = Universe()
+    v1, v2, v3 = (Vertex(universes=[uni]) for _ in range(3))
+    calls = _count_invalidations(monkeypatch)
+
+    with uni.batch():
+        explicit.link_directed(v1, v2)
+        with uni.batch():
+            explicit.link_directed(v1, v3)
+        assert batching.in_batch()
+        assert calls == {}
+
+    assert calls == {v1: 1, v2: 1, v3: 1}
+
+
+def test_batch_exception():
+    """
+    Ensure the batch is closed, and caches invalidated, on exceptions.
+    """
+    uni = Universe(neighbor_cache=NeighborCachePolicy())
+    v1, v2 = (Vertex(universes=[uni]) for _ in range(2))
+    helpers.neighbors(v1)
+
+    with pytest.raises(RuntimeError):
+        with uni.batch():
+            explicit.link_directed(v1, v2)
+            raise RuntimeError("oops")
+
+    assert not batching.in_batch()
+    assert helpers.neighbors(v1) == [v2]
+
+
+def test_batch_unlink():
+    """
+    Ensure removals within a batch are handled as well.
+    """
+    uni = Universe()
+    v1, v2 = (Vertex(universes=[uni]) for _ in range(2))
+    e = DirectedEdge(v1, v2)
+    assert helpers.neighbors(v1) == [v2]
+
+    with uni.batch():
+        v1.remove_from_link(e)
+        assert helpers.neighbors(v1) == []
+        assert v1.links == ()
+
+    assert helpers.neighbors(v1) == []
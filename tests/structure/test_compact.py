@@ -0,0 +1,167 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for structure.compact module.
+"""
+
+import pytest
+from edgegraph.structure import (
+    Vertex,
+    Universe,
+    DirectedEdge,
+    compact,
+    vertex,
+)
+from edgegraph.builder import explicit
+from edgegraph.traversal import helpers, breadthfirst
+
+# W0212 is protected-access, or, access to a protected member (starting with a
+# _) of a client class.  In this case, the test objectives require we inspect
+# internal state of the objects, so we need to read these attributes.
+# pylint: disable=W0212
+
+
+@pytest.mark.parametrize(
+    "cls",
+    [
+        compact.CompactVertex,
+        compact.CompactDirectedEdge,
+        compact.CompactUnDirectedEdge,
+    ],
+)
+def test_compact_no_dict(cls):
+    """
+    Ensure compact objects do not carry a per-instance __dict__.
+    """
+    obj = cls()
+    assert not hasattr(obj, "__dict__"), "compact object has a __dict__!"
+
+    # the attribute dictionary is only made on demand
+    assert getattr(obj, "_attributes", None) is None
+
+
+def test_compact_attributes():
+    """
+    Ensure compact objects support dot and item access to dynamic attributes.
+    """
+    v = compact.CompactVertex(attributes={"fifteen": 15})
+    assert v.fifteen == 15, "compact vertex lost init attributes!"
+    assert v["fifteen"] == 15, "compact vertex getitem failed!"
+
+    v.x = 7
+    v["y"] = 12
+    assert v.x == 7, "compact vertex did not setattr!"
+    assert v["x"] == 7, "compact vertex did not setattr!"
+    assert v.y == 12, "compact vertex did not setitem!"
+    assert {"fifteen", "x", "y"} <= set(dir(v)), "dir() missed attributes!"
+
+    del v.x
+    del v["y"]
+    with pytest.raises(AttributeError):
+        _ = v.x
+    with pytest.raises(AttributeError):
+        _ = v["y"]
+    with pytest.raises(AttributeError):
+        del v.x
+
+    assert v.fifteen == 15, "compact vertex delattr removed others!"
+
+
+def test_compact_readonly_property():
+    """
+    Ensure read-only properties stay read-only on compact objects.
+    """
+    v = compact.CompactVertex(uid=5)
+    with pytest.raises(AttributeError):
+        v.uid = 7
+    assert v.uid == 5, "compact vertex uid changed!"
+
+
+def test_compact_bad_attributes():
+    """
+    Ensure the attributes argument is still type checked.
+    """
+    with pytest.raises(TypeError):
+        compact.CompactVertex(attributes=[("x", 1)])
+
+
+def test_compact_edges():
+    """
+    Ensure compact edges link (and are bucketed) like the default ones.
+    """
+    v1 = compact.CompactVertex()
+    v2 = compact.CompactVertex()
+    v3 = Vertex()
+
+    d = compact.CompactDirectedEdge(v1, v2)
+    u = explicit.link_from_to(v2, compact.CompactUnDirectedEdge, v3)
+
+    assert d.vertices == (v1, v2)
+    assert v1.links == (d,)
+    assert v2.links == (d, u)
+    assert v3.links == (u,)
+
+    assert helpers.neighbors(v1) == [v2]
+    assert helpers.neighbors(v2) == [v3]
+    assert helpers.neighbors(v2, helpers.DIR_SENS_BACKWARD) == [v1, v3]
+    assert helpers.find_links(v1, v2) == {d}
+    assert helpers.find_links(v2, v1) == set()
+    assert helpers.find_links(v2, v3) == {u}
+
+    with pytest.raises(TypeError):
+        compact.CompactDirectedEdge(object(), v1)
+
+
+def test_compact_traversal():
+    """
+    Ensure graphs of compact objects (and mixed graphs) can be traversed.
+    """
+    uni = Universe()
+    verts = [compact.CompactVertex(universes=[uni]) for _ in range(5)]
+    verts.append(Vertex(universes=[uni]))
+    for v1, v2 in zip(verts, verts[1:]):
+        explicit.link_from_to(v1, compact.CompactDirectedEdge, v2)
+    # a default edge into a compact vertex
+    DirectedEdge(verts[-1], verts[0])
+
+    assert uni.vertices == verts
+    assert verts[0].universes == [uni]
+    assert breadthfirst.bft(uni, verts[0]) == verts
+
+
+def test_compact_neighbor_caching():
+    """
+    Ensure compact vertices have their own neighbor caching switch.
+    """
+    v1 = compact.CompactVertex()
+    v2 = compact.CompactVertex()
+    explicit.link_from_to(v1, compact.CompactDirectedEdge, v2)
+
+    assert not compact.CompactVertex.NEIGHBOR_CACHING
+    assert helpers.neighbors(v1) == [v2]
+    assert (
+        v1._qa_neighbors_get(
+            helpers.DIR_SENS_FORWARD, helpers.LNK_UNKNOWN_ERROR, None
+        )
+        is None
+    )
+
+    compact.CompactVertex.NEIGHBOR_CACHING = True
+    try:
+        assert helpers.neighbors(v1) == [v2]
+        assert helpers.neighbors(v1) == [v2]
+        assert v1._qa_neighbors_get(
+            helpers.DIR_SENS_FORWARD, helpers.LNK_UNKNOWN_ERROR, None
+        ) == [v2]
+    finally:
+        compact.CompactVertex.NEIGHBOR_CACHING = False
+
+
+def test_compact_core_classes():
+    """
+    Ensure the compact classes share the slotted cores of the default ones.
+    """
+    assert issubclass(compact.CompactVertex, vertex.VertexCore)
+    assert issubclass(Vertex, vertex.VertexCore)
+    assert not issubclass(compact.CompactVertex, Vertex)
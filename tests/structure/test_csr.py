@@ -0,0 +1,211 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for structure.csr.CSRSnapshot class.
+"""
+
+import pytest
+from edgegraph.structure import Vertex, Universe, Link, TwoEndedLink
+from edgegraph.structure.csr import CSRSnapshot
+from edgegraph.builder import explicit
+from edgegraph.traversal import helpers, breadthfirst, depthfirst
+from edgegraph.pathfinding import shortestpath
+
+
+def test_csr_freeze_numbering(graph_clrs09_22_6):
+    """
+    Ensure the snapshot numbers vertices in universe insertion order.
+    """
+    uni, verts = graph_clrs09_22_6
+    snap = uni.freeze()
+
+    assert isinstance(snap, CSRSnapshot)
+    assert len(snap) == len(uni.vertices)
+    assert list(snap.vertices) == uni.vertices
+
+    for i, v in enumerate(uni.vertices):
+        assert snap.index_of(v) == i
+        assert snap.vertex_at(i) is v
+        assert v in snap
+        assert snap.has_vertex(v)
+
+    assert Vertex() not in snap
+
+
+def test_csr_adjacency_matches_neighbors(graph_clrs09_22_6):
+    """
+    Ensure the snapshot records the same neighbors as the live graph.
+    """
+    uni, _ = graph_clrs09_22_6
+    snap = uni.freeze()
+
+    for direction in (
+        helpers.DIR_SENS_FORWARD,
+        helpers.DIR_SENS_BACKWARD,
+        helpers.DIR_SENS_ANY,
+    ):
+        for v in uni.vertices:
+            expect = helpers.neighbors(v, direction_sensitive=direction)
+            got = [
+                snap.vertex_at(i)
+                for i in snap.neighbor_ids(snap.index_of(v), direction)
+            ]
+            assert got == expect, f"snapshot neighbors differ ({direction})"
+
+
+def test_csr_arrays_readonly(graph_clrs09_22_6):
+    """
+    Ensure the CSR arrays cannot be written to.
+    """
+    uni, _ = graph_clrs09_22_6
+    snap = uni.freeze()
+
+    assert snap.out_offsets.readonly
+    assert snap.out_targets.readonly
+    assert snap.in_offsets.readonly
+    assert snap.in_targets.readonly
+    assert snap.und_offsets.readonly
+    assert snap.und_targets.readonly
+
+    with pytest.raises(TypeError):
+        snap.out_targets[0] = 5
+
+    # 14 edges in the graph, no undirected ones
+    assert len(snap.out_targets) == 14
+    assert len(snap.in_targets) == 14
+    assert len(snap.und_targets) == 0
+    assert len(snap.out_offsets) == len(snap) + 1
+
+
+def test_csr_mixed_and_loops():
+    """
+    Ensure undirected edges and self-loops are recorded correctly.
+    """
+    verts = [Vertex() for _ in range(3)]
+    uni = Universe(vertices=verts)
+    explicit.link_undirected(verts[0], verts[1])
+    explicit.link_directed(verts[1], verts[2])
+    explicit.link_directed(verts[2], verts[2])
+
+    snap = uni.freeze()
+
+    assert snap.neighbor_ids(0) == [1]
+    assert snap.neighbor_ids(1) == [0, 2]
+    assert snap.neighbor_ids(2) == [2]
+    assert snap.neighbor_ids(2, helpers.DIR_SENS_BACKWARD) == [1, 2]
+    # the self-loop must only be given once
+    assert snap.neighbor_ids(2, helpers.DIR_SENS_ANY) == [1, 2]
+
+
+def test_csr_excludes_outside_universe():
+    """
+    Ensure links leaving the universe are not part of the snapshot.
+    """
+    inside = Vertex()
+    outside = Vertex()
+    uni = Universe(vertices=[inside])
+    explicit.link_directed(inside, outside)
+
+    snap = uni.freeze()
+    assert snap.neighbor_ids(0) == []
+    assert outside not in snap
+
+
+def test_csr_is_a_copy(graph_clrs09_22_6):
+    """
+    Ensure graph edits after freezing do not alter the snapshot.
+    """
+    uni, verts = graph_clrs09_22_6
+    snap = uni.freeze()
+    before = snap.neighbor_ids(0)
+
+    explicit.unlink(verts[0], verts[2])
+
+    assert snap.neighbor_ids(0) == before
+
+
+def test_csr_unknown_links():
+    """
+    Ensure unknown link types follow the unknown_handling argument.
+    """
+    v1 = Vertex()
+    v2 = Vertex()
+    uni = Universe(vertices=[v1, v2])
+    TwoEndedLink(v1, v2)
+
+    snap = uni.freeze()
+
+    with pytest.raises(NotImplementedError):
+        snap.neighbor_ids(0)
+    assert snap.neighbor_ids(0, helpers.DIR_SENS_ANY) == [1]
+    assert (
+        snap.neighbor_ids(
+            0, helpers.DIR_SENS_FORWARD, helpers.LNK_UNKNOWN_NONNEIGHBOR
+        )
+        == []
+    )
+    assert (
+        snap.neighbor_ids(
+            0, helpers.DIR_SENS_FORWARD, helpers.LNK_UNKNOWN_NEIGHBOR
+        )
+        == [1]
+    )
+
+
+def test_csr_bad_direction(graph_clrs09_22_6):
+    """
+    Ensure unknown direction options are refused.
+    """
+    uni, _ = graph_clrs09_22_6
+    snap = uni.freeze()
+
+    with pytest.raises(ValueError):
+        snap.neighbor_ids(0, 17)
+
+
+def test_csr_mixed_link_order():
+    """
+    Ensure a snapshot gives neighbors in link order, as the live graph does,
+    when directed and undirected links are mixed.
+    """
+    a, b, c, d, e = (Vertex(attributes={"name": n}) for n in "abcde")
+    uni = Universe(vertices=[a, b, c, d, e])
+    explicit.link_undirected(a, b)
+    explicit.link_directed(a, c)
+    explicit.link_undirected(a, d)
+    explicit.link_directed(e, a)
+    snap = uni.freeze()
+
+    for direction in (helpers.DIR_SENS_FORWARD, helpers.DIR_SENS_BACKWARD):
+        live = helpers.neighbors(a, direction_sensitive=direction)
+        assert [snap.vertex_at(i) for i in snap.neighbor_ids(0, direction)] == (
+            live
+        )
+        assert breadthfirst.bft(
+            snap, a, direction_sensitive=direction
+        ) == breadthfirst.bft(uni, a, direction_sensitive=direction)
+    assert breadthfirst.bft(snap, a) == [a, b, c, d]
+
+
+def test_csr_unknown_links_bypass_filter():
+    """
+    Ensure links of unknown type bypass ff_via on a snapshot, as they do live.
+    """
+    a, b, c = (Vertex() for _ in range(3))
+    uni = Universe(vertices=[a, b, c])
+    TwoEndedLink(a, b)
+    explicit.link_directed(a, c)
+    snap = uni.freeze()
+
+    kwargs = {
+        "unknown_handling": helpers.LNK_UNKNOWN_NEIGHBOR,
+        "ff_via": lambda e, v: False,
+    }
+    for graph in (uni, snap):
+        assert breadthfirst.bft(graph, a, **kwargs) == [a, b]
+        assert depthfirst.dft_recursive(graph, a, **kwargs) == [a, b]
+        assert depthfirst.dft_iterative(graph, a, **kwargs) == [a, b]
+        assert shortestpath.single_pair_shortest_path(
+            graph, a, b, **kwargs
+        ) == ([a, b], 1)
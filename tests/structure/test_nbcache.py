@@ -0,0 +1,288 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for structure.nbcache module.
+"""
+
+import pytest
+from edgegraph.structure import Universe, Vertex, NeighborCachePolicy
+from edgegraph.builder import explicit
+from edgegraph.traversal import helpers, breadthfirst, depthfirst
+
+# W0212 is protected-access, or, access to a protected member (starting with a
+# _) of a client class.  In this case, the test objectives require we inspect
+# internal state of the objects, so we need to read these attributes.
+# pylint: disable=W0212
+
+_FWD = (helpers.DIR_SENS_FORWARD, helpers.LNK_UNKNOWN_ERROR, None)
+
+
+def _star(policy, n=5):
+    """
+    Make a universe with the given policy, holding a center vertex linked to
+    ``n`` others.
+    """
+    uni = Universe(neighbor_cache=policy)
+    center = Vertex(universes=[uni])
+    leaves = [Vertex(universes=[uni]) for _ in range(n)]
+    for leaf in leaves:
+        explicit.link_directed(center, leaf)
+        explicit.link_directed(leaf, center)
+    return uni, center, leaves
+
+
+def test_nbcache_init_errors():
+    """
+    Ensure bad policy options are rejected.
+    """
+    with pytest.raises(ValueError):
+        NeighborCachePolicy(eviction="fifo")
+    with pytest.raises(ValueError):
+        NeighborCachePolicy(max_entries=-1)
+    with pytest.raises(ValueError):
+        NeighborCachePolicy(max_bytes=-1)
+
+
+def test_nbcache_properties():
+    """
+    Ensure the policy options are reported back.
+    """
+    pol = NeighborCachePolicy(
+        max_entries=10, max_bytes=1000, eviction="clock", cache_filtered=True
+    )
+    assert pol.max_entries == 10
+    assert pol.max_bytes == 1000
+    assert pol.eviction == NeighborCachePolicy.CLOCK
+    assert pol.cache_filtered
+    assert NeighborCachePolicy().eviction == NeighborCachePolicy.LRU
+
+
+def test_nbcache_hit():
+    """
+    Ensure lookups are cached in the universe's policy, and hit afterwards.
+    """
+    pol = NeighborCachePolicy()
+    _, center, leaves = _star(pol)
+
+    assert center._qa_neighbors_get(*_FWD) is center._QA_NB_INVALID
+    assert helpers.neighbors(center) == leaves
+    assert len(pol) == 1
+    assert pol.nbytes > 0
+    assert center._qa_neighbors_get(*_FWD) == leaves
+    assert helpers.neighbors(center) == leaves
+
+
+def test_nbcache_not_global():
+    """
+    Ensure vertices outside of a universe with a policy are unaffected by it.
+    """
+    pol = NeighborCachePolicy()
+    _, center, _ = _star(pol)
+
+    lone = Vertex()
+    explicit.link_directed(lone, center)
+    helpers.neighbors(lone)
+
+    assert len(pol) == 0
+
+
+def test_nbcache_invalidate_on_link():
+    """
+    Ensure linking or unlinking a vertex drops its cached lookups.
+    """
+    pol = NeighborCachePolicy()
+    uni, center, leaves = _star(pol)
+
+    helpers.neighbors(center)
+    helpers.neighbors(leaves[0])
+    assert len(pol) == 2
+
+    extra = Vertex(universes=[uni])
+    explicit.link_directed(center, extra)
+    assert len(pol) == 1, "link did not invalidate!"
+    assert helpers.neighbors(center) == leaves + [extra]
+
+    explicit.unlink(center, extra)
+    assert helpers.neighbors(center) == leaves
+
+
+@pytest.mark.parametrize("policy", [False, True])
+def test_nbcache_invalidate_on_reassign(policy):
+    """
+    Ensure reassigning one end of a link drops the cached lookups of the end
+    that stays attached.
+    """
+    uni = Universe(neighbor_cache=NeighborCachePolicy() if policy else None)
+    a, b, c, d = (Vertex(universes=[uni]) for _ in range(4))
+    e = explicit.link_undirected(a, b)
+
+    assert helpers.neighbors(b) == [a]
+    assert helpers.neighbors(b) == [a]
+    e.v1 = c
+    assert helpers.neighbors(b) == [c]
+
+    assert helpers.neighbors(c) == [b]
+    assert helpers.neighbors(c) == [b]
+    e.v2 = d
+    assert helpers.neighbors(c) == [d]
+    assert helpers.neighbors(b) == []
+
+
+def test_nbcache_invalidate_on_universe_removal():
+    """
+    Ensure leaving the universe drops a vertex's cached lookups.
+    """
+    pol = NeighborCachePolicy()
+    uni, center, leaves = _star(pol)
+
+    helpers.neighbors(center)
+    center.remove_from_universe(uni)
+    assert len(pol) == 0
+
+    # changes made while outside must not be hidden when rejoining
+    explicit.unlink(center, leaves[0])
+    center.add_to_universe(uni)
+    assert helpers.neighbors(center) == leaves[1:]
+
+
+def test_nbcache_filtered():
+    """
+    Ensure filtered lookups are only cached if asked for.
+    """
+
+    def ff(_, v):
+        return v is not None
+
+    pol = NeighborCachePolicy()
+    _, center, leaves = _star(pol)
+
+    assert helpers.neighbors(center, filterfunc=ff) == leaves
+    assert center._qa_neighbors_get(*_FWD[:2], ff) is None
+    assert len(pol) == 0
+
+    pol = NeighborCachePolicy(cache_filtered=True)
+    _, center, leaves = _star(pol)
+
+    assert helpers.neighbors(center, filterfunc=ff) == leaves
+    assert len(pol) == 1
+    assert center._qa_neighbors_get(*_FWD[:2], ff) == leaves
+
+
+def test_nbcache_lru():
+    """
+    Ensure the least recently used lookup is evicted first.
+    """
+    pol = NeighborCachePolicy(max_entries=2)
+    _, center, leaves = _star(pol)
+    a, b, c = leaves[:3]
+
+    helpers.neighbors(a)
+    helpers.neighbors(b)
+    # use a again; b is now the least recent
+    helpers.neighbors(a)
+    helpers.neighbors(c)
+
+    assert len(pol) == 2
+    assert a._qa_neighbors_get(*_FWD) == [center]
+    assert b._qa_neighbors_get(*_FWD) is b._QA_NB_INVALID
+    assert c._qa_neighbors_get(*_FWD) == [center]
+
+
+def test_nbcache_clock():
+    """
+    Ensure clock eviction gives used lookups a second chance.
+    """
+    pol = NeighborCachePolicy(max_entries=3, eviction="clock")
+    _, center, leaves = _star(pol)
+    a, b, c, d = leaves[:4]
+
+    helpers.neighbors(a)
+    helpers.neighbors(b)
+    helpers.neighbors(c)
+    # a is referenced, so b (the next in line) goes instead
+    helpers.neighbors(a)
+    helpers.neighbors(d)
+
+    assert len(pol) == 3
+    assert a._qa_neighbors_get(*_FWD) == [center]
+    assert b._qa_neighbors_get(*_FWD) is b._QA_NB_INVALID
+    assert c._qa_neighbors_get(*_FWD) == [center]
+    assert d._qa_neighbors_get(*_FWD) == [center]
+
+
+def test_nbcache_bytes():
+    """
+    Ensure the byte budget is kept.
+    """
+    probe = NeighborCachePolicy()
+    _, center, leaves = _star(probe)
+    helpers.neighbors(leaves[0])
+    one = probe.nbytes
+
+    pol = NeighborCachePolicy(max_bytes=one * 2)
+    _, center, leaves = _star(pol, n=50)
+    for leaf in leaves:
+        helpers.neighbors(leaf)
+        assert pol.nbytes <= one * 2
+    assert len(pol) == 2
+
+    # too big to ever fit; not cached, and nothing else evicted
+    helpers.neighbors(center)
+    assert center._qa_neighbors_get(*_FWD) is center._QA_NB_INVALID
+    assert len(pol) == 2
+
+    pol.clear()
+    assert len(pol) == 0
+    assert pol.nbytes == 0
+
+
+def test_nbcache_zero_entries():
+    """
+    Ensure a zero-size cache caches nothing.
+    """
+    pol = NeighborCachePolicy(max_entries=0)
+    _, center, leaves = _star(pol)
+    assert helpers.neighbors(center) == leaves
+    assert len(pol) == 0
+
+
+def test_nbcache_replace_policy():
+    """
+    Ensure swapping policies does not leave stale lookups behind.
+    """
+    pol = NeighborCachePolicy()
+    uni, center, leaves = _star(pol)
+    helpers.neighbors(center)
+
+    uni.neighbor_cache = None
+    explicit.unlink(center, leaves[0])
+    uni.neighbor_cache = pol
+
+    assert uni.neighbor_cache is pol
+    assert helpers.neighbors(center) == leaves[1:]
+
+
+@pytest.mark.parametrize(
+    "trav",
+    [breadthfirst.bft, depthfirst.dft_recursive, depthfirst.dft_iterative],
+)
+@pytest.mark.parametrize("eviction", ["lru", "clock"])
+def test_nbcache_traversal(graph_clrs09_22_6, trav, eviction):
+    """
+    Ensure traversals give the same answers under a tight cache, before and
+    after the graph changes.
+    """
+    uni, verts = graph_clrs09_22_6
+    expected = trav(uni, verts[0])
+
+    uni.neighbor_cache = NeighborCachePolicy(max_entries=3, eviction=eviction)
+    assert trav(uni, verts[0]) == expected
+    assert trav(uni, verts[0]) == expected
+    assert len(uni.neighbor_cache) <= 3
+
+    explicit.unlink(verts[0], verts[2])
+    uni.neighbor_cache = None
+    expected = trav(uni, verts[0])
+    uni.neighbor_cache = NeighborCachePolicy(max_entries=3, eviction=eviction)
+    assert trav(uni, verts[0]) == expected
@@ -0,0 +1,195 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for structure.pairindex module.
+"""
+
+import pytest
+from edgegraph.structure import (
+    Vertex,
+    DirectedEdge,
+    UnDirectedEdge,
+    CompactVertex,
+)
+from edgegraph.structure.pairindex import PairIndex
+from edgegraph.builder import explicit
+from edgegraph.traversal import helpers
+
+# W0212 is protected-access, or, access to a protected member (starting with a
+# _) of a client class.  In this case, the test objectives require we inspect
+# internal state of the objects, so we need to read these attributes.
+# pylint: disable=W0212
+
+
+@pytest.fixture
+def threshold():
+    """
+    Lower the pair index threshold for the duration of a test.
+    """
+    orig = Vertex.PAIR_INDEX_THRESHOLD
+    Vertex.PAIR_INDEX_THRESHOLD = 4
+    yield 4
+    Vertex.PAIR_INDEX_THRESHOLD = orig
+
+
+def _brute(v1, v2):
+    """
+    Links from v1 whose other end is v2, found the slow way.
+    """
+    return [lnk for lnk in v1.links if lnk.other(v1) is v2]
+
+
+def _check(vert, others):
+    """
+    Ensure the index of ``vert`` agrees with a brute-force search.  (The order
+    of the links may differ, once ends have been reassigned.)
+    """
+    for other in others:
+        found = list(vert._links_to(other))
+        assert len(found) == len(set(found))
+        assert set(found) == set(_brute(vert, other))
+
+
+def _hub(n=6, vcls=Vertex):
+    """
+    Make a hub vertex directed-linked to ``n`` leaves.
+    """
+    hub = vcls()
+    leaves = [vcls() for _ in range(n)]
+    for leaf in leaves:
+        explicit.link_directed(hub, leaf)
+    return hub, leaves
+
+
+def test_pairindex_class():
+    """
+    Basic operation of the index itself.
+    """
+    idx = PairIndex()
+    a, b, c = Vertex(), Vertex(), Vertex()
+    l1, l2 = object(), object()
+
+    idx.update(l1, (a,))
+    idx.update(l2, (a, b))
+    assert len(idx) == 2
+    assert idx.links_to(a) == (l1, l2)
+    assert idx.links_to(b) == (l2,)
+    assert idx.links_to(c) == ()
+
+    idx.update(l1, (c,))
+    assert idx.links_to(a) == (l2,)
+    assert idx.links_to(c) == (l1,)
+
+    idx.discard(l2)
+    idx.discard(l2)
+    assert idx.links_to(a) == ()
+    assert idx.links_to(b) == ()
+    assert idx._by_neighbor == {c: {l1: None}}
+
+    idx.update(l1, ())
+    assert len(idx) == 0
+    assert idx._by_neighbor == {}
+
+
+def test_pairindex_threshold(threshold):
+    """
+    Ensure indexes are only built for vertices with enough links.
+    """
+    hub, leaves = _hub(threshold - 1)
+    assert hub._links_to(leaves[0]) is hub._links
+    assert hub._pair_index is None
+
+    explicit.link_directed(hub, Vertex())
+    assert list(hub._links_to(leaves[0])) == _brute(hub, leaves[0])
+    assert hub._pair_index is not None
+    assert len(hub._pair_index) == threshold
+
+
+def test_pairindex_disabled(threshold):
+    """
+    Ensure setting the threshold to None disables indexing.
+    """
+    Vertex.PAIR_INDEX_THRESHOLD = None
+    hub, leaves = _hub(50)
+    assert hub._links_to(leaves[0]) is hub._links
+    assert hub._pair_index is None
+    assert helpers.find_links(hub, leaves[0]) == set(_brute(hub, leaves[0]))
+
+
+@pytest.mark.parametrize("vcls", [Vertex, CompactVertex])
+def test_pairindex_maintained(monkeypatch, vcls):
+    """
+    Ensure the index follows link additions, removals, and reassignment.
+    """
+    monkeypatch.setattr(vcls, "PAIR_INDEX_THRESHOLD", 4)
+    hub, leaves = _hub(6, vcls)
+    extra = vcls()
+    everyone = [hub, extra, *leaves]
+    hub._links_to(leaves[0])
+    assert hub._pair_index is not None
+
+    # parallel and reverse links
+    e1 = explicit.link_directed(hub, leaves[0])
+    e2 = explicit.link_directed(leaves[1], hub)
+    u1 = explicit.link_undirected(hub, leaves[2])
+    _check(hub, everyone)
+
+    # self-loop
+    loop = explicit.link_directed(hub, hub)
+    assert list(hub._links_to(hub)) == [loop]
+    _check(hub, everyone)
+
+    # removal
+    explicit.unlink(hub, leaves[3])
+    assert list(hub._links_to(leaves[3])) == []
+    hub.remove_from_link(e1)
+    _check(hub, everyone)
+
+    # reassigning the far end, then the near end
+    u1.v2 = extra
+    assert list(hub._links_to(extra)) == [u1]
+    _check(hub, everyone)
+    e2.v1 = extra
+    assert e2 not in hub._links_to(leaves[1])
+    _check(hub, everyone)
+    e2.v1 = leaves[1]
+    _check(hub, everyone)
+
+    # moving one of the hub's links away from the hub entirely
+    first = hub.links[0]
+    first.v1 = extra
+    assert first not in hub._links
+    _check(hub, everyone)
+
+
+def test_pairindex_findlinks(threshold):
+    """
+    Ensure find_links gives the same answers with an index.
+    """
+    hub, leaves = _hub(8)
+    back = DirectedEdge(leaves[0], hub)
+    und = UnDirectedEdge(hub, leaves[1])
+
+    assert helpers.find_links(hub, leaves[0]) == {hub.links[0]}
+    assert helpers.find_links(hub, leaves[0], direction_sensitive=False) == {
+        hub.links[0],
+        back,
+    }
+    assert helpers.find_links(leaves[0], hub) == {back}
+    assert helpers.find_links(hub, leaves[1]) == {hub.links[1], und}
+    assert helpers.find_links(hub, Vertex()) == set()
+
+
+def test_pairindex_dontdup(threshold):
+    """
+    Ensure dontdup finds existing links through the index.
+    """
+    hub, leaves = _hub(8)
+    assert explicit.link_directed(hub, leaves[5], dontdup=True) is hub.links[5]
+    assert hub._pair_index is not None
+    assert explicit.link_undirected(leaves[6], hub, dontdup=True) is (
+        hub.links[6]
+    )
+    new = explicit.link_directed(hub, Vertex(), dontdup=True)
+    assert hub.links[-1] is new
@@ -0,0 +1,147 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for structure.uidgen module.
+"""
+
+import threading
+import pytest
+from edgegraph.structure import (
+    uidgen,
+    BaseObject,
+    Vertex,
+    Universe,
+    DirectedEdge,
+)
+from edgegraph.builder import explicit
+
+
+@pytest.fixture
+def restore_default_generator():
+    """
+    Put the global default UID generator back after a test.
+    """
+    old = uidgen.get_default_generator()
+    yield
+    uidgen.set_default_generator(old)
+
+
+def test_uidgen_random_default():
+    """
+    Ensure random 128-bit UIDs are the default.
+    """
+    assert uidgen.get_default_generator() is uidgen.random_uid
+    uids = {BaseObject().uid for _ in range(100)}
+    assert len(uids) == 100, "random UIDs collided!"
+
+
+def test_uidgen_counter():
+    """
+    Ensure counter generators count independently from their start.
+    """
+    gen = uidgen.counter()
+    assert [gen() for _ in range(3)] == [1, 2, 3]
+
+    other = uidgen.counter(start=100)
+    assert [other() for _ in range(3)] == [100, 101, 102]
+    assert gen() == 4, "counters are not independent!"
+
+    with pytest.raises(ValueError):
+        uidgen.counter(start=0)
+
+
+def test_uidgen_time_node_sequence():
+    """
+    Ensure time + node + sequence UIDs are unique, increasing, and embed the
+    node number.
+    """
+    gen = uidgen.TimeNodeSequence(node=5)
+    assert gen.node == 5
+
+    # plenty to overflow the sequence number within one millisecond
+    uids = [gen() for _ in range(20_000)]
+    assert uids == sorted(uids), "UIDs not increasing!"
+    assert len(set(uids)) == len(uids), "UIDs collided!"
+    assert all(0 < u < (1 << 63) for u in uids), "UIDs exceed 63 bits!"
+    assert all((u >> 12) & 0x3FF == 5 for u in uids), "node number lost!"
+
+    assert 0 <= uidgen.TimeNodeSequence().node < 1024
+
+    with pytest.raises(ValueError):
+        uidgen.TimeNodeSequence(node=1024)
+    with pytest.raises(ValueError):
+        uidgen.TimeNodeSequence(node=-1)
+
+
+def test_uidgen_time_node_sequence_threads():
+    """
+    Ensure time + node + sequence UIDs are unique across threads.
+    """
+    gen = uidgen.TimeNodeSequence(node=1)
+    results = [[] for _ in range(4)]
+
+    def work(out):
+        for _ in range(5000):
+            out.append(gen())
+
+    threads = [threading.Thread(target=work, args=(r,)) for r in results]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    uids = [u for r in results for u in r]
+    assert len(set(uids)) == len(uids), "UIDs collided across threads!"
+
+
+# pylint: disable-next=unused-argument,redefined-outer-name
+def test_uidgen_global(restore_default_generator):
+    """
+    Ensure the global default generator is used, and can be restored.
+    """
+    uidgen.set_default_generator(uidgen.counter(start=10))
+    assert BaseObject().uid == 10
+    assert Vertex().uid == 11
+
+    # explicit UIDs still win
+    assert Vertex(uid=-5).uid == -5
+
+    uidgen.set_default_generator(None)
+    assert uidgen.get_default_generator() is uidgen.random_uid
+
+
+def test_uidgen_universe():
+    """
+    Ensure a universe's generator numbers its vertices and their links.
+    """
+    uni = Universe(uid_generator=uidgen.counter(start=1000))
+    assert uni.uid_generator is not None
+    assert uni.uid > (1 << 64), "universe itself did not use the default!"
+
+    v1 = Vertex(universes=[uni])
+    v2 = Vertex(universes=[uni])
+    assert (v1.uid, v2.uid) == (1000, 1001)
+
+    e = explicit.link_directed(v1, v2)
+    assert e.uid == 1002, "link did not use its vertex's universe generator!"
+
+    # vertices outside of the universe, and links created without vertices,
+    # are unaffected
+    assert Vertex().uid > (1 << 64)
+    assert DirectedEdge().uid > (1 << 64)
+
+    uni.uid_generator = None
+    assert Vertex(universes=[uni]).uid > (1 << 64)
+
+
+def test_uidgen_universe_first_wins():
+    """
+    Ensure the first universe with a generator is the one used.
+    """
+    plain = Universe()
+    u1 = Universe(uid_generator=uidgen.counter(start=1))
+    u2 = Universe(uid_generator=uidgen.counter(start=500))
+
+    assert Vertex(universes=[plain, u2, u1]).uid == 500
+    assert Vertex(universes=[u1, u2]).uid == 1
@@ -5,6 +5,7 @@
 Unit tests for Universe object.
 """
 
+import pytest
 from edgegraph.structure import vertex, universe
 
 
@@ -160,3 +161,37 @@ def test_universe_laws_removal():
     u.laws = None
 
     assert u.laws is None  # still!
+
+
+def test_universe_vertex_membership():
+    """
+    Ensure the universe membership checks agree with the vertices list.
+    """
+    u = universe.Universe()
+    inside = [vertex.Vertex(universes=[u]) for _ in range(10)]
+    outside = [vertex.Vertex() for _ in range(10)]
+
+    for v in inside:
+        assert u.has_vertex(v), "has_vertex missed a member vertex"
+        assert v in u, "`in` operator missed a member vertex"
+
+    for v in outside:
+        assert not u.has_vertex(v), "has_vertex found a non-member vertex"
+        assert v not in u, "`in` operator found a non-member vertex"
+
+    u.remove_vertex(inside[0])
+    assert not u.has_vertex(inside[0]), "has_vertex found a removed vertex"
+    assert inside[0] not in u, "`in` operator found a removed vertex"
+
+    assert u.vertices == inside[1:], "membership index lost insertion order"
+
+
+def test_universe_vertex_remove_nonmember():
+    """
+    Ensure removing a vertex that is not present raises an error.
+    """
+    u = universe.Universe()
+    v = vertex.Vertex()
+
+    with pytest.raises(ValueError):
+        u.remove_vertex(v)
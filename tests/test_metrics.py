@@ -0,0 +1,256 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for the metrics module.
+"""
+
+import gc
+import json
+
+import pytest
+from edgegraph import metrics
+from edgegraph.structure import Universe, Vertex, NeighborCachePolicy
+from edgegraph.builder import explicit
+from edgegraph.traversal import helpers, breadthfirst, depthfirst
+from edgegraph.pathfinding import shortestpath
+
+
+@pytest.fixture
+def counting():
+    """
+    Enable counting with a fresh registry for the duration of a test.
+    """
+    was = metrics.ENABLED
+    metrics.REGISTRY.reset()
+    metrics.enable()
+    yield metrics.REGISTRY
+    if not was:
+        metrics.disable()
+    metrics.REGISTRY.reset()
+
+
+def _line(uni, n=4):
+    """
+    Make a directed line of ``n`` vertices in the given universe.
+    """
+    verts = [Vertex(universes=[uni]) for _ in range(n)]
+    for v1, v2 in zip(verts, verts[1:]):
+        explicit.link_directed(v1, v2)
+    return verts
+
+
+def test_metrics_enable_disable():
+    """
+    Ensure the enable / disable functions toggle the flag.
+    """
+    was = metrics.ENABLED
+    try:
+        metrics.enable()
+        assert metrics.ENABLED
+        metrics.disable()
+        assert not metrics.ENABLED
+    finally:
+        if was:
+            metrics.enable()
+
+
+def test_metrics_registry_basics():
+    """
+    Ensure the registry keeps counters by universe, and sums them.
+    """
+    reg = metrics.MetricsRegistry()
+    uni1 = Universe()
+    uni2 = Universe()
+
+    reg.count(uni1, "a")
+    reg.count(uni1, "a", 2)
+    reg.count(uni2, "a")
+    reg.count(uni2, "b", 5)
+    reg.count(None, "c")
+
+    assert reg.counters(uni1) == {"a": 3}
+    assert reg.counters(uni2) == {"a": 1, "b": 5}
+    assert reg.counters(None) == {"c": 1}
+    assert reg.counters(Universe()) == {}
+    assert reg.totals() == {"a": 4, "b": 5, "c": 1}
+    assert reg.by_universe() == {
+        uni1: {"a": 3},
+        uni2: {"a": 1, "b": 5},
+        None: {"c": 1},
+    }
+
+    # copies, not views
+    reg.counters(uni1)["a"] = 100
+    assert reg.counters(uni1) == {"a": 3}
+
+    reg.reset()
+    assert reg.totals() == {}
+    assert reg.by_universe() == {}
+
+
+def test_metrics_registry_as_dict():
+    """
+    Ensure the structured export is JSON-serializable and complete.
+    """
+    reg = metrics.MetricsRegistry()
+    uni = Universe()
+    reg.count(uni, "a", 2)
+    reg.count(None, "b")
+
+    data = json.loads(json.dumps(reg.as_dict()))
+    assert data["totals"] == {"a": 2, "b": 1}
+    assert data["unscoped"] == {"b": 1}
+    assert data["universes"] == [
+        {"uid": uni.uid, "type": "Universe", "counters": {"a": 2}}
+    ]
+
+
+def test_metrics_registry_weak():
+    """
+    Ensure the registry does not keep universes alive.
+    """
+    reg = metrics.MetricsRegistry()
+    uni = Universe()
+    reg.count(uni, "a")
+    del uni
+    gc.collect()
+    assert reg.by_universe() == {}
+
+
+def test_metrics_disabled_counts_nothing():
+    """
+    Ensure nothing is counted while disabled.
+    """
+    was = metrics.ENABLED
+    metrics.disable()
+    metrics.REGISTRY.reset()
+    try:
+        uni = Universe(neighbor_cache=NeighborCachePolicy())
+        verts = _line(uni)
+        breadthfirst.bft(uni, verts[0])
+        breadthfirst.bft(uni, verts[0])
+        assert metrics.REGISTRY.totals() == {}
+    finally:
+        if was:
+            metrics.enable()
+
+
+def test_metrics_no_per_vertex_growth():
+    """
+    Ensure creating vertices does not grow any global state.
+    """
+    assert not hasattr(Vertex, "_CACHE_STATS")
+    before = metrics.REGISTRY.totals()
+    for _ in range(100):
+        Vertex()
+    assert metrics.REGISTRY.totals() == before
+
+
+def test_metrics_nbcache_policy(counting):
+    """
+    Ensure neighbor cache events are counted under the vertex's universe.
+    """
+    uni = Universe(neighbor_cache=NeighborCachePolicy(max_entries=2))
+    other = Universe()
+    verts = _line(uni)
+    counting.reset()
+
+    breadthfirst.bft(uni, verts[0])
+    cnt = counting.counters(uni)
+    assert cnt["traversal.ibft"] == 1
+    assert cnt["neighbors.calls"] == 4
+    assert cnt["nbcache.misses"] == 4
+    assert cnt["nbcache.insertions"] == 4
+    assert cnt["nbcache.evictions"] == 2
+    assert "nbcache.hits" not in cnt
+
+    helpers.neighbors(verts[3])
+    assert counting.counters(uni)["nbcache.hits"] == 1
+
+    explicit.link_directed(verts[3], verts[0])
+    assert counting.counters(uni)["nbcache.invalidations"] == 2
+
+    assert counting.counters(other) == {}
+
+
+def test_metrics_nbcache_legacy(counting):
+    """
+    Ensure the per-vertex cache is counted, and total_cache_stats reports it.
+    """
+    was = Vertex.NEIGHBOR_CACHING
+    Vertex.NEIGHBOR_CACHING = True
+    try:
+        uni = Universe()
+        verts = _line(uni, 3)
+        counting.reset()
+
+        depthfirst.dft_iterative(uni, verts[0])
+        depthfirst.dft_iterative(uni, verts[0])
+        cnt = counting.counters(uni)
+        assert cnt["traversal.idft_iterative"] == 2
+        assert cnt["nbcache.misses"] == 3
+        assert cnt["nbcache.insertions"] == 3
+        assert cnt["nbcache.hits"] == 3
+
+        stats = Vertex.total_cache_stats()
+        assert "Hits:          3" in stats
+        assert "Misses:        3" in stats
+        assert "DISABLED" not in stats
+    finally:
+        Vertex.NEIGHBOR_CACHING = was
+
+
+def test_metrics_nocache_not_counted(counting):
+    """
+    Ensure uncached lookups count as calls, but not as cache misses.
+    """
+    was = Vertex.NEIGHBOR_CACHING
+    Vertex.NEIGHBOR_CACHING = False
+    try:
+        uni = Universe()
+        verts = _line(uni, 3)
+        counting.reset()
+
+        breadthfirst.bft(uni, verts[0])
+        cnt = counting.counters(uni)
+        assert cnt == {"traversal.ibft": 1, "neighbors.calls": 3}
+    finally:
+        Vertex.NEIGHBOR_CACHING = was
+
+
+def test_metrics_traversal_entries(counting):
+    """
+    Ensure traversal and pathfinding calls are counted.
+    """
+    uni = Universe()
+    verts = _line(uni, 3)
+
+    breadthfirst.bfs(uni, verts[0], "x", 1)
+    depthfirst.dft_recursive(uni, verts[0])
+    depthfirst.dfs_recursive(uni, verts[0], "x", 1)
+    depthfirst.dfs_iterative(uni, verts[0], "x", 1)
+    shortestpath.single_pair_shortest_path(uni, verts[0], verts[2])
+
+    cnt = counting.counters(uni)
+    for name in (
+        "traversal.bfs",
+        "traversal.idft_recursive",
+        "traversal.dfs_recursive",
+        "traversal.dfs_iterative",
+        "pathfinding.single_pair_shortest_path",
+    ):
+        assert cnt[name] == 1
+
+
+def test_metrics_total_cache_stats_disabled():
+    """
+    Ensure the summary says so when counting is disabled.
+    """
+    was = metrics.ENABLED
+    metrics.disable()
+    try:
+        assert "DISABLED" in Vertex.total_cache_stats()
+    finally:
+        if was:
+            metrics.enable()
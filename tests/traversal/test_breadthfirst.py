@@ -5,9 +5,10 @@
 Unit tests for traversal.breadthfirst module.
 """
 
+import random
 import pytest
 from edgegraph.structure import Vertex, Universe
-from edgegraph.traversal import breadthfirst
+from edgegraph.traversal import breadthfirst, helpers
 from edgegraph.builder import explicit
 
 # everything except 1 and 4 should be findable from the starting vertex
@@ -224,6 +225,260 @@ def test_bft_ff_via_and_result(graph_clrs09_22_6):
     assert trav == {6, 8}
 
 
+def _hops_by_bft(uni, start, dest, **kwargs):
+    """
+    Fewest hops from start to dest, found the slow way.
+    """
+    depth = {start: 0}
+    for v in breadthfirst.bft(uni, start, **kwargs):
+        if v is dest:
+            return depth[v]
+        for w in helpers.neighbors(v, **kwargs):
+            depth.setdefault(w, depth[v] + 1)
+    return None
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+@pytest.mark.parametrize(
+    "direction",
+    [
+        helpers.DIR_SENS_FORWARD,
+        helpers.DIR_SENS_BACKWARD,
+        helpers.DIR_SENS_ANY,
+    ],
+)
+@pytest.mark.parametrize("seed", range(3))
+def test_shortest_hops_matches_bft(seed, direction, frozen):
+    """
+    Ensure the bidirectional search finds paths as short as a one-way
+    traversal does.
+    """
+    rng = random.Random(seed)
+    verts = [Vertex(attributes={"i": i}) for i in range(80)]
+    for _ in range(160):
+        explicit.link_directed(rng.choice(verts), rng.choice(verts))
+    uni = Universe(vertices=verts)
+    search = uni.freeze() if frozen else uni
+
+    for _ in range(30):
+        start, dest = rng.choice(verts), rng.choice(verts)
+        path = breadthfirst.shortest_hops(
+            search, start, dest, direction_sensitive=direction
+        )
+        hops = _hops_by_bft(uni, start, dest, direction_sensitive=direction)
+
+        if hops is None:
+            assert path is None
+            continue
+        assert len(path) - 1 == hops
+        assert path[0] is start and path[-1] is dest
+        for u, v in zip(path, path[1:]):
+            assert v in helpers.neighbors(u, direction_sensitive=direction)
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+def test_shortest_hops_ff_via(graph_clrs09_22_6, frozen):
+    """
+    Ensure the filter is honored by both halves of the search.
+    """
+    uni, verts = graph_clrs09_22_6
+    if frozen:
+        uni = uni.freeze()
+
+    # q -> t -> y is the way from q to y; q -> w -> ... is not
+    path = breadthfirst.shortest_hops(uni, verts[0], verts[8])
+    assert path == [verts[0], verts[3], verts[8]]
+
+    # without t, y is unreachable
+    path = breadthfirst.shortest_hops(
+        uni, verts[0], verts[8], ff_via=lambda e, v: v is not verts[3]
+    )
+    assert path is None
+
+    # the destination itself may be filtered
+    path = breadthfirst.shortest_hops(
+        uni, verts[0], verts[8], ff_via=lambda e, v: v is not verts[8]
+    )
+    assert path is None
+
+
+def test_shortest_hops_trivial(graph_clrs09_22_6):
+    """
+    Ensure the edge cases are handled.
+    """
+    uni, verts = graph_clrs09_22_6
+
+    assert breadthfirst.shortest_hops(uni, verts[0], verts[0]) == [verts[0]]
+    assert breadthfirst.shortest_hops(Universe(), verts[0], verts[1]) is None
+    with pytest.raises(ValueError):
+        breadthfirst.shortest_hops(uni, Vertex(), verts[1])
+    assert breadthfirst.shortest_hops(uni, verts[0], Vertex()) is None
+
+
+def _random_uni(seed, nverts=80, nedges=160):
+    """
+    Make a random directed graph.
+    """
+    rng = random.Random(seed)
+    verts = [Vertex(attributes={"i": i}) for i in range(nverts)]
+    for _ in range(nedges):
+        explicit.link_directed(rng.choice(verts), rng.choice(verts))
+    return Universe(vertices=verts), verts
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+@pytest.mark.parametrize(
+    "direction", [helpers.DIR_SENS_FORWARD, helpers.DIR_SENS_ANY]
+)
+@pytest.mark.parametrize("seed", range(3))
+def test_ibft_depths(seed, direction, frozen):
+    """
+    Ensure depths are hop counts, the order is that of the plain traversal,
+    and the layers agree with both.
+    """
+    uni, verts = _random_uni(seed)
+    search = uni.freeze() if frozen else uni
+    kwargs = {
+        "direction_sensitive": direction,
+        "ff_via": lambda e, v: v.i % 9 != 4,
+    }
+
+    plain = breadthfirst.bft(search, verts[0], **kwargs)
+    deep = breadthfirst.bft(search, verts[0], yield_depth=True, **kwargs)
+    layers = list(breadthfirst.ibft_layers(search, verts[0], **kwargs))
+
+    assert [v for v, _ in deep] == plain
+    assert [v for layer in layers for v in layer] == plain
+    for v, depth in deep:
+        assert len(breadthfirst.shortest_hops(uni, verts[0], v, **kwargs)) == (
+            depth + 1
+        )
+        assert v in layers[depth]
+
+    for k in range(4):
+        within = breadthfirst.bft(search, verts[0], max_depth=k, **kwargs)
+        assert within == [v for v, d in deep if d <= k]
+        assert list(
+            breadthfirst.ibft_layers(search, verts[0], max_depth=k, **kwargs)
+        ) == layers[: k + 1]
+
+
+def test_ibft_max_depth_work():
+    """
+    Ensure nothing beyond the cutoff is looked at.
+    """
+    verts = [Vertex() for _ in range(100)]
+    for u, v in zip(verts, verts[1:]):
+        explicit.link_directed(u, v)
+    uni = Universe(vertices=verts)
+
+    seen = []
+    trav = breadthfirst.bft(
+        uni,
+        verts[0],
+        max_depth=3,
+        ff_via=lambda e, v: seen.append(v) or True,
+    )
+
+    assert trav == verts[:4]
+    assert seen == verts[1:4]
+
+
+def test_ibft_layers_filters(graph_clrs09_22_6):
+    """
+    Ensure ff_result applies within layers, keeping empty ones in place.
+    """
+    uni, verts = graph_clrs09_22_6
+
+    full = list(breadthfirst.ibft_layers(uni, verts[0]))
+    kept = list(
+        breadthfirst.ibft_layers(uni, verts[0], ff_result=lambda v: v.i > 2)
+    )
+
+    assert len(kept) == len(full)
+    assert kept[0] == []
+    for a, b in zip(full, kept):
+        assert [v for v in a if v.i > 2] == b
+    assert list(
+        breadthfirst.ibft(uni, verts[0], yield_depth=True, max_depth=1)
+    ) == [(v, d) for d, layer in enumerate(full[:2]) for v in layer]
+
+
+def test_ibft_layers_edges(graph_clrs09_22_6):
+    """
+    Ensure the odd cases are handled.
+    """
+    uni, verts = graph_clrs09_22_6
+
+    assert list(breadthfirst.ibft_layers(Universe(), verts[0])) == []
+    assert list(breadthfirst.ibft_layers(uni, verts[0], max_depth=0)) == [
+        [verts[0]]
+    ]
+    with pytest.raises(ValueError):
+        list(breadthfirst.ibft_layers(uni, Vertex()))
+    with pytest.raises(ValueError):
+        list(breadthfirst.ibft_layers(uni, verts[0], max_depth=-1))
+    with pytest.raises(ValueError):
+        breadthfirst.bft(uni, verts[0], max_depth=-1)
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+@pytest.mark.parametrize("seed", range(3))
+def test_ibft_multi_source(seed, frozen):
+    """
+    Ensure a traversal from several vertices is one from a single vertex
+    linked to each of them, less that vertex.
+    """
+    uni, verts = _random_uni(seed)
+    starts = verts[:5]
+    root = Vertex()
+    for v in starts:
+        explicit.link_directed(root, v)
+    rooted = Universe(vertices=verts + [root])
+    if frozen:
+        uni, rooted = uni.freeze(), rooted.freeze()
+
+    expect = [
+        (v, d - 1)
+        for v, d in breadthfirst.bft(rooted, root, yield_depth=True)[1:]
+    ]
+
+    assert breadthfirst.bft(uni, starts, yield_depth=True) == expect
+    assert breadthfirst.bft(uni, starts) == [v for v, _ in expect]
+    assert breadthfirst.bft(uni, starts, max_depth=1) == [
+        v for v, d in expect if d <= 1
+    ]
+    layers = list(breadthfirst.ibft_layers(uni, starts))
+    assert layers[0] == starts
+    assert [(v, d) for d, layer in enumerate(layers) for v in layer] == expect
+    for v, d in expect:
+        path = breadthfirst.shortest_hops(uni, starts, v)
+        assert path[0] in starts
+        assert len(path) == d + 1
+    target = expect[-1][0]
+    assert breadthfirst.bfs(uni, starts, "i", target.i) is target
+
+
+def test_ibft_multi_source_edges(graph_clrs09_22_6):
+    """
+    Ensure the odd cases of several start vertices are handled.
+    """
+    uni, verts = graph_clrs09_22_6
+
+    assert breadthfirst.bft(uni, [verts[3], verts[0], verts[3]])[:2] == [
+        verts[3],
+        verts[0],
+    ]
+    assert breadthfirst.bft(uni, []) == []
+    assert breadthfirst.bft(Universe(), [verts[0]]) == []
+    with pytest.raises(ValueError):
+        breadthfirst.bft(uni, [verts[0], Vertex()])
+    assert breadthfirst.shortest_hops(uni, [verts[1], verts[2]], verts[2]) == [
+        verts[2]
+    ]
+    assert breadthfirst.bfs(uni, [verts[1], verts[0]], "i", 0) is verts[0]
+
+
 ###############################################################################
 # stress testing
 
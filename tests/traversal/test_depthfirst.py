@@ -6,9 +6,10 @@ Unit tests for traversal.depthfirst module.
 """
 
 import itertools
+import random
 import pytest
 from edgegraph.structure import Vertex, Universe
-from edgegraph.traversal import depthfirst
+from edgegraph.traversal import depthfirst, helpers
 from edgegraph.builder import explicit
 
 ###############################################################################
@@ -190,6 +191,170 @@ def test_dft_ff_via_and_result(graph_clrs09_22_6, func):
     assert trav == {6, 8}
 
 
+@pytest.mark.parametrize("frozen", [False, True])
+@pytest.mark.parametrize("starts", [(0, 1), (1, 0), (4, 1, 0), (2, 2)])
+@pytest.mark.parametrize("func", travs)
+def test_dft_forest(graph_clrs09_22_6, func, starts, frozen):
+    """
+    Ensure several start vertices are each traversed from in turn, skipping
+    what an earlier one already visited.
+    """
+    uni, verts = graph_clrs09_22_6
+    if frozen:
+        uni = uni.freeze()
+
+    expect = []
+    for i in starts:
+        expect += [v for v in func(uni, verts[i]) if v not in expect]
+
+    assert func(uni, [verts[i] for i in starts]) == expect
+    assert func(uni, []) == []
+    with pytest.raises(ValueError):
+        func(uni, [verts[0], Vertex()])
+
+
+def _naive_dfti(uni, start, **kwargs):
+    """
+    The iterative traversal as first written; every neighbor pushed, and
+    visited vertices skipped only when popped.
+    """
+    stack = [start]
+    discovered = []
+    while stack:
+        v = stack.pop()
+        if v in discovered or not uni.has_vertex(v):
+            continue
+        discovered.append(v)
+        stack.extend(helpers.ineighbors(v, **kwargs))
+    return discovered
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+@pytest.mark.parametrize(
+    "direction", [helpers.DIR_SENS_FORWARD, helpers.DIR_SENS_ANY]
+)
+@pytest.mark.parametrize("seed", range(4))
+def test_dfti_order_kept(seed, direction, frozen):
+    """
+    Ensure skipping visited neighbors at push time leaves the order as it was.
+    """
+    rng = random.Random(seed)
+    verts = [Vertex(attributes={"i": i}) for i in range(60)]
+    for _ in range(150):
+        explicit.link_directed(rng.choice(verts), rng.choice(verts))
+    uni = Universe(vertices=verts[:50])
+    search = uni.freeze() if frozen else uni
+
+    expect = _naive_dfti(uni, verts[0], direction_sensitive=direction)
+
+    trav = depthfirst.dft_iterative(
+        search, verts[0], direction_sensitive=direction
+    )
+    assert trav == expect
+    if direction == helpers.DIR_SENS_FORWARD:
+        for v in verts:
+            found = depthfirst.dfs_iterative(search, verts[0], "i", v.i)
+            assert found is (v if v in expect else None)
+
+
+def _naive_dftr(uni, start, **kwargs):
+    """
+    The recursive traversal as first written, noting discovery and finish
+    times as it goes.
+    """
+    times = {}
+    clock = [0]
+
+    def recur(v):
+        clock[0] += 1
+        times[v] = clock[0]
+        for w in helpers.ineighbors(v, **kwargs):
+            if uni.has_vertex(w) and w not in times:
+                recur(w)
+        clock[0] += 1
+        times[v] = (times[v], clock[0])
+
+    recur(start)
+    return times
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+@pytest.mark.parametrize(
+    "direction", [helpers.DIR_SENS_FORWARD, helpers.DIR_SENS_ANY]
+)
+@pytest.mark.parametrize("seed", range(4))
+def test_dftr_order_kept(seed, direction, frozen):
+    """
+    Ensure the explicit stack gives the order (and times) of true recursion.
+    """
+    rng = random.Random(seed)
+    verts = [Vertex(attributes={"i": i}) for i in range(60)]
+    for _ in range(150):
+        explicit.link_directed(rng.choice(verts), rng.choice(verts))
+    uni = Universe(vertices=verts[:50])
+    search = uni.freeze() if frozen else uni
+    kwargs = {
+        "direction_sensitive": direction,
+        "filterfunc": lambda e, v: v.i % 7 != 3,
+    }
+
+    expect = _naive_dftr(uni, verts[0], **kwargs)
+
+    ff_via = kwargs.pop("filterfunc")
+    trav = depthfirst.dft_recursive(search, verts[0], ff_via=ff_via, **kwargs)
+    assert trav == list(expect)
+    times = depthfirst.dft_timestamps(
+        search, verts[0], ff_via=ff_via, **kwargs
+    )
+    assert times == expect
+    assert list(times) == trav
+    if direction == helpers.DIR_SENS_FORWARD:
+        plain = _naive_dftr(uni, verts[0])
+        for v in verts:
+            found = depthfirst.dfs_recursive(search, verts[0], "i", v.i)
+            assert found is (v if v in plain else None)
+
+
+def test_dft_timestamps(graph_clrs09_22_6):
+    """
+    Ensure the times nest as they should, and carry on across start vertices.
+    """
+    uni, verts = graph_clrs09_22_6
+
+    times = depthfirst.dft_timestamps(uni, [verts[0], verts[1]])
+
+    ticks = sorted(t for pair in times.values() for t in pair)
+    assert ticks == list(range(1, 2 * len(times) + 1))
+    assert times[verts[0]][0] == 1
+    assert times[verts[1]][0] == times[verts[0]][1] + 1
+    for u, (du, fu) in times.items():
+        assert du < fu
+        for v, (dv, fv) in times.items():
+            # the intervals of any two vertices are nested or disjoint
+            assert (fu < dv) or (fv < du) or (du < dv < fv < fu) or (
+                dv <= du < fu <= fv
+            )
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+def test_dft_deep(frozen):
+    """
+    Ensure a path far longer than the recursion limit is handled.
+    """
+    verts = [Vertex(attributes={"i": i}) for i in range(20000)]
+    for u, v in zip(verts, verts[1:]):
+        explicit.link_directed(u, v)
+    uni = Universe(vertices=verts)
+    if frozen:
+        uni = uni.freeze()
+
+    assert depthfirst.dft_recursive(uni, verts[0]) == verts
+    assert depthfirst.dfs_recursive(uni, verts[0], "i", 19999) is verts[-1]
+    times = depthfirst.dft_timestamps(uni, verts[0])
+    assert times[verts[0]] == (1, 40000)
+    assert times[verts[-1]] == (20000, 20001)
+
+
 ###############################################################################
 # searches!
 
@@ -294,6 +459,21 @@ def test_dfs_none_universe(graph_clrs09_22_6, func):
     assert vert is verts[8], f"{func} did not find answer with uni = None!"
 
 
+@pytest.mark.parametrize("frozen", [False, True])
+@pytest.mark.parametrize("func", searches)
+def test_dfs_forest(graph_clrs09_22_6, func, frozen):
+    """
+    Ensure searches from several start vertices look below each in turn.
+    """
+    uni, verts = graph_clrs09_22_6
+    if frozen:
+        uni = uni.freeze()
+
+    assert func(uni, [verts[0]], "i", 1) is None
+    assert func(uni, [verts[0], verts[1]], "i", 1) is verts[1]
+    assert func(uni, [verts[0], verts[1]], "i", -1) is None
+
+
 ###############################################################################
 # stress testing
 
@@ -474,6 +474,81 @@ def test_neighbors_filter_func_subclass_undirected_backwards():
     assert nb3 == {v[2], v[3], v[5]}, "nb3 yielded wrong traversal!"
 
 
+def test_neighbors_mixed_link_order():
+    """
+    Ensure vertices with both directed and undirected links give neighbors in
+    link order.
+    """
+    v = [Vertex() for _ in range(5)]
+    explicit.link_directed(v[0], v[1])
+    explicit.link_undirected(v[0], v[2])
+    explicit.link_directed(v[3], v[0])
+    explicit.link_undirected(v[4], v[0])
+
+    fwd = helpers.neighbors(v[0])
+    bwd = helpers.neighbors(v[0], direction_sensitive=helpers.DIR_SENS_BACKWARD)
+    anyd = helpers.neighbors(v[0], direction_sensitive=helpers.DIR_SENS_ANY)
+
+    assert fwd == [v[1], v[2], v[4]], "forward mixed neighbors wrong!"
+    assert bwd == [v[2], v[3], v[4]], "backward mixed neighbors wrong!"
+    assert anyd == [v[1], v[2], v[3], v[4]], "any-direction neighbors wrong!"
+
+
+def test_ineighbor_links():
+    """
+    Ensure ineighbor_links gives each link taken along with its neighbor.
+    """
+    v = [Vertex() for _ in range(4)]
+    e1 = explicit.link_directed(v[0], v[1])
+    e2 = explicit.link_directed(v[0], v[1])
+    u1 = explicit.link_undirected(v[2], v[0])
+    e3 = explicit.link_directed(v[3], v[0])
+
+    fwd = list(helpers.ineighbor_links(v[0]))
+    bwd = list(
+        helpers.ineighbor_links(
+            v[0], direction_sensitive=helpers.DIR_SENS_BACKWARD
+        )
+    )
+    anyd = list(
+        helpers.ineighbor_links(v[0], direction_sensitive=helpers.DIR_SENS_ANY)
+    )
+    filt = list(helpers.ineighbor_links(v[0], filterfunc=lambda e, v2: e is e2))
+
+    assert fwd == [(e1, v[1]), (e2, v[1]), (u1, v[2])]
+    assert bwd == [(u1, v[2]), (e3, v[3])]
+    assert anyd == [(e1, v[1]), (e2, v[1]), (u1, v[2]), (e3, v[3])]
+    assert filt == [(e2, v[1])]
+
+
+def test_ineighbor_links_unknown_link_type():
+    """
+    Ensure ineighbor_links handles unknown edge types like neighbors does.
+    """
+    v = [Vertex() for _ in range(3)]
+    e1 = explicit.link_directed(v[0], v[1])
+    t1 = TwoEndedLink(v[0], v[2])
+
+    with pytest.raises(NotImplementedError):
+        list(helpers.ineighbor_links(v[0]))
+
+    nb = list(
+        helpers.ineighbor_links(
+            v[0],
+            unknown_handling=helpers.LNK_UNKNOWN_NEIGHBOR,
+            filterfunc=lambda e, v2: False,
+        )
+    )
+    nonnb = list(
+        helpers.ineighbor_links(
+            v[0], unknown_handling=helpers.LNK_UNKNOWN_NONNEIGHBOR
+        )
+    )
+    # unknown links bypass the filterfunc, as they do for neighbors()
+    assert nb == [(t1, v[2])]
+    assert nonnb == [(e1, v[1])]
+
+
 def test_neighbors_bad_directionality(graph_clrs09_22_6):
     """
     Ensure an exception is raised when an invalid value is passed to the
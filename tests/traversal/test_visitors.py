@@ -0,0 +1,309 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for traversal.visitors module.
+"""
+
+import random
+import pytest
+from edgegraph.structure import Vertex, Universe
+from edgegraph.traversal import breadthfirst, depthfirst, helpers, visitors
+from edgegraph.builder import explicit
+
+traversals = [
+    breadthfirst.bft,
+    depthfirst.dft_recursive,
+    depthfirst.dft_iterative,
+]
+
+
+class _Recorder(visitors.Visitor):
+    """
+    Note every event, in order.
+    """
+
+    def __init__(self):
+        self.events = []
+
+    def start_vertex(self, v):
+        self.events.append(("start", v.i))
+
+    def discover_vertex(self, v):
+        self.events.append(("discover", v.i))
+
+    def examine_edge(self, e, u, v):
+        self.events.append(("examine", u.i, v.i))
+
+    def tree_edge(self, e, u, v):
+        self.events.append(("tree", u.i, v.i))
+
+    def back_edge(self, e, u, v):
+        self.events.append(("back", u.i, v.i))
+
+    def forward_or_cross_edge(self, e, u, v):
+        self.events.append(("forward_or_cross", u.i, v.i))
+
+    def non_tree_edge(self, e, u, v):
+        self.events.append(("non_tree", u.i, v.i))
+
+    def finish_vertex(self, v):
+        self.events.append(("finish", v.i))
+
+
+def _kinds_graph():
+    """
+    a -> b -> c -> a, a -> c, and d -> c; with a back edge (c, a), a forward
+    edge (a, c), and a cross edge (d, c).
+    """
+    verts = [Vertex(attributes={"i": i}) for i in range(4)]
+    a, b, c, d = verts
+    links = {
+        "ab": explicit.link_directed(a, b),
+        "bc": explicit.link_directed(b, c),
+        "ca": explicit.link_directed(c, a),
+        "ac": explicit.link_directed(a, c),
+        "dc": explicit.link_directed(d, c),
+    }
+    return Universe(vertices=verts), verts, links
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+@pytest.mark.parametrize("trav", traversals)
+@pytest.mark.parametrize(
+    "direction", [helpers.DIR_SENS_FORWARD, helpers.DIR_SENS_ANY]
+)
+@pytest.mark.parametrize("seed", range(3))
+def test_visitor_order_kept(seed, direction, trav, frozen):
+    """
+    Ensure attaching visitors changes nothing about the traversal itself.
+    """
+    rng = random.Random(seed)
+    verts = [Vertex(attributes={"i": i}) for i in range(60)]
+    for _ in range(150):
+        explicit.link_directed(rng.choice(verts), rng.choice(verts))
+    uni = Universe(vertices=verts[:50])
+    search = uni.freeze() if frozen else uni
+    kwargs = {
+        "direction_sensitive": direction,
+        "ff_via": lambda e, v: v.i % 7 != 3,
+        "ff_result": lambda v: v.i % 2 == 0,
+    }
+
+    expect = trav(search, [verts[0], verts[1]], **kwargs)
+    rec = _Recorder()
+    got = trav(search, [verts[0], verts[1]], visitor=rec, **kwargs)
+
+    assert got == expect
+    discovered = [ev[1] for ev in rec.events if ev[0] == "discover"]
+    assert [v.i for v in got] == [i for i in discovered if i % 2 == 0]
+    assert all(v.i < 50 and v.i % 7 != 3 for v in got if v.i > 1)
+
+
+def test_dftr_events():
+    """
+    Ensure the recursive-order depth-first traversal calls its hooks in the
+    right order, and tells the kinds of edges apart.
+    """
+    uni, verts, _ = _kinds_graph()
+    a, _, _, d = verts
+    rec = _Recorder()
+
+    depthfirst.dft_recursive(uni, [a, d], visitor=rec)
+
+    assert rec.events == [
+        ("start", 0),
+        ("discover", 0),
+        ("examine", 0, 1),
+        ("tree", 0, 1),
+        ("discover", 1),
+        ("examine", 1, 2),
+        ("tree", 1, 2),
+        ("discover", 2),
+        ("examine", 2, 0),
+        ("back", 2, 0),
+        ("finish", 2),
+        ("finish", 1),
+        ("examine", 0, 2),
+        ("forward_or_cross", 0, 2),
+        ("finish", 0),
+        ("start", 3),
+        ("discover", 3),
+        ("examine", 3, 2),
+        ("forward_or_cross", 3, 2),
+        ("finish", 3),
+    ]
+
+
+def test_bft_events():
+    """
+    Ensure the breadth-first traversal calls its hooks in the right order.
+    """
+    uni, verts, _ = _kinds_graph()
+    rec = _Recorder()
+
+    breadthfirst.bft(uni, verts[0], visitor=rec)
+
+    assert rec.events == [
+        ("start", 0),
+        ("discover", 0),
+        ("examine", 0, 1),
+        ("tree", 0, 1),
+        ("discover", 1),
+        ("examine", 0, 2),
+        ("tree", 0, 2),
+        ("discover", 2),
+        ("finish", 0),
+        ("examine", 1, 2),
+        ("non_tree", 1, 2),
+        ("finish", 1),
+        ("examine", 2, 0),
+        ("non_tree", 2, 0),
+        ("finish", 2),
+    ]
+
+
+def test_dfti_events():
+    """
+    Ensure the iterative depth-first traversal gives each vertex the tree
+    edge it was actually discovered over.
+    """
+    uni, verts, _ = _kinds_graph()
+    rec = _Recorder()
+
+    depthfirst.dft_iterative(uni, verts[0], visitor=rec)
+
+    assert rec.events == [
+        ("start", 0),
+        ("discover", 0),
+        ("examine", 0, 1),
+        ("examine", 0, 2),
+        ("tree", 0, 2),
+        ("discover", 2),
+        ("examine", 2, 0),
+        ("non_tree", 2, 0),
+        ("tree", 0, 1),
+        ("discover", 1),
+        ("examine", 1, 2),
+        ("non_tree", 1, 2),
+    ]
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+def test_edge_classes(frozen):
+    """
+    Ensure the edge class visitor sorts every link met.
+    """
+    uni, verts, links = _kinds_graph()
+    search = uni.freeze() if frozen else uni
+    kinds = visitors.EdgeClassVisitor()
+
+    depthfirst.dft_recursive(search, [verts[0], verts[3]], visitor=kinds)
+
+    assert kinds.of_kind("tree") == [links["ab"], links["bc"]]
+    assert kinds.of_kind("back") == [links["ca"]]
+    assert kinds.of_kind("forward_or_cross") == [links["ac"], links["dc"]]
+    assert kinds.of_kind("non_tree") == []
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+def test_undirected_classified_once(frozen):
+    """
+    Ensure links followed both ways are examined from each end, but given
+    only one kind.
+    """
+    verts = [Vertex(attributes={"i": i}) for i in range(3)]
+    explicit.link_undirected(verts[0], verts[1])
+    across = explicit.link_undirected(verts[1], verts[2])
+    closing = explicit.link_undirected(verts[2], verts[0])
+    uni = Universe(vertices=verts)
+    search = uni.freeze() if frozen else uni
+
+    rec = _Recorder()
+    kinds = visitors.EdgeClassVisitor()
+    depthfirst.dft_recursive(search, verts[0], visitor=[rec, kinds])
+
+    assert sum(ev[0] == "examine" for ev in rec.events) == 6
+    assert len(kinds.kinds) == 3
+    assert kinds.of_kind("back") == [closing]
+
+    kinds = visitors.EdgeClassVisitor()
+    breadthfirst.bft(search, verts[0], visitor=kinds)
+    assert kinds.of_kind("non_tree") == [across]
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+def test_shared_pass(graph_clrs09_22_6, frozen):
+    """
+    Ensure several visitors sharing one pass each get what they would alone.
+    """
+    uni, verts = graph_clrs09_22_6
+    search = uni.freeze() if frozen else uni
+    parents = visitors.ParentVisitor()
+    depths = visitors.DepthVisitor()
+    times = visitors.TimestampVisitor()
+
+    order = depthfirst.dft_recursive(
+        search, verts[0], visitor=[parents, depths, times]
+    )
+
+    assert list(times.times) == order
+    assert times.times == depthfirst.dft_timestamps(search, verts[0])
+    for v in order:
+        path = parents.path_to(v)
+        assert path[0] is verts[0]
+        assert path[-1] is v
+        assert depths.depths[v] == len(path) - 1
+        for u, w in zip(path, path[1:]):
+            assert parents.links[w] in helpers.find_links(u, w)
+    assert parents.path_to(verts[1]) is None
+
+
+def test_bft_depths(graph_clrs09_22_6):
+    """
+    Ensure depths of a breadth-first traversal are the fewest hops.
+    """
+    uni, verts = graph_clrs09_22_6
+    depths = visitors.DepthVisitor()
+
+    breadthfirst.bft(uni, verts[1], visitor=depths)
+
+    expect = dict(breadthfirst.bft(uni, verts[1], yield_depth=True))
+    assert depths.depths == expect
+
+
+def test_hooks_overridden_only():
+    """
+    Ensure hooks are only looked up where a visitor overrides them, and are
+    combined across several visitors.
+    """
+    times = visitors.TimestampVisitor()
+    depths = visitors.DepthVisitor()
+
+    # pylint: disable-next=protected-access
+    hooks = visitors._hooks(times)
+    assert hooks["discover_vertex"] == times.discover_vertex
+    assert hooks["examine_edge"] is None
+
+    # pylint: disable-next=protected-access
+    hooks = visitors._hooks([times, depths])
+    assert hooks["start_vertex"] == depths.start_vertex
+    assert hooks["tree_edge"] == depths.tree_edge
+    assert hooks["back_edge"] is None
+    assert set(hooks) == set(visitors.HOOKS)
+
+
+def test_visitor_depth_options(graph_clrs09_22_6):
+    """
+    Ensure visitors are refused alongside the depth options.
+    """
+    uni, verts = graph_clrs09_22_6
+
+    with pytest.raises(ValueError):
+        breadthfirst.bft(
+            uni, verts[0], max_depth=2, visitor=visitors.Visitor()
+        )
+    with pytest.raises(ValueError):
+        breadthfirst.bft(
+            uni, verts[0], yield_depth=True, visitor=visitors.Visitor()
+        )
@@ -0,0 +1,57 @@
+#!/usr/bin/python3
+# -*- coding: utf-8 -*-
+
+"""
+Unit tests for traversal.visitsets module.
+"""
+
+import pytest
+from edgegraph.structure import Universe, Vertex
+from edgegraph.traversal import visitsets
+
+
+def test_bitset_members():
+    """
+    Ensure a bitset behaves as a set of the integers in its range.
+    """
+    seen = visitsets.Bitset(10)
+
+    assert len(seen) == 0
+    seen.add(3)
+    seen.add(7)
+    seen.add(3)
+    assert 3 in seen
+    assert 4 not in seen
+    assert len(seen) == 2
+    assert list(seen) == [3, 7]
+
+    seen.discard(3)
+    seen.discard(5)
+    assert list(seen) == [7]
+    assert seen.flags[7] == 1
+
+
+def test_bitset_range():
+    """
+    Ensure integers outside the range are never members, and cannot be added.
+    """
+    seen = visitsets.Bitset(4)
+
+    assert -1 not in seen
+    assert 4 not in seen
+    with pytest.raises(IndexError):
+        seen.add(4)
+
+
+def test_visited_set_kinds():
+    """
+    Ensure the right kind of set is made for each kind of universe.
+    """
+    verts = [Vertex() for _ in range(5)]
+    uni = Universe(vertices=verts)
+
+    assert visitsets.visited_set(uni) == set()
+    assert visitsets.visited_set(None) == set()
+    snap = visitsets.visited_set(uni.freeze())
+    assert isinstance(snap, visitsets.Bitset)
+    assert len(snap.flags) == 5